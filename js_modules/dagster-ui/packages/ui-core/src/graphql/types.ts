@@ -482,6 +482,7 @@ export type AssetNode = {
   partitionKeys: Array<Scalars['String']['output']>;
   partitionKeysByDimension: Array<DimensionPartitionKeys>;
   partitionStats: Maybe<PartitionStats>;
+  partitionStatusBuckets: Maybe<PartitionStatusBuckets>;
   pools: Array<Scalars['String']['output']>;
   repository: Repository;
   requiredResources: Array<ResourceRequirement>;
@@ -536,6 +537,14 @@ export type AssetNodePartitionKeysByDimensionArgs = {
   startIdx?: InputMaybe<Scalars['Int']['input']>;
 };
 
+export type AssetNodePartitionStatusBucketsArgs = {
+  bucketSize?: InputMaybe<Scalars['Int']['input']>;
+  endIndex?: InputMaybe<Scalars['Int']['input']>;
+  endTime?: InputMaybe<Scalars['Float']['input']>;
+  startIndex?: InputMaybe<Scalars['Int']['input']>;
+  startTime?: InputMaybe<Scalars['Float']['input']>;
+};
+
 export type AssetNodeStaleCausesArgs = {
   partition?: InputMaybe<Scalars['String']['input']>;
 };
@@ -3255,6 +3264,7 @@ export type PartitionSet = {
   name: Scalars['String']['output'];
   partition: Maybe<Partition>;
   partitionRuns: Array<PartitionRun>;
+  partitionStatusCounts: Array<PartitionStatusCounts>;
   partitionStatusesOrError: PartitionStatusesOrError;
   partitionsOrError: PartitionsOrError;
   pipelineName: Scalars['String']['output'];
@@ -3271,6 +3281,12 @@ export type PartitionSetPartitionArgs = {
   partitionName: Scalars['String']['input'];
 };
 
+export type PartitionSetPartitionStatusesOrErrorArgs = {
+  cursor?: InputMaybe<Scalars['String']['input']>;
+  limit?: InputMaybe<Scalars['Int']['input']>;
+  reverse?: InputMaybe<Scalars['Boolean']['input']>;
+};
+
 export type PartitionSetPartitionsOrErrorArgs = {
   cursor?: InputMaybe<Scalars['String']['input']>;
   limit?: InputMaybe<Scalars['Int']['input']>;
@@ -3316,6 +3332,27 @@ export type PartitionStatus = {
 
 export type PartitionStatus1D = DefaultPartitionStatuses | TimePartitionStatuses;
 
+export type PartitionStatusBucket = {
+  __typename: 'PartitionStatusBucket';
+  endIndex: Scalars['Int']['output'];
+  endKey: Scalars['String']['output'];
+  endTime: Maybe<Scalars['Float']['output']>;
+  numFailed: Scalars['Int']['output'];
+  numMaterialized: Scalars['Int']['output'];
+  numMaterializing: Scalars['Int']['output'];
+  numPartitions: Scalars['Int']['output'];
+  startIndex: Scalars['Int']['output'];
+  startKey: Scalars['String']['output'];
+  startTime: Maybe<Scalars['Float']['output']>;
+};
+
+export type PartitionStatusBuckets = {
+  __typename: 'PartitionStatusBuckets';
+  buckets: Array<PartitionStatusBucket>;
+  dimensionName: Maybe<Scalars['String']['output']>;
+  numPartitions: Scalars['Int']['output'];
+};
+
 export type PartitionStatusCounts = {
   __typename: 'PartitionStatusCounts';
   count: Scalars['Int']['output'];
@@ -6750,6 +6787,12 @@ export const buildAssetNode = (
         : relationshipsToOmit.has('PartitionStats')
           ? ({} as PartitionStats)
           : buildPartitionStats({}, relationshipsToOmit),
+    partitionStatusBuckets:
+      overrides && overrides.hasOwnProperty('partitionStatusBuckets')
+        ? overrides.partitionStatusBuckets!
+        : relationshipsToOmit.has('PartitionStatusBuckets')
+          ? ({} as PartitionStatusBuckets)
+          : buildPartitionStatusBuckets({}, relationshipsToOmit),
     pools: overrides && overrides.hasOwnProperty('pools') ? overrides.pools! : [],
     repository:
       overrides && overrides.hasOwnProperty('repository')
@@ -11253,6 +11296,10 @@ export const buildPartitionSet = (
           : buildPartition({}, relationshipsToOmit),
     partitionRuns:
       overrides && overrides.hasOwnProperty('partitionRuns') ? overrides.partitionRuns! : [],
+    partitionStatusCounts:
+      overrides && overrides.hasOwnProperty('partitionStatusCounts')
+        ? overrides.partitionStatusCounts!
+        : [],
     partitionStatusesOrError:
       overrides && overrides.hasOwnProperty('partitionStatusesOrError')
         ? overrides.partitionStatusesOrError!
@@ -11369,6 +11416,48 @@ export const buildPartitionStatus = (
   };
 };
 
+export const buildPartitionStatusBucket = (
+  overrides?: Partial<PartitionStatusBucket>,
+  _relationshipsToOmit: Set<string> = new Set(),
+): {__typename: 'PartitionStatusBucket'} & PartitionStatusBucket => {
+  const relationshipsToOmit: Set<string> = new Set(_relationshipsToOmit);
+  relationshipsToOmit.add('PartitionStatusBucket');
+  return {
+    __typename: 'PartitionStatusBucket',
+    endIndex: overrides && overrides.hasOwnProperty('endIndex') ? overrides.endIndex! : 7164,
+    endKey: overrides && overrides.hasOwnProperty('endKey') ? overrides.endKey! : 'quia',
+    endTime: overrides && overrides.hasOwnProperty('endTime') ? overrides.endTime! : 5.14,
+    numFailed: overrides && overrides.hasOwnProperty('numFailed') ? overrides.numFailed! : 1923,
+    numMaterialized:
+      overrides && overrides.hasOwnProperty('numMaterialized') ? overrides.numMaterialized! : 6480,
+    numMaterializing:
+      overrides && overrides.hasOwnProperty('numMaterializing')
+        ? overrides.numMaterializing!
+        : 2017,
+    numPartitions:
+      overrides && overrides.hasOwnProperty('numPartitions') ? overrides.numPartitions! : 8311,
+    startIndex: overrides && overrides.hasOwnProperty('startIndex') ? overrides.startIndex! : 3075,
+    startKey: overrides && overrides.hasOwnProperty('startKey') ? overrides.startKey! : 'dolores',
+    startTime: overrides && overrides.hasOwnProperty('startTime') ? overrides.startTime! : 8.29,
+  };
+};
+
+export const buildPartitionStatusBuckets = (
+  overrides?: Partial<PartitionStatusBuckets>,
+  _relationshipsToOmit: Set<string> = new Set(),
+): {__typename: 'PartitionStatusBuckets'} & PartitionStatusBuckets => {
+  const relationshipsToOmit: Set<string> = new Set(_relationshipsToOmit);
+  relationshipsToOmit.add('PartitionStatusBuckets');
+  return {
+    __typename: 'PartitionStatusBuckets',
+    buckets: overrides && overrides.hasOwnProperty('buckets') ? overrides.buckets! : [],
+    dimensionName:
+      overrides && overrides.hasOwnProperty('dimensionName') ? overrides.dimensionName! : 'magnam',
+    numPartitions:
+      overrides && overrides.hasOwnProperty('numPartitions') ? overrides.numPartitions! : 6142,
+  };
+};
+
 export const buildPartitionStatusCounts = (
   overrides?: Partial<PartitionStatusCounts>,
   _relationshipsToOmit: Set<string> = new Set(),
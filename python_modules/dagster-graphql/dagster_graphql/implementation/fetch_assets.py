@@ -13,18 +13,23 @@
     _check as check,
 )
 from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     CachingDynamicPartitionsLoader,
+    PartitionKeyIndex,
     PartitionsDefinition,
     PartitionsSubset,
 )
 from dagster._core.definitions.remote_asset_graph import RemoteAssetNode
 from dagster._core.definitions.time_window_partitions import (
     PartitionRangeStatus,
+    PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
     fetch_flattened_time_window_ranges,
 )
+from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.event_api import AssetRecordsFilter
 from dagster._core.events.log import EventLogEntry
 from dagster._core.instance import DynamicPartitionsStore
@@ -53,7 +58,9 @@
     from dagster_graphql.schema.pipelines.pipeline import (
         GrapheneAsset,
         GrapheneDefaultPartitionStatuses,
+        GrapheneMultiPartitionRangeStatuses,
         GrapheneMultiPartitionStatuses,
+        GraphenePartitionStatusBuckets,
         GrapheneTimePartitionStatuses,
     )
     from dagster_graphql.schema.roots.assets import GrapheneAssetConnection
@@ -410,17 +417,23 @@ def get_partition_subsets(
             loading_context,
         )
         materialized_subset = (
-            updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_materialized_partition_subsets(
+                partitions_def, dynamic_partitions_store=dynamic_partitions_loader or instance
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
         failed_subset = (
-            updated_cache_value.deserialize_failed_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_failed_partition_subsets(
+                partitions_def, dynamic_partitions_store=dynamic_partitions_loader or instance
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
         in_progress_subset = (
-            updated_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_in_progress_partition_subsets(
+                partitions_def, dynamic_partitions_store=dynamic_partitions_loader or instance
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
@@ -564,10 +577,7 @@ def get_2d_run_length_encoded_partitions(
     in_progress_partitions_subset: PartitionsSubset,
     partitions_def: MultiPartitionsDefinition,
 ) -> "GrapheneMultiPartitionStatuses":
-    from dagster_graphql.schema.pipelines.pipeline import (
-        GrapheneMultiPartitionRangeStatuses,
-        GrapheneMultiPartitionStatuses,
-    )
+    from dagster_graphql.schema.pipelines.pipeline import GrapheneMultiPartitionStatuses
 
     check.invariant(
         isinstance(partitions_def, MultiPartitionsDefinition),
@@ -576,52 +586,16 @@ def get_2d_run_length_encoded_partitions(
 
     primary_dim = partitions_def.primary_dimension
     secondary_dim = partitions_def.secondary_dimension
+    primary_partitions_def = primary_dim.partitions_def
+    secondary_partitions_def = secondary_dim.partitions_def
 
-    dim2_materialized_partition_subset_by_dim1: dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in materialized_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_failed_partition_subset_by_dim1: dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in failed_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_in_progress_partition_subset_by_dim1: dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in in_progress_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    materialized_2d_ranges = []
-
-    dim1_keys = primary_dim.partitions_def.get_partition_keys(
+    dim1_keys = primary_partitions_def.get_partition_keys(
         dynamic_partitions_store=dynamic_partitions_store
     )
-    unevaluated_idx = 0
-    range_start_idx = 0  # pointer to first dim1 partition with same dim2 materialization status
-
     if (
         len(dim1_keys) == 0
         or len(
-            secondary_dim.partitions_def.get_partition_keys(
+            secondary_partitions_def.get_partition_keys(
                 dynamic_partitions_store=dynamic_partitions_store
             )
         )
@@ -629,61 +603,361 @@ def get_2d_run_length_encoded_partitions(
     ):
         return GrapheneMultiPartitionStatuses(ranges=[], primaryDimensionName=primary_dim.name)
 
-    while unevaluated_idx <= len(dim1_keys):
-        if (
-            unevaluated_idx == len(dim1_keys)
-            or dim2_materialized_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_failed_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_in_progress_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-        ):
-            # Add new multipartition range if we've reached the end of the dim1 keys or if the
-            # second dimension subsets are different than for the previous dim1 key
-            if (
-                len(dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
+    dim1_idx_by_key = {key: idx for idx, key in enumerate(dim1_keys)}
+
+    # For each status, the subset is stored as a range-structured subset of the primary dimension
+    # per secondary key. Each run of primary keys in one of these subsets adds the secondary key
+    # to the status at the start of the run and removes it at the end of the run, so the
+    # secondary dimension subsets only change at these transition indexes.
+    status_subsets = [
+        materialized_partitions_subset,
+        failed_partitions_subset,
+        in_progress_partitions_subset,
+    ]
+    transitions_by_dim1_idx: dict[int, dict[tuple[int, str], int]] = defaultdict(
+        lambda: defaultdict(int)
+    )
+    for status_idx, status_subset in enumerate(status_subsets):
+        multi_partitions_subset = check.inst(
+            MultiPartitionsSubset.from_subset(status_subset, partitions_def),
+            MultiPartitionsSubset,
+            "Expected a partition key for each dimension of the multi-partitions definition",
+        )
+        for (
+            secondary_key,
+            primary_subset,
+        ) in multi_partitions_subset.subsets_by_secondary_key.items():
+            for start_idx, end_idx in _get_dim1_index_runs(
+                primary_subset, primary_partitions_def, dim1_idx_by_key, dynamic_partitions_store
             ):
-                # Do not add to materialized_2d_ranges if the dim2 partition subset is empty
-                start_key = dim1_keys[range_start_idx]
-                end_key = dim1_keys[unevaluated_idx - 1]
-
-                primary_partitions_def = primary_dim.partitions_def
-                if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
-                    time_windows = cast(
-                        TimeWindowPartitionsDefinition, primary_partitions_def
-                    ).time_windows_for_partition_keys(frozenset([start_key, end_key]))
-                    start_time = time_windows[0].start.timestamp()
-                    end_time = time_windows[-1].end.timestamp()
-                else:
-                    start_time = None
-                    end_time = None
-
-                materialized_2d_ranges.append(
-                    GrapheneMultiPartitionRangeStatuses(
-                        primaryDimStartKey=start_key,
-                        primaryDimEndKey=end_key,
-                        primaryDimStartTime=start_time,
-                        primaryDimEndTime=end_time,
-                        secondaryDim=build_partition_statuses(
-                            dynamic_partitions_store,
-                            dim2_materialized_partition_subset_by_dim1[start_key],
-                            dim2_failed_partition_subset_by_dim1[start_key],
-                            dim2_in_progress_partition_subset_by_dim1[start_key],
-                            secondary_dim.partitions_def,
-                        ),
-                    )
+                transitions_by_dim1_idx[start_idx][(status_idx, secondary_key)] += 1
+                transitions_by_dim1_idx[end_idx][(status_idx, secondary_key)] -= 1
+
+    materialized_2d_ranges = []
+    dim2_keys_by_status: list[set[str]] = [set() for _ in status_subsets]
+    range_start_idx = 0  # pointer to first dim1 partition with same dim2 statuses
+    for dim1_idx in sorted(transitions_by_dim1_idx):
+        changes = [
+            (status_idx, secondary_key, delta)
+            for (status_idx, secondary_key), delta in transitions_by_dim1_idx[dim1_idx].items()
+            if delta != 0
+        ]
+        if not changes:
+            # adjacent runs of the same secondary key, so the dim2 statuses are unchanged
+            continue
+
+        if any(dim2_keys_by_status):
+            # Do not add to materialized_2d_ranges if the dim2 partition subsets are empty
+            materialized_2d_ranges.append(
+                _build_multi_partition_range_statuses(
+                    dynamic_partitions_store,
+                    dim1_keys[range_start_idx],
+                    dim1_keys[dim1_idx - 1],
+                    dim2_keys_by_status,
+                    primary_partitions_def,
+                    secondary_partitions_def,
                 )
-            range_start_idx = unevaluated_idx
-        unevaluated_idx += 1
+            )
+
+        for status_idx, secondary_key, delta in changes:
+            if delta > 0:
+                dim2_keys_by_status[status_idx].add(secondary_key)
+            else:
+                dim2_keys_by_status[status_idx].discard(secondary_key)
+        range_start_idx = dim1_idx
 
     return GrapheneMultiPartitionStatuses(
         ranges=materialized_2d_ranges, primaryDimensionName=primary_dim.name
     )
 
 
+def _get_dim1_index_runs(
+    primary_subset: PartitionsSubset,
+    primary_partitions_def: PartitionsDefinition,
+    dim1_idx_by_key: Mapping[str, int],
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Sequence[tuple[int, int]]:
+    """Returns the runs of consecutive primary dimension partitions in the subset, as (start, end)
+    index pairs into the primary dimension partition keys, where end is exclusive.
+    """
+    runs = []
+    for key_range in primary_subset.get_partition_key_ranges(
+        primary_partitions_def, dynamic_partitions_store=dynamic_partitions_store
+    ):
+        start_idx = dim1_idx_by_key.get(key_range.start)
+        end_idx = dim1_idx_by_key.get(key_range.end)
+        if start_idx is None or end_idx is None:
+            break
+        runs.append((start_idx, end_idx + 1))
+    else:
+        return runs
+
+    # the subset contains partitions that are no longer in the primary dimension, so only the
+    # runs of the partitions that still exist are kept
+    runs = []
+    for idx in sorted(
+        dim1_idx_by_key[key]
+        for key in primary_subset.get_partition_keys()
+        if key in dim1_idx_by_key
+    ):
+        if runs and runs[-1][1] == idx:
+            runs[-1] = (runs[-1][0], idx + 1)
+        else:
+            runs.append((idx, idx + 1))
+    return runs
+
+
+def _build_multi_partition_range_statuses(
+    dynamic_partitions_store: DynamicPartitionsStore,
+    start_key: str,
+    end_key: str,
+    dim2_keys_by_status: Sequence[AbstractSet[str]],
+    primary_partitions_def: PartitionsDefinition,
+    secondary_partitions_def: PartitionsDefinition,
+) -> "GrapheneMultiPartitionRangeStatuses":
+    from dagster_graphql.schema.pipelines.pipeline import GrapheneMultiPartitionRangeStatuses
+
+    if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+        time_windows = primary_partitions_def.time_windows_for_partition_keys(
+            frozenset([start_key, end_key])
+        )
+        start_time = time_windows[0].start.timestamp()
+        end_time = time_windows[-1].end.timestamp()
+    else:
+        start_time = None
+        end_time = None
+
+    materialized_keys, failed_keys, in_progress_keys = dim2_keys_by_status
+    return GrapheneMultiPartitionRangeStatuses(
+        primaryDimStartKey=start_key,
+        primaryDimEndKey=end_key,
+        primaryDimStartTime=start_time,
+        primaryDimEndTime=end_time,
+        secondaryDim=build_partition_statuses(
+            dynamic_partitions_store,
+            secondary_partitions_def.empty_subset().with_partition_keys(materialized_keys),
+            secondary_partitions_def.empty_subset().with_partition_keys(failed_keys),
+            secondary_partitions_def.empty_subset().with_partition_keys(in_progress_keys),
+            secondary_partitions_def,
+        ),
+    )
+
+
+# The maximum number of buckets that can be requested from get_partition_status_buckets
+MAX_PARTITION_STATUS_BUCKETS = 10000
+
+
+def get_partition_status_buckets(
+    dynamic_partitions_store: DynamicPartitionsStore,
+    materialized_partitions_subset: PartitionsSubset,
+    failed_partitions_subset: PartitionsSubset,
+    in_progress_partitions_subset: PartitionsSubset,
+    partitions_def: PartitionsDefinition,
+    start_index: Optional[int] = None,
+    end_index: Optional[int] = None,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    bucket_size: Optional[int] = None,
+) -> "GraphenePartitionStatusBuckets":
+    """Counts the partitions with each status in consecutive buckets of `bucket_size` partitions,
+    over a window of the partitions of the asset. For multi-partitioned assets, partitions are
+    bucketed by their key in the primary dimension.
+
+    The window is either given as a [start_index, end_index) range of partition indexes, or for
+    time-partitioned assets as the partitions that start within [start_time, end_time). Counts are
+    computed from runs of partition indexes in the status subsets, without expanding them into
+    partition keys where the subsets are range-structured.
+    """
+    from dagster_graphql.schema.pipelines.pipeline import (
+        GraphenePartitionStatusBucket,
+        GraphenePartitionStatusBuckets,
+    )
+
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        dimension_name = partitions_def.primary_dimension.name
+        dimension_partitions_def = partitions_def.primary_dimension.partitions_def
+        num_partitions_per_dimension_partition = (
+            partitions_def.secondary_dimension.partitions_def.get_num_partitions(
+                dynamic_partitions_store=dynamic_partitions_store
+            )
+        )
+    else:
+        dimension_name = None
+        dimension_partitions_def = partitions_def
+        num_partitions_per_dimension_partition = 1
+
+    num_partitions = dimension_partitions_def.get_num_partitions(
+        dynamic_partitions_store=dynamic_partitions_store
+    )
+
+    if start_time is not None or end_time is not None:
+        check.invariant(
+            start_index is None and end_index is None,
+            "Cannot filter partition statuses by both time and partition index",
+        )
+        if not isinstance(dimension_partitions_def, TimeWindowPartitionsDefinition):
+            check.failed("Can only filter partition statuses by time for time-partitioned assets")
+        # the index of the first partition that starts at or after each timestamp
+        start_index, end_index = [
+            dimension_partitions_def.get_partition_index_intervals_for_time_windows(
+                [
+                    PersistedTimeWindow(
+                        TimestampWithTimezone(timestamp, dimension_partitions_def.timezone),
+                        TimestampWithTimezone(timestamp, dimension_partitions_def.timezone),
+                    )
+                ]
+            )[0][0]
+            if timestamp is not None
+            else None
+            for timestamp in (start_time, end_time)
+        ]
+
+    start_index = min(max(start_index if start_index is not None else 0, 0), num_partitions)
+    end_index = min(
+        max(end_index if end_index is not None else num_partitions, start_index), num_partitions
+    )
+    bucket_size = bucket_size if bucket_size is not None else 1
+    check.invariant(bucket_size > 0, "bucketSize must be a positive integer")
+    num_buckets = -(-(end_index - start_index) // bucket_size)
+    check.invariant(
+        num_buckets <= MAX_PARTITION_STATUS_BUCKETS,
+        f"Requested {num_buckets} partition status buckets, but at most"
+        f" {MAX_PARTITION_STATUS_BUCKETS} can be requested. Use a larger bucketSize.",
+    )
+
+    # a partition is counted once, with failed and in progress statuses taking precedence
+    failed_or_in_progress_subset = failed_partitions_subset | in_progress_partitions_subset
+    status_subsets = [
+        materialized_partitions_subset - failed_or_in_progress_subset,
+        failed_partitions_subset - in_progress_partitions_subset,
+        in_progress_partitions_subset,
+    ]
+    counts_by_status = [
+        _count_partitions_per_bucket(
+            _get_dimension_index_intervals(status_subset, partitions_def, dynamic_partitions_store),
+            start_index,
+            end_index,
+            bucket_size,
+        )
+        for status_subset in status_subsets
+    ]
+
+    bucket_intervals = [
+        (bucket_start, min(bucket_start + bucket_size, end_index))
+        for bucket_start in range(start_index, end_index, bucket_size)
+    ]
+    if isinstance(dimension_partitions_def, TimeWindowPartitionsDefinition):
+        time_windows = dimension_partitions_def.get_time_windows_for_partition_index_intervals(
+            bucket_intervals
+        )
+        bucket_times = [
+            (time_window.start.timestamp(), time_window.end.timestamp())
+            for time_window in time_windows
+        ]
+        bucket_keys = [
+            tuple(
+                dimension_partitions_def.get_partition_keys_between_indexes(idx, idx + 1)[0]
+                for idx in (bucket_start, bucket_end - 1)
+            )
+            for bucket_start, bucket_end in bucket_intervals
+        ]
+    else:
+        bucket_times = [(None, None)] * len(bucket_intervals)
+        partition_keys = PartitionKeyIndex.for_partitions_def(
+            dimension_partitions_def, dynamic_partitions_store
+        ).partition_keys
+        bucket_keys = [
+            (partition_keys[bucket_start], partition_keys[bucket_end - 1])
+            for bucket_start, bucket_end in bucket_intervals
+        ]
+
+    num_materialized, num_failed, num_materializing = counts_by_status
+    return GraphenePartitionStatusBuckets(
+        buckets=[
+            GraphenePartitionStatusBucket(
+                startIndex=bucket_start,
+                endIndex=bucket_end,
+                startKey=start_key,
+                endKey=end_key,
+                startTime=bucket_start_time,
+                endTime=bucket_end_time,
+                numPartitions=(bucket_end - bucket_start) * num_partitions_per_dimension_partition,
+                numMaterialized=num_materialized[i],
+                numFailed=num_failed[i],
+                numMaterializing=num_materializing[i],
+            )
+            for i, (
+                (bucket_start, bucket_end),
+                (start_key, end_key),
+                (bucket_start_time, bucket_end_time),
+            ) in enumerate(zip(bucket_intervals, bucket_keys, bucket_times))
+        ],
+        numPartitions=num_partitions,
+        dimensionName=dimension_name,
+    )
+
+
+def _get_dimension_index_intervals(
+    subset: PartitionsSubset,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Sequence[tuple[int, int]]:
+    """Returns [start, end) intervals of the partition indexes in the subset. For multi-partitioned
+    assets, these are indexes in the primary dimension, and intervals may overlap.
+    """
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        multi_partitions_subset = check.inst(
+            MultiPartitionsSubset.from_subset(subset, partitions_def),
+            MultiPartitionsSubset,
+            "Expected a partition key for each dimension of the multi-partitions definition",
+        )
+        return [
+            index_interval
+            for primary_subset in multi_partitions_subset.subsets_by_secondary_key.values()
+            for index_interval in _get_dimension_index_intervals(
+                primary_subset,
+                partitions_def.primary_dimension.partitions_def,
+                dynamic_partitions_store,
+            )
+        ]
+
+    if isinstance(subset, TimeWindowPartitionsSubset) and isinstance(
+        partitions_def, TimeWindowPartitionsDefinition
+    ):
+        return partitions_def.get_partition_index_intervals_for_time_windows(
+            subset.included_time_windows
+        )
+
+    key_index = PartitionKeyIndex.for_partitions_def(partitions_def, dynamic_partitions_store)
+    if isinstance(subset, BitmapPartitionsSubset) and subset.key_index.has_same_keys(key_index):
+        return subset.get_ordinal_runs()
+
+    ordinals = (key_index.get_ordinal(key) for key in subset.get_partition_keys())
+    return [(ordinal, ordinal + 1) for ordinal in ordinals if ordinal is not None]
+
+
+def _count_partitions_per_bucket(
+    index_intervals: Sequence[tuple[int, int]],
+    start_index: int,
+    end_index: int,
+    bucket_size: int,
+) -> Sequence[int]:
+    """Counts the partition indexes in the intervals that fall into each bucket of bucket_size
+    indexes, starting at start_index and ending at end_index.
+    """
+    counts = [0] * -(-(end_index - start_index) // bucket_size)
+    for interval_start, interval_end in index_intervals:
+        # offsets of the interval from the start of the window
+        lo = max(interval_start, start_index) - start_index
+        hi = min(interval_end, end_index) - start_index
+        while lo < hi:
+            bucket_idx = lo // bucket_size
+            next_lo = min((bucket_idx + 1) * bucket_size, hi)
+            counts[bucket_idx] += next_lo - lo
+            lo = next_lo
+    return counts
+
+
 def get_freshness_info(
     asset_key: AssetKey,
     data_time_resolver: CachingDataTimeResolver,
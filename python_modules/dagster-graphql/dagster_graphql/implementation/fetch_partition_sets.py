@@ -8,14 +8,8 @@
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.remote_representation import RemotePartitionSet, RepositoryHandle
 from dagster._core.remote_representation.external_data import PartitionExecutionErrorSnap
-from dagster._core.storage.dagster_run import DagsterRunStatus, RunPartitionData, RunsFilter
-from dagster._core.storage.tags import (
-    PARTITION_NAME_TAG,
-    PARTITION_SET_TAG,
-    REPOSITORY_LABEL_TAG,
-    TagType,
-    get_tag_type,
-)
+from dagster._core.storage.dagster_run import RunPartitionData, RunsFilter
+from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, TagType, get_tag_type
 from dagster._utils.yaml_utils import dump_run_config_yaml
 
 from dagster_graphql.implementation.utils import apply_cursor_limit_reverse
@@ -198,29 +192,51 @@ def get_partition_set_partition_statuses(
     graphene_info: ResolveInfo,
     remote_partition_set: RemotePartitionSet,
     partition_names: Sequence[str],
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    reverse: bool = False,
 ) -> Sequence["GraphenePartitionStatus"]:
     check.inst_param(remote_partition_set, "remote_partition_set", RemotePartitionSet)
 
-    repository_handle = remote_partition_set.repository_handle
-    partition_set_name = remote_partition_set.name
-
-    run_partition_data = graphene_info.context.instance.run_storage.get_run_partition_data(
-        runs_filter=RunsFilter(
-            statuses=[status for status in DagsterRunStatus if status != DagsterRunStatus.CANCELED],
-            tags={
-                PARTITION_SET_TAG: partition_set_name,
-                REPOSITORY_LABEL_TAG: repository_handle.get_remote_origin().get_label(),
-            },
-        )
+    partition_names = apply_cursor_limit_reverse(partition_names, cursor, limit, reverse)
+    run_partition_data = _get_latest_run_partition_data(
+        graphene_info,
+        remote_partition_set,
+        # only restrict the query to the page of partitions if a page was requested
+        partition_names if cursor or limit else None,
     )
 
     return partition_statuses_from_run_partition_data(
-        partition_set_name,
+        remote_partition_set.name,
         run_partition_data,
         partition_names,
     )
 
 
+def get_partition_set_partition_status_counts(
+    graphene_info: ResolveInfo,
+    remote_partition_set: RemotePartitionSet,
+    partition_names: Sequence[str],
+) -> Sequence["GraphenePartitionStatusCounts"]:
+    check.inst_param(remote_partition_set, "remote_partition_set", RemotePartitionSet)
+
+    run_partition_data = _get_latest_run_partition_data(graphene_info, remote_partition_set)
+    return partition_status_counts_from_run_partition_data(run_partition_data, partition_names)
+
+
+def _get_latest_run_partition_data(
+    graphene_info: ResolveInfo,
+    remote_partition_set: RemotePartitionSet,
+    partition_names: Optional[Sequence[str]] = None,
+) -> Sequence[RunPartitionData]:
+    repository_handle = remote_partition_set.repository_handle
+    return graphene_info.context.instance.run_storage.get_latest_run_partition_data(
+        partition_set_name=remote_partition_set.name,
+        repository_label=repository_handle.get_remote_origin().get_label(),
+        partition_names=partition_names,
+    )
+
+
 def partition_statuses_from_run_partition_data(
     partition_set_name: Optional[str],
     run_partition_data: Sequence[RunPartitionData],
@@ -47,6 +47,7 @@
     get_asset_materializations,
     get_asset_observations,
     get_freshness_info,
+    get_partition_status_buckets,
     get_partition_subsets,
 )
 from dagster_graphql.implementation.loader import StaleStatusLoader
@@ -95,6 +96,7 @@
     GrapheneDefaultPartitionStatuses,
     GrapheneMultiPartitionStatuses,
     GraphenePartitionStats,
+    GraphenePartitionStatusBuckets,
     GraphenePipeline,
     GrapheneRun,
     GrapheneTimePartitionStatuses,
@@ -271,6 +273,14 @@ class GrapheneAssetNode(graphene.ObjectType):
     latestRunForPartition = graphene.Field(GrapheneRun, partition=graphene.NonNull(graphene.String))
     assetPartitionStatuses = graphene.NonNull(GrapheneAssetPartitionStatuses)
     partitionStats = graphene.Field(GraphenePartitionStats)
+    partitionStatusBuckets = graphene.Field(
+        GraphenePartitionStatusBuckets,
+        startIndex=graphene.Int(),
+        endIndex=graphene.Int(),
+        startTime=graphene.Float(),
+        endTime=graphene.Float(),
+        bucketSize=graphene.Int(),
+    )
     metadata_entries = non_null_list(GrapheneMetadataEntry)
     tags = non_null_list(GrapheneDefinitionTag)
     kinds = non_null_list(graphene.String)
@@ -1098,6 +1108,55 @@ def resolve_partitionStats(
         else:
             return None
 
+    def resolve_partitionStatusBuckets(
+        self,
+        graphene_info: ResolveInfo,
+        startIndex: Optional[int] = None,
+        endIndex: Optional[int] = None,
+        startTime: Optional[float] = None,
+        endTime: Optional[float] = None,
+        bucketSize: Optional[int] = None,
+    ) -> Optional[GraphenePartitionStatusBuckets]:
+        partitions_snap = self._asset_node_snap.partitions
+        if not partitions_snap:
+            return None
+
+        if not self._dynamic_partitions_loader:
+            check.failed("dynamic_partitions_loader must be provided to get partition keys")
+
+        partitions_def = partitions_snap.get_partitions_definition()
+        (
+            materialized_partition_subset,
+            failed_partition_subset,
+            in_progress_subset,
+        ) = get_partition_subsets(
+            graphene_info.context.instance,
+            graphene_info.context,
+            self._asset_node_snap.asset_key,
+            self._dynamic_partitions_loader,
+            partitions_def,
+        )
+
+        if (
+            materialized_partition_subset is None
+            or failed_partition_subset is None
+            or in_progress_subset is None
+        ):
+            check.failed("Expected partitions subset for a partitioned asset")
+
+        return get_partition_status_buckets(
+            self._dynamic_partitions_loader,
+            materialized_partition_subset,
+            failed_partition_subset,
+            in_progress_subset,
+            partitions_def,
+            start_index=startIndex,
+            end_index=endIndex,
+            start_time=startTime,
+            end_time=endTime,
+            bucket_size=bucketSize,
+        )
+
     def resolve_metadata_entries(
         self, _graphene_info: ResolveInfo
     ) -> Sequence[GrapheneMetadataEntry]:
@@ -24,6 +24,7 @@
     get_partition_by_name,
     get_partition_config,
     get_partition_set_partition_runs,
+    get_partition_set_partition_status_counts,
     get_partition_set_partition_statuses,
     get_partition_tags,
     get_partitions,
@@ -337,7 +338,13 @@ class GraphenePartitionSet(graphene.ObjectType):
         reverse=graphene.Boolean(),
     )
     partition = graphene.Field(GraphenePartition, partition_name=graphene.NonNull(graphene.String))
-    partitionStatusesOrError = graphene.NonNull(GraphenePartitionStatusesOrError)
+    partitionStatusesOrError = graphene.Field(
+        graphene.NonNull(GraphenePartitionStatusesOrError),
+        cursor=graphene.String(),
+        limit=graphene.Int(),
+        reverse=graphene.Boolean(),
+    )
+    partitionStatusCounts = non_null_list(GraphenePartitionStatusCounts)
     partitionRuns = non_null_list(GraphenePartitionRun)
     repositoryOrigin = graphene.NonNull(GrapheneRepositoryOrigin)
     backfills = graphene.Field(
@@ -420,11 +427,27 @@ def resolve_partitionRuns(self, graphene_info: ResolveInfo):
         )
 
     @capture_error
-    def resolve_partitionStatusesOrError(self, graphene_info: ResolveInfo):
+    def resolve_partitionStatusesOrError(
+        self,
+        graphene_info: ResolveInfo,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        reverse: Optional[bool] = None,
+    ):
         return get_partition_set_partition_statuses(
             graphene_info,
             self._remote_partition_set,
             self._get_partition_names(graphene_info),
+            cursor=cursor,
+            limit=limit,
+            reverse=reverse or False,
+        )
+
+    def resolve_partitionStatusCounts(self, graphene_info: ResolveInfo):
+        return get_partition_set_partition_status_counts(
+            graphene_info,
+            self._remote_partition_set,
+            self._get_partition_names(graphene_info),
         )
 
     def resolve_repositoryOrigin(self, _):
@@ -197,6 +197,35 @@ class Meta:
         name = "PartitionStats"
 
 
+class GraphenePartitionStatusBucket(graphene.ObjectType):
+    """The number of partitions with each status among the partitions with indexes in
+    [startIndex, endIndex). For multi-partitioned assets, indexes are in the primary dimension.
+    """
+
+    startIndex = graphene.NonNull(graphene.Int)
+    endIndex = graphene.NonNull(graphene.Int)
+    startKey = graphene.NonNull(graphene.String)
+    endKey = graphene.NonNull(graphene.String)
+    startTime = graphene.Field(graphene.Float)
+    endTime = graphene.Field(graphene.Float)
+    numPartitions = graphene.NonNull(graphene.Int)
+    numMaterialized = graphene.NonNull(graphene.Int)
+    numFailed = graphene.NonNull(graphene.Int)
+    numMaterializing = graphene.NonNull(graphene.Int)
+
+    class Meta:
+        name = "PartitionStatusBucket"
+
+
+class GraphenePartitionStatusBuckets(graphene.ObjectType):
+    buckets = non_null_list(GraphenePartitionStatusBucket)
+    numPartitions = graphene.NonNull(graphene.Int)
+    dimensionName = graphene.Field(graphene.String)
+
+    class Meta:
+        name = "PartitionStatusBuckets"
+
+
 class GrapheneAsset(graphene.ObjectType):
     id = graphene.NonNull(graphene.String)
     key = graphene.NonNull(GrapheneAssetKey)
@@ -19,7 +19,11 @@
     define_asset_job,
     repository,
 )
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionKey
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionKey,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import PartitionsSubset
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.test_utils import instance_for_test, poll_for_finished_run
@@ -30,6 +34,10 @@
     LAUNCH_PIPELINE_REEXECUTION_MUTATION,
 )
 from dagster_graphql.implementation.execution.run_lifecycle import create_valid_pipeline_run
+from dagster_graphql.implementation.fetch_assets import (
+    get_2d_run_length_encoded_partitions,
+    get_partition_status_buckets,
+)
 from dagster_graphql.implementation.utils import ExecutionParams, pipeline_selector_from_graphql
 from dagster_graphql.schema.roots.mutation import create_execution_metadata
 from dagster_graphql.test.utils import (
@@ -467,6 +475,43 @@
 """
 
 
+GET_PARTITION_STATUS_BUCKETS = """
+    query PartitionStatusBuckets(
+        $pipelineSelector: PipelineSelector!
+        $startIndex: Int
+        $endIndex: Int
+        $startTime: Float
+        $endTime: Float
+        $bucketSize: Int
+    ) {
+        assetNodes(pipeline: $pipelineSelector) {
+            id
+            partitionStatusBuckets(
+                startIndex: $startIndex
+                endIndex: $endIndex
+                startTime: $startTime
+                endTime: $endTime
+                bucketSize: $bucketSize
+            ) {
+                numPartitions
+                dimensionName
+                buckets {
+                    startIndex
+                    endIndex
+                    startKey
+                    endKey
+                    startTime
+                    endTime
+                    numPartitions
+                    numMaterialized
+                    numFailed
+                    numMaterializing
+                }
+            }
+        }
+    }
+"""
+
 GET_1D_ASSET_PARTITIONS = """
     query AssetNodeQuery($pipelineSelector: PipelineSelector!) {
         assetNodes(pipeline: $pipelineSelector) {
@@ -3451,6 +3496,124 @@ def partitioned_asset_repo():
     return partitioned_asset_repo
 
 
+def test_partition_status_buckets():
+    with instance_for_test() as instance:
+        with define_out_of_process_context(
+            __file__, "get_partitioned_asset_repo", instance
+        ) as graphql_context:
+            for partition in ["2022-01-01", "2022-01-02", "2022-01-05"]:
+                _create_partitioned_run(graphql_context, "daily_asset_job", partition)
+            for partition in ["a", "c"]:
+                _create_partitioned_run(graphql_context, "abc_asset_job", partition)
+
+            result = execute_dagster_graphql(
+                graphql_context,
+                GET_PARTITION_STATUS_BUCKETS,
+                variables={
+                    "pipelineSelector": infer_job_selector(graphql_context, "daily_asset_job"),
+                    "startTime": datetime.datetime(
+                        2022, 1, 1, tzinfo=datetime.timezone.utc
+                    ).timestamp(),
+                    "endTime": datetime.datetime(
+                        2022, 1, 8, tzinfo=datetime.timezone.utc
+                    ).timestamp(),
+                    "bucketSize": 3,
+                },
+            )
+            statuses = result.data["assetNodes"][0]["partitionStatusBuckets"]
+            assert statuses["dimensionName"] is None
+            assert [
+                (
+                    bucket["startIndex"],
+                    bucket["endIndex"],
+                    bucket["startKey"],
+                    bucket["endKey"],
+                    bucket["numPartitions"],
+                    bucket["numMaterialized"],
+                )
+                for bucket in statuses["buckets"]
+            ] == [
+                (0, 3, "2022-01-01", "2022-01-03", 3, 2),
+                (3, 6, "2022-01-04", "2022-01-06", 3, 1),
+                (6, 7, "2022-01-07", "2022-01-07", 1, 0),
+            ]
+            assert statuses["buckets"][0]["startTime"] == (
+                datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc).timestamp()
+            )
+            assert statuses["buckets"][-1]["endTime"] == (
+                datetime.datetime(2022, 1, 8, tzinfo=datetime.timezone.utc).timestamp()
+            )
+
+            result = execute_dagster_graphql(
+                graphql_context,
+                GET_PARTITION_STATUS_BUCKETS,
+                variables={
+                    "pipelineSelector": infer_job_selector(graphql_context, "abc_asset_job"),
+                    "bucketSize": 2,
+                },
+            )
+            statuses = result.data["assetNodes"][0]["partitionStatusBuckets"]
+            assert statuses["numPartitions"] == 4
+            assert [
+                (bucket["startKey"], bucket["endKey"], bucket["numMaterialized"])
+                for bucket in statuses["buckets"]
+            ] == [("a", "b", 1), ("c", "d", 1)]
+            assert statuses["buckets"][0]["startTime"] is None
+
+
+@pytest.mark.parametrize("from_status_cache", [False, True])
+def test_partition_status_buckets_multipartitions(from_status_cache: bool):
+    partitions_def, materialized, failed, in_progress = _get_large_multipartitions_statuses(
+        20, 300, from_status_cache
+    )
+
+    with instance_for_test() as instance:
+        statuses = get_partition_status_buckets(
+            instance,
+            materialized,
+            failed,
+            in_progress,
+            partitions_def,
+            start_index=2,
+            end_index=18,
+            bucket_size=5,
+        )
+
+    dates = partitions_def.primary_dimension.partitions_def.get_partition_keys()
+    failed_keys = set(failed.get_partition_keys())
+    in_progress_keys = set(in_progress.get_partition_keys())
+    expected_keys_by_status = [
+        set(materialized.get_partition_keys()) - failed_keys - in_progress_keys,
+        failed_keys - in_progress_keys,
+        in_progress_keys,
+    ]
+
+    assert statuses.dimensionName == "date"
+    assert statuses.numPartitions == 20
+    assert [(bucket.startIndex, bucket.endIndex) for bucket in statuses.buckets] == [
+        (2, 7),
+        (7, 12),
+        (12, 17),
+        (17, 18),
+    ]
+    for bucket in statuses.buckets:
+        bucket_dates = set(dates[bucket.startIndex : bucket.endIndex])
+        assert (bucket.startKey, bucket.endKey) == (
+            dates[bucket.startIndex],
+            dates[bucket.endIndex - 1],
+        )
+        assert bucket.numPartitions == len(bucket_dates) * 300
+        assert [bucket.numMaterialized, bucket.numFailed, bucket.numMaterializing] == [
+            sum(
+                1
+                for key in keys
+                if partitions_def.get_partition_key_from_str(key).keys_by_dimension["date"]
+                in bucket_dates
+            )
+            for keys in expected_keys_by_status
+        ]
+
+
 def test_1d_subset_backcompat():
     with instance_for_test() as instance:
         instance.can_read_asset_status_cache = lambda: False
@@ -3598,3 +3761,114 @@ def _graphql_pool(asset_key):
     assert _graphql_pool(AssetKey(["concurrency_asset"])) == {"foo"}
     assert _graphql_pool(AssetKey(["concurrency_graph_asset"])) == {"bar", "baz"}
     assert _graphql_pool(AssetKey(["concurrency_multi_asset_1"])) == {"buzz"}
+
+
+def _get_large_multipartitions_statuses(
+    num_days: int, num_static_keys: int, from_status_cache: bool
+) -> tuple[MultiPartitionsDefinition, PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+    """A daily x static multi-partitioned asset where every static key was materialized over a
+    different contiguous range of days, and a few partitions failed or are in progress.
+
+    Subsets read from the asset status cache are MultiPartitionsSubsets, while subsets fetched
+    from the event log are DefaultPartitionsSubsets.
+    """
+    start = datetime.datetime(2022, 1, 1)
+    daily_partitions_def = DailyPartitionsDefinition(
+        start_date=start, end_date=start + datetime.timedelta(days=num_days)
+    )
+    static_keys = [f"key_{i}" for i in range(num_static_keys)]
+    partitions_def = MultiPartitionsDefinition(
+        {"date": daily_partitions_def, "static": StaticPartitionsDefinition(static_keys)}
+    )
+    dates = daily_partitions_def.get_partition_keys()
+
+    def _keys(date_idxs, static_idxs):
+        return [
+            MultiPartitionKey({"date": dates[date_idx], "static": static_keys[static_idx]})
+            for date_idx in date_idxs
+            for static_idx in static_idxs
+        ]
+
+    materialized_keys = [
+        key
+        for static_idx in range(num_static_keys)
+        for key in _keys(range(static_idx % num_days, num_days), [static_idx])
+    ]
+    failed_keys = _keys(range(0, num_days, 7), range(0, num_static_keys, 100))
+    in_progress_keys = _keys([num_days - 1], range(0, num_static_keys, 2))
+    empty_subset = (
+        MultiPartitionsSubset(partitions_def, {})
+        if from_status_cache
+        else partitions_def.empty_subset()
+    )
+    return (
+        partitions_def,
+        empty_subset.with_partition_keys(materialized_keys),
+        empty_subset.with_partition_keys(failed_keys),
+        empty_subset.with_partition_keys(in_progress_keys),
+    )
+
+
+def _get_expected_2d_ranges(
+    partitions_def: MultiPartitionsDefinition, *status_subsets: PartitionsSubset
+) -> list[tuple[str, str, tuple[frozenset[str], ...]]]:
+    dim2_keys_by_dim1 = {}
+    for status_idx, subset in enumerate(status_subsets):
+        for partition_key in subset.get_partition_keys():
+            keys_by_dimension = partitions_def.get_partition_key_from_str(
+                partition_key
+            ).keys_by_dimension
+            dim2_keys = dim2_keys_by_dim1.setdefault(
+                keys_by_dimension[partitions_def.primary_dimension.name],
+                tuple(set() for _ in status_subsets),
+            )
+            dim2_keys[status_idx].add(keys_by_dimension[partitions_def.secondary_dimension.name])
+
+    ranges = []
+    empty = tuple(frozenset() for _ in status_subsets)
+    for dim1_key in partitions_def.primary_dimension.partitions_def.get_partition_keys():
+        dim2_keys = tuple(frozenset(keys) for keys in dim2_keys_by_dim1.get(dim1_key, empty))
+        if ranges and ranges[-1][2] == dim2_keys:
+            ranges[-1] = (ranges[-1][0], dim1_key, dim2_keys)
+        else:
+            ranges.append((dim1_key, dim1_key, dim2_keys))
+    return [r for r in ranges if r[2] != empty]
+
+
+@pytest.mark.parametrize(
+    "num_days,num_static_keys,from_status_cache",
+    [(10, 25, False), (10, 25, True), (365, 2000, True)],
+)
+def test_2d_run_length_encoded_partitions(
+    num_days: int, num_static_keys: int, from_status_cache: bool
+):
+    partitions_def, *status_subsets = _get_large_multipartitions_statuses(
+        num_days, num_static_keys, from_status_cache
+    )
+
+    with instance_for_test() as instance:
+        start = time.time()
+        statuses = get_2d_run_length_encoded_partitions(instance, *status_subsets, partitions_def)
+        # the 365 x 2,000 asset used to take over 20 seconds to encode
+        assert time.time() - start < 5
+
+    assert statuses.primaryDimensionName == "date"
+    assert [
+        (
+            r.primaryDimStartKey,
+            r.primaryDimEndKey,
+            (
+                frozenset(r.secondaryDim.materializedPartitions)
+                | frozenset(r.secondaryDim.failedPartitions)
+                | frozenset(r.secondaryDim.materializingPartitions),
+                frozenset(r.secondaryDim.failedPartitions),
+                frozenset(r.secondaryDim.materializingPartitions),
+            ),
+        )
+        for r in statuses.ranges
+    ] == [
+        (start_key, end_key, (materialized | failed | in_progress, failed, in_progress))
+        for start_key, end_key, (materialized, failed, in_progress) in _get_expected_2d_ranges(
+            partitions_def, *status_subsets
+        )
+    ]
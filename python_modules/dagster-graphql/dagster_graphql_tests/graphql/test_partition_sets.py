@@ -1,5 +1,7 @@
 from collections import OrderedDict
 
+from dagster._core.storage.dagster_run import RunsFilter
+from dagster._core.storage.tags import PARTITION_NAME_TAG
 from dagster_graphql.client.query import LAUNCH_PARTITION_BACKFILL_MUTATION
 from dagster_graphql.test.utils import (
     execute_dagster_graphql,
@@ -121,6 +123,40 @@
 """
 
 
+GET_PAGINATED_PARTITION_SET_STATUS_QUERY = """
+    query PartitionSetQuery(
+        $repositorySelector: RepositorySelector!
+        $partitionSetName: String!
+        $cursor: String
+        $limit: Int
+    ) {
+        partitionSetOrError(repositorySelector: $repositorySelector, partitionSetName: $partitionSetName) {
+            ...on PartitionSet {
+                id
+                partitionStatusesOrError(cursor: $cursor, limit: $limit) {
+                    __typename
+                    ... on PartitionStatuses {
+                        results {
+                            id
+                            partitionName
+                            runStatus
+                        }
+                    }
+                    ... on PythonError {
+                        message
+                        stack
+                    }
+                }
+                partitionStatusCounts {
+                    runStatus
+                    count
+                }
+            }
+        }
+    }
+"""
+
+
 ADD_DYNAMIC_PARTITION_MUTATION = """
 mutation($partitionsDefName: String!, $partitionKey: String!, $repositorySelector: RepositorySelector!) {
     addDynamicPartition(partitionsDefName: $partitionsDefName, partitionKey: $partitionKey, repositorySelector: $repositorySelector) {
@@ -372,6 +408,50 @@ def test_get_status_failure_cancelation_states(self, graphql_context):
         assert success == 1
         assert canceled == 0
 
+    def test_get_paginated_status_and_counts(self, graphql_context):
+        repository_selector = infer_repository_selector(graphql_context)
+        result = execute_dagster_graphql_and_finish_runs(
+            graphql_context,
+            LAUNCH_PARTITION_BACKFILL_MUTATION,
+            variables={
+                "backfillParams": {
+                    "selector": {
+                        "repositorySelector": repository_selector,
+                        "partitionSetName": "integers_partition_set",
+                    },
+                    "partitionNames": ["2", "3", "4"],
+                    "forceSynchronousSubmission": True,
+                }
+            },
+        )
+        assert not result.errors
+
+        [run] = graphql_context.instance.get_runs(
+            filters=RunsFilter(tags={PARTITION_NAME_TAG: "3"})
+        )
+        graphql_context.instance.report_run_failed(run)
+
+        result = execute_dagster_graphql(
+            graphql_context,
+            query=GET_PAGINATED_PARTITION_SET_STATUS_QUERY,
+            variables={
+                "partitionSetName": "integers_partition_set",
+                "repositorySelector": repository_selector,
+                "cursor": "1",
+                "limit": 3,
+            },
+        )
+        assert not result.errors
+        partition_set = result.data["partitionSetOrError"]
+        assert [
+            (status["partitionName"], status["runStatus"])
+            for status in partition_set["partitionStatusesOrError"]["results"]
+        ] == [("2", "SUCCESS"), ("3", "FAILURE"), ("4", "SUCCESS")]
+        assert {
+            counts["runStatus"]: counts["count"]
+            for counts in partition_set["partitionStatusCounts"]
+        } == {"SUCCESS": 2, "FAILURE": 1, "NOT_STARTED": 7}
+
     def test_get_status_time_window_partitioned_job(self, graphql_context):
         repository_selector = infer_repository_selector(graphql_context)
         result = execute_dagster_graphql_and_finish_runs(
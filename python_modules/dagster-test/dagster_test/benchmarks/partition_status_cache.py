@@ -0,0 +1,121 @@
+# ruff: noqa: T201
+import argparse
+import warnings
+
+from dagster import AssetKey, AssetMaterialization, ExperimentalWarning, StaticPartitionsDefinition
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the latency of reading the cached partition status of a partitioned asset when the asset
+status cache is computed lazily on read, against when it is updated as events are written
+(`asset_status_cache: update_on_write: true` in dagster.yaml).
+
+The script materializes `--num-partitions` partitions of a statically partitioned asset and reads
+its cached status, then repeatedly materializes `--batch-size` more partitions and reads the cached
+status again. Execution time is logged for each step, for each mode.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="partition_status_cache",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=5000,
+    help="Set the number of partitions materialized before the cached status is first read.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=100,
+    help="Set the number of partitions materialized between subsequent reads.",
+)
+
+parser.add_argument(
+    "--num-batches",
+    type=int,
+    default=5,
+    help="Set the number of batches of partitions materialized after the first read.",
+)
+
+ASSET_KEY = AssetKey("asset1")
+
+# ########################
+# ##### HELPERS
+# ########################
+
+
+def report_materializations(instance: DagsterInstance, partition_keys: list[str]) -> None:
+    for partition_key in partition_keys:
+        instance.report_runless_asset_event(
+            AssetMaterialization(asset_key=ASSET_KEY, partition=partition_key)
+        )
+
+
+def run_session(
+    update_on_write: bool, num_partitions: int, batch_size: int, num_batches: int
+) -> None:
+    partition_keys = [str(i) for i in range(num_partitions + batch_size * num_batches)]
+    partitions_def = StaticPartitionsDefinition(partition_keys)
+
+    with instance_for_test(
+        overrides={"asset_status_cache": {"update_on_write": update_on_write}}
+    ) as instance:
+        session = ProfilingSession(
+            name="Partition status cache",
+            experiment_settings={
+                "update_on_write": update_on_write,
+                "num_partitions": num_partitions,
+                "batch_size": batch_size,
+                "num_batches": num_batches,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        with session.logged_execution_time(f"Materialize {num_partitions} partitions"):
+            report_materializations(instance, partition_keys[:num_partitions])
+
+        with session.logged_execution_time("Read cached status (cold)"):
+            get_and_update_asset_status_cache_value(instance, ASSET_KEY, partitions_def)
+
+        for i in range(num_batches):
+            start = num_partitions + i * batch_size
+            with session.logged_execution_time(f"Materialize {batch_size} partitions"):
+                report_materializations(instance, partition_keys[start : start + batch_size])
+
+            with session.logged_execution_time("Read cached status (warm)"):
+                cached_status = get_and_update_asset_status_cache_value(
+                    instance, ASSET_KEY, partitions_def
+                )
+
+            assert cached_status
+            materialized_subset = cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            )
+            assert len(materialized_subset) == start + batch_size
+
+        session.log_result_summary()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_partitions: int, batch_size: int, num_batches: int) -> None:
+    warnings.filterwarnings("ignore", category=ExperimentalWarning)
+    for update_on_write in [False, True]:
+        run_session(update_on_write, num_partitions, batch_size, num_batches)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.batch_size, args.num_batches)
@@ -0,0 +1,223 @@
+# ruff: noqa: T201
+import argparse
+import random
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterEvent,
+    DagsterEventType,
+    DagsterInstance,
+    HourlyPartitionsDefinition,
+    StaticPartitionsDefinition,
+    asset,
+    evaluate_automation_conditions,
+)
+from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.definitions_class import Definitions
+from dagster._core.events import StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.asset_backfill import AssetBackfillData
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes.serdes import PackableValue
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the JSON and compact serdes encodings of the payloads that are serialized most often:
+event log entries, asset graph subsets, asset backfill data and asset daemon cursors.
+
+The payloads are built from `--num-assets` assets, alternating between hourly and static partitions
+definitions with `--num-partitions` partitions each, of which a random half are included in each
+subset. The serialized size of each payload is
+printed, and the execution time of serializing and deserializing it `--num-iterations` times is
+logged for each encoding.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes_compact_encoding",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=50,
+    help="Set the number of assets in the asset graph.",
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=2000,
+    help="Set the number of partitions of each asset.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=1000,
+    help="Set the number of event log entries that are serialized one at a time.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=5,
+    help="Set the number of times each payload is serialized and deserialized.",
+)
+
+START_DATE = datetime(2020, 1, 1)
+HOURLY_FORMAT = "%Y-%m-%d-%H:%M"
+
+# ########################
+# ##### HELPERS
+# ########################
+
+
+def get_definitions(num_assets: int, num_partitions: int) -> Definitions:
+    end_date = START_DATE + timedelta(hours=num_partitions)
+    hourly_partitions_def = HourlyPartitionsDefinition(
+        START_DATE.strftime(HOURLY_FORMAT), end_date=end_date.strftime(HOURLY_FORMAT)
+    )
+    static_partitions_def = StaticPartitionsDefinition([str(i) for i in range(num_partitions)])
+
+    assets = []
+    for i in range(num_assets):
+        partitions_def = hourly_partitions_def if i % 2 == 0 else static_partitions_def
+
+        @asset(
+            name=f"asset_{i}",
+            partitions_def=partitions_def,
+            deps=[f"asset_{i - 2}"] if i >= 2 else [],
+            automation_condition=AutomationCondition.eager(),
+        )
+        def _asset() -> None: ...
+
+        assets.append(_asset)
+    return Definitions(assets=assets)
+
+
+def get_events(num_events: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="a9e4b9e3-2f1d-4e7b-8f0a-6c1b3d5e7f90",
+            timestamp=time.time(),
+            step_key="my_step",
+            job_name="my_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "my_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["my_prefix", f"asset_{i}"]),
+                        partition=str(i),
+                        metadata={"num_rows": i, "path": f"s3://bucket/asset_{i}"},
+                    )
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+def get_fragmented_subset(defs: Definitions, rng: random.Random) -> AssetGraphSubset:
+    asset_graph = defs.get_asset_graph()
+    subsets_by_asset_key = {}
+    for asset_key in asset_graph.get_all_asset_keys():
+        partitions_def = asset_graph.get(asset_key).partitions_def
+        assert partitions_def
+        partition_keys = [key for key in partitions_def.get_partition_keys() if rng.random() < 0.5]
+        subsets_by_asset_key[asset_key] = partitions_def.empty_subset().with_partition_keys(
+            partition_keys
+        )
+    return AssetGraphSubset(partitions_subsets_by_asset_key=subsets_by_asset_key)
+
+
+def get_backfill_data(defs: Definitions, rng: random.Random) -> AssetBackfillData:
+    asset_graph = defs.get_asset_graph()
+    instance = DagsterInstance.ephemeral()
+    backfill_data = AssetBackfillData.from_asset_partitions(
+        asset_graph=asset_graph,
+        partition_names=None,
+        asset_selection=list(asset_graph.get_all_asset_keys()),
+        dynamic_partitions_store=instance,
+        backfill_start_timestamp=time.time(),
+        all_partitions=True,
+    )
+    return backfill_data._replace(
+        requested_subset=get_fragmented_subset(defs, rng),
+        materialized_subset=get_fragmented_subset(defs, rng),
+    )
+
+
+def run_session(name: str, payloads: Sequence[PackableValue], num_iterations: int) -> None:
+    json_serialized = [serialize_value(payload) for payload in payloads]
+    compact_serialized = [serialize_value(payload, compact=True) for payload in payloads]
+    json_size = sum(len(serialized) for serialized in json_serialized)
+    compact_size = sum(len(serialized) for serialized in compact_serialized)
+
+    session = ProfilingSession(
+        name=f"Serdes encodings ({name})",
+        experiment_settings={
+            "num_payloads": len(payloads),
+            "num_iterations": num_iterations,
+            "json_size_bytes": json_size,
+            "compact_size_bytes": compact_size,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Serialize (json)"):
+        for _ in range(num_iterations):
+            for payload in payloads:
+                serialize_value(payload)
+
+    with session.logged_execution_time("Serialize (compact)"):
+        for _ in range(num_iterations):
+            for payload in payloads:
+                serialize_value(payload, compact=True)
+
+    with session.logged_execution_time("Deserialize (json)"):
+        for _ in range(num_iterations):
+            for serialized in json_serialized:
+                deserialize_value(serialized)
+
+    with session.logged_execution_time("Deserialize (compact)"):
+        for _ in range(num_iterations):
+            for serialized in compact_serialized:
+                deserialize_value(serialized)
+
+    print(f"Compact encoding is {compact_size / json_size:.0%} of the size of the json encoding")
+    session.log_result_summary()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_partitions: int, num_events: int, num_iterations: int) -> None:
+    rng = random.Random(0)
+    defs = get_definitions(num_assets, num_partitions)
+
+    with DagsterInstance.ephemeral() as instance:
+        cursor = evaluate_automation_conditions(defs, instance).cursor
+
+    run_session("event log entries", get_events(num_events), num_iterations)
+    run_session("asset graph subset", [get_fragmented_subset(defs, rng)], num_iterations)
+    run_session("asset backfill data", [get_backfill_data(defs, rng)], num_iterations)
+    run_session("asset daemon cursor", [cursor], num_iterations)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_partitions, args.num_events, args.num_iterations)
@@ -0,0 +1,127 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+
+from dagster import AssetKey, AssetMaterialization, DagsterEvent, DagsterEventType
+from dagster._core.events import StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import SqliteEventLogStorage
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the write throughput of the sqlite event log storage when storing `--num-events` events of
+a run one at a time with `store_event`, compared to storing them in batches of `--batch-size` events
+with `store_event_batch`.
+
+Every `--asset-event-interval`th event is an asset materialization, which is also mirrored in the
+index shard and updates the asset tables. The remaining events are step log messages, which are
+only written to the run shard.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="sqlite_event_log_batch_writes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=2000,
+    help="Set the number of events stored in each case.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=100,
+    help="Set the number of events in each batch passed to `store_event_batch`.",
+)
+
+parser.add_argument(
+    "--asset-event-interval",
+    type=int,
+    default=10,
+    help="Set how often an asset materialization is stored among the step log messages.",
+)
+
+# ########################
+# ##### HELPERS
+# ########################
+
+
+def make_events(run_id: str, num_events: int, asset_event_interval: int) -> list[EventLogEntry]:
+    events = []
+    for i in range(num_events):
+        if i % asset_event_interval == 0:
+            dagster_event = DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "my_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(asset_key=AssetKey(f"asset_{i % 7}"))
+                ),
+            )
+        else:
+            dagster_event = None
+
+        events.append(
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message=f"message {i}",
+                run_id=run_id,
+                timestamp=time.time(),
+                step_key="my_step",
+                job_name="my_job",
+                dagster_event=dagster_event,
+            )
+        )
+    return events
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_events: int, batch_size: int, asset_event_interval: int) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteEventLogStorage(tmpdir)
+        single_events = make_events(make_new_run_id(), num_events, asset_event_interval)
+        batched_events = make_events(make_new_run_id(), num_events, asset_event_interval)
+
+        session = ProfilingSession(
+            name="SqliteEventLogStorage writes",
+            experiment_settings={
+                "num_events": num_events,
+                "batch_size": batch_size,
+                "asset_event_interval": asset_event_interval,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        start = time.time()
+        with session.logged_execution_time("Store events one at a time"):
+            for event in single_events:
+                storage.store_event(event)
+        single_duration = time.time() - start
+
+        start = time.time()
+        with session.logged_execution_time("Store events in batches"):
+            for i in range(0, num_events, batch_size):
+                storage.store_event_batch(batched_events[i : i + batch_size])
+        batched_duration = time.time() - start
+
+        print(f"Events per second one at a time: {num_events / single_duration:.0f}")
+        print(f"Events per second in batches: {num_events / batched_duration:.0f}")
+
+        session.log_result_summary()
+        storage.dispose()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_events, args.batch_size, args.asset_event_interval)
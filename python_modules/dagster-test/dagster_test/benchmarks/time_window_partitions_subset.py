@@ -0,0 +1,128 @@
+# ruff: noqa: T201
+import argparse
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from dagster import HourlyPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of set operations between two subsets of an hourly partitioned asset with
+`--num-partitions` partitions.
+
+In the fragmented case, each subset contains a random half of the partitions, so it is made up of
+thousands of disjoint time windows (e.g. the failed partitions of an asset after a week of flaky
+runs). In the contiguous case, each subset is a single range covering most of the partitions.
+Execution time is logged for `--num-iterations` repetitions of each operation, for each case.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions_subset",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=20000,
+    help="Set the number of partitions in the partitions definition.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=10,
+    help="Set the number of times each operation is repeated.",
+)
+
+START_DATE = datetime(2020, 1, 1)
+HOURLY_FORMAT = "%Y-%m-%d-%H:%M"
+
+# ########################
+# ##### HELPERS
+# ########################
+
+
+def get_fragmented_keys(partition_keys: list[str], rng: random.Random) -> list[str]:
+    return [key for key in partition_keys if rng.random() < 0.5]
+
+
+def get_contiguous_keys(partition_keys: list[str], rng: random.Random) -> list[str]:
+    start = rng.randrange(len(partition_keys) // 10)
+    end = len(partition_keys) - rng.randrange(len(partition_keys) // 10)
+    return partition_keys[start:end]
+
+
+def run_session(
+    name: str,
+    get_keys: Callable[[list[str], random.Random], list[str]],
+    num_partitions: int,
+    num_iterations: int,
+) -> None:
+    end_date = START_DATE + timedelta(hours=num_partitions)
+    partitions_def = HourlyPartitionsDefinition(
+        START_DATE.strftime(HOURLY_FORMAT), end_date=end_date.strftime(HOURLY_FORMAT)
+    )
+    partition_keys = list(partitions_def.get_partition_keys())
+    rng = random.Random(0)
+
+    session = ProfilingSession(
+        name=f"TimeWindowPartitionsSubset set operations ({name})",
+        experiment_settings={
+            "num_partitions": num_partitions,
+            "num_iterations": num_iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    a_keys = get_keys(partition_keys, rng)
+    b_keys = get_keys(partition_keys, rng)
+
+    with session.logged_execution_time("Build subsets from partition keys"):
+        for _ in range(num_iterations):
+            a = partitions_def.empty_subset().with_partition_keys(a_keys)
+            b = partitions_def.empty_subset().with_partition_keys(b_keys)
+
+    assert isinstance(a, TimeWindowPartitionsSubset)
+    print(f"Subsets have {len(a.included_time_windows)} and {len(b.included_time_windows)} windows")
+
+    with session.logged_execution_time("Union"):
+        for _ in range(num_iterations):
+            len(a | b)
+
+    with session.logged_execution_time("Intersection"):
+        for _ in range(num_iterations):
+            len(a & b)
+
+    with session.logged_execution_time("Difference"):
+        for _ in range(num_iterations):
+            len(a - b)
+
+    with session.logged_execution_time("Partition keys not in subset"):
+        for _ in range(num_iterations):
+            a.get_partition_keys_not_in_subset(partitions_def)
+
+    with session.logged_execution_time("Membership of every partition key"):
+        for _ in range(num_iterations):
+            sum(1 for key in partition_keys if key in a)
+
+    session.log_result_summary()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_partitions: int, num_iterations: int) -> None:
+    run_session("fragmented", get_fragmented_keys, num_partitions, num_iterations)
+    run_session("contiguous", get_contiguous_keys, num_partitions, num_iterations)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.num_iterations)
@@ -198,6 +198,9 @@ def _shutdown_threads(
     cancellation_thread_shutdown_event: Optional[threading.Event],
 ):
     pid = os.getpid()
+    # write any events that steps left buffered in memory before the run worker exits
+    instance.flush_buffered_events(dagster_run.run_id)
+
     if metrics_thread and metrics_thread_shutdown_event:
         stopped = stop_run_metrics_thread(metrics_thread, metrics_thread_shutdown_event)
         if not stopped:
@@ -1,4 +1,5 @@
 import functools
+import threading
 from collections.abc import Awaitable, Iterable
 from datetime import datetime, timedelta
 from typing import (  # noqa: UP035
@@ -131,7 +132,7 @@ def __init__(
 
         self._temporal_context = temporal_context
         self._instance = instance
-        self._loaders = {}
+        self._thread_local = threading.local()
         self._asset_graph = asset_graph
 
         self._queryer = CachingInstanceQueryer(
@@ -147,7 +148,11 @@ def instance(self) -> "DagsterInstance":
 
     @property
     def loaders(self) -> dict[type, DataLoader]:
-        return self._loaders
+        # DataLoaders are bound to the event loop they are first used on, so each thread that
+        # drives its own event loop gets its own set of loaders
+        if not hasattr(self._thread_local, "loaders"):
+            self._thread_local.loaders = {}
+        return self._thread_local.loaders
 
     @property
     def effective_dt(self) -> datetime:
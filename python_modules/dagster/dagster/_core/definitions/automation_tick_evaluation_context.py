@@ -24,7 +24,7 @@
     AutomationConditionEvaluation,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
-from dagster._core.definitions.partition import PartitionsDefinition
+from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
 from dagster._core.definitions.run_request import RunRequest
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.tags import (
@@ -87,6 +87,10 @@ def asset_graph(self) -> BaseAssetGraph:
     def total_keys(self) -> int:
         return self._total_keys
 
+    @property
+    def evaluation_durations_by_key(self) -> Mapping[EntityKey, float]:
+        return self._evaluator.evaluation_durations_by_key
+
     def _legacy_build_auto_observe_run_requests(self) -> Sequence[RunRequest]:
         current_timestamp = self._evaluator.evaluation_time.timestamp()
         assets_to_auto_observe: set[AssetKey] = set()
@@ -342,64 +346,107 @@ def build_run_requests_with_backfill_policies(
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> Sequence[RunRequest]:
     """Build run requests for a selection of asset partitions based on the associated BackfillPolicies."""
-    run_requests = []
+    return build_run_requests_for_asset_graph_subset_with_backfill_policies(
+        AssetGraphSubset.from_asset_partition_set(set(asset_partitions), asset_graph),
+        asset_graph=asset_graph,
+        dynamic_partitions_store=dynamic_partitions_store,
+    )
 
-    asset_partition_keys: Mapping[AssetKey, set[str]] = {
-        asset_key_partition.asset_key: set() for asset_key_partition in asset_partitions
-    }
-    for asset_partition in asset_partitions:
-        if asset_partition.partition_key:
-            asset_partition_keys[asset_partition.asset_key].add(asset_partition.partition_key)
 
-    assets_to_reconcile_by_partitions_def_partition_keys_backfill_policy: Mapping[
-        tuple[Optional[PartitionsDefinition], Optional[frozenset[str]], Optional[BackfillPolicy]],
+def build_run_requests_for_asset_graph_subset_with_backfill_policies(
+    asset_graph_subset: AssetGraphSubset,
+    asset_graph: BaseAssetGraph,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Sequence[RunRequest]:
+    """Build run requests for an AssetGraphSubset based on the associated BackfillPolicies.
+
+    Assets are grouped by their partitions def, selected partition key ranges, and backfill policy
+    without expanding their partitions subsets into individual asset partitions, so the cost of
+    planning runs for assets with a backfill policy scales with the number of partition key ranges
+    rather than the number of partitions.
+    """
+    run_requests = []
+
+    assets_to_reconcile_by_partitions_def_partition_key_ranges_backfill_policy: Mapping[
+        tuple[PartitionsDefinition, tuple[PartitionKeyRange, ...], Optional[BackfillPolicy]],
         set[AssetKey],
     ] = defaultdict(set)
+    partitions_subset_by_group_key: dict[
+        tuple[PartitionsDefinition, tuple[PartitionKeyRange, ...], Optional[BackfillPolicy]],
+        PartitionsSubset,
+    ] = {}
+
+    # here we are grouping assets by their partitions def, selected partition key ranges, and
+    # backfill policy.
+    for asset_key, partitions_subset in asset_graph_subset.partitions_subsets_by_asset_key.items():
+        if partitions_subset.is_empty:
+            continue
+        asset_node = asset_graph.get(asset_key)
+        partitions_def = asset_node.partitions_def
+        if partitions_def is None:
+            check.failed("Partition key provided for unpartitioned asset")
 
-    # here we are grouping assets by their partitions def, selected partition keys, and backfill policy.
-    for asset_key, partition_keys in asset_partition_keys.items():
-        assets_to_reconcile_by_partitions_def_partition_keys_backfill_policy[
-            asset_graph.get(asset_key).partitions_def,
-            frozenset(partition_keys) if partition_keys else None,
-            asset_graph.get(asset_key).backfill_policy,
-        ].add(asset_key)
+        group_key = (
+            partitions_def,
+            tuple(
+                partitions_subset.get_partition_key_ranges(
+                    partitions_def, dynamic_partitions_store=dynamic_partitions_store
+                )
+            ),
+            asset_node.backfill_policy,
+        )
+        assets_to_reconcile_by_partitions_def_partition_key_ranges_backfill_policy[group_key].add(
+            asset_key
+        )
+        partitions_subset_by_group_key[group_key] = partitions_subset
 
-    for (
-        partitions_def,
-        partition_keys,
-        backfill_policy,
-    ), asset_keys in assets_to_reconcile_by_partitions_def_partition_keys_backfill_policy.items():
-        asset_check_keys = asset_graph.get_check_keys_for_assets(asset_keys)
-        if partitions_def is None and partition_keys is not None:
-            check.failed("Partition key provided for unpartitioned asset")
-        elif partitions_def is not None and partition_keys is None:
+    non_partitioned_asset_keys_by_backfill_policy: Mapping[
+        Optional[BackfillPolicy], set[AssetKey]
+    ] = defaultdict(set)
+    for asset_key in asset_graph_subset.non_partitioned_asset_keys:
+        asset_node = asset_graph.get(asset_key)
+        if asset_node.partitions_def is not None:
             check.failed("Partition key missing for partitioned asset")
-        elif partitions_def is None and partition_keys is None:
-            # non partitioned assets will be backfilled in a single run
-            run_requests.append(
-                RunRequest(
-                    asset_selection=list(asset_keys),
-                    asset_check_keys=list(asset_check_keys),
-                    tags={},
-                )
+        non_partitioned_asset_keys_by_backfill_policy[asset_node.backfill_policy].add(asset_key)
+
+    # non partitioned assets with the same backfill policy will be backfilled in a single run
+    for asset_keys in non_partitioned_asset_keys_by_backfill_policy.values():
+        run_requests.append(
+            RunRequest(
+                asset_selection=list(asset_keys),
+                asset_check_keys=list(asset_graph.get_check_keys_for_assets(asset_keys)),
+                tags={},
             )
-        elif backfill_policy is None:
+        )
+
+    for (
+        (
+            partitions_def,
+            partition_key_ranges,
+            backfill_policy,
+        ),
+        asset_keys,
+    ) in assets_to_reconcile_by_partitions_def_partition_key_ranges_backfill_policy.items():
+        if backfill_policy is None:
             # just use the normal single-partition behavior
+            partitions_subset = partitions_subset_by_group_key[
+                (partitions_def, partition_key_ranges, backfill_policy)
+            ]
             entity_keys = cast(set[EntityKey], asset_keys)
             mapping: _PartitionsDefKeyMapping = {
-                (partitions_def, pk): entity_keys for pk in (partition_keys or [None])
+                (partitions_def, pk): entity_keys for pk in partitions_subset.get_partition_keys()
             }
             run_requests.extend(
                 _build_run_requests_from_partitions_def_mapping(mapping, asset_graph, run_tags={})
             )
         else:
             run_requests.extend(
-                _build_run_requests_with_backfill_policy(
+                _build_run_requests_for_partition_key_ranges_with_backfill_policy(
                     list(asset_keys),
-                    list(asset_check_keys),
-                    check.not_none(backfill_policy),
-                    check.not_none(partition_keys),
-                    check.not_none(partitions_def),
+                    list(asset_graph.get_check_keys_for_assets(asset_keys)),
+                    backfill_policy,
+                    partition_key_ranges,
+                    partitions_def,
                     tags={},
                     dynamic_partitions_store=dynamic_partitions_store,
                 )
@@ -407,20 +454,16 @@ def build_run_requests_with_backfill_policies(
     return run_requests
 
 
-def _build_run_requests_with_backfill_policy(
+def _build_run_requests_for_partition_key_ranges_with_backfill_policy(
     asset_keys: Sequence[AssetKey],
     asset_check_keys: Sequence[AssetCheckKey],
     backfill_policy: BackfillPolicy,
-    partition_keys: frozenset[str],
+    partition_key_ranges: Sequence[PartitionKeyRange],
     partitions_def: PartitionsDefinition,
     tags: dict[str, Any],
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> Sequence[RunRequest]:
     run_requests = []
-    partition_subset = partitions_def.subset_with_partition_keys(partition_keys)
-    partition_key_ranges = partition_subset.get_partition_key_ranges(
-        partitions_def, dynamic_partitions_store=dynamic_partitions_store
-    )
     for partition_key_range in partition_key_ranges:
         # We might resolve more than one partition key range for the given partition keys.
         # We can only apply chunking on individual partition key ranges.
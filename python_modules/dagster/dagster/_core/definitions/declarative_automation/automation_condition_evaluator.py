@@ -1,8 +1,10 @@
 import asyncio
 import datetime
 import logging
+import threading
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
 
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
@@ -17,6 +19,7 @@
 )
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
 from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
 
@@ -62,6 +65,9 @@ def __init__(
             _instance.auto_materialize_respect_materialization_data_versions
         )
         self.emit_backfills = emit_backfills or _instance.da_request_backfills()
+        self.num_workers = _instance.auto_materialize_evaluation_num_workers
+        self._worker_thread_local = threading.local()
+        self._worker_event_loops: list[asyncio.AbstractEventLoop] = []
 
         self.legacy_expected_data_time_by_key: dict[AssetKey, Optional[datetime.datetime]] = {}
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
@@ -91,6 +97,35 @@ def evaluated_asset_keys_and_parents(self) -> AbstractSet[AssetKey]:
     def asset_records_to_prefetch(self) -> Sequence[AssetKey]:
         return [key for key in self.evaluated_asset_keys_and_parents if self.asset_graph.has(key)]
 
+    @property
+    def legacy_data_time_asset_keys_to_prefetch(self) -> AbstractSet[AssetKey]:
+        """The time-partitioned assets whose materialized partitions may be queried to resolve the
+        data times of the evaluated assets with a freshness policy.
+        """
+        return {
+            ancestor_key
+            for ek in self.entity_keys
+            if isinstance(ek, AssetKey) and self.asset_graph.get(ek).freshness_policy is not None
+            for ancestor_key in self.asset_graph.get_ancestor_asset_keys(ek, include_self=True)
+            if self.asset_graph.has(ancestor_key)
+            and isinstance(
+                self.asset_graph.get(ancestor_key).partitions_def, TimeWindowPartitionsDefinition
+            )
+        }
+
+    @property
+    def prefetch_after_cursor(self) -> Optional[int]:
+        """The earliest event id after which any evaluated entity will look for updates, or None if
+        some entity has not been evaluated before.
+        """
+        last_event_ids = []
+        for entity_key in self.entity_keys:
+            previous_cursor = self.cursor.get_previous_condition_cursor(entity_key)
+            if previous_cursor is None or previous_cursor.last_event_id is None:
+                return None
+            last_event_ids.append(previous_cursor.last_event_id)
+        return min(last_event_ids, default=None)
+
     def prefetch(self) -> None:
         """Pre-populate the cached values here to avoid situations in which the new latest_storage_id
         value is calculated using information that comes in after the set of asset partitions with
@@ -101,6 +136,15 @@ def prefetch(self) -> None:
             f"Prefetching asset records for {len(self.asset_records_to_prefetch)} records."
         )
         self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
+        self.instance_queryer.prefetch_latest_storage_ids_by_partition(
+            self.asset_records_to_prefetch, after_cursor=self.prefetch_after_cursor
+        )
+        self.instance_queryer.prefetch_materialized_partitions_for_status_cache(
+            self.asset_records_to_prefetch
+        )
+        self.instance_queryer.prefetch_materialized_partitions(
+            self.legacy_data_time_asset_keys_to_prefetch
+        )
         self.logger.info("Done prefetching asset records.")
 
     def evaluate(self) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
@@ -113,13 +157,27 @@ async def async_evaluate(
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
 
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=self.num_workers, thread_name_prefix="automation_condition_evaluator"
+            )
+            if self.num_workers
+            else None
+        )
+
         async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             self.logger.debug(
                 f"Evaluating {entity_key.to_user_string()} ({num_evaluated+offset}/{num_conditions})"
             )
 
             try:
-                await self.evaluate_entity(entity_key)
+                if executor and not self._must_evaluate_serially(entity_key):
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        executor, self._evaluate_condition_in_thread, entity_key
+                    )
+                    self._record_result(result)
+                else:
+                    await self.evaluate_entity(entity_key)
             except Exception as e:
                 raise Exception(
                     f"Error while evaluating conditions for {entity_key.to_user_string()}"
@@ -138,22 +196,88 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
                 f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
             )
 
-        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
-            coroutines = [
-                _evaluate_entity_async(entity_key, offset)
-                for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
-            ]
-            await asyncio.gather(*coroutines)
-            num_evaluated += len(coroutines)
-
-        return list(self.current_results_by_key.values()), [
-            v for v in self.request_subsets_by_key.values() if not v.is_empty
+        async def _evaluate_entities_serially(entity_keys_with_offsets):
+            for entity_key, offset in entity_keys_with_offsets:
+                await _evaluate_entity_async(entity_key, offset)
+
+        try:
+            for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
+                level_keys_with_offsets = [
+                    (entity_key, offset)
+                    for offset, entity_key in enumerate(topo_level)
+                    if entity_key in self.entity_keys
+                ]
+                if executor:
+                    # entities that must be executed together read and update each other's
+                    # requested subsets, so they are evaluated one at a time, in level order
+                    serial_keys_with_offsets = [
+                        (entity_key, offset)
+                        for entity_key, offset in level_keys_with_offsets
+                        if self._must_evaluate_serially(entity_key)
+                    ]
+                    coroutines = [
+                        _evaluate_entity_async(entity_key, offset)
+                        for entity_key, offset in level_keys_with_offsets
+                        if not self._must_evaluate_serially(entity_key)
+                    ]
+                    coroutines.append(_evaluate_entities_serially(serial_keys_with_offsets))
+                else:
+                    coroutines = [
+                        _evaluate_entity_async(entity_key, offset)
+                        for entity_key, offset in level_keys_with_offsets
+                    ]
+                await asyncio.gather(*coroutines)
+                num_evaluated += len(level_keys_with_offsets)
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+                for loop in self._worker_event_loops:
+                    loop.close()
+                self._worker_event_loops.clear()
+
+        # results are returned in topological order so that the output does not depend on the
+        # order in which concurrent evaluations happened to complete
+        results = [
+            self.current_results_by_key[entity_key]
+            for topo_level in self.asset_graph.toposorted_entity_keys_by_level
+            for entity_key in topo_level
+            if entity_key in self.current_results_by_key
         ]
+        return results, [v for v in self.request_subsets_by_key.values() if not v.is_empty]
+
+    @property
+    def evaluation_durations_by_key(self) -> Mapping[EntityKey, float]:
+        """The time in seconds spent evaluating the condition of each evaluated entity."""
+        return {
+            key: result.end_timestamp - result.start_timestamp
+            for key, result in self.current_results_by_key.items()
+        }
+
+    def _must_evaluate_serially(self, key: EntityKey) -> bool:
+        return len(self.asset_graph.get(key).execution_set_entity_keys) > 1
+
+    def _evaluate_condition_in_thread(self, key: EntityKey) -> AutomationResult:
+        # each worker thread drives its evaluations on its own event loop, which is reused across
+        # evaluations so that the thread's loaders stay usable. conditions in the same topological
+        # level only read the results of earlier levels, which are not modified until every
+        # evaluation in the level has completed
+        loop = getattr(self._worker_thread_local, "event_loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._worker_thread_local.event_loop = loop
+            self._worker_event_loops.append(loop)
+        return loop.run_until_complete(
+            AutomationContext.create(key=key, evaluator=self).evaluate_async()
+        )
 
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
+        self._record_result(result)
+
+    def _record_result(self, result: AutomationResult) -> None:
+        key = result.key
 
         # update dictionaries to keep track of this result
         self.current_results_by_key[key] = result
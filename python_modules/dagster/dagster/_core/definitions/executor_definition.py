@@ -332,12 +332,17 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=check.opt_int_elem(worker_pool_cfg or {}, "max_steps_per_worker"),
+        max_worker_memory_mb=check.opt_int_elem(worker_pool_cfg or {}, "max_worker_memory_mb"),
     )
 
 
@@ -390,6 +395,35 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps that a worker process executes before it is replaced"
+                        " with a new one. By default, workers are reused for the whole run."
+                    ),
+                ),
+                "max_worker_memory_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process after a step once its peak memory usage exceeds"
+                        " this many megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes, one per concurrently"
+                " executing step, instead of starting a new process for each step. This avoids"
+                " paying the cost of starting a process and loading the job for every step, at"
+                " the cost of steps that run in the same worker sharing imported modules and"
+                " global state. Each worker executes one step at a time, and is replaced if its"
+                " step crashes or is terminated."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -419,6 +453,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Jobs with many short steps can set ``worker_pool`` to execute steps in long-lived worker
+    processes instead of starting a new process for each step:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
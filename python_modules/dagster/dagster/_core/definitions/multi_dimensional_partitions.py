@@ -1,15 +1,19 @@
 import hashlib
 import itertools
-from collections.abc import Mapping, Sequence
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
-from functools import lru_cache, reduce
-from typing import NamedTuple, Optional, Union, cast
+from functools import lru_cache
+from typing import AbstractSet, Callable, NamedTuple, Optional, Union, cast, overload  # noqa: UP035
 
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
+    PartitionKeyIndex,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
@@ -21,6 +25,7 @@
 )
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -156,6 +161,219 @@ def _check_valid_partitions_dimensions(
                 )
 
 
+class _TimeWindowDimensionKeys(Sequence[str]):
+    """The partition keys of a time window partitions dimension at a fixed current time. Keys are
+    only formatted when accessed.
+    """
+
+    def __init__(self, partitions_def: TimeWindowPartitionsDefinition, current_time: datetime):
+        self._partitions_def = partitions_def
+        self._current_time = current_time
+        self._num_partitions = partitions_def.get_num_partitions(current_time)
+
+    @property
+    def partition_keys(self) -> Sequence[str]:
+        return self
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._partitions_def.get_index_for_partition_key(partition_key, self._current_time)
+
+    def __len__(self) -> int:
+        return self._num_partitions
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, Sequence[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._num_partitions)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._partitions_def.get_partition_keys_between_indexes(
+                start, stop, current_time=self._current_time
+            )
+
+        if index < 0:
+            index += self._num_partitions
+        if not 0 <= index < self._num_partitions:
+            raise IndexError("partition key index out of range")
+        return self._partitions_def.get_partition_keys_between_indexes(
+            index, index + 1, current_time=self._current_time
+        )[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self[:])
+
+
+class MultiPartitionKeySpace(Sequence[MultiPartitionKey]):
+    """The partition keys of a MultiPartitionsDefinition, in the same order as
+    MultiPartitionsDefinition.get_partition_keys, without materializing the cross-product of the
+    partition keys of each dimension.
+
+    Supports len, membership checks, indexing, slicing and index lookup in time proportional to
+    the number of keys accessed, and iteration over the keys that share a dimension value.
+    """
+
+    def __init__(
+        self,
+        partitions_defs: Sequence[PartitionDimensionDefinition],
+        current_time: datetime,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+    ):
+        self._dimension_names = [dim.name for dim in partitions_defs]
+        self._dimension_keys = [
+            _TimeWindowDimensionKeys(dim.partitions_def, current_time)
+            if isinstance(dim.partitions_def, TimeWindowPartitionsDefinition)
+            else PartitionKeyIndex.for_partitions_def(dim.partitions_def, dynamic_partitions_store)
+            for dim in partitions_defs
+        ]
+
+        # the number of keys between consecutive values of each dimension, as in a row-major array
+        self._strides = [1] * len(self._dimension_keys)
+        for i in reversed(range(len(self._dimension_keys) - 1)):
+            self._strides[i] = self._strides[i + 1] * len(self._dimension_keys[i + 1])
+
+    def _dimension_idx(self, dimension_name: str) -> int:
+        check.invariant(
+            dimension_name in self._dimension_names,
+            f"Dimension {dimension_name} not found in MultiPartitionsDefinition with dimensions"
+            f" {self._dimension_names}",
+        )
+        return self._dimension_names.index(dimension_name)
+
+    def _build_key(self, dimension_partition_keys: Iterable[str]) -> MultiPartitionKey:
+        return MultiPartitionKey(dict(zip(self._dimension_names, dimension_partition_keys)))
+
+    def get_dimension_partition_keys(self, dimension_name: str) -> Sequence[str]:
+        """Returns the ordered partition keys of a single dimension."""
+        return self._dimension_keys[self._dimension_idx(dimension_name)].partition_keys
+
+    def get_dimension_ordinal(self, dimension_name: str, partition_key: str) -> Optional[int]:
+        """Returns the position of the partition key within the partition keys of the given
+        dimension, or None if it is not a partition key of the dimension.
+        """
+        return self._dimension_keys[self._dimension_idx(dimension_name)].get_ordinal(partition_key)
+
+    def get_keys_with_dimension_value(
+        self, dimension_name: str, dimension_partition_key: str
+    ) -> Sequence[MultiPartitionKey]:
+        """Returns the partition keys that have the given partition key in the given dimension,
+        ordered by the partition keys of the other dimensions.
+        """
+        dimension_idx = self._dimension_idx(dimension_name)
+        partition_key_sequences = [
+            [dimension_partition_key] if i == dimension_idx else dimension_keys.partition_keys
+            for i, dimension_keys in enumerate(self._dimension_keys)
+        ]
+        return [
+            self._build_key(partition_key_tuple)
+            for partition_key_tuple in itertools.product(*partition_key_sequences)
+        ]
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        """Returns the position of the partition key within the key space, or None if it is not
+        part of the key space.
+        """
+        dimension_partition_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(dimension_partition_keys) != len(self._dimension_keys):
+            return None
+
+        ordinal = 0
+        for dimension_keys, stride, dimension_partition_key in zip(
+            self._dimension_keys, self._strides, dimension_partition_keys
+        ):
+            dimension_ordinal = dimension_keys.get_ordinal(dimension_partition_key)
+            if dimension_ordinal is None:
+                return None
+            ordinal += dimension_ordinal * stride
+        return ordinal
+
+    def index(self, value: object, start: int = 0, stop: Optional[int] = None) -> int:
+        ordinal = self.get_ordinal(value) if isinstance(value, str) else None
+        if ordinal is None or ordinal not in range(len(self))[start:stop]:
+            raise ValueError(f"{value} is not in the partition key space")
+        return ordinal
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, str) and self.get_ordinal(value) is not None
+
+    def __len__(self) -> int:
+        return self._strides[0] * len(self._dimension_keys[0])
+
+    @overload
+    def __getitem__(self, index: int) -> MultiPartitionKey: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[MultiPartitionKey]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[MultiPartitionKey, Sequence[MultiPartitionKey]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        num_partitions = len(self)
+        if index < 0:
+            index += num_partitions
+        if not 0 <= index < num_partitions:
+            raise IndexError("partition key index out of range")
+        return self._build_key(
+            dimension_keys.partition_keys[index // stride % len(dimension_keys)]
+            for dimension_keys, stride in zip(self._dimension_keys, self._strides)
+        )
+
+    def __iter__(self) -> Iterator[MultiPartitionKey]:
+        for partition_key_tuple in itertools.product(
+            *(dimension_keys.partition_keys for dimension_keys in self._dimension_keys)
+        ):
+            yield self._build_key(partition_key_tuple)
+
+    def get_partition_key_ranges(
+        self, partition_keys: Iterable[str], grouping_dimension_name: str
+    ) -> Sequence[PartitionKeyRange]:
+        """Returns the ranges of the given partition keys, where each range holds the grouping
+        dimension constant and spans consecutive keys of the other dimension.
+        """
+        check.invariant(len(self._dimension_keys) == 2, "Expected exactly two dimensions")
+        grouping_idx = self._dimension_idx(grouping_dimension_name)
+        other_idx = 1 - grouping_idx
+        other_dimension_keys = self._dimension_keys[other_idx]
+
+        other_ordinals_by_grouping_key: dict[str, list[int]] = {}
+        for partition_key in partition_keys:
+            dimension_partition_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+            other_ordinal = other_dimension_keys.get_ordinal(dimension_partition_keys[other_idx])
+            if other_ordinal is not None:
+                other_ordinals_by_grouping_key.setdefault(
+                    dimension_partition_keys[grouping_idx], []
+                ).append(other_ordinal)
+
+        def _build_key(grouping_key: str, other_ordinal: int) -> MultiPartitionKey:
+            keys = [grouping_key, grouping_key]
+            keys[other_idx] = other_dimension_keys.partition_keys[other_ordinal]
+            return self._build_key(keys)
+
+        ranges = []
+        for grouping_key, other_ordinals in other_ordinals_by_grouping_key.items():
+            other_ordinals.sort()
+            range_start = prev = other_ordinals[0]
+            for other_ordinal in [*other_ordinals[1:], None]:
+                if other_ordinal is not None and other_ordinal <= prev + 1:
+                    prev = other_ordinal
+                    continue
+                ranges.append(
+                    PartitionKeyRange(
+                        _build_key(grouping_key, range_start), _build_key(grouping_key, prev)
+                    )
+                )
+                if other_ordinal is not None:
+                    range_start = prev = other_ordinal
+        return ranges
+
+
 class MultiPartitionsDefinition(PartitionsDefinition[MultiPartitionKey]):
     """Takes the cross-product of partitions from two partitions definitions.
 
@@ -236,6 +454,19 @@ def get_partition_keys_in_range(
             for partition_key_tuple in itertools.product(*partition_key_sequences)
         ]
 
+    def deserialize_subset(
+        self,
+        serialized: str,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> PartitionsSubset:
+        if MultiPartitionsSubset.is_serialized_multi_partitions_subset(serialized):
+            return MultiPartitionsSubset.from_serialized_multi_partitions_subset(
+                self, serialized, dynamic_partitions_store=dynamic_partitions_store
+            )
+        return super().deserialize_subset(
+            serialized, dynamic_partitions_store=dynamic_partitions_store
+        )
+
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
     ) -> str:
@@ -282,33 +513,30 @@ def has_partition_key(
                 " not the dimensions of the partitions definition."
             )
 
-        for dimension in self.partitions_defs:
-            if not dimension.partitions_def.has_partition_key(
-                partition_key.keys_by_dimension[dimension.name],
-                current_time=current_time,
-                dynamic_partitions_store=dynamic_partitions_store,
-            ):
-                return False
-        return True
+        return partition_key in self.get_partition_key_space(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+
+    def get_partition_key_space(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> MultiPartitionKeySpace:
+        """Returns a sequence of the partition keys of this partitions definition that computes
+        keys on demand, rather than materializing every key.
+        """
+        return MultiPartitionKeySpace(
+            self._partitions_defs,
+            current_time=current_time or get_current_datetime(),
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
 
     # store results for repeated calls with the same current_time
     @lru_cache(maxsize=1)
     def _get_partition_keys(
         self, current_time: datetime, dynamic_partitions_store: Optional[DynamicPartitionsStore]
     ) -> Sequence[MultiPartitionKey]:
-        partition_key_sequences = [
-            partition_dim.partitions_def.get_partition_keys(
-                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
-            )
-            for partition_dim in self._partitions_defs
-        ]
-
-        return [
-            MultiPartitionKey(
-                {self._partitions_defs[i].name: key for i, key in enumerate(partition_key_tuple)}
-            )
-            for partition_key_tuple in itertools.product(*partition_key_sequences)
-        ]
+        return list(self.get_partition_key_space(current_time, dynamic_partitions_store))
 
     @public
     def get_partition_keys(
@@ -488,54 +716,353 @@ def get_multipartition_keys_with_dimension_value(
         check.str_param(dimension_name, "dimension_name")
         check.str_param(dimension_partition_key, "dimension_partition_key")
 
-        matching_dimensions = [
-            dimension for dimension in self.partitions_defs if dimension.name == dimension_name
-        ]
-        other_dimensions = [
-            dimension for dimension in self.partitions_defs if dimension.name != dimension_name
-        ]
-
-        check.invariant(
-            len(matching_dimensions) == 1,
-            f"Dimension {dimension_name} not found in MultiPartitionsDefinition with dimensions"
-            f" {[dim.name for dim in self.partitions_defs]}",
-        )
+        return self.get_partition_key_space(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        ).get_keys_with_dimension_value(dimension_name, dimension_partition_key)
 
-        partition_sequences = [
-            partition_dim.partitions_def.get_partition_keys(
+    def get_num_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> int:
+        return len(
+            self.get_partition_key_space(
                 current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
             )
-            for partition_dim in other_dimensions
-        ] + [[dimension_partition_key]]
+        )
+
+
+class MultiPartitionsSubset(PartitionsSubset):
+    """A subset of the partitions of a MultiPartitionsDefinition, stored as a subset of the primary
+    dimension for each key of the secondary dimension. When the primary dimension is time
+    partitioned, each of these is a TimeWindowPartitionsSubset, so contiguous runs of time
+    partitions are stored as a single time window.
+
+    Set operations between subsets of the same partitions definition are done per secondary key,
+    and key ranges are computed from the ranges of each primary dimension subset.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # Version 1 is the format of DefaultPartitionsSubset, which is still readable.
+    SERIALIZATION_VERSION = 2
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Mapping[str, PartitionsSubset],
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        self._subsets_by_secondary_key = {
+            secondary_key: subset
+            for secondary_key, subset in check.mapping_param(
+                subsets_by_secondary_key, "subsets_by_secondary_key", key_type=str
+            ).items()
+            if not subset.is_empty
+        }
+
+        dimension_names = partitions_def.partition_dimension_names
+        self._primary_idx = dimension_names.index(partitions_def.primary_dimension.name)
+
+    @classmethod
+    def from_partition_keys(
+        cls, partitions_def: MultiPartitionsDefinition, partition_keys: Iterable[str]
+    ) -> Optional["MultiPartitionsSubset"]:
+        """Returns None if any of the partition keys do not have a key for each dimension."""
+        return cls(partitions_def, {}).with_partition_keys_if_valid(partition_keys)
+
+    @classmethod
+    def from_subset(
+        cls, subset: PartitionsSubset, partitions_def: MultiPartitionsDefinition
+    ) -> PartitionsSubset:
+        """Converts the subset to a MultiPartitionsSubset. If the subset contains keys that are not
+        multi-partition keys, the subset is returned unchanged.
+        """
+        if isinstance(subset, MultiPartitionsSubset) and subset.partitions_def == partitions_def:
+            return subset
+        multi_partitions_subset = cls.from_partition_keys(
+            partitions_def, subset.get_partition_keys()
+        )
+        return multi_partitions_subset if multi_partitions_subset is not None else subset
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
 
-        # Names of partitions dimensions in the same order as partition_sequences
-        partition_dim_names = [dim.name for dim in other_dimensions] + [dimension_name]
+    @property
+    def subsets_by_secondary_key(self) -> Mapping[str, PartitionsSubset]:
+        """Subsets of the primary dimension, keyed by partition key of the secondary dimension."""
+        return self._subsets_by_secondary_key
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._subsets_by_secondary_key
+
+    def _empty_primary_subset(self) -> PartitionsSubset:
+        primary_partitions_def = self._partitions_def.primary_dimension.partitions_def
+        if isinstance(primary_partitions_def, StaticPartitionsDefinition):
+            return BitmapPartitionsSubset.create_empty_subset(primary_partitions_def)
+        return primary_partitions_def.empty_subset()
+
+    def _split_key(self, partition_key: str) -> Optional[tuple[str, str]]:
+        """Returns the primary and secondary dimension keys of a partition key."""
+        dimension_partition_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(dimension_partition_keys) != 2:
+            return None
+        return (
+            dimension_partition_keys[self._primary_idx],
+            dimension_partition_keys[1 - self._primary_idx],
+        )
 
+    def _join_keys(self, primary_key: str, secondary_key: str) -> str:
+        return MULTIPARTITION_KEY_DELIMITER.join(
+            [primary_key, secondary_key] if self._primary_idx == 0 else [secondary_key, primary_key]
+        )
+
+    def _build_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {
+                self._partitions_def.primary_dimension.name: primary_key,
+                self._partitions_def.secondary_dimension.name: secondary_key,
+            }
+        )
+
+    def _is_compatible(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and other.partitions_def == self._partitions_def
+        )
+
+    def _combine(
+        self,
+        other: "MultiPartitionsSubset",
+        op: Callable[[PartitionsSubset, PartitionsSubset], PartitionsSubset],
+        secondary_keys: Iterable[str],
+    ) -> "MultiPartitionsSubset":
+        empty_primary_subset = self._empty_primary_subset()
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: op(
+                    self._subsets_by_secondary_key.get(secondary_key, empty_primary_subset),
+                    other.subsets_by_secondary_key.get(secondary_key, empty_primary_subset),
+                )
+                for secondary_key in secondary_keys
+            },
+        )
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        # returns a set for parity with DefaultPartitionsSubset, which this subset stands in for
+        return {
+            self._join_keys(primary_key, secondary_key)
+            for secondary_key, primary_subset in self._subsets_by_secondary_key.items()
+            for primary_key in primary_subset.get_partition_keys()
+        }
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        primary_partitions_def = self._partitions_def.primary_dimension.partitions_def
+        secondary_keys = self._partitions_def.secondary_dimension.partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        empty_primary_subset = self._empty_primary_subset()
         return [
-            MultiPartitionKey(
-                {
-                    partition_dim_names[i]: partition_key
-                    for i, partition_key in enumerate(partitions_tuple)
-                }
+            self._build_key(primary_key, secondary_key)
+            for secondary_key in secondary_keys
+            for primary_key in self._subsets_by_secondary_key.get(
+                secondary_key, empty_primary_subset
+            ).get_partition_keys_not_in_subset(
+                primary_partitions_def,
+                current_time=current_time,
+                dynamic_partitions_store=dynamic_partitions_store,
             )
-            for partitions_tuple in itertools.product(*partition_sequences)
         ]
 
-    def get_num_partitions(
+    def get_partition_key_ranges(
         self,
+        partitions_def: PartitionsDefinition,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
-    ) -> int:
-        # Static partitions definitions can contain duplicate keys (will throw error in 1.3.0)
-        # In the meantime, relying on get_num_partitions to handle duplicates to display
-        # correct counts in the Dagster UI.
-        dimension_counts = [
-            dim.partitions_def.get_num_partitions(
-                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+    ) -> Sequence[PartitionKeyRange]:
+        primary_partitions_def = self._partitions_def.primary_dimension.partitions_def
+        return [
+            PartitionKeyRange(
+                self._build_key(primary_range.start, secondary_key),
+                self._build_key(primary_range.end, secondary_key),
+            )
+            for secondary_key, primary_subset in self._subsets_by_secondary_key.items()
+            for primary_range in primary_subset.get_partition_key_ranges(
+                primary_partitions_def,
+                current_time=current_time,
+                dynamic_partitions_store=dynamic_partitions_store,
             )
-            for dim in self.partitions_defs
         ]
-        return reduce(lambda x, y: x * y, dimension_counts, 1)
+
+    def with_partition_keys_if_valid(
+        self, partition_keys: Iterable[str]
+    ) -> Optional["MultiPartitionsSubset"]:
+        """Returns None if any of the partition keys do not have a key for each dimension."""
+        primary_keys_by_secondary_key: dict[str, list[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            split_key = self._split_key(partition_key)
+            if split_key is None:
+                return None
+            primary_key, secondary_key = split_key
+            primary_keys_by_secondary_key[secondary_key].append(primary_key)
+
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        empty_primary_subset = self._empty_primary_subset()
+        for secondary_key, primary_keys in primary_keys_by_secondary_key.items():
+            subsets_by_secondary_key[secondary_key] = subsets_by_secondary_key.get(
+                secondary_key, empty_primary_subset
+            ).with_partition_keys(primary_keys)
+        return MultiPartitionsSubset(self._partitions_def, subsets_by_secondary_key)
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_keys = list(partition_keys)
+        subset = self.with_partition_keys_if_valid(partition_keys)
+        if subset is None:
+            return DefaultPartitionsSubset(self.get_partition_keys()).with_partition_keys(
+                partition_keys
+            )
+        return subset
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            other = cast(MultiPartitionsSubset, other)
+            return self._combine(
+                other,
+                lambda a, b: a | b,
+                self._subsets_by_secondary_key.keys() | other.subsets_by_secondary_key.keys(),
+            )
+        return super().__or__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return self._combine(
+                cast(MultiPartitionsSubset, other),
+                lambda a, b: a - b,
+                self._subsets_by_secondary_key.keys(),
+            )
+        return super().__sub__(other)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            other = cast(MultiPartitionsSubset, other)
+            return self._combine(
+                other,
+                lambda a, b: a & b,
+                self._subsets_by_secondary_key.keys() & other.subsets_by_secondary_key.keys(),
+            )
+        return super().__and__(other)
+
+    def serialize(self) -> str:
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                # sort to ensure that equivalent subsets have identical serialized forms
+                "subsets_by_secondary_key": {
+                    secondary_key: self._subsets_by_secondary_key[secondary_key].serialize()
+                    for secondary_key in sorted(self._subsets_by_secondary_key)
+                },
+            }
+        )
+
+    @classmethod
+    def is_serialized_multi_partitions_subset(cls, serialized: str) -> bool:
+        # cheap check that avoids parsing the JSON of subsets in other formats
+        return serialized.startswith(
+            f'{{"version": {cls.SERIALIZATION_VERSION}, "subsets_by_secondary_key": '
+        )
+
+    @classmethod
+    def from_serialized_multi_partitions_subset(
+        cls,
+        partitions_def: MultiPartitionsDefinition,
+        serialized: str,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "MultiPartitionsSubset":
+        data = json.loads(serialized)
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return cls(
+            partitions_def,
+            {
+                secondary_key: primary_partitions_def.deserialize_subset(
+                    serialized_subset, dynamic_partitions_store=dynamic_partitions_store
+                )
+                for secondary_key, serialized_subset in data["subsets_by_secondary_key"].items()
+            },
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        return partitions_def.deserialize_subset(serialized)
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiPartitionsSubset) and self._is_compatible(other):
+            return self._subsets_by_secondary_key == other.subsets_by_secondary_key
+        return isinstance(
+            other, (MultiPartitionsSubset, DefaultPartitionsSubset)
+        ) and self.get_partition_keys() == set(other.get_partition_keys())
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.get_partition_keys()))
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self._subsets_by_secondary_key.values())
+
+    def __contains__(self, value) -> bool:
+        split_key = self._split_key(value) if isinstance(value, str) else None
+        if split_key is None:
+            return False
+        primary_key, secondary_key = split_key
+        primary_subset = self._subsets_by_secondary_key.get(secondary_key)
+        return primary_subset is not None and primary_key in primary_subset
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset(subsets_by_secondary_key={self._subsets_by_secondary_key})"
+
+    def empty_subset(self) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(self._partitions_def, {})
+
+    @classmethod
+    def create_empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        return cls(
+            check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition), {}
+        )
+
+    def to_serializable_subset(self) -> DefaultPartitionsSubset:
+        return DefaultPartitionsSubset(self.get_partition_keys())
 
 
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
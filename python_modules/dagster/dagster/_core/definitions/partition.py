@@ -1,11 +1,13 @@
 import copy
 import hashlib
 import json
+import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (  # noqa: UP035
     AbstractSet,
     Any,
@@ -228,7 +230,15 @@ def subset_with_all_partitions(
             )
         )
 
-    def deserialize_subset(self, serialized: str) -> "PartitionsSubset":
+    def deserialize_subset(
+        self,
+        serialized: str,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        if BitmapPartitionsSubset.is_serialized_bitmap(serialized):
+            return BitmapPartitionsSubset.from_serialized_bitmap(
+                self, serialized, dynamic_partitions_store=dynamic_partitions_store
+            )
         return self.partitions_subset_class.from_serialized(self, serialized)
 
     def can_deserialize_subset(
@@ -345,6 +355,10 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @cached_method
+    def get_partition_key_index(self) -> "PartitionKeyIndex":
+        return PartitionKeyIndex(self._partition_keys)
+
     @public
     def get_partition_keys(
         self,
@@ -1169,16 +1183,11 @@ def get_partition_key_ranges(
             primary_keys_in_subset = set()
             secondary_keys_in_subset = set()
             for partition_key in self.subset:
-                primary_keys_in_subset.add(
-                    partitions_def.get_partition_key_from_str(partition_key).keys_by_dimension[
-                        primary_dimension.name
-                    ]
-                )
-                secondary_keys_in_subset.add(
-                    partitions_def.get_partition_key_from_str(partition_key).keys_by_dimension[
-                        secondary_dimension.name
-                    ]
-                )
+                keys_by_dimension = partitions_def.get_partition_key_from_str(
+                    partition_key
+                ).keys_by_dimension
+                primary_keys_in_subset.add(keys_by_dimension[primary_dimension.name])
+                secondary_keys_in_subset.add(keys_by_dimension[secondary_dimension.name])
 
             # for efficiency, group the keys by whichever dimension has fewer distinct keys
             grouping_dimension = (
@@ -1186,22 +1195,10 @@ def get_partition_key_ranges(
                 if len(primary_keys_in_subset) <= len(secondary_keys_in_subset)
                 else secondary_dimension
             )
-            grouping_keys = (
-                primary_keys_in_subset
-                if grouping_dimension == primary_dimension
-                else secondary_keys_in_subset
-            )
 
-            results = []
-            for grouping_key in grouping_keys:
-                keys = partitions_def.get_multipartition_keys_with_dimension_value(
-                    dimension_name=grouping_dimension.name,
-                    dimension_partition_key=grouping_key,
-                    current_time=current_time,
-                    dynamic_partitions_store=dynamic_partitions_store,
-                )
-                results.extend(self.get_ranges_for_keys(keys))
-            return results
+            return partitions_def.get_partition_key_space(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            ).get_partition_key_ranges(self.subset, grouping_dimension_name=grouping_dimension.name)
 
         else:
             partition_keys = partitions_def.get_partition_keys(
@@ -1261,6 +1258,8 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1284,6 +1283,362 @@ def empty_subset(
         return DefaultPartitionsSubset()
 
 
+class PartitionKeyIndex:
+    """An ordered sequence of partition keys, with constant-time lookup of the position (ordinal)
+    of each key within the sequence.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self._partition_keys = partition_keys
+
+    @cached_property
+    def _ordinals(self) -> Mapping[str, int]:
+        return {key: i for i, key in enumerate(self._partition_keys)}
+
+    @staticmethod
+    def for_partitions_def(
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionKeyIndex":
+        if isinstance(partitions_def, StaticPartitionsDefinition):
+            return partitions_def.get_partition_key_index()
+        partition_keys = partitions_def.get_partition_keys(
+            dynamic_partitions_store=dynamic_partitions_store
+        )
+        if isinstance(partitions_def, DynamicPartitionsDefinition) and partitions_def.name:
+            return _get_dynamic_partition_key_index(partitions_def.name, partition_keys)
+        return PartitionKeyIndex(partition_keys)
+
+    @property
+    def partition_keys(self) -> Sequence[str]:
+        return self._partition_keys
+
+    @cached_property
+    def unique_id(self) -> str:
+        """Matches the serializable unique identifier of the partitions definition that the keys
+        were fetched from.
+        """
+        return hashlib.sha1(json.dumps(self._partition_keys).encode("utf-8")).hexdigest()
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals.get(partition_key)
+
+    def has_same_keys(self, other: "PartitionKeyIndex") -> bool:
+        return self is other or self._partition_keys == other.partition_keys
+
+    def __len__(self) -> int:
+        return len(self._partition_keys)
+
+
+# Number of dynamic partitions definitions whose latest key index is kept in memory
+_MAX_CACHED_DYNAMIC_PARTITION_KEY_INDEXES = 128
+
+# The key index of the latest snapshot of keys of each dynamic partitions definition, by name, so
+# that the ordinals and unique id are only computed once per set of keys rather than on every
+# deserialization. Only one snapshot is kept per definition, since older ones are rarely used again.
+_dynamic_partition_key_indexes: dict[str, PartitionKeyIndex] = {}
+
+
+def _get_dynamic_partition_key_index(
+    partitions_def_name: str, partition_keys: Sequence[str]
+) -> PartitionKeyIndex:
+    cached = _dynamic_partition_key_indexes.get(partitions_def_name)
+    # dynamic partitions stores that cache their keys return the same sequence on each call, in
+    # which case the keys don't need to be compared
+    if cached is not None and (
+        cached.partition_keys is partition_keys
+        or (
+            len(cached.partition_keys) == len(partition_keys)
+            and cached.partition_keys == partition_keys
+        )
+    ):
+        return cached
+
+    key_index = PartitionKeyIndex(partition_keys)
+    _dynamic_partition_key_indexes.pop(partitions_def_name, None)
+    _dynamic_partition_key_indexes[partitions_def_name] = key_index
+    if len(_dynamic_partition_key_indexes) > _MAX_CACHED_DYNAMIC_PARTITION_KEY_INDEXES:
+        _dynamic_partition_key_indexes.pop(next(iter(_dynamic_partition_key_indexes)), None)
+    return key_index
+
+
+def _bits_from_ordinals(ordinals: Iterable[int], num_bits: int) -> int:
+    # build the bitmap as a string of binary digits, most significant bit first, which is linear
+    # in the number of bits, rather than or-ing in one bit at a time
+    if num_bits == 0:
+        return 0
+    digits = bytearray(b"0" * num_bits)
+    for ordinal in ordinals:
+        digits[num_bits - 1 - ordinal] = ord("1")
+    return int(digits, 2)
+
+
+def _get_bit_runs(bits: int) -> Iterable[tuple[int, int]]:
+    """Yields (start, end) ordinal pairs for each run of consecutive set bits, in ascending order."""
+    # reverse the binary digits so that the string position of each digit is its ordinal
+    for match in re.finditer("1+", bin(bits)[:1:-1]):
+        yield match.start(), match.end()
+
+
+class BitmapPartitionsSubset(PartitionsSubset):
+    """A subset of the partitions of a statically or dynamically partitioned asset, represented as
+    a bitmap over the ordered partition keys of the partitions definition.
+
+    Set operations between bitmap subsets over the same partition keys are done with integer
+    bitwise operations, and the subset is serialized as alternating lengths of runs of
+    excluded / included partitions. Operations involving keys that are not part of the key index
+    fall back to a DefaultPartitionsSubset.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # Version 1 is the format of DefaultPartitionsSubset, which is still readable.
+    SERIALIZATION_VERSION = 2
+
+    def __init__(self, key_index: PartitionKeyIndex, bits: int = 0):
+        self._key_index = check.inst_param(key_index, "key_index", PartitionKeyIndex)
+        self._bits = check.int_param(bits, "bits")
+
+    @classmethod
+    def from_partition_keys(
+        cls, key_index: PartitionKeyIndex, partition_keys: Iterable[str]
+    ) -> Optional["BitmapPartitionsSubset"]:
+        """Returns None if any of the partition keys are not part of the key index."""
+        ordinals = []
+        for partition_key in partition_keys:
+            ordinal = key_index.get_ordinal(partition_key)
+            if ordinal is None:
+                return None
+            ordinals.append(ordinal)
+        return cls(key_index, _bits_from_ordinals(ordinals, len(key_index)))
+
+    @classmethod
+    def from_subset(
+        cls,
+        subset: PartitionsSubset,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> PartitionsSubset:
+        """Converts the subset to a bitmap subset over the partition keys of the given partitions
+        definition. If the subset contains keys that do not exist in the partitions definition,
+        the subset is returned unchanged.
+        """
+        key_index = PartitionKeyIndex.for_partitions_def(partitions_def, dynamic_partitions_store)
+        if isinstance(subset, BitmapPartitionsSubset) and subset.key_index.has_same_keys(key_index):
+            return subset
+        bitmap_subset = cls.from_partition_keys(key_index, subset.get_partition_keys())
+        return bitmap_subset if bitmap_subset is not None else subset
+
+    @property
+    def key_index(self) -> PartitionKeyIndex:
+        return self._key_index
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def is_empty(self) -> bool:
+        return self._bits == 0
+
+    def get_ordinal_runs(self) -> Sequence[tuple[int, int]]:
+        """Returns a [start, end) pair of ordinals in the key index for each run of consecutive
+        partitions in the subset, in ascending order.
+        """
+        return list(_get_bit_runs(self._bits))
+
+    def _with_bits(self, bits: int) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(self._key_index, bits)
+
+    def _is_compatible(self, other: PartitionsSubset) -> bool:
+        return isinstance(other, BitmapPartitionsSubset) and self._key_index.has_same_keys(
+            other.key_index
+        )
+
+    def _to_default_subset(self) -> DefaultPartitionsSubset:
+        return DefaultPartitionsSubset(self.get_partition_keys())
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        # returns a set for parity with DefaultPartitionsSubset, which this subset stands in for
+        return set(self.get_ordered_partition_keys())
+
+    def get_ordered_partition_keys(self) -> Sequence[str]:
+        partition_keys = self._key_index.partition_keys
+        return [
+            partition_key
+            for start, end in _get_bit_runs(self._bits)
+            for partition_key in partition_keys[start:end]
+        ]
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        key_index = PartitionKeyIndex.for_partitions_def(partitions_def, dynamic_partitions_store)
+        if not self._key_index.has_same_keys(key_index):
+            return self._to_default_subset().get_partition_keys_not_in_subset(
+                partitions_def, current_time, dynamic_partitions_store
+            )
+        all_bits = (1 << len(key_index)) - 1
+        return self._with_bits(all_bits & ~self._bits).get_ordered_partition_keys()
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        key_index = PartitionKeyIndex.for_partitions_def(partitions_def, dynamic_partitions_store)
+        if not self._key_index.has_same_keys(key_index):
+            return self._to_default_subset().get_partition_key_ranges(
+                partitions_def, current_time, dynamic_partitions_store
+            )
+        partition_keys = self._key_index.partition_keys
+        return [
+            PartitionKeyRange(partition_keys[start], partition_keys[end - 1])
+            for start, end in _get_bit_runs(self._bits)
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_keys = list(partition_keys)
+        other = BitmapPartitionsSubset.from_partition_keys(self._key_index, partition_keys)
+        if other is None:
+            return self._to_default_subset().with_partition_keys(partition_keys)
+        return self._with_bits(self._bits | other.bits)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return self._with_bits(self._bits | cast(BitmapPartitionsSubset, other).bits)
+        return super().__or__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return self._with_bits(self._bits & ~cast(BitmapPartitionsSubset, other).bits)
+        return super().__sub__(other)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self._is_compatible(other):
+            return self._with_bits(self._bits & cast(BitmapPartitionsSubset, other).bits)
+        return super().__and__(other)
+
+    def serialize(self) -> str:
+        run_lengths = []
+        prev_end = 0
+        for start, end in _get_bit_runs(self._bits):
+            run_lengths.extend([start - prev_end, end - start])
+            prev_end = end
+
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partitions_def_id": self._key_index.unique_id,
+                "num_partitions": len(self._key_index),
+                # alternating lengths of runs of excluded and included partitions, starting with
+                # excluded partitions
+                "run_lengths": run_lengths,
+            }
+        )
+
+    @classmethod
+    def is_serialized_bitmap(cls, serialized: str) -> bool:
+        # cheap check that avoids parsing the JSON of subsets in other formats. Matches on the
+        # leading keys written by serialize, since a partition key may itself be "run_lengths"
+        return serialized.startswith(
+            f'{{"version": {cls.SERIALIZATION_VERSION}, "partitions_def_id": '
+        )
+
+    @classmethod
+    def from_serialized_bitmap(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "BitmapPartitionsSubset":
+        data = json.loads(serialized)
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        key_index = PartitionKeyIndex.for_partitions_def(partitions_def, dynamic_partitions_store)
+        num_partitions = data["num_partitions"]
+        if key_index.unique_id != data["partitions_def_id"]:
+            # dynamic partitions are usually only appended to, in which case the partition keys
+            # the subset was serialized with are a prefix of the current partition keys
+            prefix_key_index = PartitionKeyIndex(key_index.partition_keys[:num_partitions])
+            if prefix_key_index.unique_id != data["partitions_def_id"]:
+                raise DagsterInvalidDeserializationVersionError(
+                    "Attempted to deserialize a partition subset that was serialized with"
+                    " different partition keys than the current partitions definition."
+                )
+
+        digits = "".join(
+            ("1" if i % 2 else "0") * run_length for i, run_length in enumerate(data["run_lengths"])
+        )
+        return cls(key_index, int(digits[::-1], 2) if digits else 0)
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        return partitions_def.deserialize_subset(serialized)
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # bitmap subsets are only equal over the same partition keys, so that they can be hashed
+        # by their key index and runs of partitions without materializing the keys
+        if isinstance(other, BitmapPartitionsSubset):
+            return self._is_compatible(other) and self._bits == other.bits
+        return isinstance(other, DefaultPartitionsSubset) and self.get_partition_keys() == set(
+            other.get_partition_keys()
+        )
+
+    def __hash__(self) -> int:
+        # the same runs of included partitions that serialize encodes
+        return hash((self._key_index.unique_id, tuple(_get_bit_runs(self._bits))))
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def __contains__(self, value) -> bool:
+        ordinal = self._key_index.get_ordinal(value)
+        return ordinal is not None and bool(self._bits >> ordinal & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={self.get_partition_keys()})"
+
+    def empty_subset(self) -> "BitmapPartitionsSubset":
+        return self._with_bits(0)
+
+    @classmethod
+    def create_empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> PartitionsSubset:
+        if isinstance(partitions_def, StaticPartitionsDefinition):
+            return cls(partitions_def.get_partition_key_index())
+        # the keys of other partitions definitions can't be fetched without a partitions store
+        return DefaultPartitionsSubset()
+
+    def to_serializable_subset(self) -> DefaultPartitionsSubset:
+        return self._to_default_subset()
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -0,0 +1,256 @@
+import bisect
+import itertools
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytz
+
+from dagster._utils.cronstring import get_fixed_minute_interval
+from dagster._utils.schedules import cron_string_iterator, cron_string_timestamp_iterator
+
+# Number of consecutive ticks in each block of a TimeWindowPartitionIndex
+_TICKS_PER_BLOCK = 256
+# Maximum number of blocks of ticks each TimeWindowPartitionIndex keeps in memory
+_MAX_CACHED_BLOCKS = 1024
+
+
+def _get_wall_clock_interval_seconds(cron_schedule: str) -> Optional[int]:
+    """Returns the number of seconds between consecutive ticks of the cron schedule when measured
+    in local wall-clock time, if that number is constant.
+    """
+    fixed_minute_interval = get_fixed_minute_interval(cron_schedule)
+    if fixed_minute_interval:
+        return fixed_minute_interval * 60
+    if re.fullmatch(r"\d+ \* \* \* \*", cron_schedule):
+        return 60 * 60
+    if re.fullmatch(r"\d+ \d+ \* \* \*", cron_schedule):
+        return 24 * 60 * 60
+    if re.fullmatch(r"\d+ \d+ \* \* \d+", cron_schedule):
+        return 7 * 24 * 60 * 60
+    return None
+
+
+def _get_utc_offsets_since(timezone_name: str, timestamp: float) -> Optional[set[int]]:
+    """Returns every UTC offset (in seconds) that the timezone observes at or after the given
+    timestamp, or None if the offsets cannot be determined.
+    """
+    try:
+        tz = pytz.timezone(timezone_name)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    transition_times = getattr(tz, "_utc_transition_times", None)
+    transition_info = getattr(tz, "_transition_info", None)
+    if transition_times is None or transition_info is None:
+        # static timezone, e.g. UTC or Etc/GMT+5
+        offset = tz.utcoffset(None)
+        return {int(offset.total_seconds())} if offset is not None else None
+
+    naive_utc = datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None)
+    first_transition_idx = max(bisect.bisect_right(transition_times, naive_utc) - 1, 0)
+    return {int(info[0].total_seconds()) for info in transition_info[first_transition_idx:]}
+
+
+def _has_uniform_ticks(cron_schedule: str, timezone_name: str, origin_timestamp: float) -> bool:
+    interval = _get_wall_clock_interval_seconds(cron_schedule)
+    if interval is None:
+        return False
+
+    # Ticks that are evenly spaced in wall-clock time are also evenly spaced in absolute time as
+    # long as every UTC offset change shifts the wall clock by a multiple of the interval, e.g.
+    # hourly ticks across a one hour DST transition.
+    offsets = _get_utc_offsets_since(timezone_name, origin_timestamp)
+    return offsets is not None and len({offset % interval for offset in offsets}) == 1
+
+
+class TimeWindowPartitionIndex:
+    """Maps between integer partition indexes and the timestamps of the cron ticks that bound
+    the time windows of a TimeWindowPartitionsDefinition.
+
+    Index 0 corresponds to the first cron tick at or after the start of the partitions
+    definition, and the time window of the partition with index ``i`` spans from tick ``i`` to
+    tick ``i + 1``. Negative indexes refer to ticks before the start.
+
+    When ticks are evenly spaced in absolute time (e.g. fixed-minute-interval schedules, or any
+    schedule with a constant wall-clock interval in a timezone without offset changes), index
+    arithmetic is done in closed form. Otherwise, ticks are read with the cron iterator, which is
+    backed by the shared cron tick table (see `get_cron_tick_table`), in blocks of
+    _TICKS_PER_BLOCK consecutive indexes. Only the timestamp of the first tick of each block is
+    kept for the life of the index, along with the _MAX_CACHED_BLOCKS most recently used blocks.
+    Lookups are binary searches, a lookup far from the start only keeps one timestamp per block
+    it passes, and the exact DST semantics of the cron iterator are preserved.
+    """
+
+    def __init__(self, cron_schedule: str, timezone: str, start_timestamp: float):
+        self._cron_schedule = cron_schedule
+        self._timezone = timezone
+
+        origin_timestamp = next(
+            tick.timestamp()
+            for tick in cron_string_iterator(start_timestamp, cron_schedule, timezone)
+            if tick.timestamp() >= start_timestamp
+        )
+        self._origin_timestamp = origin_timestamp
+
+        self._interval: Optional[int] = (
+            _get_wall_clock_interval_seconds(cron_schedule)
+            if _has_uniform_ticks(cron_schedule, timezone, origin_timestamp)
+            else None
+        )
+
+        # timestamps of the first ticks of blocks 0, 1, 2, ..., i.e. of ticks 0, K, 2K, ...
+        self._forward_block_starts = array("d", [origin_timestamp])
+        # negated timestamps of the first ticks of blocks -1, -2, -3, ..., i.e. of ticks -K, -2K,
+        # ..., which keeps the table in ascending order
+        self._negated_backward_block_starts = array("d")
+        self._blocks: OrderedDict[int, array[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def origin_timestamp(self) -> float:
+        return self._origin_timestamp
+
+    @property
+    def has_fixed_interval(self) -> bool:
+        return self._interval is not None
+
+    def timestamp_for_index(self, index: int) -> float:
+        """Returns the timestamp of the cron tick with the given index."""
+        if index >= 0 and self._interval is not None:
+            return self._origin_timestamp + index * self._interval
+
+        block_idx, offset = divmod(index, _TICKS_PER_BLOCK)
+        return self._get_block(block_idx)[offset]
+
+    def floor_index(self, timestamp: float) -> int:
+        """Returns the index of the latest cron tick at or before the given timestamp."""
+        if timestamp >= self._origin_timestamp:
+            if self._interval is not None:
+                return int((timestamp - self._origin_timestamp) // self._interval)
+
+            block_starts = self._forward_block_starts
+            if block_starts[-1] <= timestamp:
+                self._extend_forward(min_last_value=timestamp)
+            block_idx = bisect.bisect_right(block_starts, timestamp) - 1
+        else:
+            negated_block_starts = self._negated_backward_block_starts
+            if not negated_block_starts or negated_block_starts[-1] < -timestamp:
+                self._extend_backward(min_last_value=-timestamp)
+            block_idx = -(bisect.bisect_left(negated_block_starts, -timestamp) + 1)
+
+        block = self._get_block(block_idx)
+        return block_idx * _TICKS_PER_BLOCK + bisect.bisect_right(block, timestamp) - 1
+
+    def ceil_index(self, timestamp: float) -> int:
+        """Returns the index of the earliest cron tick at or after the given timestamp."""
+        index = self.floor_index(timestamp)
+        return index if self.timestamp_for_index(index) == timestamp else index + 1
+
+    def ceil_indexes(self, timestamps: Iterable[float]) -> list[int]:
+        """Returns the index of the earliest cron tick at or after each of the given timestamps."""
+        interval = self._interval
+        if interval is None:
+            return list(map(self.ceil_index, timestamps))
+
+        # ticks are only known to be evenly spaced from the origin onwards
+        origin_timestamp = self._origin_timestamp
+        return [
+            int(-((origin_timestamp - timestamp) // interval))
+            if timestamp >= origin_timestamp
+            else self.ceil_index(timestamp)
+            for timestamp in timestamps
+        ]
+
+    def _ticks_after(self, timestamp: float, num_ticks: int, ascending: bool) -> "array[float]":
+        """Returns the timestamps of the next num_ticks ticks strictly after (or strictly before,
+        if descending) the given timestamp, in iteration order.
+        """
+        return array(
+            "d",
+            itertools.islice(
+                (
+                    tick
+                    for tick in cron_string_timestamp_iterator(
+                        timestamp, self._cron_schedule, self._timezone, ascending=ascending
+                    )
+                    if (tick > timestamp if ascending else tick < timestamp)
+                ),
+                num_ticks,
+            ),
+        )
+
+    def _cache_block(self, block_idx: int, block: "array[float]") -> None:
+        # must be called with the lock held
+        self._blocks[block_idx] = block
+        self._blocks.move_to_end(block_idx)
+        while len(self._blocks) > _MAX_CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+
+    def _get_block(self, block_idx: int) -> "array[float]":
+        """Returns the sorted timestamps of the ticks with indexes in
+        [block_idx * _TICKS_PER_BLOCK, (block_idx + 1) * _TICKS_PER_BLOCK).
+        """
+        with self._lock:
+            block = self._blocks.get(block_idx)
+            if block is not None:
+                self._blocks.move_to_end(block_idx)
+                return block
+
+        if block_idx >= 0:
+            self._extend_forward(min_len=block_idx + 1)
+            block_start = self._forward_block_starts[block_idx]
+            block = array("d", [block_start])
+            block.extend(self._ticks_after(block_start, _TICKS_PER_BLOCK - 1, ascending=True))
+        else:
+            # ticks before the origin are computed going backwards in time from the next block
+            self._extend_backward(min_len=-block_idx - 1)
+            next_block_start = (
+                self._origin_timestamp
+                if block_idx == -1
+                else -self._negated_backward_block_starts[-block_idx - 2]
+            )
+            block = self._ticks_after(next_block_start, _TICKS_PER_BLOCK, ascending=False)
+            block.reverse()
+
+        with self._lock:
+            self._cache_block(block_idx, block)
+        return block
+
+    def _extend_forward(self, min_len: int = 0, min_last_value: float = float("-inf")) -> None:
+        """Computes the starts of blocks after the origin until there are at least min_len of them
+        and the last one is greater than min_last_value.
+        """
+        block_starts = self._forward_block_starts
+        with self._lock:
+            while len(block_starts) < min_len or block_starts[-1] <= min_last_value:
+                block_idx = len(block_starts) - 1
+                ticks = self._ticks_after(block_starts[-1], _TICKS_PER_BLOCK, ascending=True)
+                block = array("d", [block_starts[-1]])
+                block.extend(ticks[:-1])
+                self._cache_block(block_idx, block)
+                block_starts.append(ticks[-1])
+
+    def _extend_backward(self, min_len: int = 0, min_last_value: float = float("-inf")) -> None:
+        """Computes the negated starts of blocks before the origin until there are at least
+        min_len of them and the last one is at least min_last_value.
+        """
+        negated_block_starts = self._negated_backward_block_starts
+        with self._lock:
+            while (
+                len(negated_block_starts) < min_len
+                or not negated_block_starts
+                or negated_block_starts[-1] < min_last_value
+            ):
+                block_idx = -len(negated_block_starts) - 1
+                next_block_start = (
+                    -negated_block_starts[-1] if negated_block_starts else self._origin_timestamp
+                )
+                block = self._ticks_after(next_block_start, _TICKS_PER_BLOCK, ascending=False)
+                block.reverse()
+                self._cache_block(block_idx, block)
+                negated_block_starts.append(-block[0])
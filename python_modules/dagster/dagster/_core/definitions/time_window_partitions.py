@@ -1,13 +1,19 @@
+import bisect
 import functools
 import hashlib
+import heapq
 import json
+import math
 import re
+from array import array
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import cached_property
 from typing import Any, Callable, NamedTuple, Optional, Union, cast
 
+import pytz
+
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
 from dagster._core.definitions.partition import (
@@ -20,6 +26,7 @@
     cron_schedule_from_schedule_type_and_offsets,
 )
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
+from dagster._core.definitions.time_window_partition_index import TimeWindowPartitionIndex
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
@@ -37,12 +44,7 @@
 )
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
-from dagster._utils.schedules import (
-    cron_string_iterator,
-    cron_string_repeats_every_hour,
-    is_valid_cron_schedule,
-    reverse_cron_string_iterator,
-)
+from dagster._utils.schedules import cron_string_repeats_every_hour, is_valid_cron_schedule
 
 
 def is_second_ambiguous_time(dt: datetime, tz: str):
@@ -128,6 +130,251 @@ def dst_safe_strptime(date_string: str, tz: str, fmt: str) -> datetime:
         )
 
 
+# Formats whose keys can be converted arithmetically, mapped to whether they include a time of day
+_ARITHMETIC_KEY_FORMATS = {
+    DEFAULT_DATE_FORMAT: False,
+    DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE: True,
+}
+_DATE_KEY_REGEX = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_DATE_KEY_LENGTH = len("YYYY-MM-DD")
+_SECONDS_PER_DAY = 24 * 60 * 60
+# suffixes of hourly format keys for each minute of the day, e.g. "-13:45"
+_TIME_SUFFIXES = [f"-{minute // 60:02d}:{minute % 60:02d}" for minute in range(24 * 60)]
+_SECONDS_BY_TIME_SUFFIX = {suffix: minute * 60 for minute, suffix in enumerate(_TIME_SUFFIXES)}
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# strftime does not zero-pad years before 1000
+_MIN_FORMATTED_ORDINAL = date(1000, 1, 1).toordinal()
+_MAX_FORMATTED_ORDINAL = date.max.toordinal()
+# Keys and timestamps closer than this to a UTC offset transition use the DST-safe path. This
+# exceeds any UTC offset, so it can be applied to local wall-clock times as well as timestamps.
+_TRANSITION_MARGIN_SECONDS = 2 * _SECONDS_PER_DAY
+# The offset after the last known transition of a timezone is verified against the timezone used by
+# dst_safe_strptime() up to this timestamp (2100-01-01), sampling it at this interval, which is
+# shorter than any DST period.
+_OPEN_ENDED_OFFSET_VERIFIED_UNTIL = 4102444800.0
+_OPEN_ENDED_OFFSET_SAMPLE_SECONDS = 7 * _SECONDS_PER_DAY
+
+
+def _has_fixed_offset_after(timezone_name: str, timestamp: float, utc_offset: int) -> bool:
+    """Returns whether the timezone keeps the given UTC offset from the given timestamp until
+    _OPEN_ENDED_OFFSET_VERIFIED_UNTIL, i.e. no recurring DST rule applies after it.
+    """
+    tz = get_timezone(timezone_name)
+    expected_offset = timedelta(seconds=utc_offset)
+    while timestamp < _OPEN_ENDED_OFFSET_VERIFIED_UNTIL:
+        if datetime.fromtimestamp(timestamp, tz=tz).utcoffset() != expected_offset:
+            return False
+        timestamp += _OPEN_ENDED_OFFSET_SAMPLE_SECONDS
+    return True
+
+
+@functools.cache
+def _get_utc_offset_transitions(
+    timezone_name: str,
+) -> Optional[tuple[Sequence[float], Sequence[int]]]:
+    """Returns the timestamps at which the UTC offset of the timezone changes, and the offset (in
+    seconds) in effect from each of them, or None if they cannot be determined. A timezone with a
+    static offset has a single entry starting at -inf.
+
+    If the timezone no longer observes DST (e.g. Asia/Kolkata), the last offset is extended by a
+    final entry at _OPEN_ENDED_OFFSET_VERIFIED_UNTIL, so that it also applies after the last
+    transition.
+    """
+    try:
+        tz = pytz.timezone(timezone_name)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    transition_times = getattr(tz, "_utc_transition_times", None)
+    transition_info = getattr(tz, "_transition_info", None)
+    if transition_times is None or transition_info is None:
+        offset = tz.utcoffset(None)
+        return ((float("-inf"),), (int(offset.total_seconds()),)) if offset is not None else None
+
+    transition_timestamps = [
+        dt.replace(tzinfo=pytz.UTC).timestamp() if dt.year > 1 else float("-inf")
+        for dt in transition_times
+    ]
+    utc_offsets = [int(info[0].total_seconds()) for info in transition_info]
+
+    # pytz only lists transitions up to 2037 (or fewer, for recent rule changes), after which
+    # recurring DST rules may apply, so the last offset is only extended if it is fixed
+    last_timestamp = transition_timestamps[-1]
+    if (
+        len(transition_timestamps) > 1
+        and last_timestamp + _TRANSITION_MARGIN_SECONDS < _OPEN_ENDED_OFFSET_VERIFIED_UNTIL
+        and _has_fixed_offset_after(
+            timezone_name, last_timestamp + _TRANSITION_MARGIN_SECONDS, utc_offsets[-1]
+        )
+    ):
+        transition_timestamps.append(_OPEN_ENDED_OFFSET_VERIFIED_UNTIL)
+        utc_offsets.append(utc_offsets[-1])
+
+    return tuple(transition_timestamps), tuple(utc_offsets)
+
+
+class TimeWindowPartitionKeyCodec:
+    """Converts between the partition keys of a TimeWindowPartitionsDefinition and the timestamps
+    of the datetimes they represent, in bulk.
+
+    For the default daily and hourly formats, conversions are done with calendar arithmetic and
+    the UTC offset of the timezone. Keys and timestamps that are near a UTC offset transition (or
+    past the last known one), keys in other formats, and malformed keys fall back to
+    dst_safe_strptime() and dst_safe_strftime(), so results are always identical to theirs.
+    """
+
+    def __init__(self, timezone: str, fmt: str, cron_schedule: str):
+        self._timezone = timezone
+        self._fmt = fmt
+        self._cron_schedule = cron_schedule
+
+        self._includes_time = _ARITHMETIC_KEY_FORMATS.get(fmt)
+        transitions = (
+            _get_utc_offset_transitions(timezone) if self._includes_time is not None else None
+        )
+        self._transition_timestamps, self._utc_offsets = transitions or ([], [])
+
+        # formatted dates keyed by the number of days since the epoch, and vice versa
+        self._date_strs: dict[int, str] = {}
+        self._days_by_date_str: dict[str, int] = {}
+
+    def _get_offset_range(self, timestamp: float) -> Optional[tuple[float, float, int]]:
+        """Returns the range [start, end) of timestamps around the given one throughout which the
+        UTC offset can be applied arithmetically, and the offset, or None if the timestamp is not
+        in such a range. Since the range is at least the transition margin away from any offset
+        change, it may also be queried with local wall-clock times.
+        """
+        transition_timestamps = self._transition_timestamps
+        if not transition_timestamps:
+            return None
+        if len(transition_timestamps) == 1:
+            return float("-inf"), float("inf"), self._utc_offsets[0]
+
+        # the offset after the last entry may be superseded by recurring DST rules
+        i = bisect.bisect_right(transition_timestamps, timestamp) - 1
+        if i < 0 or i + 1 == len(transition_timestamps):
+            return None
+
+        start = transition_timestamps[i] + _TRANSITION_MARGIN_SECONDS
+        end = transition_timestamps[i + 1] - _TRANSITION_MARGIN_SECONDS
+        if not start <= timestamp < end:
+            return None
+        return start, end, self._utc_offsets[i]
+
+    def _get_days(self, date_str: str) -> Optional[int]:
+        """Returns the number of days since the epoch of a date in the default date format, or None
+        if it is not a valid date in that format.
+        """
+        days = self._days_by_date_str.get(date_str)
+        if days is None:
+            match = _DATE_KEY_REGEX.fullmatch(date_str)
+            if not match:
+                return None
+            try:
+                days = date(*map(int, match.groups())).toordinal() - _EPOCH_ORDINAL
+            except ValueError:
+                return None
+            self._days_by_date_str[date_str] = days
+        return days
+
+    def _get_date_str(self, days: int) -> Optional[str]:
+        """Returns the date that is the given number of days after the epoch in the default date
+        format, or None if its year would not be formatted with four digits.
+        """
+        date_str = self._date_strs.get(days)
+        if date_str is None:
+            ordinal = _EPOCH_ORDINAL + days
+            if not _MIN_FORMATTED_ORDINAL <= ordinal <= _MAX_FORMATTED_ORDINAL:
+                return None
+            date_str = date.fromordinal(ordinal).strftime(DEFAULT_DATE_FORMAT)
+            self._date_strs[days] = date_str
+        return date_str
+
+    def keys_to_timestamps(self, partition_keys: Iterable[str]) -> "array[float]":
+        """Returns the timestamps of the datetimes represented by each of the partition keys.
+        Raises a ValueError if any of the keys cannot be parsed.
+        """
+        timestamps = array("d")
+        days_by_date_str = self._days_by_date_str
+        includes_time = self._includes_time
+        # the offset range of the last key, which consecutive keys are likely to share
+        start, end, offset = 0.0, 0.0, 0
+        for partition_key in partition_keys:
+            local_timestamp = None
+            if self._utc_offsets:
+                date_str = partition_key[:_DATE_KEY_LENGTH]
+                days = days_by_date_str.get(date_str)
+                if days is None:
+                    days = self._get_days(date_str)
+                seconds = (
+                    _SECONDS_BY_TIME_SUFFIX.get(partition_key[_DATE_KEY_LENGTH:])
+                    if includes_time
+                    else (0 if len(partition_key) == _DATE_KEY_LENGTH else None)
+                )
+                if days is not None and seconds is not None:
+                    local_timestamp = days * _SECONDS_PER_DAY + seconds
+                    if not start <= local_timestamp < end:
+                        offset_range = self._get_offset_range(local_timestamp)
+                        if offset_range is None:
+                            local_timestamp = None
+                        else:
+                            start, end, offset = offset_range
+
+            if local_timestamp is not None:
+                timestamps.append(local_timestamp - offset)
+            else:
+                timestamps.append(
+                    dst_safe_strptime(partition_key, self._timezone, self._fmt).timestamp()
+                )
+        return timestamps
+
+    def timestamps_to_keys(self, timestamps: Iterable[float]) -> list[str]:
+        """Returns the partition keys that represent the datetimes at each of the timestamps."""
+        partition_keys = []
+        date_strs = self._date_strs
+        includes_time = self._includes_time
+        # the offset range of the last timestamp, which consecutive timestamps are likely to share
+        start, end, offset = 0.0, 0.0, 0
+        for timestamp in timestamps:
+            partition_key = None
+            if self._utc_offsets:
+                offset_range = (
+                    (start, end, offset)
+                    if start <= timestamp < end
+                    else self._get_offset_range(timestamp)
+                )
+                if offset_range is not None:
+                    start, end, offset = offset_range
+                    days, seconds = divmod(math.floor(timestamp) + offset, _SECONDS_PER_DAY)
+                    date_str = date_strs.get(days)
+                    if date_str is None:
+                        date_str = self._get_date_str(days)
+                    if date_str is not None:
+                        partition_key = (
+                            date_str + _TIME_SUFFIXES[seconds // 60] if includes_time else date_str
+                        )
+
+            if partition_key is None:
+                partition_key = dst_safe_strftime(
+                    datetime_from_timestamp(timestamp, tz=self._timezone),
+                    self._timezone,
+                    self._fmt,
+                    self._cron_schedule,
+                )
+            partition_keys.append(partition_key)
+        return partition_keys
+
+    def key_to_timestamp(self, partition_key: str) -> float:
+        """Returns the timestamp of the datetime represented by the partition key. Raises a
+        ValueError if the key cannot be parsed.
+        """
+        return self.keys_to_timestamps([partition_key])[0]
+
+    def timestamp_to_key(self, timestamp: float) -> str:
+        """Returns the partition key that represents the datetime at the given timestamp."""
+        return self.timestamps_to_keys([timestamp])[0]
+
+
 class TimeWindow(NamedTuple):
     """An interval that is closed at the start and open at the end.
 
@@ -363,6 +610,59 @@ def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
 
         return current_time.timestamp()
 
+    @cached_property
+    def _partition_index(self) -> TimeWindowPartitionIndex:
+        return TimeWindowPartitionIndex(
+            cron_schedule=self.cron_schedule,
+            timezone=self.timezone,
+            start_timestamp=self.start_ts.timestamp,
+        )
+
+    @cached_property
+    def _partition_key_codec(self) -> TimeWindowPartitionKeyCodec:
+        return TimeWindowPartitionKeyCodec(
+            timezone=self.timezone, fmt=self.fmt, cron_schedule=self.cron_schedule
+        )
+
+    def _time_window_for_index(self, index: int) -> TimeWindow:
+        tz = get_timezone(self.timezone)
+        return TimeWindow(
+            datetime_from_timestamp(self._partition_index.timestamp_for_index(index), tz=tz),
+            datetime_from_timestamp(self._partition_index.timestamp_for_index(index + 1), tz=tz),
+        )
+
+    def _partition_key_for_index(self, index: int) -> str:
+        return self._partition_key_codec.timestamp_to_key(
+            self._partition_index.timestamp_for_index(index)
+        )
+
+    def _partition_keys_for_indexes(self, indexes: Iterable[int]) -> list[str]:
+        return self._partition_key_codec.timestamps_to_keys(
+            map(self._partition_index.timestamp_for_index, indexes)
+        )
+
+    @functools.lru_cache(maxsize=256)
+    def _get_num_partitions(self, *, current_timestamp: float) -> int:
+        """Returns the number of partitions that exist at the given time. The partition with index
+        i exists iff 0 <= i < the returned value.
+        """
+        # count the windows that have fully elapsed at the current time, which a positive end
+        # offset extends past. Before the start, the end offset is counted from the first tick
+        # after the current time.
+        partition_index = self._partition_index
+        num_partitions = (
+            partition_index.floor_index(current_timestamp)
+            if current_timestamp >= partition_index.origin_timestamp
+            else partition_index.ceil_index(current_timestamp)
+        )
+        if self.end_offset > 0:
+            num_partitions += self.end_offset
+        if self.end_ts:
+            num_partitions = min(num_partitions, partition_index.floor_index(self.end_ts.timestamp))
+        if self.end_offset < 0:
+            num_partitions += self.end_offset
+        return max(num_partitions, 0)
+
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
         if self.is_basic_daily:
             return (
@@ -383,21 +683,17 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
             minutes_in_window = (time_window.end.timestamp() - time_window.start.timestamp()) / 60
             return int(minutes_in_window // fixed_minute_interval)
 
-        return len(self.get_partition_keys_in_time_window(time_window))
+        return self._partition_index.ceil_index(
+            time_window.end.timestamp()
+        ) - self._partition_index.ceil_index(time_window.start.timestamp())
 
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> int:
-        last_partition_window = self.get_last_partition_window(current_time)
-        first_partition_window = self.get_first_partition_window(current_time)
-
-        if not last_partition_window or not first_partition_window:
-            return 0
-
-        return self.get_num_partitions_in_window(
-            TimeWindow(start=first_partition_window.start, end=last_partition_window.end)
+        return self._get_num_partitions(
+            current_timestamp=self._get_current_timestamp(current_time=current_time)
         )
 
     def get_partition_keys_between_indexes(
@@ -407,70 +703,17 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
-        current_timestamp = self._get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys = []
-        reached_end = False
-
-        for idx, time_window in enumerate(self._iterate_time_windows(self.start.timestamp())):
-            if time_window.end.timestamp() >= current_timestamp:
-                reached_end = True
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                reached_end = True
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                if idx >= start_idx and idx < end_idx:
-                    partition_keys.append(
-                        dst_safe_strftime(
-                            time_window.start, self.timezone, self.fmt, self.cron_schedule
-                        )
-                    )
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-            if len(partition_keys) >= end_idx - start_idx:
-                break
-
-        if reached_end and self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
-
-        return partition_keys
+        num_partitions = self.get_num_partitions(current_time)
+        return self._partition_keys_for_indexes(
+            range(max(start_idx, 0), min(end_idx, num_partitions))
+        )
 
     def get_partition_keys(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
-        current_timestamp = self._get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys: list[str] = []
-        for time_window in self._iterate_time_windows(self.start.timestamp()):
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                break
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                partition_keys.append(
-                    dst_safe_strftime(
-                        time_window.start, self.timezone, self.fmt, self.cron_schedule
-                    )
-                )
-
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-
-        if self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
-
-        return partition_keys
+        return self._partition_keys_for_indexes(range(self.get_num_partitions(current_time)))
 
     def __str__(self) -> str:
         schedule_str = (
@@ -498,10 +741,32 @@ def __repr__(self):
     def __hash__(self):
         return hash(tuple(self.__repr__()))
 
+    def _index_for_partition_key(self, partition_key: str) -> int:
+        # the datetime format might not include granular components, so the parsed partition key
+        # is assumed to be <= the start of the partition's time window
+        return self._partition_index.ceil_index(
+            self._partition_key_codec.key_to_timestamp(partition_key)
+        )
+
+    def get_index_for_partition_key(
+        self, partition_key: str, current_time: Optional[datetime] = None
+    ) -> Optional[int]:
+        """Returns the position of the given partition key within the partition keys that exist at
+        the given time, or None if the partition key does not exist.
+        """
+        try:
+            index = self._index_for_partition_key(partition_key)
+        except ValueError:
+            # unparseable partition key
+            return None
+
+        if not 0 <= index < self.get_num_partitions(current_time):
+            return None
+        return index if self._partition_key_for_index(index) == partition_key else None
+
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
-        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
+        return self._time_window_for_index(self._index_for_partition_key(partition_key))
 
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
@@ -512,207 +777,149 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
-        sorted_pks = sorted(
-            partition_keys,
-            key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
-        )
-        cur_windows_iterator = iter(
-            self._iterate_time_windows(
-                dst_safe_strptime(sorted_pks[0], self.timezone, self.fmt).timestamp()
+        return [
+            self._time_window_for_index(idx)
+            for idx in self.get_partition_indexes_for_partition_keys(
+                partition_keys, validate=validate
             )
-        )
-        partition_key_time_windows: list[TimeWindow] = []
-        for partition_key in sorted_pks:
-            next_window = next(cur_windows_iterator)
-            if (
-                dst_safe_strftime(next_window.start, self.timezone, self.fmt, self.cron_schedule)
-                == partition_key
-            ):
-                partition_key_time_windows.append(next_window)
-            else:
-                cur_windows_iterator = iter(
-                    self._iterate_time_windows(
-                        dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
-                    )
-                )
-                partition_key_time_windows.append(next(cur_windows_iterator))
+        ]
 
-        if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
+    def get_partition_indexes_for_partition_keys(
+        self, partition_keys: Iterable[str], validate: bool = True
+    ) -> Sequence[int]:
+        """Returns the sorted, distinct indexes of the given partition keys. If validate is True,
+        indexes of partitions that do not currently exist are dropped.
+        """
+        indexes = sorted(
+            set(
+                self._partition_index.ceil_indexes(
+                    self._partition_key_codec.keys_to_timestamps(partition_keys)
+                )
+            )
+        )
 
-            if start_time_window is None or end_time_window is None:
+        if validate and indexes:
+            num_partitions = self.get_num_partitions()
+            if num_partitions == 0:
                 check.failed("No partitions in the PartitionsDefinition")
 
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
+            indexes = [idx for idx in indexes if 0 <= idx < num_partitions]
 
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
-        return partition_key_time_windows
+        return indexes
+
+    def get_partition_index_intervals_for_time_windows(
+        self, time_windows: Sequence[PersistedTimeWindow]
+    ) -> Sequence[tuple[int, int]]:
+        """Returns the [start, end) interval of partition indexes covered by each time window."""
+        partition_index = self._partition_index
+        return [
+            (
+                partition_index.ceil_index(time_window._asdict()["start"].timestamp),
+                partition_index.ceil_index(time_window._asdict()["end"].timestamp),
+            )
+            for time_window in time_windows
+        ]
+
+    def get_time_windows_for_partition_index_intervals(
+        self, index_intervals: Sequence[tuple[int, int]]
+    ) -> Sequence[PersistedTimeWindow]:
+        """Returns the time window spanned by each [start, end) interval of partition indexes.
+        Datetimes are not constructed until the start or end of a window is accessed.
+        """
+        partition_index = self._partition_index
+        return [
+            PersistedTimeWindow(
+                TimestampWithTimezone(partition_index.timestamp_for_index(start), self.timezone),
+                TimestampWithTimezone(partition_index.timestamp_for_index(end), self.timezone),
+            )
+            for start, end in index_intervals
+        ]
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
-        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        partition_key_timestamp = self._partition_key_codec.key_to_timestamp(partition_key)
         if self.is_basic_hourly or self.is_basic_daily:
-            return partition_key_dt
+            return datetime_from_timestamp(partition_key_timestamp, tz=self.timezone)
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
+        return datetime_from_timestamp(
+            self._partition_index.timestamp_for_index(
+                self._partition_index.ceil_index(partition_key_timestamp)
+            ),
+            tz=self.timezone,
+        )
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
     ) -> Optional[str]:
-        last_partition_window = self.get_last_partition_window(current_time)
-        if last_partition_window is None:
+        next_idx = self._index_for_partition_key(partition_key) + 1
+        if next_idx >= self.get_num_partitions(current_time):
             return None
-
-        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
-        windows_iter = iter(self._iterate_time_windows(partition_key_dt.timestamp()))
-        next(windows_iter)
-        start_time = next(windows_iter).start
-        if start_time.timestamp() >= last_partition_window.end.timestamp():
-            return None
-        else:
-            return dst_safe_strftime(start_time, self.timezone, self.fmt, self.cron_schedule)
+        return self._partition_key_for_index(next_idx)
 
     def get_next_partition_window(
         self, end_dt: datetime, current_time: Optional[datetime] = None, respect_bounds: bool = True
     ) -> Optional[TimeWindow]:
-        windows_iter = iter(self._iterate_time_windows(end_dt.timestamp()))
-        next_window = next(windows_iter)
-
-        if respect_bounds:
-            last_partition_window = self.get_last_partition_window(current_time)
-            if last_partition_window is None:
-                return None
-
-            if next_window.start.timestamp() >= last_partition_window.end.timestamp():
-                return None
+        next_idx = self._partition_index.ceil_index(end_dt.timestamp())
+        if respect_bounds and next_idx >= self.get_num_partitions(current_time):
+            return None
 
-        return next_window
+        return self._time_window_for_index(next_idx)
 
     def get_prev_partition_window(
         self, start_dt: datetime, respect_bounds: bool = True
     ) -> Optional[TimeWindow]:
-        windows_iter = iter(self._reverse_iterate_time_windows(start_dt.timestamp()))
-        prev_window = next(windows_iter)
-        if respect_bounds:
-            first_partition_window = self.get_first_partition_window()
-            if (
-                first_partition_window is None
-                or prev_window.start.timestamp() < first_partition_window.start.timestamp()
-            ):
-                return None
-
-        return prev_window
-
-    @functools.lru_cache(maxsize=256)
-    def _get_first_partition_window(self, *, current_timestamp: float) -> Optional[TimeWindow]:
-        time_window = next(iter(self._iterate_time_windows(self.start.timestamp())))
-
-        if self.end_offset == 0:
-            return time_window if time_window.end.timestamp() <= current_timestamp else None
-        elif self.end_offset > 0:
-            iterator = iter(self._iterate_time_windows(current_timestamp))
-            # first returned time window is time window of current time
-            curr_window_plus_offset = next(iterator)
-            for _ in range(self.end_offset):
-                curr_window_plus_offset = next(iterator)
-            return (
-                time_window
-                if time_window.end.timestamp() <= curr_window_plus_offset.start.timestamp()
-                else None
-            )
-        else:
-            # end offset < 0
-            end_window = None
-            iterator = iter(self._reverse_iterate_time_windows(current_timestamp))
-            for _ in range(abs(self.end_offset)):
-                end_window = next(iterator)
+        prev_idx = self._partition_index.floor_index(start_dt.timestamp()) - 1
+        if respect_bounds and (prev_idx < 0 or self.get_num_partitions() == 0):
+            return None
 
-            if end_window is None:
-                check.failed("end_window should not be None")
-
-            return (
-                time_window if time_window.end.timestamp() <= end_window.start.timestamp() else None
-            )
+        return self._time_window_for_index(prev_idx)
 
     def get_first_partition_window(
         self, current_time: Optional[datetime] = None
     ) -> Optional[TimeWindow]:
-        current_timestamp = self._get_current_timestamp(current_time)
-        return self._get_first_partition_window(current_timestamp=current_timestamp)
-
-    @functools.lru_cache(maxsize=256)
-    def _get_last_partition_window(self, *, current_timestamp: float) -> Optional[TimeWindow]:
-        if self._get_first_partition_window(current_timestamp=current_timestamp) is None:
+        if self.get_num_partitions(current_time) == 0:
             return None
-
-        if self.end and self.end.timestamp() < current_timestamp:
-            current_timestamp = self.end.timestamp()
-
-        if self.end_offset == 0:
-            return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
-        else:
-            # TODO: make this efficient
-            last_partition_key = super().get_last_partition_key(
-                datetime.fromtimestamp(current_timestamp, tz=get_timezone(self.timezone))
-            )
-            return (
-                self.time_window_for_partition_key(last_partition_key)
-                if last_partition_key
-                else None
-            )
+        return self._time_window_for_index(0)
 
     def get_last_partition_window(
         self, current_time: Optional[datetime] = None
     ) -> Optional[TimeWindow]:
-        current_timestamp = self._get_current_timestamp(current_time)
-        return self._get_last_partition_window(current_timestamp=current_timestamp)
+        num_partitions = self.get_num_partitions(current_time)
+        if num_partitions == 0:
+            return None
+        return self._time_window_for_index(num_partitions - 1)
 
     def get_first_partition_key(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Optional[str]:
-        first_window = self.get_first_partition_window(current_time)
-        if first_window is None:
+        if self.get_num_partitions(current_time) == 0:
             return None
-
-        return dst_safe_strftime(first_window.start, self.timezone, self.fmt, self.cron_schedule)
+        return self._partition_key_for_index(0)
 
     def get_last_partition_key(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Optional[str]:
-        last_window = self.get_last_partition_window(current_time)
-        if last_window is None:
+        num_partitions = self.get_num_partitions(current_time)
+        if num_partitions == 0:
             return None
-
-        return dst_safe_strftime(last_window.start, self.timezone, self.fmt, self.cron_schedule)
+        return self._partition_key_for_index(num_partitions - 1)
 
     def end_time_for_partition_key(self, partition_key: str) -> datetime:
         return self.time_window_for_partition_key(partition_key).end
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
-        result: list[str] = []
-        time_window_end_timestamp = time_window.end.timestamp()
-        for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
-            if partition_time_window.start.timestamp() < time_window_end_timestamp:
-                result.append(
-                    dst_safe_strftime(
-                        partition_time_window.start, self.timezone, self.fmt, self.cron_schedule
-                    )
-                )
-            else:
-                break
-        return result
+        return self._partition_keys_for_indexes(
+            range(
+                self._partition_index.ceil_index(time_window.start.timestamp()),
+                self._partition_index.ceil_index(time_window.end.timestamp()),
+            )
+        )
 
     def get_partition_subset_in_time_window(
         self, time_window: TimeWindow
@@ -895,56 +1102,15 @@ def get_cron_schedule(
             day_offset=day_offset,
         )
 
-    def _iterate_time_windows(self, start_timestamp: float) -> Iterable[TimeWindow]:
-        """Returns an infinite generator of time windows that start after the given start time."""
-        iterator = cron_string_iterator(
-            start_timestamp=start_timestamp,
-            cron_string=self.cron_schedule,
-            execution_timezone=self.timezone,
-        )
-        prev_time = next(iterator)
-        while prev_time.timestamp() < start_timestamp:
-            prev_time = next(iterator)
-
-        while True:
-            next_time = next(iterator)
-            yield TimeWindow(prev_time, next_time)
-            prev_time = next_time
-
-    def _reverse_iterate_time_windows(self, end_timestamp: float) -> Iterable[TimeWindow]:
-        """Returns an infinite generator of time windows that end before the given end time."""
-        iterator = reverse_cron_string_iterator(
-            end_timestamp=end_timestamp,
-            cron_string=self.cron_schedule,
-            execution_timezone=self.timezone,
-        )
-
-        prev_time = next(iterator)
-        while prev_time.timestamp() > end_timestamp:
-            prev_time = next(iterator)
-
-        while True:
-            next_time = next(iterator)
-            yield TimeWindow(next_time, prev_time)
-            prev_time = next_time
-
     def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = False) -> str:
         """Args:
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
-        iterator = cron_string_iterator(
-            timestamp, self.cron_schedule, self.timezone, start_offset=-1
-        )
-        # prev will be < timestamp
-        prev = next(iterator)
-        # prev_next will be >= timestamp
-        prev_next = next(iterator)
-
-        if end_closed or prev_next.timestamp() > timestamp:
-            return dst_safe_strftime(prev, self.timezone, self.fmt, self.cron_schedule)
-        else:
-            return dst_safe_strftime(prev_next, self.timezone, self.fmt, self.cron_schedule)
+        idx = self._partition_index.floor_index(timestamp)
+        if end_closed and self._partition_index.timestamp_for_index(idx) == timestamp:
+            idx -= 1
+        return self._partition_key_for_index(idx)
 
     def less_than(self, partition_key1: str, partition_key2: str) -> bool:
         """Returns true if the partition_key1 is earlier than partition_key2."""
@@ -1003,7 +1169,7 @@ def has_partition_key(
             # partition starts after the last valid partition
             or partition_start_timestamp > last_partition_window.start.timestamp()
             # partition key string does not represent the start of an actual partition
-            or dst_safe_strftime(partition_start_time, self.timezone, self.fmt, self.cron_schedule)
+            or self._partition_key_codec.timestamp_to_key(partition_start_timestamp)
             != partition_key
         )
 
@@ -1691,6 +1857,76 @@ def inner(
     return inner
 
 
+def _num_partitions_in_index_intervals(index_intervals: Sequence[tuple[int, int]]) -> int:
+    return sum(end - start for start, end in index_intervals)
+
+
+def _coalesce_index_intervals(
+    index_intervals: Iterable[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """Merges overlapping and adjacent [start, end) intervals, which must be sorted by start, and
+    drops empty ones.
+    """
+    result: list[tuple[int, int]] = []
+    for start, end in index_intervals:
+        if start >= end:
+            continue
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = (result[-1][0], end)
+        else:
+            result.append((start, end))
+    return result
+
+
+def _union_index_intervals(
+    a: Sequence[tuple[int, int]], b: Sequence[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    return _coalesce_index_intervals(heapq.merge(a, b))
+
+
+def _intersect_index_intervals(
+    a: Sequence[tuple[int, int]], b: Sequence[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    result: list[tuple[int, int]] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if start < end:
+            result.append((start, end))
+
+        # advance past the interval that ends first, as it cannot intersect anything else
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_index_intervals(
+    a: Sequence[tuple[int, int]], b: Sequence[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    result: list[tuple[int, int]] = []
+    j = 0
+    for a_start, end in a:
+        # skip the intervals being subtracted that end before this one starts
+        while j < len(b) and b[j][1] <= a_start:
+            j += 1
+
+        start = a_start
+        k = j
+        while k < len(b) and b[k][0] < end:
+            if b[k][0] > start:
+                result.append((start, b[k][0]))
+            start = max(start, b[k][1])
+            k += 1
+
+        if start < end:
+            result.append((start, end))
+    return result
+
+
 class TimeWindowPartitionsSubsetSerializer(NamedTupleSerializer):
     # TimeWindowPartitionsSubsets have custom logic to delay calculating num_partitions until it
     # is needed to improve performance. When serializing, we want to serialize the number of
@@ -1803,24 +2039,63 @@ def cheap_ends_before(self, dt: datetime, dt_cron_schedule: str) -> bool:
     def num_partitions(self) -> int:
         num_partitions_ = self._asdict()["num_partitions"]
         if num_partitions_ is None:
-            return sum(
-                self.partitions_def.get_num_partitions_in_window(
-                    time_window.to_public_time_window()
+            return _num_partitions_in_index_intervals(self._partition_index_intervals)
+        return num_partitions_
+
+    @cached_property
+    def _partition_index_intervals(self) -> Sequence[tuple[int, int]]:
+        """The included partitions, as sorted, disjoint and non-adjacent [start, end) intervals of
+        partition indexes. Set operations are merges over these intervals, and the results are
+        only converted back to time windows when a new subset is constructed.
+        """
+        return _coalesce_index_intervals(
+            sorted(
+                self.partitions_def.get_partition_index_intervals_for_time_windows(
+                    self.included_time_windows
                 )
-                for time_window in self.included_time_windows
             )
-        return num_partitions_
+        )
+
+    def _get_partition_index_intervals_of(
+        self, other: "TimeWindowPartitionsSubset"
+    ) -> Sequence[tuple[int, int]]:
+        """Returns the partitions of the other subset as index intervals of this subset's
+        partitions definition, whose first partition may differ from the other's.
+        """
+        if other.partitions_def == self.partitions_def:
+            return other._partition_index_intervals  # noqa: SLF001
+        return _coalesce_index_intervals(
+            sorted(
+                self.partitions_def.get_partition_index_intervals_for_time_windows(
+                    other.included_time_windows
+                )
+            )
+        )
 
     @classmethod
-    def _num_partitions_from_time_windows(
+    def _from_partition_index_intervals(
         cls,
         partitions_def: TimeWindowPartitionsDefinition,
-        time_windows: Sequence[PersistedTimeWindow],
-    ) -> int:
-        return sum(
-            len(partitions_def.get_partition_keys_in_time_window(time_window))
-            for time_window in time_windows
+        index_intervals: Sequence[tuple[int, int]],
+    ) -> "TimeWindowPartitionsSubset":
+        subset = TimeWindowPartitionsSubset(
+            partitions_def=partitions_def,
+            num_partitions=_num_partitions_in_index_intervals(index_intervals),
+            included_time_windows=partitions_def.get_time_windows_for_partition_index_intervals(
+                index_intervals
+            ),
         )
+        # avoid converting the time windows back into index intervals
+        subset.__dict__["_partition_index_intervals"] = index_intervals
+        return subset
+
+    def _get_partition_index_intervals_not_in_subset(
+        self, current_time: Optional[datetime] = None
+    ) -> Sequence[tuple[int, int]]:
+        num_partitions = self.partitions_def.get_num_partitions(current_time)
+        if num_partitions == 0:
+            return []
+        return _subtract_index_intervals([(0, num_partitions)], self._partition_index_intervals)
 
     def _get_partition_time_windows_not_in_subset(
         self,
@@ -1829,70 +2104,9 @@ def _get_partition_time_windows_not_in_subset(
         """Returns a list of partition time windows that are not in the subset.
         Each time window is a single partition.
         """
-        first_tw = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).get_first_partition_window(current_time=current_time)
-        last_tw = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).get_last_partition_window(current_time=current_time)
-
-        if not first_tw or not last_tw:
-            # no partitions
-            return []
-
-        last_tw_end_timestamp = last_tw.end.timestamp()
-        first_tw_start_timestamp = first_tw.start.timestamp()
-
-        if len(self.included_time_windows) == 0:
-            return [
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(first_tw.start, last_tw.end), self.partitions_def.timezone
-                )
-            ]
-
-        time_windows = []
-        if first_tw_start_timestamp < self.included_time_windows[0].start.timestamp():
-            time_windows.append(
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(first_tw.start, self.included_time_windows[0].start),
-                    self.partitions_def.timezone,
-                )
-            )
-
-        for i in range(len(self.included_time_windows) - 1):
-            if self.included_time_windows[i].start.timestamp() >= last_tw_end_timestamp:
-                break
-            if self.included_time_windows[i].end.timestamp() < last_tw_end_timestamp:
-                if self.included_time_windows[i + 1].start.timestamp() <= last_tw_end_timestamp:
-                    time_windows.append(
-                        PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(
-                                self.included_time_windows[i].end,
-                                self.included_time_windows[i + 1].start,
-                            ),
-                            self.partitions_def.timezone,
-                        )
-                    )
-                else:
-                    time_windows.append(
-                        PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(
-                                self.included_time_windows[i].end,
-                                last_tw.end,
-                            ),
-                            self.partitions_def.timezone,
-                        )
-                    )
-
-        if last_tw_end_timestamp > self.included_time_windows[-1].end.timestamp():
-            time_windows.append(
-                PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(self.included_time_windows[-1].end, last_tw.end),
-                    self.partitions_def.timezone,
-                )
-            )
-
-        return time_windows
+        return self.partitions_def.get_time_windows_for_partition_index_intervals(
+            self._get_partition_index_intervals_not_in_subset(current_time)
+        )
 
     def get_partition_keys_not_in_subset(
         self,
@@ -1901,11 +2115,9 @@ def get_partition_keys_not_in_subset(
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
         partition_keys: list[str] = []
-        for tw in self._get_partition_time_windows_not_in_subset(current_time):
+        for start, end in self._get_partition_index_intervals_not_in_subset(current_time):
             partition_keys.extend(
-                cast(
-                    TimeWindowPartitionsDefinition, self.partitions_def
-                ).get_partition_keys_in_time_window(tw)
+                self.partitions_def.get_partition_keys_between_indexes(start, end, current_time)
             )
         return partition_keys
 
@@ -1925,89 +2137,6 @@ def get_partition_key_ranges(
             for window in self.included_time_windows
         ]
 
-    def _add_partitions_to_time_windows(
-        self,
-        initial_windows: Sequence[PersistedTimeWindow],
-        partition_keys: Sequence[str],
-        validate: bool = True,
-    ) -> tuple[Sequence[PersistedTimeWindow], int]:
-        """Merges a set of partition keys into an existing set of time windows, returning the
-        minimized set of time windows and the number of partitions added.
-        """
-        result_windows = [*initial_windows]
-        time_windows = cast(
-            TimeWindowPartitionsDefinition, self.partitions_def
-        ).time_windows_for_partition_keys(frozenset(partition_keys), validate=validate)
-
-        num_added_partitions = 0
-        for window in sorted(time_windows, key=lambda tw: tw.start.timestamp()):
-            window_start_timestamp = window.start.timestamp()
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window_start_timestamp < included_window.end.timestamp()
-                gte_start_of_range = window_start_timestamp >= included_window.start.timestamp()
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end.timestamp() == window_start_timestamp
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end.timestamp() == result_windows[i + 1].start.timestamp()
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, window.end),
-                            self.partitions_def.timezone,
-                        )
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                    else:
-                        result_windows.insert(
-                            i + 1,
-                            PersistedTimeWindow.from_public_time_window(
-                                window, self.partitions_def.timezone
-                            ),
-                        )
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window_start_timestamp == result_windows[0].start.timestamp():
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end), self.partitions_def.timezone
-                    )
-                elif (
-                    result_windows and window.end.timestamp() == result_windows[0].start.timestamp()
-                ):
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end), self.partitions_def.timezone
-                    )
-                else:
-                    result_windows.insert(
-                        0,
-                        PersistedTimeWindow.from_public_time_window(
-                            window,
-                            self.partitions_def.timezone,
-                        ),
-                    )
-
-                num_added_partitions += 1
-
-        return result_windows, num_added_partitions
-
     @public
     def get_partition_keys(self) -> Iterable[str]:
         return [
@@ -2019,14 +2148,17 @@ def get_partition_keys(self) -> Iterable[str]:
     def with_partition_keys(
         self, partition_keys: Iterable[str], validate: bool = True
     ) -> "TimeWindowPartitionsSubset":
-        result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys), validate=validate
+        added_index_intervals = _coalesce_index_intervals(
+            [
+                (idx, idx + 1)
+                for idx in self.partitions_def.get_partition_indexes_for_partition_keys(
+                    partition_keys, validate=validate
+                )
+            ]
         )
-
-        return TimeWindowPartitionsSubset(
+        return self._from_partition_index_intervals(
             self.partitions_def,
-            num_partitions=self.num_partitions + added_partitions,
-            included_time_windows=result_windows,
+            _union_index_intervals(self._partition_index_intervals, added_index_intervals),
         )
 
     def empty_subset(self):
@@ -2063,39 +2195,11 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__and__(other)
 
-        self_time_windows_iter = iter(
-            sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
-        )
-        other_time_windows_iter = iter(
-            sorted(other.included_time_windows, key=lambda tw: tw.start.timestamp())
-        )
-
-        result_windows = []
-        self_window = next(self_time_windows_iter, None)
-        other_window = next(other_time_windows_iter, None)
-        while self_window and other_window:
-            # find the intersection between the current two windows
-            start = max(self_window.start, other_window.start)
-            end = min(self_window.end, other_window.end)
-
-            # these windows intersect
-            if start.timestamp() < end.timestamp():
-                result_windows.append(
-                    PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(start=start, end=end), self.partitions_def.timezone
-                    )
-                )
-
-            # advance the iterator with the earliest end time to find the next potential intersection
-            if self_window.end.timestamp() < other_window.end.timestamp():
-                self_window = next(self_time_windows_iter, None)
-            else:
-                other_window = next(other_time_windows_iter, None)
-
-        return TimeWindowPartitionsSubset(
-            partitions_def=self.partitions_def,
-            num_partitions=None,  # lazily calculated
-            included_time_windows=result_windows,
+        return self._from_partition_index_intervals(
+            self.partitions_def,
+            _intersect_index_intervals(
+                self._partition_index_intervals, self._get_partition_index_intervals_of(other)
+            ),
         )
 
     def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
@@ -2103,26 +2207,11 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__or__(other)
 
-        input_time_windows = sorted(
-            [*self.included_time_windows, *other.included_time_windows],
-            key=lambda tw: tw.start.timestamp(),
-        )
-        result_windows = [input_time_windows[0]] if len(input_time_windows) > 0 else []
-        for window in input_time_windows[1:]:
-            latest_window = result_windows[-1]
-            if window.start.timestamp() <= latest_window.end.timestamp():
-                # merge this window with the latest window
-                result_windows[-1] = PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(latest_window.start, max(latest_window.end, window.end)),
-                    self.partitions_def.timezone,
-                )
-            else:
-                result_windows.append(window)
-
-        return TimeWindowPartitionsSubset(
-            partitions_def=self.partitions_def,
-            num_partitions=None,  # lazily calculated
-            included_time_windows=result_windows,
+        return self._from_partition_index_intervals(
+            self.partitions_def,
+            _union_index_intervals(
+                self._partition_index_intervals, self._get_partition_index_intervals_of(other)
+            ),
         )
 
     def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
@@ -2130,52 +2219,11 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__sub__(other)
 
-        time_windows = sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
-        other_time_windows = sorted(
-            other.included_time_windows, key=lambda tw: tw.start.timestamp()
-        )
-
-        next_time_window_index_to_process = 0
-        next_other_window_index_to_process = 0
-
-        # Slide through both sets of windows, moving to the next window once its start has passed
-        # the end of the window is it being compared to
-        while (next_time_window_index_to_process < len(time_windows)) and (
-            next_other_window_index_to_process < len(other_time_windows)
-        ):
-            time_window = time_windows[next_time_window_index_to_process]
-            other_time_window = other_time_windows[next_other_window_index_to_process]
-
-            # Perform the subtraction and splice the 0, 1, or 2 result windows
-            # back into the time_windows list
-
-            subtracted_time_windows = time_window.subtract(other_time_window)
-
-            time_windows[
-                next_time_window_index_to_process : next_time_window_index_to_process + 1
-            ] = subtracted_time_windows
-
-            if len(subtracted_time_windows) == 0:
-                # other_time_window fully consumed time_window
-                # next_time_window_index_to_process can stay the same since everything has shifted over one
-                pass
-            else:
-                updated_time_window = time_windows[next_time_window_index_to_process]
-                if updated_time_window.end.timestamp() <= other_time_window.start.timestamp():
-                    # Current subtractor is too early to intersect, can advance
-                    next_time_window_index_to_process += 1
-                elif other_time_window.end.timestamp() <= updated_time_window.start.timestamp():
-                    # current subtractee is too early to intersect, can advance
-                    next_other_window_index_to_process += 1
-                else:
-                    check.failed(
-                        "After subtraction, the new window should no longer intersect with the other window"
-                    )
-
-        return TimeWindowPartitionsSubset(
-            partitions_def=self.partitions_def,
-            num_partitions=None,
-            included_time_windows=time_windows,
+        return self._from_partition_index_intervals(
+            self.partitions_def,
+            _subtract_index_intervals(
+                self._partition_index_intervals, self._get_partition_index_intervals_of(other)
+            ),
         )
 
     def __contains__(self, partition_key: Optional[str]) -> bool:
@@ -2183,20 +2231,18 @@ def __contains__(self, partition_key: Optional[str]) -> bool:
             return False
 
         try:
-            time_window = cast(
-                TimeWindowPartitionsDefinition, self.partitions_def
-            ).time_window_for_partition_key(partition_key)
+            indexes = self.partitions_def.get_partition_indexes_for_partition_keys(
+                [partition_key], validate=False
+            )
         except ValueError:
             # invalid partition key
             return False
 
-        time_window_start_timestamp = time_window.start.timestamp()
-
-        return any(
-            time_window_start_timestamp >= included_time_window.start.timestamp()
-            and time_window_start_timestamp < included_time_window.end.timestamp()
-            for included_time_window in self.included_time_windows
-        )
+        index = indexes[0]
+        index_intervals = self._partition_index_intervals
+        # find the last interval that starts at or before the index
+        i = bisect.bisect_right(index_intervals, (index, float("inf"))) - 1
+        return i >= 0 and index < index_intervals[i][1]
 
     def __len__(self) -> int:
         return self.num_partitions
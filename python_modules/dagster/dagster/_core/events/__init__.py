@@ -236,12 +236,26 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
+# These are the only events that are sent to `EventLogStorage.store_event_batch` in explicit
+# batches (see `DagsterEventBatchMetadata`), so every storage that implements batch writes must
+# support them
 BATCH_WRITABLE_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
 }
 
+# Events emitted while a step is executing that may be buffered in memory and written to the event
+# log in batches. Any other event for the run flushes the buffered events before it is written, so
+# that events are stored in order and step boundaries are stored as soon as they happen. Asset and
+# asset check events are not buffered, since they are the source of truth for the state of assets.
+BUFFERABLE_STEP_EVENTS = {
+    DagsterEventType.STEP_INPUT,
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.LOADED_INPUT,
+    DagsterEventType.HANDLED_OUTPUT,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
 ASSET_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
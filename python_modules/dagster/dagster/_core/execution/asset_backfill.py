@@ -2,11 +2,13 @@
 import logging
 import os
 import sys
+import threading
 import time
+from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, NamedTuple, Optional, Union, cast
+from typing import TYPE_CHECKING, AbstractSet, NamedTuple, Optional, Union, cast  # noqa: UP035
 
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
@@ -22,7 +24,7 @@
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 from dagster._core.definitions.asset_selection import KeysAssetSelection
 from dagster._core.definitions.automation_tick_evaluation_context import (
-    build_run_requests_with_backfill_policies,
+    build_run_requests_for_asset_graph_subset_with_backfill_policies,
 )
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
@@ -45,6 +47,7 @@
     DagsterInvariantViolationError,
 )
 from dagster._core.event_api import AssetRecordsFilter
+from dagster._core.execution.bulk_actions import get_backfill_iteration_time_budget_seconds
 from dagster._core.execution.submit_asset_runs import submit_asset_run
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.dagster_run import NOT_FINISHED_STATUSES, DagsterRunStatus, RunsFilter
@@ -696,15 +699,20 @@ def _write_updated_backfill_data(
     asset_graph: RemoteAssetGraph,
     updated_run_requests: Sequence[RunRequest],
     updated_reserved_run_ids: Sequence[str],
+    submission_paused_by_time_budget: bool = False,
 ):
     backfill = check.not_none(instance.get_backfill(backfill_id))
-    updated_backfill = backfill.with_asset_backfill_data(
-        updated_backfill_data,
-        dynamic_partitions_store=instance,
-        asset_graph=asset_graph,
-    ).with_submitting_run_requests(
-        updated_run_requests,
-        updated_reserved_run_ids,
+    updated_backfill = (
+        backfill.with_asset_backfill_data(
+            updated_backfill_data,
+            dynamic_partitions_store=instance,
+            asset_graph=asset_graph,
+        )
+        .with_submitting_run_requests(
+            updated_run_requests,
+            updated_reserved_run_ids,
+        )
+        .with_submission_paused_by_time_budget(submission_paused_by_time_budget)
     )
     instance.update_backfill(updated_backfill)
     return updated_backfill
@@ -717,6 +725,7 @@ def _submit_runs_and_update_backfill_in_chunks(
     asset_backfill_iteration_result: AssetBackfillIterationResult,
     logger: logging.Logger,
     run_tags: Mapping[str, str],
+    submission_deadline: Optional[float] = None,
 ) -> Iterable[None]:
     from dagster._core.execution.backfill import BulkActionStatus
     from dagster._daemon.utils import DaemonErrorCapture
@@ -789,6 +798,11 @@ def _submit_runs_and_update_backfill_in_chunks(
         # After each chunk or on the final request, write the updated backfill data
         # and check to make sure we weren't interrupted
         if (num_submitted % chunk_size == 0) or num_submitted == len(run_requests):
+            submission_paused_by_time_budget = (
+                submission_deadline is not None
+                and num_submitted < len(run_requests)
+                and get_current_timestamp() >= submission_deadline
+            )
             backfill = _write_updated_backfill_data(
                 instance,
                 backfill_id,
@@ -796,11 +810,22 @@ def _submit_runs_and_update_backfill_in_chunks(
                 asset_graph,
                 run_requests[num_submitted:],
                 asset_backfill_iteration_result.reserved_run_ids[num_submitted:],
+                submission_paused_by_time_budget=submission_paused_by_time_budget,
             )
 
             if backfill.status != BulkActionStatus.REQUESTED:
                 break
 
+            if submission_paused_by_time_budget:
+                # the remaining runs were written to the backfill as submitting run requests, and
+                # will be submitted by the next iteration
+                logger.info(
+                    f"Backfill iteration time budget exhausted after submitting {num_submitted} runs."
+                    f" The remaining {len(run_requests) - num_submitted} runs will be submitted in"
+                    " the next iteration."
+                )
+                break
+
         yield None
 
     yield None
@@ -982,17 +1007,24 @@ def execute_asset_backfill_iteration(
     logger: logging.Logger,
     workspace_process_context: IWorkspaceProcessContext,
     instance: DagsterInstance,
+    materialization_tailer: Optional["AssetBackfillMaterializationTailer"] = None,
 ) -> Iterable[None]:
     """Runs an iteration of the backfill, including submitting runs and updating the backfill object
     in the DB.
 
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
+
+    If an iteration time budget is set, run submission stops once it is exhausted, and the remaining
+    runs are submitted by the next iteration. Computing the runs to request is not bounded.
     """
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 
     logger.info(f"Evaluating asset backfill {backfill.backfill_id}")
 
+    time_budget = get_backfill_iteration_time_budget_seconds()
+    submission_deadline = get_current_timestamp() + time_budget if time_budget else None
+
     workspace_context = workspace_process_context.create_request_context()
     asset_graph = workspace_context.asset_graph
 
@@ -1024,10 +1056,19 @@ def execute_asset_backfill_iteration(
 
     if backfill.status == BulkActionStatus.REQUESTED:
         if backfill.submitting_run_requests:
-            # interrupted in the middle of executing run requests - re-construct the in-progress iteration result
-            logger.warn(
-                f"Resuming previous backfill iteration and re-submitting {len(backfill.submitting_run_requests)} runs."
-            )
+            # interrupted in the middle of executing run requests, or paused by the iteration time
+            # budget - re-construct the in-progress iteration result
+            if backfill.submission_paused_by_time_budget:
+                logger.info(
+                    f"Continuing previous backfill iteration and submitting the remaining {len(backfill.submitting_run_requests)} runs."
+                )
+                # clear the flag, so that an interruption of this iteration is reported as such
+                backfill = backfill.with_submission_paused_by_time_budget(False)
+                instance.update_backfill(backfill)
+            else:
+                logger.warning(
+                    f"Resuming previous backfill iteration and re-submitting {len(backfill.submitting_run_requests)} runs."
+                )
             result = AssetBackfillIterationResult(
                 run_requests=backfill.submitting_run_requests,
                 backfill_data=previous_asset_backfill_data,
@@ -1046,6 +1087,7 @@ def execute_asset_backfill_iteration(
                 asset_graph_view=asset_graph_view,
                 backfill_start_timestamp=backfill.backfill_timestamp,
                 logger=logger,
+                materialization_tailer=materialization_tailer,
             ):
                 yield None
 
@@ -1084,16 +1126,21 @@ def execute_asset_backfill_iteration(
                 result,
                 logger,
                 run_tags=updated_backfill.tags,
+                submission_deadline=submission_deadline,
             )
 
         updated_backfill = cast(
             PartitionBackfill, instance.get_backfill(updated_backfill.backfill_id)
         )
         if updated_backfill.status == BulkActionStatus.REQUESTED:
-            check.invariant(
-                not updated_backfill.submitting_run_requests,
-                "All run requests should have been submitted",
-            )
+            if updated_backfill.submitting_run_requests:
+                check.invariant(
+                    submission_deadline is not None
+                    and get_current_timestamp() >= submission_deadline,
+                    "All run requests should have been submitted",
+                )
+                # resume submitting runs in the next iteration
+                return
 
         updated_backfill_data = updated_backfill.get_asset_backfill_data(asset_graph)
 
@@ -1171,6 +1218,7 @@ def execute_asset_backfill_iteration(
             previous_asset_backfill_data,
             asset_graph_view,
             backfill.backfill_timestamp,
+            materialization_tailer=materialization_tailer,
         ):
             yield None
 
@@ -1224,6 +1272,7 @@ def get_canceling_asset_backfill_iteration_data(
     asset_backfill_data: AssetBackfillData,
     asset_graph_view: AssetGraphView,
     backfill_start_timestamp: float,
+    materialization_tailer: Optional["AssetBackfillMaterializationTailer"] = None,
 ) -> Iterable[Optional[AssetBackfillData]]:
     """For asset backfills in the "canceling" state, fetch the asset backfill data with the updated
     materialized and failed subsets.
@@ -1232,7 +1281,7 @@ def get_canceling_asset_backfill_iteration_data(
     instance_queryer = asset_graph_view.get_inner_queryer_for_back_compat()
     updated_materialized_subset = None
     for updated_materialized_subset in get_asset_backfill_iteration_materialized_subset(
-        backfill_id, asset_backfill_data, asset_graph, instance_queryer
+        backfill_id, asset_backfill_data, asset_graph, instance_queryer, materialization_tailer
     ):
         yield None
 
@@ -1268,17 +1317,173 @@ def get_canceling_asset_backfill_iteration_data(
     yield updated_backfill_data
 
 
+class AssetBackfillMaterializationTailer:
+    """Reads new asset materializations from the event log once per backfill daemon tick, and
+    shares them across all of the asset backfills evaluated in that tick.
+
+    Without it, each backfill scans the materializations of each of its targeted assets since its
+    own cursor on every tick, so the cost grows with the number and size of active backfills. The
+    tailer instead reads the materializations of the assets targeted by the backfills after the
+    lowest cursor requested for each asset (up to the maximum storage id at the time it was
+    created) once, and keeps the ones produced by backfill runs, indexed by backfill id.
+
+    Only materializations are tailed. The failed partitions of a backfill are not read from the
+    event log, but recomputed on every tick from the planned and completed materializations of all
+    of its failed and canceled runs, so that partitions materialized by a retry of a failed run are
+    no longer counted as failed. Step and run failure events have no asset key, so they could not
+    be read by the same query either.
+
+    Thread-safe, so that it can be shared by backfills evaluated in a threadpool. The lock only
+    guards the in-memory state; the event log and run storage are queried without holding it.
+    """
+
+    def __init__(self, instance: DagsterInstance):
+        self._instance = instance
+        self._lock = threading.Lock()
+        self._max_storage_id = instance.event_log_storage.get_maximum_record_id() or 0
+        # the events of each asset key in (_min_after_storage_id_by_asset_key[key], _max_storage_id]
+        # have been read
+        self._min_after_storage_id_by_asset_key: dict[AssetKey, int] = {}
+        self._asset_partitions_by_backfill_id: dict[str, dict[int, AssetKeyPartitionKey]] = (
+            defaultdict(dict)
+        )
+        self._backfill_id_by_run_id: dict[str, Optional[str]] = {}
+
+    @property
+    def max_storage_id(self) -> int:
+        """The maximum storage id that the tailer reads up to. Backfills using the tailer must not
+        advance their cursor past it.
+        """
+        return self._max_storage_id
+
+    def read_materializations(
+        self, asset_keys: AbstractSet[AssetKey], after_storage_id: int
+    ) -> Iterable[None]:
+        """Reads the materializations of the given assets after the given storage id that have not
+        been read yet.
+
+        This function is a generator so we can return control to the daemon and let it heartbeat
+        between chunks of materializations.
+        """
+        with self._lock:
+            asset_keys_by_up_to_storage_id: dict[int, list[AssetKey]] = defaultdict(list)
+            for asset_key in asset_keys:
+                min_after_storage_id = self._min_after_storage_id_by_asset_key.get(
+                    asset_key, self._max_storage_id
+                )
+                if after_storage_id < min_after_storage_id:
+                    asset_keys_by_up_to_storage_id[min_after_storage_id].append(asset_key)
+
+        for up_to_storage_id, asset_keys_to_read in asset_keys_by_up_to_storage_id.items():
+            yield from self._read_materializations(
+                asset_keys_to_read, after_storage_id, up_to_storage_id
+            )
+            with self._lock:
+                for asset_key in asset_keys_to_read:
+                    self._min_after_storage_id_by_asset_key[asset_key] = min(
+                        self._min_after_storage_id_by_asset_key.get(
+                            asset_key, self._max_storage_id
+                        ),
+                        after_storage_id,
+                    )
+
+    def get_materialized_asset_partitions(
+        self, backfill_id: str, after_storage_id: int
+    ) -> Sequence[AssetKeyPartitionKey]:
+        """Returns the asset partitions materialized by runs of the given backfill after the given
+        storage id, among the materializations that have been read.
+        """
+        with self._lock:
+            return [
+                asset_partition
+                for storage_id, asset_partition in self._asset_partitions_by_backfill_id.get(
+                    backfill_id, {}
+                ).items()
+                if storage_id > after_storage_id
+            ]
+
+    def _read_materializations(
+        self, asset_keys: Sequence[AssetKey], after_storage_id: int, up_to_storage_id: int
+    ) -> Iterable[None]:
+        cursor = after_storage_id
+        while cursor < up_to_storage_id:
+            records = self._instance.event_log_storage.get_materialization_records_for_assets(
+                asset_keys,
+                after_cursor=cursor,
+                before_cursor=up_to_storage_id + 1,
+                limit=MATERIALIZATION_CHUNK_SIZE,
+            )
+            if not records:
+                break
+
+            backfill_id_by_run_id = self._get_backfill_ids_for_runs(
+                {record.run_id for record in records}
+            )
+            with self._lock:
+                # backfills evaluated concurrently may read the same events, so index them by
+                # storage id to keep them once
+                for record in records:
+                    backfill_id = backfill_id_by_run_id.get(record.run_id)
+                    if backfill_id is not None and record.asset_key is not None:
+                        self._asset_partitions_by_backfill_id[backfill_id][record.storage_id] = (
+                            AssetKeyPartitionKey(record.asset_key, record.partition_key)
+                        )
+            cursor = records[-1].storage_id
+            yield None
+
+    def _get_backfill_ids_for_runs(self, run_ids: AbstractSet[str]) -> Mapping[str, Optional[str]]:
+        with self._lock:
+            run_ids_to_fetch = [
+                run_id for run_id in run_ids if run_id not in self._backfill_id_by_run_id
+            ]
+
+        fetched_backfill_id_by_run_id: dict[str, Optional[str]] = {}
+        if run_ids_to_fetch:
+            for run in self._instance.get_runs(filters=RunsFilter(run_ids=run_ids_to_fetch)):
+                fetched_backfill_id_by_run_id[run.run_id] = run.tags.get(BACKFILL_ID_TAG)
+            for run_id in run_ids_to_fetch:
+                # runs that have been deleted can't belong to a backfill
+                fetched_backfill_id_by_run_id.setdefault(run_id, None)
+
+        with self._lock:
+            self._backfill_id_by_run_id.update(fetched_backfill_id_by_run_id)
+            return {run_id: self._backfill_id_by_run_id[run_id] for run_id in run_ids}
+
+
 def get_asset_backfill_iteration_materialized_subset(
     backfill_id: str,
     asset_backfill_data: AssetBackfillData,
     asset_graph: RemoteWorkspaceAssetGraph,
     instance_queryer: CachingInstanceQueryer,
+    materialization_tailer: Optional[AssetBackfillMaterializationTailer] = None,
 ) -> Iterable[Optional[AssetGraphSubset]]:
     """Returns the partitions that have been materialized by the backfill.
 
+    If a materialization tailer is provided and the backfill has a cursor, new materializations
+    are read from it instead of being queried for each targeted asset.
+
     This function is a generator so we can return control to the daemon and let it heartbeat
     during expensive operations.
     """
+    if materialization_tailer is not None and asset_backfill_data.latest_storage_id is not None:
+        target_asset_keys = asset_backfill_data.target_subset.asset_keys
+        yield from materialization_tailer.read_materializations(
+            target_asset_keys, asset_backfill_data.latest_storage_id
+        )
+        recently_materialized_asset_partitions = AssetGraphSubset.from_asset_partition_set(
+            {
+                asset_partition
+                for asset_partition in materialization_tailer.get_materialized_asset_partitions(
+                    backfill_id, asset_backfill_data.latest_storage_id
+                )
+                if asset_partition.asset_key in target_asset_keys
+            },
+            asset_graph,
+        )
+        yield None
+        yield asset_backfill_data.materialized_subset | recently_materialized_asset_partitions
+        return
+
     recently_materialized_asset_partitions = AssetGraphSubset()
     for asset_key in asset_backfill_data.target_subset.asset_keys:
         cursor = None
@@ -1372,7 +1577,10 @@ def _get_failed_and_downstream_asset_graph_subset(
     return failed_and_downstream_subset
 
 
-def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int:
+def _get_next_latest_storage_id(
+    instance_queryer: CachingInstanceQueryer,
+    materialization_tailer: Optional[AssetBackfillMaterializationTailer] = None,
+) -> int:
     # Events are not always guaranteed to be written to the event log in monotonically increasing
     # order, so add a configurable offset to ensure that any stragglers will still be included in
     # the next iteration.
@@ -1380,9 +1588,14 @@ def _get_next_latest_storage_id(instance_queryer: CachingInstanceQueryer) -> int
     # idempotence checks later ensure that the materialization isn't incorrectly
     # double-counted.
     cursor_offset = int(os.getenv("ASSET_BACKFILL_CURSOR_OFFSET", "0"))
-    next_latest_storage_id = (
-        instance_queryer.instance.event_log_storage.get_maximum_record_id() or 0
-    )
+    if materialization_tailer is not None:
+        # events after the tailer's max storage id have not been read yet, so they must be read on
+        # the next iteration
+        next_latest_storage_id = materialization_tailer.max_storage_id
+    else:
+        next_latest_storage_id = (
+            instance_queryer.instance.event_log_storage.get_maximum_record_id() or 0
+        )
     return max(next_latest_storage_id - cursor_offset, 0)
 
 
@@ -1436,6 +1649,7 @@ def execute_asset_backfill_iteration_inner(
     asset_graph_view: AssetGraphView,
     backfill_start_timestamp: float,
     logger: logging.Logger,
+    materialization_tailer: Optional[AssetBackfillMaterializationTailer] = None,
 ) -> Iterable[Optional[AssetBackfillIterationResult]]:
     """Core logic of a backfill iteration. Has no side effects.
 
@@ -1465,9 +1679,13 @@ def execute_asset_backfill_iteration_inner(
 
         updated_materialized_subset = AssetGraphSubset()
         failed_and_downstream_subset = AssetGraphSubset()
-        next_latest_storage_id = _get_next_latest_storage_id(instance_queryer)
+        next_latest_storage_id = _get_next_latest_storage_id(
+            instance_queryer, materialization_tailer
+        )
     else:
-        next_latest_storage_id = _get_next_latest_storage_id(instance_queryer)
+        next_latest_storage_id = _get_next_latest_storage_id(
+            instance_queryer, materialization_tailer
+        )
 
         cursor_delay_time = int(os.getenv("ASSET_BACKFILL_CURSOR_DELAY_TIME", "0"))
         # Events are not guaranteed to be written to the event log in monotonic increasing order,
@@ -1477,7 +1695,7 @@ def execute_asset_backfill_iteration_inner(
 
         updated_materialized_subset = None
         for updated_materialized_subset in get_asset_backfill_iteration_materialized_subset(
-            backfill_id, asset_backfill_data, asset_graph, instance_queryer
+            backfill_id, asset_backfill_data, asset_graph, instance_queryer, materialization_tailer
         ):
             yield None
 
@@ -1496,6 +1714,19 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
+        # batch together the lookups made for the parents of each targeted asset below
+        asset_keys_to_prefetch = {
+            parent_key
+            for asset_key in asset_backfill_data.target_subset.asset_keys
+            for parent_key in asset_graph.get(asset_key).parent_keys
+            if asset_graph.has(parent_key)
+        } | asset_backfill_data.target_subset.asset_keys
+        instance_queryer.prefetch_asset_records(asset_keys_to_prefetch)
+        instance_queryer.prefetch_latest_storage_ids_by_partition(
+            asset_keys_to_prefetch, after_cursor=asset_backfill_data.latest_storage_id
+        )
+        instance_queryer.prefetch_materialized_partitions_for_status_cache(asset_keys_to_prefetch)
+
         parent_materialized_asset_partitions = set().union(
             *(
                 instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
@@ -1542,8 +1773,6 @@ def execute_asset_backfill_iteration_inner(
         else "No asset partitions to request."
     )
 
-    asset_partitions_to_request = set(asset_subset_to_request.iterate_asset_partitions())
-
     if len(not_requested_and_reasons) > 0:
         not_requested_str = "\n\n".join(
             [
@@ -1555,8 +1784,10 @@ def execute_asset_backfill_iteration_inner(
             f"The following assets were considered for materialization but not requested:\n\n{not_requested_str}"
         )
 
-    run_requests = build_run_requests_with_backfill_policies(
-        asset_partitions=asset_partitions_to_request,
+    # plan runs from the range-structured subset rather than expanding it into individual asset
+    # partitions, which can number in the millions for large time-partitioned backfills
+    run_requests = build_run_requests_for_asset_graph_subset_with_backfill_policies(
+        asset_graph_subset=asset_subset_to_request,
         asset_graph=asset_graph,
         dynamic_partitions_store=instance_queryer,
     )
@@ -118,6 +118,7 @@ class PartitionBackfill(
             ("submitting_run_requests", Sequence[RunRequest]),
             ("reserved_run_ids", Sequence[str]),
             ("backfill_end_timestamp", Optional[float]),
+            ("submission_paused_by_time_budget", bool),
         ],
     ),
 ):
@@ -142,6 +143,7 @@ def __new__(
         submitting_run_requests: Optional[Sequence[RunRequest]] = None,
         reserved_run_ids: Optional[Sequence[str]] = None,
         backfill_end_timestamp: Optional[float] = None,
+        submission_paused_by_time_budget: bool = False,
     ):
         check.invariant(
             not (asset_selection and reexecution_steps),
@@ -195,6 +197,9 @@ def __new__(
             backfill_end_timestamp=check.opt_float_param(
                 backfill_end_timestamp, "backfill_end_timestamp"
             ),
+            submission_paused_by_time_budget=check.bool_param(
+                submission_paused_by_time_budget, "submission_paused_by_time_budget"
+            ),
         )
 
     @property
@@ -408,6 +413,12 @@ def with_end_timestamp(self, end_timestamp: float) -> "PartitionBackfill":
         check.float_param(end_timestamp, "end_timestamp")
         return self._replace(backfill_end_timestamp=end_timestamp)
 
+    def with_submission_paused_by_time_budget(
+        self, submission_paused_by_time_budget: bool
+    ) -> "PartitionBackfill":
+        check.bool_param(submission_paused_by_time_budget, "submission_paused_by_time_budget")
+        return self._replace(submission_paused_by_time_budget=submission_paused_by_time_budget)
+
     def with_asset_backfill_data(
         self,
         asset_backfill_data: AssetBackfillData,
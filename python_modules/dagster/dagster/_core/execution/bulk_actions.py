@@ -1,4 +1,6 @@
+import os
 from enum import Enum
+from typing import Optional
 
 from dagster._serdes import whitelist_for_serdes
 
@@ -7,3 +9,15 @@
 class BulkActionType(Enum):
     PARTITION_BACKFILL = "PARTITION_BACKFILL"
     MULTI_RUN_ASSET_ACTION = "MULTI_RUN_ASSET_ACTION"
+
+
+def get_backfill_iteration_time_budget_seconds() -> Optional[float]:
+    """Returns the number of seconds that a single daemon iteration of a backfill can spend
+    submitting runs before it checkpoints and leaves the remaining runs for the next iteration, so
+    that large backfills don't delay progress on other backfills. Unbounded if unset.
+
+    Only run submission is bounded. Computing which runs an asset backfill should request is not
+    interrupted by the time budget, since its result can't be checkpointed part way through.
+    """
+    time_budget = os.getenv("DAGSTER_BACKFILL_ITERATION_TIME_BUDGET_SECONDS")
+    return float(time_budget) if time_budget else None
@@ -13,6 +13,7 @@
     PartitionBackfill,
     cancel_backfill_runs_and_cancellation_complete,
 )
+from dagster._core.execution.bulk_actions import get_backfill_iteration_time_budget_seconds
 from dagster._core.execution.plan.resume_retry import ReexecutionStrategy
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.instance import DagsterInstance
@@ -85,6 +86,9 @@ def execute_job_backfill_iteration(
             )
         return
 
+    time_budget = get_backfill_iteration_time_budget_seconds()
+    deadline = get_current_timestamp() + time_budget if time_budget else None
+
     has_more = True
     while has_more:
         if backfill.status != BulkActionStatus.REQUESTED:
@@ -119,6 +123,13 @@ def execute_job_backfill_iteration(
             backfill = cast(PartitionBackfill, instance.get_backfill(backfill.backfill_id))
             instance.update_backfill(backfill.with_partition_checkpoint(checkpoint))
             yield None
+            if deadline is not None and get_current_timestamp() >= deadline:
+                # resume from the checkpoint in the next iteration
+                logger.info(
+                    f"Backfill iteration time budget exhausted for {backfill.backfill_id}. Remaining"
+                    " partitions will be submitted in the next iteration."
+                )
+                return
             time.sleep(CHECKPOINT_INTERVAL)
         else:
             unfinished_runs = instance.get_runs(
@@ -3,17 +3,19 @@
 import os
 import queue
 import sys
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -44,6 +46,15 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerIdleEvent(
+    NamedTuple("ChildProcessWorkerIdleEvent", [("pid", int), ("is_exiting", bool)]),
+    ChildProcessEvent,
+):
+    """Sent by a pooled worker process once it has finished a command. If `is_exiting` is set, the
+    worker will exit instead of waiting for another command.
+    """
+
+
 class ChildProcessCommand(ABC):
     """Inherit from this class in order to use this library.
 
@@ -176,3 +187,236 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # not available on windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macos, and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _run_child_process_worker(
+    command_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_bytes: Optional[int],
+) -> None:
+    """Executes ChildProcessCommands from a queue until told to stop, recycling itself once it has
+    executed `max_commands` commands or its peak memory usage exceeds `max_memory_bytes`.
+
+    Setting `term_event` interrupts the command in progress, after which the worker exits.
+    """
+    with capture_interrupts():
+        pid = os.getpid()
+
+        # the termination thread only interrupts the worker while a command is in progress
+        is_idle = threading.Event()
+        is_idle.set()
+        start_termination_thread(term_event, is_idle)
+
+        num_commands = 0
+        try:
+            while True:
+                command = command_queue.get()
+                if command is None:
+                    return
+
+                is_idle.clear()
+                _execute_command_in_child_process(event_queue, command)
+                is_idle.set()
+                num_commands += 1
+
+                max_rss_bytes = _get_max_rss_bytes() if max_memory_bytes else None
+                is_exiting = bool(
+                    term_event.is_set()
+                    or (max_commands and num_commands >= max_commands)
+                    or (max_memory_bytes and max_rss_bytes and max_rss_bytes >= max_memory_bytes)
+                )
+                event_queue.put(ChildProcessWorkerIdleEvent(pid=pid, is_exiting=is_exiting))
+                if is_exiting:
+                    return
+        finally:
+            # stop the termination thread
+            is_idle.set()
+            term_event.set()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time."""
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands: Optional[int],
+        max_memory_bytes: Optional[int],
+    ):
+        self.command_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(  # type: ignore
+            target=_run_child_process_worker,
+            args=(
+                self.command_queue,
+                self.event_queue,
+                self.term_event,
+                max_commands,
+                max_memory_bytes,
+            ),
+        )
+        self.process.start()
+        self.is_retired = False
+
+    def shutdown(self, timeout: float) -> None:
+        if self.process.is_alive():
+            self.command_queue.put(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.command_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived worker processes for executing ChildProcessCommands, to avoid paying
+    the cost of starting a process (and importing user code) for every command.
+
+    Each worker executes one command at a time, so commands are isolated from each other in the
+    same way as with execute_child_process_command, except that they share the worker's
+    interpreter state (e.g. imported modules and cached definitions). Workers are replaced after
+    they crash or are terminated, and are recycled after executing `max_commands_per_worker`
+    commands or once their peak memory usage exceeds `max_worker_memory_bytes`.
+
+    Commands are sent to the workers over a queue, so they must be picklable without relying on
+    inheritance (e.g. they cannot contain multiprocessing Events).
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_workers: int,
+        max_commands_per_worker: Optional[int] = None,
+        max_worker_memory_bytes: Optional[int] = None,
+        shutdown_timeout: float = 30.0,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_worker_memory_bytes = check.opt_int_param(
+            max_worker_memory_bytes, "max_worker_memory_bytes"
+        )
+        self._shutdown_timeout = shutdown_timeout
+        self._idle_workers: list[ChildProcessWorker] = []
+        self._workers: list[ChildProcessWorker] = []
+
+    def _start_worker(self) -> ChildProcessWorker:
+        worker = ChildProcessWorker(
+            self._multiprocessing_ctx,
+            max_commands=self._max_commands_per_worker,
+            max_memory_bytes=self._max_worker_memory_bytes,
+        )
+        self._workers.append(worker)
+        return worker
+
+    def _retire_worker(self, worker: ChildProcessWorker) -> None:
+        worker.is_retired = True
+        worker.shutdown(self._shutdown_timeout)
+        self._workers.remove(worker)
+
+    def start(self, num_workers: Optional[int] = None) -> "ChildProcessWorkerPool":
+        """Starts up to `num_workers` workers ahead of time, so that they are ready to execute
+        commands by the time they are needed.
+        """
+        num_workers = self._max_workers if num_workers is None else num_workers
+        while len(self._workers) < min(num_workers, self._max_workers):
+            self._idle_workers.append(self._start_worker())
+        return self
+
+    def _acquire_worker(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            self._retire_worker(worker)
+
+        check.invariant(
+            len(self._workers) < self._max_workers,
+            f"Cannot execute more than {self._max_workers} commands at once",
+        )
+        return self._start_worker()
+
+    def execute_command(
+        self, command: ChildProcessCommand, term_event: Any
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a ChildProcessCommand in a worker process from the pool.
+
+        Yields the same sequence of objects as execute_child_process_command. Setting `term_event`
+        interrupts the command, and the worker is replaced afterwards.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        worker = self._acquire_worker()
+        is_idle = False
+        is_reusable = False
+        try:
+            worker.command_queue.put(command)
+            yield worker.process
+
+            completed_properly = False
+            while not is_idle:
+                if (
+                    term_event.is_set()
+                    and not worker.term_event.is_set()
+                    and worker.process.is_alive()
+                ):
+                    worker.term_event.set()
+
+                event = _poll_for_event(worker.process, worker.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                if isinstance(event, ChildProcessWorkerIdleEvent):
+                    is_idle = True
+                    is_reusable = not event.is_exiting
+                    continue
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+
+            if not completed_properly:
+                raise ChildProcessCrashException(
+                    pid=worker.process.pid, exit_code=worker.process.exitcode
+                )
+        finally:
+            if is_reusable and not worker.term_event.is_set():
+                self._idle_workers.append(worker)
+            else:
+                # interrupt the command if we stopped waiting for it before it finished. The
+                # event can only be set while the worker is alive, since setting it waits for the
+                # worker's termination thread to be notified.
+                if not is_idle and worker.process.is_alive():
+                    worker.term_event.set()
+                self._retire_worker(worker)
+
+    def shutdown(self) -> None:
+        for worker in list(self._workers):
+            self._retire_worker(worker)
+        self._idle_workers = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
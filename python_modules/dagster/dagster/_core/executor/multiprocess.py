@@ -33,6 +33,7 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -54,7 +55,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -74,7 +75,9 @@ def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
+            # when executing in a worker pool, termination is handled by the worker process
+            if self.term_event is not None:
+                start_termination_thread(self.term_event, done_event)
             try:
                 log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -105,7 +108,8 @@ def execute(self) -> Iterator[DagsterEvent]:
             finally:
                 # set events to stop the termination thread on exit
                 done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+                if self.term_event is not None:
+                    self.term_event.set()
 
 
 class MultiprocessExecutor(Executor):
@@ -116,6 +120,9 @@ def __init__(
         tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -141,6 +148,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -203,6 +217,21 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool: Optional[ChildProcessWorkerPool] = None
+            if self._use_worker_pool:
+                # start the workers up front, so that they are importing user code while the
+                # first steps are being scheduled
+                worker_pool = stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_workers=limit,
+                        max_commands_per_worker=self._max_steps_per_worker,
+                        max_worker_memory_bytes=self._max_worker_memory_mb * 1024 * 1024
+                        if self._max_worker_memory_mb
+                        else None,
+                    )
+                ).start(num_workers=len(execution_plan.step_keys_to_execute))
+
             active_iters: dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: dict[int, SerializableErrorInfo] = {}
             processes: dict[str, BaseProcess] = {}
@@ -250,6 +279,7 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                worker_pool,
                             )
 
                     # process active iterators
@@ -373,26 +403,38 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker_pool: Optional[ChildProcessWorkerPool] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # multiprocessing events can't be sent to worker processes over a queue, so the pool
+        # forwards termination to the worker instead
+        term_event=term_events[step.key] if worker_pool is None else None,
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        f'Launching subprocess for "{step.key}".',
-        metadata={},
-    )
+    if worker_pool is None:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Launching subprocess for "{step.key}".',
+            metadata={},
+        )
+        child_process_iter = execute_child_process_command(multiproc_ctx, command)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Sending "{step.key}" to a worker process.',
+            metadata={},
+        )
+        child_process_iter = worker_pool.execute_command(command, term_events[step.key])
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in child_process_iter:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -1,7 +1,10 @@
+import atexit
 import logging
 import logging.config
 import os
 import sys
+import threading
+import time
 import warnings
 import weakref
 from abc import abstractmethod
@@ -204,6 +207,33 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# When the `event_write_buffer` setting is enabled, events emitted while a step is executing (see
+# `BUFFERABLE_STEP_EVENTS`) are buffered and written to the event log in batches if they are emitted
+# less than `max_age_seconds` after the previous write for the run, so that sparse events are
+# written immediately and bursts of events are batched. Buffered events are written by the thread
+# that emitted them once the buffer reaches `max_size` events or the thread emits an event that
+# isn't buffered (e.g. at the end of the step), and by a background thread once the oldest buffered
+# event is older than the max age. The background thread is not a daemon thread, so the interpreter
+# waits for it to write the remaining buffered events before exiting, and any events it failed to
+# write are written by an exit hook.
+_MAX_TRACKED_RUN_WRITE_TIMES = 1000
+
+_instances_with_buffered_events: "weakref.WeakSet[DagsterInstance]" = weakref.WeakSet()
+
+
+def _flush_buffered_events_at_exit() -> None:
+    for instance in list(_instances_with_buffered_events):
+        try:
+            instance.flush_buffered_events()
+        except Exception:
+            logging.getLogger("dagster").exception(
+                "Exception while writing buffered events to the event log at exit"
+            )
+
+
+atexit.register(_flush_buffered_events_at_exit)
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, tuple[Any, Any]]:
@@ -493,6 +523,19 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: dict[str, list[EventLogEntry]] = defaultdict(list)
 
+        # Used for buffering events emitted during step execution, by run id and the id of the
+        # thread that emitted them. The buffer lock is only held to add to or take from the buffers,
+        # never while writing to the event log. The flush lock is held while buffered events are
+        # written, so that events written by the background flusher thread are stored before any
+        # later events of the same thread.
+        self._event_write_buffer_lock = threading.Lock()
+        self._event_write_buffer_condition = threading.Condition(self._event_write_buffer_lock)
+        self._event_write_flush_lock = threading.RLock()
+        self._event_write_buffers: dict[tuple[str, int], list[EventLogEntry]] = {}
+        self._event_write_flusher_thread: Optional[threading.Thread] = None
+        self._event_write_buffer_keys_in_flight: set[tuple[str, int]] = set()
+        self._last_step_event_write_times: dict[str, float] = {}
+
     # ctors
 
     @public
@@ -969,6 +1012,30 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_evaluation_num_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("evaluation_num_workers")
+
+    @property
+    def asset_status_cache_update_on_write(self) -> bool:
+        return self.get_settings("asset_status_cache").get("update_on_write", False)
+
+    @property
+    def asset_status_cache_reconcile_interval_seconds(self) -> int:
+        return self.get_settings("asset_status_cache").get("reconcile_interval_seconds", 60)
+
+    @property
+    def event_write_buffer_enabled(self) -> bool:
+        return self.get_settings("event_write_buffer").get("enabled", False)
+
+    @property
+    def event_write_buffer_max_size(self) -> int:
+        return self.get_settings("event_write_buffer").get("max_size", 100)
+
+    @property
+    def event_write_buffer_max_age_seconds(self) -> float:
+        return self.get_settings("event_write_buffer").get("max_age_seconds", 0.5)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_concurrency_config().pool_config.default_pool_limit
@@ -1026,6 +1093,9 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_buffered_events()
+        with self._event_write_buffer_condition:
+            self._event_write_buffer_condition.notify_all()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1900,6 +1970,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ) -> Sequence["EventLogEntry"]:
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1913,6 +1984,7 @@ def all_logs(
         run_id: str,
         of_type: Optional[Union["DagsterEventType", set["DagsterEventType"]]] = None,
     ) -> Sequence["EventLogEntry"]:
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1924,6 +1996,7 @@ def get_records_for_run(
         limit: Optional[int] = None,
         ascending: bool = True,
     ) -> "EventLogConnection":
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
@@ -1988,6 +2061,7 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
     def get_latest_materialization_events(
         self, asset_keys: Iterable[AssetKey]
     ) -> Mapping[AssetKey, Optional["EventLogEntry"]]:
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_latest_materialization_events(asset_keys)
 
     @public
@@ -2002,12 +2076,14 @@ def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional["Eve
             Optional[EventLogEntry]: The latest materialization event for the given asset
                 key, or `None` if the asset has not been materialized.
         """
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_latest_materialization_events([asset_key]).get(asset_key)
 
     @traced
     def get_latest_asset_check_evaluation_record(
         self, asset_check_key: "AssetCheckKey"
     ) -> Optional["AssetCheckExecutionRecord"]:
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_latest_asset_check_execution_by_key([asset_check_key]).get(
             asset_check_key
         )
@@ -2055,6 +2131,7 @@ def get_event_records(
                 "Use fetch_run_status_changes instead of get_event_records to fetch run status change events."
             )
 
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
     @public
@@ -2079,6 +2156,7 @@ def fetch_materializations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.fetch_materializations(records_filter, limit, cursor, ascending)
 
     @traced
@@ -2114,6 +2192,7 @@ def fetch_planned_materializations(
                 DagsterEventType.ASSET_MATERIALIZATION_PLANNED, cursor=cursor, ascending=ascending
             )
         )
+        self._flush_buffered_events_for_current_thread()
         records = self._event_storage.get_event_records(
             event_records_filter, limit=limit, ascending=ascending
         )
@@ -2148,6 +2227,7 @@ def fetch_observations(
         Returns:
             EventRecordsResult: Object containing a list of event log records and a cursor string
         """
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.fetch_observations(records_filter, limit, cursor, ascending)
 
     @public
@@ -2206,11 +2286,13 @@ def get_status_by_partition(
 
         if isinstance(cached_value, AssetStatusCacheValue):
             materialized_partitions = cached_value.deserialize_materialized_partition_subsets(
-                partitions_def
+                partitions_def, dynamic_partitions_store=self
+            )
+            failed_partitions = cached_value.deserialize_failed_partition_subsets(
+                partitions_def, dynamic_partitions_store=self
             )
-            failed_partitions = cached_value.deserialize_failed_partition_subsets(partitions_def)
             in_progress_partitions = cached_value.deserialize_in_progress_partition_subsets(
-                partitions_def
+                partitions_def, dynamic_partitions_store=self
             )
 
             status_by_partition = {}
@@ -2240,6 +2322,7 @@ def get_asset_records(
         Returns:
             Sequence[AssetRecord]: List of asset records.
         """
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_asset_records(asset_keys)
 
     @traced
@@ -2295,10 +2378,22 @@ def get_materialized_partitions(
         before_cursor: Optional[int] = None,
         after_cursor: Optional[int] = None,
     ) -> set[str]:
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_materialized_partitions(
             asset_key, before_cursor=before_cursor, after_cursor=after_cursor
         )
 
+    @traced
+    def get_materialized_partitions_by_asset(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, set[str]]:
+        self._flush_buffered_events_for_current_thread()
+        return self._event_storage.get_materialized_partitions_by_asset(
+            asset_keys, after_cursor=after_cursor
+        )
+
     @traced
     def get_latest_storage_id_by_partition(
         self,
@@ -2310,16 +2405,36 @@ def get_latest_storage_id_by_partition(
 
         Returns a mapping of partition to storage id.
         """
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    @traced
+    def get_latest_storage_id_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: "DagsterEventType",
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id of the given event type for each partition of each of the
+        given asset keys, only including partitions whose latest storage id is after the given
+        cursor.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        self._flush_buffered_events_for_current_thread()
+        return self._event_storage.get_latest_storage_id_by_partition_for_assets(
+            asset_keys, event_type, after_cursor=after_cursor
+        )
+
     @traced
     def get_latest_planned_materialization_info(
         self,
         asset_key: AssetKey,
         partition: Optional[str] = None,
     ) -> Optional["PlannedMaterializationInfo"]:
+        self._flush_buffered_events_for_current_thread()
         return self._event_storage.get_latest_planned_materialization_info(asset_key, partition)
 
     @public
@@ -2442,15 +2557,19 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If the `event_write_buffer` setting is enabled, log and output events emitted during step
+        execution may be buffered per run and thread if they are emitted in quick succession, and
+        written in a batch by the same thread once the buffer is full, or when the thread emits an
+        event that isn't buffered. Buffers whose oldest event is older than the max age are written
+        by a background thread. Events are always stored in the order in which each thread handled
+        them. Reads of events through the instance write the events buffered by the calling thread
+        first.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
-        from dagster._core.events import RunFailureReason
-
-        if batch_metadata is None or not _is_batch_writing_enabled():
-            events = [event]
-        else:
+        if batch_metadata is not None and _is_batch_writing_enabled():
             batch_id, is_batch_end = batch_metadata.id, batch_metadata.is_end
             self._event_buffer[batch_id].append(event)
             if is_batch_end or len(self._event_buffer[batch_id]) == _get_event_batch_size():
@@ -2458,6 +2577,190 @@ def handle_new_event(
                 del self._event_buffer[batch_id]
             else:
                 return
+        elif self._should_buffer_event(event):
+            buffer_key = (event.run_id, threading.get_ident())
+            with self._event_write_buffer_lock:
+                buffer = self._event_write_buffers.setdefault(buffer_key, [])
+                buffer.append(event)
+                should_flush = len(buffer) >= self.event_write_buffer_max_size
+                self._ensure_event_write_flusher_thread()
+            if should_flush:
+                self._flush_buffered_events([buffer_key])
+            return
+        else:
+            events = [event]
+
+        # write any buffered events first, so that events are stored in order. Run events also
+        # write the events buffered by other threads, since those threads may never emit another
+        # event for the run
+        run_id = events[0].run_id
+        with self._event_write_buffer_lock:
+            buffer_keys = [
+                buffer_key
+                for buffer_key in self._event_write_buffers
+                if buffer_key[0] == run_id
+                and (buffer_key[1] == threading.get_ident() or not events[0].step_key)
+            ]
+        self._flush_buffered_events(buffer_keys)
+        self._store_events(events)
+
+    def _should_buffer_event(self, event: "EventLogEntry") -> bool:
+        from dagster._core.events import BUFFERABLE_STEP_EVENTS
+
+        if not self.event_write_buffer_enabled:
+            return False
+
+        # asset events and failures are the source of truth for the state of assets and runs, so
+        # they are never held in memory, where a killed process would lose them
+        if not (
+            event.run_id
+            and event.step_key
+            and (
+                event.dagster_event_type in BUFFERABLE_STEP_EVENTS
+                if event.is_dagster_event
+                else event.level < logging.ERROR
+            )
+        ):
+            return False
+
+        if (
+            self.event_write_buffer_max_size <= 0
+            or not self._event_storage.supports_batch_writes_for_all_event_types
+        ):
+            return False
+
+        with self._event_write_buffer_lock:
+            if (event.run_id, threading.get_ident()) in self._event_write_buffers:
+                return True
+
+            # only buffer events if they are being emitted faster than the max age, so that
+            # isolated events are not delayed
+            last_write_time = self._last_step_event_write_times.get(event.run_id)
+            return (
+                last_write_time is not None
+                and time.monotonic() - last_write_time < self.event_write_buffer_max_age_seconds
+            )
+
+    def _ensure_event_write_flusher_thread(self) -> None:
+        # must be called with the buffer lock held. The thread exits once all buffers are written,
+        # or a write fails, and is started again the next time an event is buffered. It isn't a
+        # daemon thread, so that the interpreter doesn't exit before it has written the buffers.
+        if (
+            self._event_write_flusher_thread is None
+            or not self._event_write_flusher_thread.is_alive()
+        ):
+            self._event_write_flusher_thread = threading.Thread(
+                target=self._flush_expired_event_write_buffers,
+                name="event-write-buffer-flusher",
+            )
+            self._event_write_flusher_thread.start()
+            _instances_with_buffered_events.add(self)
+
+    def _flush_expired_event_write_buffers(self) -> None:
+        while True:
+            with self._event_write_buffer_condition:
+                if not self._event_write_buffers:
+                    self._event_write_flusher_thread = None
+                    return
+
+                max_age = self.event_write_buffer_max_age_seconds
+                oldest_timestamps = {
+                    buffer_key: buffer[0].timestamp
+                    for buffer_key, buffer in self._event_write_buffers.items()
+                }
+                now = time.time()
+                expired_keys = [
+                    buffer_key
+                    for buffer_key, timestamp in oldest_timestamps.items()
+                    if now - timestamp >= max_age
+                ]
+                if not expired_keys:
+                    self._event_write_buffer_condition.wait(
+                        min(oldest_timestamps.values()) + max_age - now
+                    )
+                    continue
+
+            try:
+                self._flush_buffered_events(expired_keys)
+            except Exception:
+                # the events are kept in their buffers, and are written by the next flush of the
+                # emitting thread, the next time the flusher thread starts, or at exit. Stopping
+                # here keeps a failing event log from holding up interpreter shutdown.
+                logging.getLogger("dagster").exception(
+                    "Exception while writing buffered events to the event log"
+                )
+                with self._event_write_buffer_condition:
+                    self._event_write_flusher_thread = None
+                return
+
+    def _flush_buffered_events(self, buffer_keys: Iterable[tuple[str, int]]) -> None:
+        # events are only removed from their buffer once they have been written, so that a thread
+        # that flushes the same buffer concurrently waits for the write to finish, and failed
+        # writes are retried with the next flush instead of being lost
+        with self._event_write_flush_lock:
+            for buffer_key in buffer_keys:
+                # skip buffers that are being written further up the stack, e.g. when a subscriber
+                # handles a new event
+                if buffer_key in self._event_write_buffer_keys_in_flight:
+                    continue
+                with self._event_write_buffer_lock:
+                    events = list(self._event_write_buffers.get(buffer_key, []))
+                if not events:
+                    continue
+
+                self._event_write_buffer_keys_in_flight.add(buffer_key)
+                try:
+                    self._store_events(events)
+                finally:
+                    self._event_write_buffer_keys_in_flight.discard(buffer_key)
+
+                with self._event_write_buffer_condition:
+                    remaining = self._event_write_buffers[buffer_key][len(events) :]
+                    if remaining:
+                        self._event_write_buffers[buffer_key] = remaining
+                    else:
+                        del self._event_write_buffers[buffer_key]
+                        if not self._event_write_buffers:
+                            self._event_write_buffer_condition.notify_all()
+
+    def _flush_buffered_events_for_current_thread(self) -> None:
+        # fast path for the common case where nothing is buffered, since this is called before
+        # every read of the event log through the instance
+        if not self._event_write_buffers:
+            return
+        with self._event_write_buffer_lock:
+            buffer_keys = [
+                buffer_key
+                for buffer_key in self._event_write_buffers
+                if buffer_key[1] == threading.get_ident()
+            ]
+        self._flush_buffered_events(buffer_keys)
+
+    def flush_buffered_events(self, run_id: Optional[str] = None) -> None:
+        """Write any events that are buffered in memory to the event log, either for the given run
+        or for all runs.
+        """
+        with self._event_write_buffer_lock:
+            buffer_keys = [
+                buffer_key
+                for buffer_key in self._event_write_buffers
+                if run_id is None or buffer_key[0] == run_id
+            ]
+        self._flush_buffered_events(buffer_keys)
+
+    def _record_step_event_write_time(self, run_id: str) -> None:
+        if not self.event_write_buffer_enabled:
+            return
+        # the entry for a run is removed when its job events are written, but a run worker that is
+        # killed never writes them, so only the most recently written runs are tracked
+        with self._event_write_buffer_lock:
+            self._last_step_event_write_times.pop(run_id, None)
+            self._last_step_event_write_times[run_id] = time.monotonic()
+            if len(self._last_step_event_write_times) > _MAX_TRACKED_RUN_WRITE_TIMES:
+                del self._last_step_event_write_times[next(iter(self._last_step_event_write_times))]
+
+    def _store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        from dagster._core.events import RunFailureReason
 
         if len(events) == 1:
             self._event_storage.store_event(events[0])
@@ -2469,16 +2772,23 @@ def handle_new_event(
             # Exception because that is the parent class of the actually received error,
             # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
             # it living in a cloud package.
-            except Exception as e:
-                sys.stderr.write(f"Exception while storing event batch: {e}\n")
-                sys.stderr.write(
-                    "Falling back to storing multiple single-event storage requests...\n"
+            except Exception:
+                logging.getLogger("dagster").warning(
+                    "Exception while storing event batch, falling back to storing multiple"
+                    " single-event storage requests",
+                    exc_info=True,
                 )
                 for event in events:
                     self._event_storage.store_event(event)
 
+        if events[-1].step_key:
+            self._record_step_event_write_time(events[-1].run_id)
+
         for event in events:
             run_id = event.run_id
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._last_step_event_write_times.pop(run_id, None)
+
             if (
                 not self._event_storage.handles_run_events_in_store_event
                 and event.is_dagster_event
@@ -3096,6 +3406,7 @@ def get_required_daemon_types(self) -> Sequence[str]:
         from dagster._core.run_coordinator import QueuedRunCoordinator
         from dagster._core.scheduler import DagsterDaemonScheduler
         from dagster._daemon.asset_daemon import AssetDaemon
+        from dagster._daemon.asset_status_cache import AssetStatusCacheDaemon
         from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
         from dagster._daemon.daemon import (
             BackfillDaemon,
@@ -3121,6 +3432,8 @@ def get_required_daemon_types(self) -> Sequence[str]:
             daemons.append(EventLogConsumerDaemon.daemon_type())
         if self.auto_materialize_enabled or self.auto_materialize_use_sensors:
             daemons.append(AssetDaemon.daemon_type())
+        if self.asset_status_cache_update_on_write:
+            daemons.append(AssetStatusCacheDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
@@ -599,9 +599,73 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "evaluation_num_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the automation conditions of "
+                        "independent assets within a single tick in parallel. If not set, "
+                        "conditions are evaluated serially."
+                    ),
+                ),
             }
         ),
         "concurrency": get_concurrency_config(),
+        "asset_status_cache": Field(
+            {
+                "update_on_write": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to apply partitioned asset events to the cached partition status"
+                        " of their asset as they are written, and to run a daemon that keeps the"
+                        " cached partition status of every partitioned asset up to date."
+                    ),
+                ),
+                "reconcile_interval_seconds": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How often the asset status cache daemon checks for stale cached partition"
+                        " statuses. Defaults to 60 seconds."
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
+        "event_write_buffer": Field(
+            {
+                "enabled": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to buffer log and output events emitted in quick succession during"
+                        " step execution in memory, and write them to the event log in batches."
+                        " Buffered events that have not been written yet are lost if the process"
+                        " is killed. Asset and failure events are always written immediately."
+                    ),
+                ),
+                "max_size": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many events to buffer per run and thread before writing them."
+                        " Defaults to 100."
+                    ),
+                ),
+                "max_age_seconds": Field(
+                    float,
+                    is_required=False,
+                    description=(
+                        "How long an event can stay buffered before it is written. Defaults to 0.5"
+                        " seconds."
+                    ),
+                ),
+            },
+            is_required=False,
+        ),
     }
 
 
@@ -458,6 +458,8 @@ def from_dir(
             "nux",
             "auto_materialize",
             "concurrency",
+            "asset_status_cache",
+            "event_write_buffer",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -361,6 +361,13 @@ def with_user_interrupted(self, user_interrupted: bool) -> "InstigatorTick":
             tick_data=self.tick_data.with_user_interrupted(user_interrupted=user_interrupted)
         )
 
+    def with_evaluation_durations(
+        self, evaluation_durations: Mapping[str, float]
+    ) -> "InstigatorTick":
+        return self._replace(
+            tick_data=self.tick_data.with_evaluation_durations(evaluation_durations)
+        )
+
     @property
     def instigator_origin_id(self) -> str:
         return self.tick_data.instigator_origin_id
@@ -583,6 +590,7 @@ class TickData(
                 "user_interrupted",
                 bool,
             ),  # indicates if a user stopped the tick while submitting runs
+            ("evaluation_durations", Optional[Mapping[str, float]]),
         ],
     )
 ):
@@ -625,6 +633,10 @@ class TickData(
             example, if a daily schedule fails on 3 consecutive days, failure_count tracks the
             number of failures for each day, and consecutive_failure_count tracks the total
             number of consecutive failures across all days.
+        user_interrupted (bool): Whether a user stopped the tick while it was submitting runs.
+        evaluation_durations (Optional[Mapping[str, float]]): For AUTO_MATERIALIZE ticks, the
+            number of seconds spent evaluating the automation condition of the slowest entities
+            evaluated by the tick, keyed by the user string of the entity key.
     """
 
     def __new__(
@@ -652,6 +664,7 @@ def __new__(
         reserved_run_ids: Optional[Sequence[str]] = None,
         consecutive_failure_count: Optional[int] = None,
         user_interrupted: bool = False,
+        evaluation_durations: Optional[Mapping[str, float]] = None,
     ):
         _validate_tick_args(instigator_type, status, run_ids, error, skip_reason)
         check.opt_list_param(log_key, "log_key", of_type=str)
@@ -684,6 +697,9 @@ def __new__(
                 consecutive_failure_count, "consecutive_failure_count", 0
             ),
             user_interrupted=user_interrupted,
+            evaluation_durations=check.opt_nullable_mapping_param(
+                evaluation_durations, "evaluation_durations", key_type=str, value_type=float
+            ),
         )
 
     def with_status(
@@ -793,6 +809,14 @@ def with_user_interrupted(self, user_interrupted: bool):
             )
         )
 
+    def with_evaluation_durations(self, evaluation_durations: Mapping[str, float]) -> "TickData":
+        return TickData(
+            **merge_dicts(
+                self._asdict(),
+                {"evaluation_durations": evaluation_durations},
+            )
+        )
+
 
 def _validate_tick_args(
     instigator_type: InstigatorType,
@@ -0,0 +1,78 @@
+"""add asset partition status table
+
+Revision ID: a1c4e7d2f9b3
+Revises: 7e2f3204cf8e
+Create Date: 2025-02-10 10:12:31.482913
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "a1c4e7d2f9b3"
+down_revision = "7e2f3204cf8e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("asset_partition_status"):
+        op.create_table(
+            "asset_partition_status",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("asset_partition_hash", db.String(64), nullable=False),
+            db.Column(
+                "last_materialization_storage_id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+            ),
+            db.Column(
+                "last_observation_storage_id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+            ),
+            db.Column(
+                "last_planned_materialization_storage_id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+            ),
+        )
+        op.create_index(
+            "idx_asset_partition_status",
+            "asset_partition_status",
+            ["asset_key", "partition"],
+            mysql_length={"asset_key": 64, "partition": 64},
+        )
+        op.create_index(
+            "idx_asset_partition_status_hash",
+            "asset_partition_status",
+            ["asset_partition_hash"],
+            unique=True,
+        )
+        op.create_index(
+            "idx_asset_partition_status_materialization",
+            "asset_partition_status",
+            ["asset_key", "last_materialization_storage_id"],
+            mysql_length={"asset_key": 64},
+        )
+
+
+def downgrade():
+    if has_index("asset_partition_status", "idx_asset_partition_status_materialization"):
+        op.drop_index("idx_asset_partition_status_materialization", "asset_partition_status")
+
+    if has_index("asset_partition_status", "idx_asset_partition_status_hash"):
+        op.drop_index("idx_asset_partition_status_hash", "asset_partition_status")
+
+    if has_index("asset_partition_status", "idx_asset_partition_status"):
+        op.drop_index("idx_asset_partition_status", "asset_partition_status")
+
+    if has_table("asset_partition_status"):
+        op.drop_table("asset_partition_status")
@@ -0,0 +1,57 @@
+"""add run partition status table
+
+Revision ID: b7d2e5f1c8a4
+Revises: a1c4e7d2f9b3
+Create Date: 2025-02-17 14:03:52.106284
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "b7d2e5f1c8a4"
+down_revision = "a1c4e7d2f9b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_table("run_partition_status"):
+        op.create_table(
+            "run_partition_status",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("repository_label", db.Text, nullable=False),
+            db.Column("partition_set", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("status", db.String(63), nullable=False),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+            db.Column("update_timestamp", db.DateTime),
+        )
+        op.create_index(
+            "idx_run_partition_status",
+            "run_partition_status",
+            ["partition_set", "repository_label", "partition"],
+            unique=True,
+            mysql_length={"partition_set": 255, "repository_label": 255, "partition": 255},
+        )
+
+
+def downgrade():
+    if has_index("run_partition_status", "idx_run_partition_status"):
+        op.drop_index("idx_run_partition_status", "run_partition_status")
+
+    if has_table("run_partition_status"):
+        op.drop_table("run_partition_status")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from typing import Any, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
@@ -11,6 +11,7 @@
     MultiPartitionKey,
     MultiPartitionsDefinition,
 )
+from dagster._core.definitions.partition import PartitionsDefinition
 from dagster._core.definitions.time_window_partitions import (
     TimeWindow,
     TimeWindowPartitionsDefinition,
@@ -29,11 +30,21 @@ class TablePartitionDimension(NamedTuple):
 
 
 class TableSlice(NamedTuple):
+    """The subset of a table that an asset or op output is stored in.
+
+    ``partition_dimensions`` selects the cartesian product of the partitions of each dimension.
+    When a multi-partitioned slice is not a single product (e.g. a range of multi-partition keys),
+    ``partition_dimension_groups`` is set to groups of dimensions whose union selects exactly the
+    slice, and ``partition_dimensions`` holds the smallest product that contains all of them. Such
+    slices are only passed to db clients that set ``supports_partition_dimension_groups``.
+    """
+
     table: str
     schema: str
     database: Optional[str] = None
     columns: Optional[Sequence[str]] = None
     partition_dimensions: Optional[Sequence[TablePartitionDimension]] = None
+    partition_dimension_groups: Optional[Sequence[Sequence[TablePartitionDimension]]] = None
 
 
 class DbTypeHandler(ABC, Generic[T]):
@@ -54,6 +65,10 @@ def supported_types(self) -> Sequence[type[object]]:
 
 
 class DbClient(Generic[T]):
+    # Whether the client selects and deletes the union of a table slice's
+    # `partition_dimension_groups` when they are set, rather than its `partition_dimensions`.
+    supports_partition_dimension_groups: bool = False
+
     @staticmethod
     @abstractmethod
     def delete_table_slice(
@@ -184,7 +199,8 @@ def _get_table_slice(
 
         schema: str
         table: str
-        partition_dimensions: list[TablePartitionDimension] = []
+        partition_dimensions: Sequence[TablePartitionDimension] = []
+        partition_dimension_groups: Optional[Sequence[Sequence[TablePartitionDimension]]] = None
         if context.has_asset_key:
             asset_key_path = context.asset_key.path
             table = asset_key_path[-1]
@@ -209,20 +225,8 @@ def _get_table_slice(
                     )
 
                 if isinstance(context.asset_partitions_def, MultiPartitionsDefinition):
-                    multi_partition_key_mapping = cast(
-                        MultiPartitionKey, context.asset_partition_key
-                    ).keys_by_dimension
                     for part in context.asset_partitions_def.partitions_defs:
-                        partition_key = multi_partition_key_mapping[part.name]
-                        if isinstance(part.partitions_def, TimeWindowPartitionsDefinition):
-                            partitions = part.partitions_def.time_window_for_partition_key(
-                                partition_key
-                            )
-                        else:
-                            partitions = [partition_key]
-
-                        partition_expr_str = cast(Mapping[str, str], partition_expr).get(part.name)
-                        if partition_expr is None:
+                        if cast(Mapping[str, str], partition_expr).get(part.name) is None:
                             raise ValueError(
                                 f"Asset '{context.asset_key}' has partition {part.name}, but the"
                                 f" 'partition_expr' metadata does not contain a {part.name} entry,"
@@ -230,13 +234,32 @@ def _get_table_slice(
                                 " column of the database contains data for the"
                                 f" {part.name} partition."
                             )
-                        partition_dimensions.append(
-                            TablePartitionDimension(
-                                partition_expr=cast(str, partition_expr_str), partitions=partitions
-                            )
+
+                    groups = _get_multi_partition_dimension_groups(
+                        context.asset_partitions_def,
+                        context.asset_partition_keys,
+                        cast(Mapping[str, str], partition_expr),
+                    )
+                    if len(groups) == 1:
+                        partition_dimensions = groups[0]
+                    elif not self._db_client.supports_partition_dimension_groups:
+                        # the bounding product of the groups would select partitions outside of
+                        # the slice
+                        raise ValueError(
+                            f"Asset '{context.asset_key}' is multi-partitioned, and the selected"
+                            " partitions are not the cartesian product of partitions of each"
+                            f" dimension, which {self._io_manager_name} does not support. Select"
+                            " the partitions of each product in a separate run."
                         )
+                    else:
+                        partition_dimensions = _get_bounding_partition_dimensions(
+                            context.asset_partitions_def,
+                            groups,
+                            cast(Mapping[str, str], partition_expr),
+                        )
+                        partition_dimension_groups = groups or None
                 elif isinstance(context.asset_partitions_def, TimeWindowPartitionsDefinition):
-                    partition_dimensions.append(
+                    partition_dimensions = [
                         TablePartitionDimension(
                             partition_expr=cast(str, partition_expr),
                             partitions=(
@@ -245,14 +268,14 @@ def _get_table_slice(
                                 else []
                             ),
                         )
-                    )
+                    ]
                 else:
-                    partition_dimensions.append(
+                    partition_dimensions = [
                         TablePartitionDimension(
                             partition_expr=cast(str, partition_expr),
                             partitions=context.asset_partition_keys,
                         )
-                    )
+                    ]
         else:
             table = output_context.name
             if output_context_metadata.get("schema"):
@@ -268,6 +291,7 @@ def _get_table_slice(
             database=self._database,
             partition_dimensions=partition_dimensions,
             columns=(context.definition_metadata or {}).get("columns"),
+            partition_dimension_groups=partition_dimension_groups,
         )
 
     def _check_supported_type(self, obj_type):
@@ -291,3 +315,115 @@ def _check_supported_type(self, obj_type):
                 )
 
             raise CheckError(msg)
+
+
+def _get_multi_partition_dimension_groups(
+    partitions_def: MultiPartitionsDefinition,
+    partition_keys: Sequence[str],
+    partition_expr_by_dimension: Mapping[str, str],
+) -> Sequence[Sequence[TablePartitionDimension]]:
+    """Splits a set of multi-partition keys into groups of partition dimensions, such that each
+    group selects the cartesian product of its dimensions' partitions, and the union of the groups
+    selects exactly the given keys.
+
+    Keys are grouped on the time window dimension if there is one, so that a range of time
+    partitions across a set of static partitions compiles to a single time window predicate.
+    """
+    dimensions = partitions_def.partitions_defs
+    outer_dim, inner_dim = sorted(
+        dimensions,
+        key=lambda dim: not isinstance(dim.partitions_def, TimeWindowPartitionsDefinition),
+    )
+
+    outer_keys_by_inner_key: dict[str, set[str]] = {}
+    for partition_key in partition_keys:
+        keys_by_dimension = cast(
+            MultiPartitionKey, partitions_def.get_partition_key_from_str(partition_key)
+        ).keys_by_dimension
+        outer_keys_by_inner_key.setdefault(keys_by_dimension[inner_dim.name], set()).add(
+            keys_by_dimension[outer_dim.name]
+        )
+
+    inner_keys_by_outer_keys: dict[frozenset[str], list[str]] = {}
+    for inner_key, outer_keys in outer_keys_by_inner_key.items():
+        inner_keys_by_outer_keys.setdefault(frozenset(outer_keys), []).append(inner_key)
+
+    groups = []
+    for outer_keys, inner_keys in inner_keys_by_outer_keys.items():
+        for outer_partitions in _get_dimension_partitions(outer_dim.partitions_def, outer_keys):
+            for inner_partitions in _get_dimension_partitions(inner_dim.partitions_def, inner_keys):
+                partitions_by_dimension = {
+                    outer_dim.name: outer_partitions,
+                    inner_dim.name: inner_partitions,
+                }
+                groups.append(
+                    [
+                        TablePartitionDimension(
+                            partition_expr=partition_expr_by_dimension[dim.name],
+                            partitions=partitions_by_dimension[dim.name],
+                        )
+                        for dim in dimensions
+                    ]
+                )
+    return groups
+
+
+def _get_dimension_partitions(
+    partitions_def: PartitionsDefinition, partition_keys: Iterable[str]
+) -> Sequence[Union[TimeWindow, Sequence[str]]]:
+    """Returns the time windows spanned by each run of consecutive partitions of a time window
+    partitions definition, or the list of keys of any other partitions definition.
+    """
+    if not isinstance(partitions_def, TimeWindowPartitionsDefinition):
+        return [sorted(partition_keys)]
+
+    index_intervals = []
+    for index in partitions_def.get_partition_indexes_for_partition_keys(
+        partition_keys, validate=False
+    ):
+        if index_intervals and index_intervals[-1][1] == index:
+            index_intervals[-1] = (index_intervals[-1][0], index + 1)
+        else:
+            index_intervals.append((index, index + 1))
+
+    return [
+        time_window.to_public_time_window()
+        for time_window in partitions_def.get_time_windows_for_partition_index_intervals(
+            index_intervals
+        )
+    ]
+
+
+def _get_bounding_partition_dimensions(
+    partitions_def: MultiPartitionsDefinition,
+    groups: Sequence[Sequence[TablePartitionDimension]],
+    partition_expr_by_dimension: Mapping[str, str],
+) -> Sequence[TablePartitionDimension]:
+    """Returns the smallest product of partition dimensions that contains every group."""
+    partition_dimensions = []
+    for i, dim in enumerate(partitions_def.partitions_defs):
+        dimension_partitions = [group[i].partitions for group in groups]
+        if isinstance(dim.partitions_def, TimeWindowPartitionsDefinition):
+            time_windows = cast(Sequence[TimeWindow], dimension_partitions)
+            partitions = (
+                TimeWindow(
+                    start=min(time_window.start for time_window in time_windows),
+                    end=max(time_window.end for time_window in time_windows),
+                )
+                if time_windows
+                else []
+            )
+        else:
+            partitions = sorted(
+                {
+                    key
+                    for keys in cast(Sequence[Sequence[str]], dimension_partitions)
+                    for key in keys
+                }
+            )
+        partition_dimensions.append(
+            TablePartitionDimension(
+                partition_expr=partition_expr_by_dimension[dim.name], partitions=partitions
+            )
+        )
+    return partition_dimensions
@@ -11,6 +11,7 @@
 )
 from dagster._core.storage.event_log.schema import (
     AssetKeyTable as AssetKeyTable,
+    AssetPartitionStatusTable as AssetPartitionStatusTable,
     DynamicPartitionsTable as DynamicPartitionsTable,
     SqlEventLogStorageMetadata as SqlEventLogStorageMetadata,
     SqlEventLogStorageTable as SqlEventLogStorageTable,
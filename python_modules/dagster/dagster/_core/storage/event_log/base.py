@@ -476,6 +476,19 @@ def get_materialized_partitions(
     ) -> set[str]:
         pass
 
+    def get_materialized_partitions_by_asset(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, set[str]]:
+        """Fetch the materialized partitions of each of the given asset keys. Storages that can
+        look up many assets at once should override this method.
+        """
+        return {
+            asset_key: self.get_materialized_partitions(asset_key, after_cursor=after_cursor)
+            for asset_key in asset_keys
+        }
+
     @abstractmethod
     def get_latest_storage_id_by_partition(
         self,
@@ -485,6 +498,54 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_storage_id_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id of the given event type for each partition of each of the
+        given asset keys, only including partitions whose latest storage id is after the given
+        cursor. Storages that can look up many assets at once should override this method.
+        """
+        return {
+            asset_key: {
+                partition: storage_id
+                for partition, storage_id in self.get_latest_storage_id_by_partition(
+                    asset_key, event_type
+                ).items()
+                if after_cursor is None or storage_id > after_cursor
+            }
+            for asset_key in asset_keys
+        }
+
+    def get_materialization_records_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: int,
+        before_cursor: int,
+        limit: int,
+    ) -> Sequence[EventLogRecord]:
+        """Fetch the materialization records of the given asset keys with storage ids between the
+        given cursors, in ascending storage id order. Storages that can look up many assets at once
+        should override this method.
+        """
+        records = [
+            record
+            for asset_key in asset_keys
+            for record in self.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    asset_key=asset_key,
+                    after_cursor=after_cursor,
+                    before_cursor=before_cursor,
+                ),
+                limit=limit,
+                ascending=True,
+            )
+        ]
+        return sorted(records, key=lambda record: record.storage_id)[:limit]
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
@@ -681,6 +742,14 @@ def get_updated_data_version_partitions(
     def handles_run_events_in_store_event(self) -> bool:
         return False
 
+    @property
+    def supports_batch_writes_for_all_event_types(self) -> bool:
+        """Whether `store_event_batch` can write batches of any type of event in fewer round trips
+        than storing each event individually, so that the instance can buffer events emitted
+        during step execution and write them in batches.
+        """
+        return False
+
     def default_run_scoped_event_tailer_offset(self) -> int:
         return 0
 
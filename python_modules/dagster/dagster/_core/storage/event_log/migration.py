@@ -11,11 +11,18 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+# builds the asset partition status table from the event log
+ASSET_PARTITION_STATUS_TABLE = "asset_partition_status_table"
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITION_STATUS_TABLE: lambda: migrate_asset_partition_status_data,
+}
+# tables that must be created by a schema migration before the data migration can run
+ASSET_DATA_MIGRATION_TABLES = {ASSET_PARTITION_STATUS_TABLE: "asset_partition_status"}
 
 
 def migrate_event_log_data(instance=None):
@@ -159,6 +166,32 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_partition_status_data(event_log_storage, print_fn=None):
+    """Utility method to build the asset partition status table from the data in existing event log
+    records.
+    """
+    from dagster._core.definitions.events import AssetKey
+    from dagster._core.storage.event_log.schema import AssetKeyTable
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying asset keys.")
+        results = conn.execute(db_select([AssetKeyTable.c.asset_key])).fetchall()
+
+    if print_fn:
+        print_fn(f"Found {len(results)} assets to index.")
+        results = tqdm(results)
+
+    for (asset_key_str,) in results:
+        asset_key = AssetKey.from_db_string(asset_key_str)
+        if asset_key:
+            event_log_storage.rebuild_asset_partition_status(asset_key)
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 
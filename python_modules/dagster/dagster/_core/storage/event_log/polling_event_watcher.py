@@ -1,13 +1,13 @@
+import logging
 import os
 import threading
-from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+from collections.abc import Sequence
+from typing import Callable, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
-
-if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -26,29 +26,39 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids
+    This class' job is to manage a single thread (SqlPollingEventWatcherThread) that polls the event
+    log on behalf of every watched run_id.
+
+    Storages that can be notified of new events (e.g. via Postgres LISTEN/NOTIFY) can call
+    `notify_new_events` to wake the thread up instead of waiting for the next poll, and can raise
+    the maximum poll period with `set_max_poll_period` while they have confirmed that
+    notifications are delivered.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        ORDER: _thread_lock -> watcher_thread._watched_runs_lock
+        INVARIANTS: _thread_lock protects _watcher_thread
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(
+        self, event_log_storage: EventLogStorage, max_poll_period: float = MAX_POLL_PERIOD
+    ):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._max_poll_period = check.numeric_param(max_poll_period, "max_poll_period")
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _thread_lock protects _watcher_thread
+        self._thread_lock: threading.Lock = threading.Lock()
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._thread_lock:
+            _has_run_id = self._watcher_thread is not None and self._watcher_thread.has_run_id(
+                run_id
+            )
         return _has_run_id
 
     def watch_run(
@@ -62,14 +72,18 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._thread_lock:
+            if self._watcher_thread is None or not self._watcher_thread.is_alive():
+                # carry the runs watched by a thread that died over to its replacement
+                watched_runs = (
+                    self._watcher_thread.watched_runs if self._watcher_thread is not None else {}
+                )
+                self._watcher_thread = SqlPollingEventWatcherThread(
+                    self._event_log_storage, self._max_poll_period, watched_runs
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+            self._watcher_thread.add_callback(run_id, cursor, callback)
 
     def unwatch_run(
         self,
@@ -78,113 +92,232 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._thread_lock:
+            if self._watcher_thread is not None:
+                self._watcher_thread.remove_callback(run_id, handler)
+
+    def notify_new_events(self, run_id: str) -> None:
+        """Wakes the watcher thread to fetch new events right away if the given run is watched."""
+        run_id = check.str_param(run_id, "run_id")
+        with self._thread_lock:
+            if self._watcher_thread is not None and self._watcher_thread.has_run_id(run_id):
+                self._watcher_thread.wake()
+
+    def set_max_poll_period(self, max_poll_period: float) -> None:
+        """Changes the longest time the watcher thread waits between polls."""
+        self._max_poll_period = check.numeric_param(max_poll_period, "max_poll_period")
+        with self._thread_lock:
+            if self._watcher_thread is not None:
+                self._watcher_thread.set_max_poll_period(self._max_poll_period)
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._thread_lock:
+                if self._watcher_thread is not None:
+                    self._watcher_thread.should_thread_exit.set()
+                    self._watcher_thread.wake()
+                    self._watcher_thread.join()
+                    self._watcher_thread = None
 
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+class _WatchedRun:
+    """The callbacks watching a run, and the storage id of the last event of the run that has been
+    passed to them.
+    """
+
+    def __init__(self, storage_id: int):
+        self.storage_id = storage_id
+        self.callbacks: list[CallbackAfterCursor] = []
+
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches a set of run_ids for new Events by polling every POLLING_CADENCE.
+
+    Holds a list of callbacks for each watched run, each passed in by an `Observer`. Note that
         the callbacks have a cursor associated; this means that the callbacks should be
         only executed on EventLogEntrys with an associated id >= callback.cursor
+    When the event log storage is not run sharded, the new events of all watched runs are fetched
+        with a single query per poll, instead of one query per run.
     Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+        INVARIANTS: _watched_runs_lock protects _watched_runs
 
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_poll_period: float,
+        watched_runs: Optional[dict[str, _WatchedRun]] = None,
+    ):
         super().__init__()
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: list[CallbackAfterCursor] = []
+        self._max_poll_period = max_poll_period
+        self._watched_runs_lock: threading.Lock = threading.Lock()
+        self._watched_runs: dict[str, _WatchedRun] = dict(watched_runs or {})
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._wake_event = threading.Event()
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+    @property
+    def watched_runs(self) -> dict[str, _WatchedRun]:
+        with self._watched_runs_lock:
+            return dict(self._watched_runs)
+
+    def has_run_id(self, run_id: str) -> bool:
+        with self._watched_runs_lock:
+            return run_id in self._watched_runs
+
+    def wake(self) -> None:
+        self._wake_event.set()
+
+    def set_max_poll_period(self, max_poll_period: float) -> None:
+        self._max_poll_period = max_poll_period
+        # wake the thread so that a shorter period applies to the current wait
+        self.wake()
+
+    def add_callback(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
         """Observer has started watching this run.
             Add a callback to execute on new EventLogEntrys after the given cursor.
 
         Args:
+            run_id (str): the run to watch
             cursor (Optional[str]): event log cursor for the callback to execute
             callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
         """
+        run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        with self._watched_runs_lock:
+            if run_id not in self._watched_runs:
+                # rely on the fact that all storage ids will be positive integers
+                self._watched_runs[run_id] = _WatchedRun(
+                    EventLogCursor.parse(cursor).storage_id() if cursor else -1
+                )
+            self._watched_runs[run_id].callbacks.append(CallbackAfterCursor(cursor, callback))
+        self.wake()
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+            Also stop polling for the run if no callbacks remaining (i.e. no Observers are watching
+            this run_id)
 
         Args:
+            run_id (str): the run being watched
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
+        run_id = check.str_param(run_id, "run_id")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
+        with self._watched_runs_lock:
+            watched_run = self._watched_runs.get(run_id)
+            if watched_run is None:
+                return
+            watched_run.callbacks = [
                 callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
+                for callback_with_cursor in watched_run.callbacks
                 if callback_with_cursor.callback != callback
             ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+            if not watched_run.callbacks:
+                del self._watched_runs[run_id]
 
     def run(self) -> None:
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+        Wakes every POLLING_CADENCE, or when woken up by `wake` &
+            1. executes a SELECT query to get new EventLogEntrys for the watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Uses the storage id of the last event passed to the callbacks of each run as a cursor in the
+        DB to make sure that only new records are retrieved.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
 
         chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
 
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
+        while True:
+            self._wake_event.wait(wait_time)
+            self._wake_event.clear()
+            if self._should_thread_exit.is_set():
+                break
+
+            with self._watched_runs_lock:
+                watched_runs = dict(self._watched_runs)
+
+            if not watched_runs:
+                wait_time = self._max_poll_period
+                continue
+
+            try:
+                if (
+                    isinstance(self._event_log_storage, SqlEventLogStorage)
+                    and not self._event_log_storage.is_run_sharded
+                ):
+                    has_new_records = self._poll_all_runs(watched_runs, chunk_limit)
+                else:
+                    has_new_records = False
+                    for run_id, watched_run in watched_runs.items():
+                        has_new_records |= self._poll_run(run_id, watched_run, chunk_limit)
+            except Exception:
+                # a transient storage error should not kill the thread, which would silently stop
+                # the updates of every watched run, so back off and retry on the next poll
+                logging.exception("Exception while polling the event log for watched runs.")
+                has_new_records = False
+
+            wait_time = (
+                INIT_POLL_PERIOD if has_new_records else min(wait_time * 2, self._max_poll_period)
             )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+    def _poll_all_runs(self, watched_runs: dict[str, _WatchedRun], chunk_limit: int) -> bool:
+        storage = check.inst(self._event_log_storage, SqlEventLogStorage)
+        records = storage.get_records_for_runs_after_storage_id(
+            list(watched_runs.keys()),
+            min(watched_run.storage_id for watched_run in watched_runs.values()),
+            limit=chunk_limit,
+        )
+        self._fire_callbacks(watched_runs, records)
+
+        if records:
+            # every new event of the polled runs up to the last fetched record has been passed to
+            # the callbacks, so runs that had no new events can skip ahead to it
+            for watched_run in watched_runs.values():
+                watched_run.storage_id = max(watched_run.storage_id, records[-1].storage_id)
+        return bool(records)
+
+    def _poll_run(self, run_id: str, watched_run: _WatchedRun, chunk_limit: int) -> bool:
+        conn = self._event_log_storage.get_records_for_run(
+            run_id,
+            cursor=EventLogCursor.from_storage_id(watched_run.storage_id).to_string(),
+            limit=chunk_limit,
+        )
+        self._fire_callbacks({run_id: watched_run}, conn.records)
+        return bool(conn.records)
+
+    def _fire_callbacks(
+        self, watched_runs: dict[str, _WatchedRun], records: Sequence[EventLogRecord]
+    ) -> None:
+        for event_record in records:
+            watched_run = watched_runs.get(event_record.run_id)
+            if watched_run is None or event_record.storage_id <= watched_run.storage_id:
+                continue
+            watched_run.storage_id = event_record.storage_id
+            with self._watched_runs_lock:
+                for callback_with_cursor in watched_run.callbacks:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
@@ -89,6 +89,36 @@
 )
 
 
+# Summarizes the latest event storage ids of each type for each partition of each asset, so that
+# they can be looked up without aggregating over the event log.
+AssetPartitionStatusTable = db.Table(
+    "asset_partition_status",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    # hash of the asset key and partition, which identifies the row. MySQL can only index a prefix
+    # of text columns, so uniqueness can't be enforced on the asset key and partition themselves.
+    db.Column("asset_partition_hash", db.String(64), nullable=False),
+    db.Column(
+        "last_materialization_storage_id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+    ),
+    db.Column(
+        "last_observation_storage_id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+    ),
+    db.Column(
+        "last_planned_materialization_storage_id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+    ),
+)
+
 DynamicPartitionsTable = db.Table(
     "dynamic_partitions",
     SqlEventLogStorageMetadata,
@@ -256,6 +286,23 @@
     ),
     mysql_length={"asset_key": 64, "dagster_event_type": 64, "partition": 64},
 )
+db.Index(
+    "idx_asset_partition_status",
+    AssetPartitionStatusTable.c.asset_key,
+    AssetPartitionStatusTable.c.partition,
+    mysql_length={"asset_key": 64, "partition": 64},
+)
+db.Index(
+    "idx_asset_partition_status_hash",
+    AssetPartitionStatusTable.c.asset_partition_hash,
+    unique=True,
+)
+db.Index(
+    "idx_asset_partition_status_materialization",
+    AssetPartitionStatusTable.c.asset_key,
+    AssetPartitionStatusTable.c.last_materialization_storage_id,
+    mysql_length={"asset_key": 64},
+)
 db.Index(
     "idx_dynamic_partitions",
     DynamicPartitionsTable.c.partitions_def_name,
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 import os
 from abc import abstractmethod
@@ -6,6 +8,7 @@
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import cached_property
+from itertools import groupby
 from typing import (  # noqa: UP035
     TYPE_CHECKING,
     AbstractSet,
@@ -75,14 +78,17 @@
     PoolLimit,
 )
 from dagster._core.storage.event_log.migration import (
+    ASSET_DATA_MIGRATION_TABLES,
     ASSET_DATA_MIGRATIONS,
     ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITION_STATUS_TABLE,
     EVENT_LOG_DATA_MIGRATIONS,
 )
 from dagster._core.storage.event_log.schema import (
     AssetCheckExecutionsTable,
     AssetEventTagsTable,
     AssetKeyTable,
+    AssetPartitionStatusTable,
     ConcurrencyLimitsTable,
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
@@ -99,7 +105,7 @@
 )
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_values
+from dagster._serdes.serdes import deserialize_values, use_compact_serdes_encoding
 from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
@@ -116,7 +122,19 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MIN_ASSET_ROWS = 25
+ASSET_STATUS_CACHE_UPDATE_ATTEMPTS = 5
+ASSET_STATUS_CACHE_MAX_UNAPPLIED_EVENTS = 100
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+ASSET_PARTITION_STATUS_INSERT_BATCH_SIZE = 1000
+# the maximum number of asset keys to look up partitions for in a single query
+ASSET_PARTITION_QUERY_BATCH_SIZE = 500
+
+# the columns of the asset partition status table that track the latest storage id of each event type
+ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE = {
+    DagsterEventType.ASSET_MATERIALIZATION: "last_materialization_storage_id",
+    DagsterEventType.ASSET_OBSERVATION: "last_observation_storage_id",
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED: "last_planned_materialization_storage_id",
+}
 
 
 def get_max_event_records_limit() -> int:
@@ -216,7 +234,7 @@ def _event_to_row(self, event: EventLogEntry) -> dict[str, Any]:
 
         return {
             "run_id": event.run_id,
-            "event": serialize_value(event),
+            "event": serialize_value(event, compact=use_compact_serdes_encoding()),
             "dagster_event_type": dagster_event_type,
             "timestamp": self._event_insert_timestamp(event),
             "step_key": step_key,
@@ -268,6 +286,323 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+        # the cached status is updated first, since it reads the previous partition status
+        self.update_asset_cached_status_data_for_event(event, event_id)
+        self.store_asset_partition_status(event, event_id)
+
+    @cached_property
+    def has_asset_partition_status_table(self) -> bool:
+        # This table was added later, and to avoid forcing a migration
+        # we handle in the code if its been added or not.
+        return self.has_table(AssetPartitionStatusTable.name)
+
+    def can_read_asset_partition_status(self) -> bool:
+        """Whether the asset partition status table exists and has been backfilled from the event
+        log, so that it can be used to look up the latest events of each partition.
+        """
+        return self.has_asset_partition_status_table and self.has_secondary_index(
+            ASSET_PARTITION_STATUS_TABLE
+        )
+
+    def _get_asset_partition_status_column(self, event: EventLogEntry) -> Optional[db.Column]:
+        """Returns the column of the asset partition status table that tracks the latest storage id
+        of events like the given event, or None if the event is not tracked in the table.
+        """
+        if not self.has_asset_partition_status_table:
+            return None
+
+        dagster_event = event.dagster_event
+        if not (dagster_event and dagster_event.asset_key and dagster_event.partition):
+            return None
+
+        column_name = ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE.get(dagster_event.event_type)
+        return AssetPartitionStatusTable.c[column_name] if column_name else None
+
+    @staticmethod
+    def get_asset_partition_hash(asset_key_str: str, partition: str) -> str:
+        """Returns the value of the column that uniquely identifies the row of an asset partition in
+        the asset partition status table.
+        """
+        return hashlib.sha256(json.dumps([asset_key_str, partition]).encode("utf-8")).hexdigest()
+
+    def store_asset_partition_status(self, event: EventLogEntry, event_id: int) -> None:
+        """Records the storage id of a partitioned asset event in the asset partition status table,
+        if it is later than the one already recorded for the partition.
+        """
+        column = self._get_asset_partition_status_column(event)
+        if column is None:
+            return
+
+        asset_key_str = event.get_dagster_event().asset_key.to_string()  # type: ignore
+        partition = event.get_dagster_event().partition
+        with self.index_connection() as conn:
+            try:
+                conn.execute(
+                    AssetPartitionStatusTable.insert().values(
+                        asset_key=asset_key_str,
+                        partition=partition,
+                        asset_partition_hash=self.get_asset_partition_hash(
+                            asset_key_str, partition
+                        ),
+                        **{column.name: event_id},
+                    )
+                )
+            except db_exc.IntegrityError:
+                conn.execute(
+                    AssetPartitionStatusTable.update()
+                    .values(**{column.name: event_id})
+                    .where(
+                        db.and_(
+                            AssetPartitionStatusTable.c.asset_partition_hash
+                            == self.get_asset_partition_hash(asset_key_str, partition),
+                            db.or_(column == None, column < event_id),  # noqa: E711
+                        )
+                    )
+                )
+
+    def rebuild_asset_partition_status(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> None:
+        """Rebuilds the rows of the asset partition status table for the given asset from the event
+        log. If partitions are provided, only the rows of those partitions are rebuilt.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.opt_sequence_param(partitions, "partitions", of_type=str)
+
+        latest_event_ids_subquery = self._latest_event_ids_by_partition_event_log_subquery(
+            asset_key,
+            list(ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE.keys()),
+            asset_partitions=partitions,
+        )
+        delete_statement = AssetPartitionStatusTable.delete().where(
+            AssetPartitionStatusTable.c.asset_key == asset_key.to_string()
+        )
+        if partitions is not None:
+            delete_statement = delete_statement.where(
+                AssetPartitionStatusTable.c.partition.in_(partitions)
+            )
+
+        # rebuild the rows in a single transaction, deleting them before reading the event log so
+        # that concurrent writes of partition statuses either are read here or wait for the rebuilt
+        # rows to be committed before they are applied
+        with self.index_transaction() as conn:
+            conn.execute(delete_statement)
+            rows = conn.execute(
+                db_select(
+                    [
+                        latest_event_ids_subquery.c.dagster_event_type,
+                        latest_event_ids_subquery.c.partition,
+                        latest_event_ids_subquery.c.id,
+                    ]
+                )
+            ).fetchall()
+
+            values_by_partition: dict[str, dict[str, Any]] = {}
+            for event_type_value, partition, storage_id in rows:
+                values = values_by_partition.setdefault(
+                    partition,
+                    {
+                        "asset_key": asset_key.to_string(),
+                        "partition": partition,
+                        "asset_partition_hash": self.get_asset_partition_hash(
+                            asset_key.to_string(), partition
+                        ),
+                        **{
+                            column_name: None
+                            for column_name in ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE.values()
+                        },
+                    },
+                )
+                column_name = ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE[
+                    DagsterEventType(event_type_value)
+                ]
+                values[column_name] = storage_id
+
+            all_values = list(values_by_partition.values())
+            for i in range(0, len(all_values), ASSET_PARTITION_STATUS_INSERT_BATCH_SIZE):
+                conn.execute(
+                    AssetPartitionStatusTable.insert(),
+                    all_values[i : i + ASSET_PARTITION_STATUS_INSERT_BATCH_SIZE],
+                )
+
+    @cached_property
+    def has_cached_status_data_col(self) -> bool:
+        return self.has_asset_key_col("cached_status_data")
+
+    def update_asset_cached_status_data_for_event(
+        self, event: EventLogEntry, event_id: int
+    ) -> None:
+        """Applies a partitioned asset event to the cached partition status of its asset, if the
+        instance is configured to update the asset status cache on write.
+
+        Cache values that have not been computed yet are left for the read path or the asset
+        status cache daemon to build, since doing so requires the partitions definition of the
+        asset.
+        """
+        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
+        # checked before anything else so that no queries are issued unless opted in
+        if not (self.has_instance and self._instance.asset_status_cache_update_on_write):
+            return
+
+        dagster_event = event.get_dagster_event()
+        is_partitioned_materialization = (
+            dagster_event.is_step_materialization and dagster_event.partition is not None
+        )
+        if not (is_partitioned_materialization or dagster_event.is_asset_materialization_planned):
+            return
+        if not self.has_cached_status_data_col:
+            return
+
+        asset_key = check.not_none(dagster_event.asset_key).to_string()
+        for _ in range(ASSET_STATUS_CACHE_UPDATE_ATTEMPTS):
+            with self.index_connection() as conn:
+                cached_status_data = conn.execute(
+                    db_select([AssetKeyTable.c.cached_status_data]).where(
+                        AssetKeyTable.c.asset_key == asset_key
+                    )
+                ).scalar()
+                cache_value = AssetStatusCacheValue.from_db_string(cached_status_data)
+                if cache_value is None or cache_value.partitions_def_id is None:
+                    return
+
+                if is_partitioned_materialization:
+                    partition = check.not_none(dagster_event.partition)
+                    updated_cache_value = cache_value.with_materialization(
+                        partition,
+                        event_id,
+                        is_materialized=self._is_partition_materialized_in_cache_value(
+                            conn, asset_key, partition, cache_value
+                        ),
+                    )
+                else:
+                    updated_cache_value = cache_value.with_materialization_planned(event_id)
+                if updated_cache_value is None:
+                    return
+                updated_cache_value = self._without_unapplied_asset_status_events(
+                    conn, asset_key, cache_value, updated_cache_value, event_id
+                )
+                if updated_cache_value == cache_value:
+                    return
+
+                # only write the updated value if no other writer has changed the cached status
+                # since we read it, to avoid dropping the partitions recorded by that writer
+                result = conn.execute(
+                    AssetKeyTable.update()
+                    .where(
+                        db.and_(
+                            AssetKeyTable.c.asset_key == asset_key,
+                            AssetKeyTable.c.cached_status_data == cached_status_data,
+                        )
+                    )
+                    .values(cached_status_data=serialize_value(updated_cache_value))
+                )
+                if result.rowcount:
+                    return
+
+        # the cached status is too contended to update, so clear it and let it be rebuilt from
+        # the event log
+        self.wipe_asset_cached_status(check.not_none(dagster_event.asset_key))
+
+    def _is_partition_materialized_in_cache_value(
+        self,
+        conn: Connection,
+        asset_key: str,
+        partition: str,
+        cache_value: "AssetStatusCacheValue",
+    ) -> bool:
+        """Whether the partition had already been materialized as of the cursor of the cache value,
+        per the asset partition status table. Must be called before the status of the event being
+        applied is stored, since that overwrites the storage id of the previous materialization.
+        """
+        if not self.has_asset_partition_status_table or partition in set(
+            cache_value.pending_materialized_partition_keys or []
+        ):
+            return False
+
+        last_materialization_storage_id = conn.execute(
+            db_select([AssetPartitionStatusTable.c.last_materialization_storage_id]).where(
+                AssetPartitionStatusTable.c.asset_partition_hash
+                == self.get_asset_partition_hash(asset_key, partition)
+            )
+        ).scalar()
+        return (
+            last_materialization_storage_id is not None
+            and last_materialization_storage_id <= cache_value.latest_storage_id
+        )
+
+    def _without_unapplied_asset_status_events(
+        self,
+        conn: Connection,
+        asset_key: str,
+        cache_value: "AssetStatusCacheValue",
+        updated_cache_value: "AssetStatusCacheValue",
+        event_id: int,
+    ) -> "AssetStatusCacheValue":
+        """Guards the cursor of an updated cache value against the events stored between the cached
+        cursor and the given event whose updates were never applied, e.g. because their writer
+        failed after storing them. Advancing the cursor past such events would drop their
+        partitions from the cache permanently, so the cursor is left in place for the read path to
+        fetch them from the event log instead.
+        """
+        if event_id <= cache_value.latest_storage_id + 1:
+            return updated_cache_value
+
+        rows = conn.execute(
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.partition,
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key,
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [
+                            DagsterEventType.ASSET_MATERIALIZATION.value,
+                            DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                        ]
+                    ),
+                    SqlEventLogStorageTable.c.id > cache_value.latest_storage_id,
+                    SqlEventLogStorageTable.c.id < event_id,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(ASSET_STATUS_CACHE_MAX_UNAPPLIED_EVENTS + 1)
+        ).fetchall()
+        if not rows:
+            return updated_cache_value
+
+        if len(rows) > ASSET_STATUS_CACHE_MAX_UNAPPLIED_EVENTS:
+            # too many events to check, so recompute everything since the cached cursor on read
+            return updated_cache_value._replace(
+                latest_storage_id=cache_value.latest_storage_id,
+                earliest_in_progress_materialization_event_id=cache_value.latest_storage_id + 1,
+            )
+
+        pending_keys = set(updated_cache_value.pending_materialized_partition_keys or [])
+        earliest_in_progress_id = updated_cache_value.earliest_in_progress_materialization_event_id
+        has_unapplied_materialization = False
+        for row_id, dagster_event_type, partition in rows:
+            if dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION.value:
+                if partition is not None and partition not in pending_keys:
+                    has_unapplied_materialization = True
+            elif earliest_in_progress_id is None or earliest_in_progress_id > row_id:
+                # planned materializations are recomputed on read starting from the earliest
+                # in-progress event id, so moving it back is enough to account for them
+                earliest_in_progress_id = row_id
+
+        return updated_cache_value._replace(
+            latest_storage_id=(
+                cache_value.latest_storage_id
+                if has_unapplied_materialization
+                else updated_cache_value.latest_storage_id
+            ),
+            earliest_in_progress_materialization_event_id=earliest_in_progress_id,
+        )
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> dict[str, Any]:
@@ -465,6 +800,75 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, using a single connection to the run storage for each run and
+        coalescing the updates to the asset key table.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        if not self.supports_batch_writes_for_all_event_types:
+            super().store_event_batch(events)
+            return
+
+        event_ids = []
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            with self.run_connection(run_id) as conn:
+                for event in run_events:
+                    result = conn.execute(self.prepare_insert_event(event))
+                    event_ids.append(result.inserted_primary_key[0])
+
+        self.store_indexes_for_event_batch(events, event_ids)
+
+    @property
+    def supports_batch_writes_for_all_event_types(self) -> bool:
+        return True
+
+    def store_indexes_for_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        """Updates the asset and asset check tables for a batch of stored events.
+
+        The asset key table is only updated with the last event of each type for each asset, since
+        each type of event overwrites the columns set by earlier events of the same type. Every
+        event is still applied to the partition status table and the cached status of its asset.
+        """
+        asset_events: list[tuple[EventLogEntry, int]] = []
+        for event, event_id in zip(events, event_ids):
+            if (
+                event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and event.get_dagster_event().asset_key
+            ):
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                asset_events.append((event, event_id))
+
+        last_index_by_asset_key_and_event_type = {
+            (event.get_dagster_event().asset_key, event.dagster_event_type): i
+            for i, (event, _) in enumerate(asset_events)
+        }
+        last_indices = set(last_index_by_asset_key_and_event_type.values())
+        for i, (event, event_id) in enumerate(asset_events):
+            if i in last_indices:
+                self.store_asset_event(event, event_id)
+            else:
+                self.update_asset_cached_status_data_for_event(event, event_id)
+                self.store_asset_partition_status(event, event_id)
+
+        if asset_events:
+            self.store_asset_event_tags(
+                [event for event, _ in asset_events], [event_id for _, event_id in asset_events]
+            )
+
+        for event, event_id in zip(events, event_ids):
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+
     def get_records_for_run(
         self,
         run_id,
@@ -558,6 +962,55 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs_after_storage_id(
+        self,
+        run_ids: Sequence[str],
+        storage_id: int,
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the logs of several runs with a storage id greater than the given storage id, in
+        ascending order. Only supported by storages that are not run sharded.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs for which to fetch logs.
+            storage_id (int): Only logs with a greater storage id will be returned.
+            limit (Optional[int]): the maximum number of events to fetch
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(storage_id, "storage_id")
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            not self.is_run_sharded,
+            "Cannot fetch the logs of several runs at once from a run sharded event log storage",
+        )
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.id > storage_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+        return records
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -687,6 +1140,14 @@ def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the asset_keys table."""
         for migration_name, migration_fn in ASSET_DATA_MIGRATIONS.items():
+            table_name = ASSET_DATA_MIGRATION_TABLES.get(migration_name)
+            if table_name and not self.has_table(table_name):
+                if print_fn:
+                    print_fn(
+                        f"Skipping data migration {migration_name}: the {table_name} table does"
+                        " not exist yet. Run `dagster instance migrate` to create it."
+                    )
+                continue
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
     def wipe(self) -> None:
@@ -717,6 +1178,9 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("asset_partition_status"):
+                conn.execute(AssetPartitionStatusTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -739,7 +1203,15 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("asset_partition_status"):
+                conn.execute(AssetPartitionStatusTable.delete())
+
     def delete_events(self, run_id: str) -> None:
+        partitions_by_asset_key = (
+            self._get_partitions_by_asset_key_for_run(run_id)
+            if self.has_asset_partition_status_table
+            else {}
+        )
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
         with self.index_connection() as conn:
@@ -747,6 +1219,37 @@ def delete_events(self, run_id: str) -> None:
         if self.supports_global_concurrency_limits:
             self.free_concurrency_slots_for_run(run_id)
 
+        # the deleted events may have been the latest events of some partitions
+        for asset_key_str, partitions in partitions_by_asset_key.items():
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                self.rebuild_asset_partition_status(asset_key, sorted(partitions))
+
+    def _get_partitions_by_asset_key_for_run(self, run_id: str) -> Mapping[str, set[str]]:
+        query = (
+            db_select([SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [
+                            event_type.value
+                            for event_type in ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE.keys()
+                        ]
+                    ),
+                )
+            )
+            .distinct()
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        partitions_by_asset_key: dict[str, set[str]] = defaultdict(set)
+        for asset_key_str, partition in rows:
+            partitions_by_asset_key[asset_key_str].add(partition)
+        return partitions_by_asset_key
+
     def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         records = conn.execute(
@@ -794,7 +1297,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=serialize_value(event, compact=use_compact_serdes_encoding()),
                     dagster_event_type=dagster_event_type,
                     timestamp=self._event_insert_timestamp(event),
                     step_key=event.step_key,
@@ -993,6 +1496,9 @@ def _get_event_records(
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
+        return self._event_records_from_rows(results)
+
+    def _event_records_from_rows(self, results: Iterable[Any]) -> Sequence[EventLogRecord]:
         event_records = []
         for row_id, json_str in results:
             try:
@@ -1800,6 +2306,12 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
                     AssetKeyTable.c.asset_key == asset_key.to_string(),
                 )
             )
+            if self.has_asset_partition_status_table:
+                conn.execute(
+                    AssetPartitionStatusTable.delete().where(
+                        AssetPartitionStatusTable.c.asset_key == asset_key.to_string()
+                    )
+                )
 
     def wipe_asset_partitions(self, asset_key: AssetKey, partition_keys: Sequence[str]) -> None:
         """Remove asset index history from event log for given asset partitions."""
@@ -1813,6 +2325,23 @@ def get_materialized_partitions(
         before_cursor: Optional[int] = None,
         after_cursor: Optional[int] = None,
     ) -> set[str]:
+        if before_cursor is None and self.can_read_asset_partition_status():
+            status_query = db_select([AssetPartitionStatusTable.c.partition]).where(
+                db.and_(
+                    AssetPartitionStatusTable.c.asset_key == asset_key.to_string(),
+                    AssetPartitionStatusTable.c.last_materialization_storage_id != None,  # noqa: E711
+                )
+            )
+            if after_cursor:
+                status_query = status_query.where(
+                    AssetPartitionStatusTable.c.last_materialization_storage_id > after_cursor
+                )
+
+            with self.index_connection() as conn:
+                results = conn.execute(status_query).fetchall()
+
+            return set([cast(str, row[0]) for row in results])
+
         query = (
             db_select(
                 [
@@ -1844,6 +2373,152 @@ def get_materialized_partitions(
 
         return set([cast(str, row[0]) for row in results])
 
+    def get_materialized_partitions_by_asset(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, set[str]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.opt_int_param(after_cursor, "after_cursor")
+
+        storage_ids_by_asset = self._get_latest_storage_id_by_partition_for_assets(
+            asset_keys, DagsterEventType.ASSET_MATERIALIZATION, after_cursor=after_cursor
+        )
+        return {
+            asset_key: set(storage_ids_by_partition.keys())
+            for asset_key, storage_ids_by_partition in storage_ids_by_asset.items()
+        }
+
+    def get_latest_storage_id_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        check.opt_int_param(after_cursor, "after_cursor")
+
+        return self._get_latest_storage_id_by_partition_for_assets(
+            asset_keys, event_type, after_cursor=after_cursor
+        )
+
+    def _get_latest_storage_id_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[AssetKey, dict[str, int]]:
+        """Looks up the latest storage id of the given event type for each partition of each of the
+        given asset keys, in batches of asset keys rather than one query per asset key.
+        """
+        asset_keys = list(dict.fromkeys(asset_keys))
+        storage_ids_by_asset: dict[AssetKey, dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        use_status_table = (
+            event_type in ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE
+            and self.can_read_asset_partition_status()
+        )
+
+        for i in range(0, len(asset_keys), ASSET_PARTITION_QUERY_BATCH_SIZE):
+            batch_asset_keys = asset_keys[i : i + ASSET_PARTITION_QUERY_BATCH_SIZE]
+            asset_key_strs = [asset_key.to_string() for asset_key in batch_asset_keys]
+            if use_status_table:
+                column = AssetPartitionStatusTable.c[
+                    ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE[event_type]
+                ]
+                query = db_select(
+                    [
+                        AssetPartitionStatusTable.c.asset_key,
+                        AssetPartitionStatusTable.c.partition,
+                        column,
+                    ]
+                ).where(
+                    db.and_(
+                        AssetPartitionStatusTable.c.asset_key.in_(asset_key_strs),
+                        column != None,  # noqa: E711
+                    )
+                )
+                if after_cursor is not None:
+                    query = query.where(column > after_cursor)
+            else:
+                query = (
+                    db_select(
+                        [
+                            SqlEventLogStorageTable.c.asset_key,
+                            SqlEventLogStorageTable.c.partition,
+                            db.func.max(SqlEventLogStorageTable.c.id),
+                        ]
+                    )
+                    .where(
+                        db.and_(
+                            SqlEventLogStorageTable.c.asset_key.in_(asset_key_strs),
+                            SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                            SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                        )
+                    )
+                    .group_by(
+                        SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition
+                    )
+                )
+                if after_cursor is not None:
+                    query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
+                query = self._add_assets_wipe_filter_to_query(
+                    query, self._get_assets_details(batch_asset_keys), batch_asset_keys
+                )
+
+            with self.index_connection() as conn:
+                rows = conn.execute(query).fetchall()
+
+            asset_keys_by_str = dict(zip(asset_key_strs, batch_asset_keys))
+            for asset_key_str, partition, storage_id in rows:
+                storage_ids_by_asset[asset_keys_by_str[asset_key_str]][cast(str, partition)] = cast(
+                    int, storage_id
+                )
+
+        return storage_ids_by_asset
+
+    def get_materialization_records_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: int,
+        before_cursor: int,
+        limit: int,
+    ) -> Sequence[EventLogRecord]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.int_param(after_cursor, "after_cursor")
+        check.int_param(before_cursor, "before_cursor")
+        check.int_param(limit, "limit")
+
+        asset_keys = list(dict.fromkeys(asset_keys))
+        records: list[EventLogRecord] = []
+        for i in range(0, len(asset_keys), ASSET_PARTITION_QUERY_BATCH_SIZE):
+            batch_asset_keys = asset_keys[i : i + ASSET_PARTITION_QUERY_BATCH_SIZE]
+            query = (
+                db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                .where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.asset_key.in_(
+                            [asset_key.to_string() for asset_key in batch_asset_keys]
+                        ),
+                        SqlEventLogStorageTable.c.dagster_event_type
+                        == DagsterEventType.ASSET_MATERIALIZATION.value,
+                        SqlEventLogStorageTable.c.id > after_cursor,
+                        SqlEventLogStorageTable.c.id < before_cursor,
+                    )
+                )
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+                .limit(limit)
+            )
+            query = self._add_assets_wipe_filter_to_query(
+                query, self._get_assets_details(batch_asset_keys), batch_asset_keys
+            )
+            with self.index_connection() as conn:
+                records.extend(self._event_records_from_rows(conn.execute(query).fetchall()))
+
+        return sorted(records, key=lambda record: record.storage_id)[:limit]
+
     def _latest_event_ids_by_partition_subquery(
         self,
         asset_key: AssetKey,
@@ -1855,6 +2530,75 @@ def _latest_event_ids_by_partition_subquery(
         """Subquery for locating the latest event ids by partition for a given asset key and set
         of event types.
         """
+        if (
+            before_cursor is None
+            and all(
+                event_type in ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE
+                for event_type in event_types
+            )
+            and self.can_read_asset_partition_status()
+        ):
+            return self._latest_event_ids_by_partition_status_subquery(
+                asset_key, event_types, asset_partitions=asset_partitions, after_cursor=after_cursor
+            )
+
+        return self._latest_event_ids_by_partition_event_log_subquery(
+            asset_key,
+            event_types,
+            asset_partitions=asset_partitions,
+            before_cursor=before_cursor,
+            after_cursor=after_cursor,
+        )
+
+    def _latest_event_ids_by_partition_status_subquery(
+        self,
+        asset_key: AssetKey,
+        event_types: Sequence[DagsterEventType],
+        asset_partitions: Optional[Sequence[str]] = None,
+        after_cursor: Optional[int] = None,
+    ):
+        """Equivalent of `_latest_event_ids_by_partition_event_log_subquery` that reads from the
+        asset partition status table instead of aggregating over the event log.
+        """
+        queries = []
+        for event_type in event_types:
+            column = AssetPartitionStatusTable.c[
+                ASSET_PARTITION_STATUS_COLUMN_BY_EVENT_TYPE[event_type]
+            ]
+            query = db_select(
+                [
+                    db.literal(event_type.value).label("dagster_event_type"),
+                    AssetPartitionStatusTable.c.partition,
+                    column.label("id"),
+                ]
+            ).where(
+                db.and_(
+                    AssetPartitionStatusTable.c.asset_key == asset_key.to_string(),
+                    column != None,  # noqa: E711
+                )
+            )
+            if asset_partitions is not None:
+                query = query.where(AssetPartitionStatusTable.c.partition.in_(asset_partitions))
+            if after_cursor is not None:
+                query = query.where(column > after_cursor)
+            queries.append(query)
+
+        return db_subquery(
+            queries[0] if len(queries) == 1 else db.union_all(*queries),
+            "latest_event_ids_by_partition_subquery",
+        )
+
+    def _latest_event_ids_by_partition_event_log_subquery(
+        self,
+        asset_key: AssetKey,
+        event_types: Sequence[DagsterEventType],
+        asset_partitions: Optional[Sequence[str]] = None,
+        before_cursor: Optional[int] = None,
+        after_cursor: Optional[int] = None,
+    ):
+        """Subquery for locating the latest event ids by partition for a given asset key and set
+        of event types, by aggregating over the event log.
+        """
         query = db_select(
             [
                 SqlEventLogStorageTable.c.dagster_event_type,
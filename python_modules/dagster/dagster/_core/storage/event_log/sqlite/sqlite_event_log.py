@@ -10,6 +10,7 @@
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from functools import cached_property
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, ContextManager, Optional, Union  # noqa: UP035
 
 import sqlalchemy as db
@@ -107,7 +108,13 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         self._initialized_dbs = set()
 
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
-        self._db_lock = threading.Lock()
+        self._db_lock = threading.RLock()
+
+        # Connections held open by `_batch_connection`, keyed by shard, so that every write made
+        # while storing a batch of events shares a single transaction per shard
+        self._batch_connections = threading.local()
+
+        self._secondary_index_cache = {}
 
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
@@ -222,6 +229,11 @@ def _initdb(self, engine: Engine, for_index_shard=False) -> None:
 
     @contextmanager
     def _connect(self, shard: str) -> Iterator[Connection]:
+        batch_conn = getattr(self._batch_connections, "conns", {}).get(shard)
+        if batch_conn is not None:
+            yield batch_conn
+            return
+
         with self._db_lock:
             check.str_param(shard, "shard")
 
@@ -237,12 +249,37 @@ def _connect(self, shard: str) -> Iterator[Connection]:
                     yield conn
             engine.dispose()
 
+    @contextmanager
+    def _batch_connection(self, shard: str) -> Iterator[Connection]:
+        """Opens a connection to the given shard that is reused by any other connection to the same
+        shard opened by this thread until it is closed, so that a batch of writes is committed in a
+        single transaction.
+        """
+        with self._connect(shard) as conn:
+            if not hasattr(self._batch_connections, "conns"):
+                self._batch_connections.conns = {}
+            self._batch_connections.conns[shard] = conn
+            try:
+                yield conn
+            finally:
+                del self._batch_connections.conns[shard]
+
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
 
     def index_connection(self) -> ContextManager[Connection]:
         return self._connect(INDEX_SHARD_NAME)
 
+    def has_secondary_index(self, name: str) -> bool:
+        if name not in self._secondary_index_cache:
+            self._secondary_index_cache[name] = super().has_secondary_index(name)
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name: str) -> None:
+        super().enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
     def store_event(self, event: EventLogEntry) -> None:
         """Overridden method to replicate asset events in a central assets.db sqlite shard, enabling
         cross-run asset queries.
@@ -288,6 +325,56 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to store a batch of events with one transaction per shard.
+
+        The events for each run are inserted into the run shard with a single executemany
+        statement, so watchers of the run are notified once per batch. Asset events and run status
+        change events are then mirrored into the index shard, and the asset and asset check tables
+        are updated, all within a single transaction on the index shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            with self.run_connection(run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),
+                    [self._event_to_row(event) for event in run_events],
+                )
+
+        if not any(
+            _is_mirrored_in_index_shard(event)
+            or (event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS)
+            for event in events
+        ):
+            return
+
+        index_event_ids: list[Optional[int]] = []
+        with self._batch_connection(INDEX_SHARD_NAME) as conn:
+            for event in events:
+                event_id = None
+                if _is_mirrored_in_index_shard(event):
+                    result = conn.execute(
+                        SqlEventLogStorageTable.insert(), self._event_to_row(event)
+                    )
+                    if event.get_dagster_event().asset_key:
+                        check.invariant(
+                            event.dagster_event_type in ASSET_EVENTS,
+                            "Can only store asset materializations, materialization_planned, and"
+                            " observations in index database",
+                        )
+                        event_id = result.inserted_primary_key[0]
+                index_event_ids.append(event_id)
+
+            self.store_indexes_for_event_batch(events, index_event_ids)
+
+    @property
+    def supports_batch_writes_for_all_event_types(self) -> bool:
+        return True
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -504,6 +591,13 @@ def supports_global_concurrency_limits(self) -> bool:
         return self.has_table("concurrency_limits")
 
 
+def _is_mirrored_in_index_shard(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and bool(
+        event.get_dagster_event().asset_key
+        or event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+    )
+
+
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
     def __init__(
         self,
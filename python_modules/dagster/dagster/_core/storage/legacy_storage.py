@@ -341,6 +341,16 @@ def update_backfill(self, partition_backfill: "PartitionBackfill") -> None:
     def get_run_partition_data(self, runs_filter: "RunsFilter") -> Sequence["RunPartitionData"]:
         return self._storage.run_storage.get_run_partition_data(runs_filter)
 
+    def get_latest_run_partition_data(
+        self,
+        partition_set_name: str,
+        repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
+    ) -> Sequence["RunPartitionData"]:
+        return self._storage.run_storage.get_latest_run_partition_data(
+            partition_set_name, repository_label, partition_names
+        )
+
     def get_cursor_values(self, keys: set[str]) -> Mapping[str, str]:
         return self._storage.run_storage.get_cursor_values(keys)
 
@@ -574,6 +584,15 @@ def get_materialized_partitions(
             asset_key, before_cursor, after_cursor
         )
 
+    def get_materialized_partitions_by_asset(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        after_cursor: Optional[int] = None,
+    ) -> Mapping["AssetKey", set[str]]:
+        return self._storage.event_log_storage.get_materialized_partitions_by_asset(
+            asset_keys, after_cursor
+        )
+
     def get_latest_storage_id_by_partition(
         self,
         asset_key: "AssetKey",
@@ -584,6 +603,27 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    def get_latest_storage_id_by_partition_for_assets(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        event_type: "DagsterEventType",
+        after_cursor: Optional[int] = None,
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        return self._storage.event_log_storage.get_latest_storage_id_by_partition_for_assets(
+            asset_keys, event_type, after_cursor
+        )
+
+    def get_materialization_records_for_assets(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        after_cursor: int,
+        before_cursor: int,
+        limit: int,
+    ) -> Sequence[EventLogRecord]:
+        return self._storage.event_log_storage.get_materialization_records_for_assets(
+            asset_keys, after_cursor, before_cursor, limit
+        )
+
     def get_latest_tags_by_partition(
         self,
         asset_key: "AssetKey",
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, NamedTuple, Optional
 
@@ -13,8 +13,10 @@
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
+    BitmapPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
@@ -34,7 +36,7 @@
 from dagster._time import get_current_datetime
 
 if TYPE_CHECKING:
-    from dagster._core.storage.event_log.base import AssetRecord
+    from dagster._core.storage.event_log.base import AssetEntry, AssetRecord
 
 
 CACHEABLE_PARTITION_TYPES = (
@@ -44,6 +46,19 @@
     DynamicPartitionsDefinition,
 )
 RUN_FETCH_BATCH_SIZE = 100
+# When the asset status cache is updated on write, the number of materialized partition keys that
+# may be recorded before the cached subsets are rebuilt on read
+MAX_PENDING_MATERIALIZED_PARTITION_KEYS = 1000
+
+
+class MaterializedPartitionsAfterCursor(NamedTuple):
+    """The latest materialization storage id of each partition of an asset that was materialized
+    after a cursor, fetched ahead of updating the asset status cache of the asset. Can be used to
+    update any cache value whose latest_storage_id is at least the cursor.
+    """
+
+    after_cursor: int
+    storage_id_by_partition: Mapping[str, int]
 
 
 class AssetPartitionStatus(Enum):
@@ -81,6 +96,7 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("pending_materialized_partition_keys", Optional[Sequence[str]]),
         ],
     ),
     LoadableBy[tuple[AssetKey, PartitionsDefinition]],
@@ -103,6 +119,11 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        pending_materialized_partition_keys (Optional(Sequence[str])): Partition keys materialized
+            up to the latest storage id that have not yet been merged into the materialized partition
+            subset. These are recorded as events are written when the instance is configured to
+            update the asset status cache on write, because the partitions definition of the asset
+            is not available at write time.
     """
 
     def __new__(
@@ -113,6 +134,7 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        pending_materialized_partition_keys: Optional[Sequence[str]] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -125,6 +147,9 @@ def __new__(
         check.opt_str_param(
             serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
         )
+        check.opt_sequence_param(
+            pending_materialized_partition_keys, "pending_materialized_partition_keys", of_type=str
+        )
         return super().__new__(
             cls,
             latest_storage_id,
@@ -133,6 +158,7 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            pending_materialized_partition_keys,
         )
 
     @staticmethod
@@ -147,6 +173,42 @@ def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
 
         return cached_data
 
+    def with_materialization(
+        self, partition_key: str, storage_id: int, is_materialized: bool = False
+    ) -> Optional["AssetStatusCacheValue"]:
+        """Returns a copy of this cache value that accounts for a materialization of the given
+        partition, or None if the cache value cannot be updated without the partitions definition.
+
+        If the partition is already known to be in the materialized partition subset, it is not
+        added to the pending keys.
+        """
+        pending_keys = self.pending_materialized_partition_keys or []
+        if is_materialized or partition_key in set(pending_keys):
+            return self._replace(latest_storage_id=max(self.latest_storage_id, storage_id))
+        if len(pending_keys) >= MAX_PENDING_MATERIALIZED_PARTITION_KEYS:
+            return None
+        return self._replace(
+            latest_storage_id=max(self.latest_storage_id, storage_id),
+            pending_materialized_partition_keys=[*pending_keys, partition_key],
+        )
+
+    def with_materialization_planned(self, storage_id: int) -> Optional["AssetStatusCacheValue"]:
+        """Returns a copy of this cache value that accounts for a planned materialization, or None
+        if the cache value cannot be updated without the partitions definition.
+
+        The in-progress and failed partition subsets depend on the status of the planned run, so
+        they are recomputed on read, starting from the earliest planned materialization.
+        """
+        pending_keys = self.pending_materialized_partition_keys or []
+        if len(pending_keys) >= MAX_PENDING_MATERIALIZED_PARTITION_KEYS:
+            return None
+        return self._replace(
+            latest_storage_id=max(self.latest_storage_id, storage_id),
+            earliest_in_progress_materialization_event_id=min(
+                self.earliest_in_progress_materialization_event_id or storage_id, storage_id
+            ),
+        )
+
     @classmethod
     def _blocking_batch_load(
         cls, keys: Iterable[tuple[AssetKey, PartitionsDefinition]], context: LoadingContext
@@ -154,28 +216,43 @@ def _blocking_batch_load(
         return context.instance.event_log_storage.get_asset_status_cache_values(keys, context)
 
     def deserialize_materialized_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_materialized_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        return partitions_def.deserialize_subset(
+            self.serialized_materialized_partition_subset,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
 
     def deserialize_failed_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_failed_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+        return partitions_def.deserialize_subset(
+            self.serialized_failed_partition_subset,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
 
     def deserialize_in_progress_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_in_progress_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+        return partitions_def.deserialize_subset(
+            self.serialized_in_progress_partition_subset,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
 
     def get_materialized_subset(
         self,
@@ -183,7 +260,10 @@ def get_materialized_subset(
         asset_key: AssetKey,
         partitions_def: PartitionsDefinition,
     ) -> EntitySubset[AssetKey]:
-        value = self.deserialize_materialized_partition_subsets(partitions_def)
+        value = self.deserialize_materialized_partition_subsets(
+            partitions_def,
+            dynamic_partitions_store=asset_graph_view.get_inner_queryer_for_back_compat(),
+        )
         return EntitySubset(
             asset_graph_view, key=asset_key, value=_ValidatedEntitySubsetValue(value)
         )
@@ -194,7 +274,10 @@ def get_failed_subset(
         asset_key: AssetKey,
         partitions_def: PartitionsDefinition,
     ) -> EntitySubset[AssetKey]:
-        value = self.deserialize_failed_partition_subsets(partitions_def)
+        value = self.deserialize_failed_partition_subsets(
+            partitions_def,
+            dynamic_partitions_store=asset_graph_view.get_inner_queryer_for_back_compat(),
+        )
         return EntitySubset(
             asset_graph_view, key=asset_key, value=_ValidatedEntitySubsetValue(value)
         )
@@ -205,7 +288,10 @@ def get_in_progress_subset(
         asset_key: AssetKey,
         partitions_def: PartitionsDefinition,
     ) -> EntitySubset[AssetKey]:
-        value = self.deserialize_in_progress_partition_subsets(partitions_def)
+        value = self.deserialize_in_progress_partition_subsets(
+            partitions_def,
+            dynamic_partitions_store=asset_graph_view.get_inner_queryer_for_back_compat(),
+        )
         return EntitySubset(
             asset_graph_view, key=asset_key, value=_ValidatedEntitySubsetValue(value)
         )
@@ -290,6 +376,7 @@ def _build_status_cache(
     dynamic_partitions_store: DynamicPartitionsStore,
     stored_cache_value: Optional[AssetStatusCacheValue],
     asset_record: Optional["AssetRecord"],
+    materialized_partitions_after_cursor: Optional[MaterializedPartitionsAfterCursor] = None,
 ) -> Optional[AssetStatusCacheValue]:
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
@@ -313,7 +400,9 @@ def _build_status_cache(
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
     failed_subset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
+        stored_cache_value.deserialize_failed_partition_subsets(
+            partitions_def, dynamic_partitions_store=dynamic_partitions_store
+        )
         if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
         else None
     )
@@ -331,25 +420,38 @@ def _build_status_cache(
     if stored_cache_value:
         # fetch the incremental new materialized partitions, and update the cached materialized
         # subset
-        new_partitions = set()
+        new_partitions = set(stored_cache_value.pending_materialized_partition_keys or [])
         if (
             last_materialization_storage_id
             and last_materialization_storage_id > stored_cache_value.latest_storage_id
         ):
+            if (
+                materialized_partitions_after_cursor is not None
+                and materialized_partitions_after_cursor.after_cursor
+                <= stored_cache_value.latest_storage_id
+            ):
+                new_partitions.update(
+                    partition
+                    for partition, storage_id in (
+                        materialized_partitions_after_cursor.storage_id_by_partition.items()
+                    )
+                    if storage_id > stored_cache_value.latest_storage_id
+                )
+            else:
+                new_partitions.update(
+                    instance.get_materialized_partitions(
+                        asset_key, after_cursor=stored_cache_value.latest_storage_id
+                    )
+                )
+        if new_partitions:
             new_partitions = get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(
-                    asset_key, after_cursor=stored_cache_value.latest_storage_id
-                ),
+                dynamic_partitions_store, partitions_def, new_partitions
             )
 
         materialized_subset: PartitionsSubset = (
-            partitions_def.deserialize_subset(
-                stored_cache_value.serialized_materialized_partition_subset
+            stored_cache_value.deserialize_materialized_partition_subsets(
+                partitions_def, dynamic_partitions_store=dynamic_partitions_store
             )
-            if stored_cache_value.serialized_materialized_partition_subset
-            else partitions_def.empty_subset()
         )
 
         if new_partitions:
@@ -383,6 +485,21 @@ def _build_status_cache(
         after_storage_id=cached_in_progress_cursor,
     )
 
+    if isinstance(partitions_def, (StaticPartitionsDefinition, DynamicPartitionsDefinition)):
+        # store the subsets of statically and dynamically partitioned assets as bitmaps, which
+        # are much more compact than a list of every partition key
+        materialized_subset, failed_subset, in_progress_subset = (
+            BitmapPartitionsSubset.from_subset(subset, partitions_def, dynamic_partitions_store)
+            for subset in (materialized_subset, failed_subset, in_progress_subset)
+        )
+    elif isinstance(partitions_def, MultiPartitionsDefinition):
+        # store the subsets of multi-partitioned assets as a primary dimension subset for each
+        # secondary dimension key, which stores ranges of time partitions compactly
+        materialized_subset, failed_subset, in_progress_subset = (
+            MultiPartitionsSubset.from_subset(subset, partitions_def)
+            for subset in (materialized_subset, failed_subset, in_progress_subset)
+        )
+
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
         partitions_def_id=partitions_def.get_serializable_unique_identifier(
@@ -471,12 +588,47 @@ def build_failed_and_in_progress_partition_subset(
     )
 
 
+def asset_status_cache_needs_update(
+    asset_entry: "AssetEntry",
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> bool:
+    """Whether the cached partition status of the given asset would change if it were recomputed,
+    without querying the event log.
+    """
+    cache_value = asset_entry.cached_status
+    if cache_value is None:
+        return True
+
+    if cache_value.partitions_def_id != partitions_def.get_serializable_unique_identifier(
+        dynamic_partitions_store=dynamic_partitions_store
+    ):
+        return True
+
+    # merge pending partitions into the materialized subset, and check on the status of any runs
+    # that were in progress the last time the cache value was computed
+    if (
+        cache_value.pending_materialized_partition_keys
+        or cache_value.earliest_in_progress_materialization_event_id is not None
+    ):
+        return True
+
+    return (
+        max(
+            asset_entry.last_materialization_storage_id or 0,
+            asset_entry.last_planned_materialization_storage_id or 0,
+        )
+        > cache_value.latest_storage_id
+    )
+
+
 def get_and_update_asset_status_cache_value(
     instance: DagsterInstance,
     asset_key: AssetKey,
     partitions_def: Optional[PartitionsDefinition],
     dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
     loading_context: Optional[LoadingContext] = None,
+    materialized_partitions_after_cursor: Optional[MaterializedPartitionsAfterCursor] = None,
 ) -> Optional[AssetStatusCacheValue]:
     from dagster._core.storage.event_log.base import AssetRecord
 
@@ -506,6 +658,7 @@ def get_and_update_asset_status_cache_value(
         dynamic_partitions_store=dynamic_partitions_store,
         stored_cache_value=stored_cache_value if use_cached_value else None,
         asset_record=asset_record,
+        materialized_partitions_after_cursor=materialized_partitions_after_cursor,
     )
     if (
         updated_cache_value is not None
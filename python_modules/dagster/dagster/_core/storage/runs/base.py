@@ -12,6 +12,7 @@
 from dagster._core.storage.daemon_cursor import DaemonCursorStorage
 from dagster._core.storage.dagster_run import (
     DagsterRun,
+    DagsterRunStatus,
     JobBucket,
     RunPartitionData,
     RunRecord,
@@ -19,6 +20,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.tags import PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -327,6 +329,32 @@ def supports_bucket_queries(self) -> bool:
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
 
+    def get_latest_run_partition_data(
+        self,
+        partition_set_name: str,
+        repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
+    ) -> Sequence[RunPartitionData]:
+        """Get the run partition data of the latest non-canceled run of each partition of a
+        partition set, optionally restricted to the given partitions.
+        """
+        run_partition_data = self.get_run_partition_data(
+            runs_filter=RunsFilter(
+                statuses=[
+                    status for status in DagsterRunStatus if status != DagsterRunStatus.CANCELED
+                ],
+                tags={
+                    PARTITION_SET_TAG: partition_set_name,
+                    REPOSITORY_LABEL_TAG: repository_label,
+                },
+            )
+        )
+        if partition_names is None:
+            return run_partition_data
+
+        partition_names_set = set(partition_names)
+        return [data for data in run_partition_data if data.partition in partition_names_set]
+
     def migrate(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
         """Call this method to run any required data migrations."""
 
@@ -40,6 +40,7 @@
 RUN_BACKFILL_ID = "run_backfill_id"
 BACKFILL_JOB_NAME_AND_TAGS = "backfill_job_name_and_tags"
 BACKFILL_END_TIMESTAMP = "backfill_end_timestamp"
+RUN_PARTITION_STATUS = "run_partition_status"
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
@@ -56,6 +57,7 @@
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
     RUN_START_END: lambda: migrate_run_start_end,
+    RUN_PARTITION_STATUS: lambda: migrate_run_partition_status,
 }
 
 CHUNK_SIZE = 100
@@ -446,3 +448,92 @@ def get_end_timestamp_for_backfill(run_storage: RunStorage, backfill: PartitionB
         # time as an estimation
         return backfill.backfill_timestamp
     return max([record.end_time or 0 for record in run_records])
+
+
+def migrate_run_partition_status(storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
+    """Utility method to build the run partition status table from the partitioned runs in the
+    runs table.
+
+    Since this migration may run while runs are being written, each row is written with the latest
+    update timestamp of the runs of its partition, and rows already written from a more recent
+    state of the partition's runs are kept.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    base_query = (
+        db_select(
+            [
+                RunsTable.c.id,
+                RunsTable.c.run_id,
+                RunsTable.c.status,
+                RunsTable.c.start_time,
+                RunsTable.c.end_time,
+                RunsTable.c.update_timestamp,
+                RunsTable.c.partition,
+                RunsTable.c.partition_set,
+                RunTagsTable.c.value,
+            ]
+        )
+        .select_from(
+            RunsTable.join(
+                RunTagsTable,
+                db.and_(
+                    RunsTable.c.run_id == RunTagsTable.c.run_id,
+                    RunTagsTable.c.key == REPOSITORY_LABEL_TAG,
+                ),
+            )
+        )
+        .where(RunsTable.c.partition != None)  # noqa: E711
+        .where(RunsTable.c.partition_set != None)  # noqa: E711
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    # runs are visited in ascending storage id order, so later runs replace earlier ones
+    latest_by_partition: dict[tuple[str, str, str], Optional[Mapping[str, Any]]] = {}
+    update_timestamp_by_partition: dict[tuple[str, str, str], Any] = {}
+    cursor = None
+    has_more = True
+    while has_more:
+        query = base_query.where(RunsTable.c.id > cursor) if cursor else base_query
+        rows = storage.fetchall(query)
+        has_more = len(rows) >= CHUNK_SIZE
+        for row in rows:
+            cursor = row["id"]
+            key = (row["value"], row["partition_set"], row["partition"])
+            if row["update_timestamp"] is not None and (
+                update_timestamp_by_partition.get(key) is None
+                or row["update_timestamp"] > update_timestamp_by_partition[key]
+            ):
+                update_timestamp_by_partition[key] = row["update_timestamp"]
+            if row["status"] == DagsterRunStatus.CANCELED.value:
+                latest_by_partition.setdefault(key, None)
+                continue
+            latest_by_partition[key] = {
+                "run_id": row["run_id"],
+                "status": row["status"],
+                "start_time": row["start_time"],
+                "end_time": row["end_time"],
+            }
+
+    if print_fn:
+        print_fn(f"Found {len(latest_by_partition)} partitions to index.")
+
+    with storage.connect() as conn:
+        for (repository_label, partition_set, partition), values in latest_by_partition.items():
+            storage._write_run_partition_status(  # noqa: SLF001
+                conn,
+                repository_label=repository_label,
+                partition_set=partition_set,
+                partition=partition,
+                values=values,
+                update_timestamp=update_timestamp_by_partition.get(
+                    (repository_label, partition_set, partition)
+                ),
+            )
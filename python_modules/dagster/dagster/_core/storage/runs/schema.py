@@ -138,6 +138,27 @@
     db.Column("value", db.Text),
 )
 
+# Tracks the latest non-canceled run of each partition of a partition set, so that partition set
+# statuses can be read without scanning every historical run of the partition set
+RunPartitionStatusTable = db.Table(
+    "run_partition_status",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("repository_label", db.Text, nullable=False),
+    db.Column("partition_set", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("status", db.String(63), nullable=False),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("update_timestamp", db.DateTime),
+)
+
 InstanceInfo = db.Table(
     "instance_info",
     RunStorageSqlMetadata,
@@ -192,6 +213,14 @@
         "create_timestamp": 8,
     },
 )
+db.Index(
+    "idx_run_partition_status",
+    RunPartitionStatusTable.c.partition_set,
+    RunPartitionStatusTable.c.repository_label,
+    RunPartitionStatusTable.c.partition,
+    unique=True,
+    mysql_length={"partition_set": 255, "repository_label": 255, "partition": 255},
+)
 db.Index("idx_kvs_keys_unique", KeyValueStoreTable.c.key, unique=True, mysql_length=64)
 
 db.Index(
@@ -43,6 +43,7 @@
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
     RUN_BACKFILL_ID,
+    RUN_PARTITION_STATUS,
     RUN_PARTITIONS,
     MigrationFn,
 )
@@ -52,6 +53,7 @@
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    RunPartitionStatusTable,
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
@@ -74,12 +76,15 @@
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import deserialize_value, serialize_value
-from dagster._serdes.serdes import deserialize_values
+from dagster._serdes.serdes import deserialize_values, use_compact_serdes_encoding
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.merger import merge_dicts
 
+# partition name lists longer than this are filtered in python instead of in the query
+MAX_RUN_PARTITION_STATUS_QUERY_PARTITIONS = 1000
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -89,6 +94,8 @@ class SnapshotType(Enum):
 class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages."""
 
+    _run_partition_status_table_exists: bool = False
+
     @abstractmethod
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -150,6 +157,8 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
                     ],
                 )
 
+            self._update_run_partition_status(conn, dagster_run)
+
         return dagster_run
 
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
@@ -197,6 +206,7 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                     **kwargs,
                 )
             )
+            self._update_run_partition_status(conn, run)
 
         if event.event_type == DagsterEventType.PIPELINE_FAILURE and isinstance(
             event.event_specific_data, JobFailureData
@@ -500,6 +510,14 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                     [dict(run_id=run_id, key=tag, value=new_tags[tag]) for tag in added_tags],
                 )
 
+            if partition != run.tags.get(PARTITION_NAME_TAG) or partition_set != run.tags.get(
+                PARTITION_SET_TAG
+            ):
+                # the run may have moved out of one partition and into another, which can move
+                # the version of the partition it left back
+                self._update_run_partition_status(conn, run, force=True)
+                self._update_run_partition_status(conn, run.with_tags(all_tags))
+
     def get_run_group(self, run_id: str) -> tuple[str, Sequence[DagsterRun]]:
         check.str_param(run_id, "run_id")
         dagster_run = self._get_run_by_id(run_id)
@@ -549,9 +567,12 @@ def has_run(self, run_id: str) -> bool:
 
     def delete_run(self, run_id: str) -> None:
         check.str_param(run_id, "run_id")
+        run = self._get_run_by_id(run_id)
         query = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
             conn.execute(query)
+            if run:
+                self._update_run_partition_status(conn, run, force=True)
 
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
@@ -692,6 +713,208 @@ def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartiti
 
             return list(_partition_data_by_partition.values())
 
+    def get_latest_run_partition_data(
+        self,
+        partition_set_name: str,
+        repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
+    ) -> Sequence[RunPartitionData]:
+        check.str_param(partition_set_name, "partition_set_name")
+        check.str_param(repository_label, "repository_label")
+        check.opt_sequence_param(partition_names, "partition_names", of_type=str)
+
+        if not self.can_read_run_partition_status():
+            return super().get_latest_run_partition_data(
+                partition_set_name, repository_label, partition_names
+            )
+
+        query = db_select(
+            [
+                RunPartitionStatusTable.c.run_id,
+                RunPartitionStatusTable.c.partition,
+                RunPartitionStatusTable.c.status,
+                RunPartitionStatusTable.c.start_time,
+                RunPartitionStatusTable.c.end_time,
+            ]
+        ).where(
+            db.and_(
+                RunPartitionStatusTable.c.partition_set == partition_set_name,
+                RunPartitionStatusTable.c.repository_label == repository_label,
+            )
+        )
+        filter_in_query = (
+            partition_names is not None
+            and len(partition_names) <= MAX_RUN_PARTITION_STATUS_QUERY_PARTITIONS
+        )
+        if filter_in_query:
+            query = query.where(RunPartitionStatusTable.c.partition.in_(partition_names))
+
+        rows = self.fetchall(query)
+        if partition_names is not None and not filter_in_query:
+            partition_names_set = set(partition_names)
+            rows = [row for row in rows if row["partition"] in partition_names_set]
+
+        return [
+            RunPartitionData(
+                run_id=row["run_id"],
+                partition=row["partition"],
+                status=DagsterRunStatus(row["status"]),
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+            )
+            for row in rows
+        ]
+
+    def has_run_partition_status_table(self) -> bool:
+        with self.connect() as conn:
+            return self._has_run_partition_status_table(conn)
+
+    def _has_run_partition_status_table(self, conn: Connection) -> bool:
+        # This table was added later, and to avoid forcing a migration we handle in the code if it
+        # has been added or not. Only a positive result is cached, since `upgrade` may add the
+        # table to a running storage.
+        if not self._run_partition_status_table_exists:
+            self._run_partition_status_table_exists = (
+                RunPartitionStatusTable.name in db.inspect(conn).get_table_names()
+            )
+        return self._run_partition_status_table_exists
+
+    def can_read_run_partition_status(self) -> bool:
+        """Whether the run partition status table has been built from the runs table, so that it
+        can be used to look up the latest run of each partition.
+        """
+        return self.has_built_index(RUN_PARTITION_STATUS) and self.has_run_partition_status_table()
+
+    def _update_run_partition_status(
+        self, conn: Connection, run: DagsterRun, force: bool = False
+    ) -> None:
+        """Recomputes the row of the run partition status table for the partition of the given run,
+        pointing it at the latest non-canceled run of that partition.
+
+        The row is versioned by the latest update timestamp of the runs of the partition, so that a
+        recomputation that read the runs before a concurrent write does not replace the row written
+        by that write. Pass `force` when a run has been deleted, which can move the version back.
+        """
+        tags = run.tags_for_storage()
+        repository_label = tags.get(REPOSITORY_LABEL_TAG)
+        partition = tags.get(PARTITION_NAME_TAG)
+        partition_set = tags.get(PARTITION_SET_TAG)
+        if not (repository_label and partition and partition_set):
+            return
+
+        if not self._has_run_partition_status_table(conn):
+            return
+
+        partition_runs = RunsTable.join(
+            RunTagsTable,
+            db.and_(
+                RunsTable.c.run_id == RunTagsTable.c.run_id,
+                RunTagsTable.c.key == REPOSITORY_LABEL_TAG,
+                RunTagsTable.c.value == repository_label,
+            ),
+        )
+        partition_runs_filter = db.and_(
+            RunsTable.c.partition_set == partition_set,
+            RunsTable.c.partition == partition,
+        )
+        update_timestamp = conn.execute(
+            db_select([db.func.max(RunsTable.c.update_timestamp)])
+            .select_from(partition_runs)
+            .where(partition_runs_filter)
+        ).scalar()
+        latest_run = conn.execute(
+            db_select(
+                [
+                    RunsTable.c.run_id,
+                    RunsTable.c.status,
+                    RunsTable.c.start_time,
+                    RunsTable.c.end_time,
+                ]
+            )
+            .select_from(partition_runs)
+            .where(
+                db.and_(
+                    partition_runs_filter,
+                    RunsTable.c.status != DagsterRunStatus.CANCELED.value,
+                )
+            )
+            .order_by(db.desc(RunsTable.c.id))
+            .limit(1)
+        ).fetchone()
+
+        self._write_run_partition_status(
+            conn,
+            repository_label=repository_label,
+            partition_set=partition_set,
+            partition=partition,
+            values=(
+                {
+                    "run_id": latest_run[0],
+                    "status": latest_run[1],
+                    "start_time": latest_run[2],
+                    "end_time": latest_run[3],
+                }
+                if latest_run
+                else None
+            ),
+            update_timestamp=update_timestamp,
+            force=force,
+        )
+
+    def _write_run_partition_status(
+        self,
+        conn: Connection,
+        repository_label: str,
+        partition_set: str,
+        partition: str,
+        values: Optional[Mapping[str, Any]],
+        update_timestamp: Optional[datetime],
+        force: bool = False,
+    ) -> None:
+        """Writes the row of the run partition status table for a partition, or deletes it if
+        values is None. Unless forced, the write is skipped if the row was computed from a more
+        recent update timestamp of the runs of the partition.
+        """
+        partition_status_filter = db.and_(
+            RunPartitionStatusTable.c.partition_set == partition_set,
+            RunPartitionStatusTable.c.repository_label == repository_label,
+            RunPartitionStatusTable.c.partition == partition,
+        )
+        if not force:
+            partition_status_filter = db.and_(
+                partition_status_filter,
+                db.or_(
+                    RunPartitionStatusTable.c.update_timestamp == None,  # noqa: E711
+                    RunPartitionStatusTable.c.update_timestamp <= update_timestamp,
+                )
+                if update_timestamp is not None
+                else RunPartitionStatusTable.c.update_timestamp == None,  # noqa: E711
+            )
+
+        if values is None:
+            conn.execute(RunPartitionStatusTable.delete().where(partition_status_filter))
+            return
+
+        values = {**values, "update_timestamp": update_timestamp}
+        update_statement = (
+            RunPartitionStatusTable.update().where(partition_status_filter).values(**values)
+        )
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            conn.execute(
+                RunPartitionStatusTable.insert().values(
+                    repository_label=repository_label,
+                    partition_set=partition_set,
+                    partition=partition,
+                    **values,
+                )
+            )
+        except db_exc.IntegrityError:
+            # the row exists, so only update it if it was not written from a more recent state
+            conn.execute(update_statement)
+
     def _get_partition_runs(
         self, partition_set_name: str, partition_name: str
     ) -> Sequence[DagsterRun]:
@@ -839,6 +1062,8 @@ def wipe(self) -> None:
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+            if self._has_run_partition_status_table(conn):
+                conn.execute(RunPartitionStatusTable.delete())
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -1026,7 +1251,9 @@ def add_backfill(self, partition_backfill: PartitionBackfill) -> None:
             key=partition_backfill.backfill_id,
             status=partition_backfill.status.value,
             timestamp=datetime_from_timestamp(partition_backfill.backfill_timestamp),
-            body=serialize_value(cast(NamedTuple, partition_backfill)),
+            body=serialize_value(
+                cast(NamedTuple, partition_backfill), compact=use_compact_serdes_encoding()
+            ),
         )
 
         if self.has_bulk_actions_selector_cols():
@@ -1066,7 +1293,7 @@ def update_backfill(self, partition_backfill: PartitionBackfill) -> None:
                 .where(BulkActionsTable.c.key == backfill_id)
                 .values(
                     status=partition_backfill.status.value,
-                    body=serialize_value(partition_backfill),
+                    body=serialize_value(partition_backfill, compact=use_compact_serdes_encoding()),
                 )
             )
 
@@ -169,11 +169,14 @@ def delete_run(self, run_id: str) -> None:
         support on cascading deletes.
         """
         check.str_param(run_id, "run_id")
+        run = self._get_run_by_id(run_id)
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
             conn.execute(remove_tags)
             conn.execute(remove_run)
+            if run:
+                self._update_run_partition_status(conn, run, force=True)
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
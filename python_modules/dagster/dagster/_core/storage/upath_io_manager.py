@@ -1,7 +1,9 @@
 import asyncio
 import inspect
 from abc import abstractmethod
-from collections.abc import Mapping
+from collections import deque
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
 
@@ -29,6 +31,9 @@ class UPathIOManager(IOManager):
      - handles loading a single upstream partition
      - handles loading multiple upstream partitions (with respect to :py:class:`PartitionMapping`)
      - supports loading multiple partitions concurrently with async `load_from_path` method
+     - supports loading multiple partitions concurrently in a bounded thread pool with sync
+       `load_from_path` method (see `max_concurrent_partition_loads`)
+     - supports streaming multiple partitions in order with `iter_partitions`
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
@@ -37,6 +42,11 @@ class UPathIOManager(IOManager):
 
     extension: Optional[str] = None  # override in child class
 
+    # Maximum number of partitions loaded at the same time when loading multiple partitions. Can be
+    # overridden per input with the `max_concurrent_partition_loads` input metadata value. When
+    # unset, sync `load_from_path` calls are made one at a time and async ones are not bounded.
+    max_concurrent_partition_loads: Optional[int] = None  # override in child class
+
     def __init__(
         self,
         base_path: Optional["UPath"] = None,
@@ -76,19 +86,90 @@ def load_partitions(self, context: InputContext):
                 context, partition_key, paths[partition_key], backcompat_paths.get(partition_key)
             )
         else:
-            objs = {}
+            return dict(self.iter_partitions(context))
+
+    def iter_partitions(self, context: InputContext) -> Iterator[tuple[str, Any]]:
+        """Lazily loads the partitions in `context.asset_partition_keys`, yielding
+        `(partition_key, obj)` pairs in the same order as the partition keys. Skipped missing
+        partitions are not yielded.
+
+        Like the default `load_partitions`, this assumes that different partitions are stored as
+        independent files and requires a sync `load_from_path`. Partitions are loaded in a thread
+        pool of at most `max_concurrent_partition_loads` workers, and at most that many loaded
+        partitions are held ahead of the consumer, so large fan-in loads can be processed without
+        keeping every partition in memory at once.
+        """
+        check.invariant(
+            not inspect.iscoroutinefunction(self.load_from_path),
+            "iter_partitions does not support an async load_from_path",
+        )
+        paths = self._get_paths_for_partitions(context)  # paths for normal partitions
+        backcompat_paths = self._get_multipartition_backcompat_paths(
+            context
+        )  # paths for multipartitions
 
-            for partition_key in context.asset_partition_keys:
-                obj = self._load_partition_from_path(
-                    context,
-                    partition_key,
-                    paths[partition_key],
-                    backcompat_paths.get(partition_key),
-                )
+        def _load(partition_key: str) -> Any:
+            return self._load_partition_from_path(
+                context,
+                partition_key,
+                paths[partition_key],
+                backcompat_paths.get(partition_key),
+            )
+
+        partition_keys = context.asset_partition_keys
+        max_concurrent_loads = self.get_max_concurrent_partition_loads(context) or 1
+
+        if max_concurrent_loads == 1 or len(partition_keys) <= 1:
+            for partition_key in partition_keys:
+                obj = _load(partition_key)
                 if obj is not None:  # in case some partitions were skipped
-                    objs[partition_key] = obj
+                    yield partition_key, obj
+            return
 
-            return objs
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_concurrent_loads, len(partition_keys)),
+            thread_name_prefix="upath_io_manager",
+        )
+        try:
+            remaining_keys = iter(partition_keys)
+            pending: deque[tuple[str, Future]] = deque()
+            for partition_key in remaining_keys:
+                pending.append((partition_key, executor.submit(_load, partition_key)))
+                if len(pending) == max_concurrent_loads:
+                    break
+
+            while pending:
+                partition_key, future = pending.popleft()
+                obj = future.result()
+                next_partition_key = next(remaining_keys, None)
+                if next_partition_key is not None:
+                    pending.append((next_partition_key, executor.submit(_load, next_partition_key)))
+                if obj is not None:  # in case some partitions were skipped
+                    yield partition_key, obj
+        finally:
+            # don't start loading partitions nobody will consume if we exit early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_max_concurrent_partition_loads(self, context: InputContext) -> Optional[int]:
+        """Returns the maximum number of partitions to load at the same time for the given input.
+        The `max_concurrent_partition_loads` input metadata value takes precedence over the
+        `max_concurrent_partition_loads` attribute of the IO manager.
+        """
+        max_concurrent_loads = (
+            context.definition_metadata.get(
+                "max_concurrent_partition_loads", self.max_concurrent_partition_loads
+            )
+            if context.definition_metadata is not None
+            else self.max_concurrent_partition_loads
+        )
+        if max_concurrent_loads is None:
+            return None
+
+        check.int_param(max_concurrent_loads, "max_concurrent_partition_loads")
+        check.invariant(
+            max_concurrent_loads >= 1, "max_concurrent_partition_loads must be at least 1"
+        )
+        return max_concurrent_loads
 
     @property
     def fs(self) -> AbstractFileSystem:
@@ -335,20 +416,32 @@ def load_partitions_async(self, context: InputContext):
             context
         )  # paths for multipartitions
 
+        max_concurrent_loads = self.get_max_concurrent_partition_loads(context)
+
         async def collect():
             loop = asyncio.get_running_loop()
+            semaphore = (
+                asyncio.Semaphore(max_concurrent_loads)
+                if max_concurrent_loads is not None
+                else None
+            )
+
+            async def load_bounded(coroutine):
+                async with semaphore:  # pyright: ignore[reportOptionalContextManager]
+                    return await coroutine
 
             tasks = []
 
             for partition_key in context.asset_partition_keys:
+                coroutine = self._load_partition_from_path(
+                    context,
+                    partition_key,
+                    paths[partition_key],
+                    backcompat_paths.get(partition_key),
+                )
                 tasks.append(
                     loop.create_task(
-                        self._load_partition_from_path(
-                            context,
-                            partition_key,
-                            paths[partition_key],
-                            backcompat_paths.get(partition_key),
-                        )
+                        load_bounded(coroutine) if semaphore is not None else coroutine
                     )
                 )
 
@@ -71,7 +71,7 @@
 from dagster._daemon.sensor import is_under_min_interval, mark_sensor_state_for_tick
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._serdes import serialize_value
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import deserialize_value, use_compact_serdes_encoding
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import SingleInstigatorDebugCrashFlags, check_for_debug_crash, return_as_list
 
@@ -95,6 +95,9 @@
 
 MIN_INTERVAL_LOOP_SECONDS = 5
 
+# How many of the slowest automation condition evaluations to record on each tick
+MAX_TICK_EVALUATION_DURATIONS = 100
+
 
 def _get_has_migrated(instance: DagsterInstance, migration_key: str) -> bool:
     return bool(
@@ -192,7 +195,9 @@ def asset_daemon_cursor_to_instigator_serialized_cursor(cursor: AssetDaemonCurso
     # increment the version if the cursor format changes
     VERSION = "0"
 
-    serialized_bytes = serialize_value(cursor).encode("utf-8")
+    serialized_bytes = serialize_value(cursor, compact=use_compact_serdes_encoding()).encode(
+        "utf-8"
+    )
     compressed_bytes = zlib.compress(serialized_bytes)
     encoded_cursor = base64.b64encode(compressed_bytes).decode("utf-8")
     return VERSION + encoded_cursor
@@ -274,6 +279,16 @@ def update_state(self, status: TickStatus, **kwargs: object):
     def set_user_interrupted(self, user_interrupted: bool):
         self._tick = self._tick.with_user_interrupted(user_interrupted)
 
+    def set_evaluation_durations(self, durations_by_key: Mapping[EntityKey, float]):
+        # only the slowest evaluations are kept to bound the size of the tick
+        slowest = sorted(durations_by_key.items(), key=lambda item: item[1], reverse=True)
+        self._tick = self._tick.with_evaluation_durations(
+            {
+                key.to_user_string(): duration
+                for key, duration in slowest[:MAX_TICK_EVALUATION_DURATIONS]
+            }
+        )
+
     def set_skip_reason(self, skip_reason: str):
         self._tick = self._tick.with_reason(skip_reason)
 
@@ -944,7 +959,7 @@ def _evaluate_auto_materialize_tick(
                 *{key for key in auto_materialize_entity_keys if isinstance(key, AssetCheckKey)}
             )
 
-            run_requests, new_cursor, evaluations = AutomationTickEvaluationContext(
+            evaluation_context = AutomationTickEvaluationContext(
                 evaluation_id=evaluation_id,
                 asset_graph=asset_graph,
                 asset_selection=asset_selection,
@@ -966,7 +981,8 @@ def _evaluate_auto_materialize_tick(
                 ),
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 logger=self._logger,
-            ).evaluate()
+            )
+            run_requests, new_cursor, evaluations = evaluation_context.evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
 
@@ -989,6 +1005,8 @@ def _evaluate_auto_materialize_tick(
                 for rr in run_requests
             ]
 
+            tick_context.set_evaluation_durations(evaluation_context.evaluation_durations_by_key)
+
             # Write out the in-progress tick data, which ensures that if the tick crashes or raises an exception, it will retry
             tick = tick_context.set_run_requests(
                 run_requests=run_requests,
@@ -1015,7 +1033,11 @@ def _evaluate_auto_materialize_tick(
                 )
             else:
                 instance.daemon_cursor_storage.set_cursor_values(
-                    {_PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY: serialize_value(new_cursor)}
+                    {
+                        _PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY: serialize_value(
+                            new_cursor, compact=use_compact_serdes_encoding()
+                        )
+                    }
                 )
 
             check_for_debug_crash(debug_crash_flags, "CURSOR_UPDATED")
@@ -0,0 +1,79 @@
+import logging
+import sys
+
+from dagster._core.definitions.partition import CachingDynamicPartitionsLoader
+from dagster._core.storage.partition_status_cache import (
+    asset_status_cache_needs_update,
+    get_and_update_asset_status_cache_value,
+    is_cacheable_partition_type,
+)
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.utils import DaemonErrorCapture
+
+ASSET_RECORD_FETCH_BATCH_SIZE = 100
+
+
+class AssetStatusCacheDaemon(IntervalDaemon):
+    """Keeps the cached partition status of every partitioned asset in the workspace up to date,
+    so that it does not need to be computed from scratch when it is first read. Runs when the
+    instance is configured to update the asset status cache on write.
+    """
+
+    @classmethod
+    def daemon_type(cls) -> str:
+        return "ASSET_STATUS_CACHE"
+
+    def run_iteration(self, workspace_process_context: IWorkspaceProcessContext) -> DaemonIterator:
+        yield from execute_asset_status_cache_iteration(workspace_process_context, self._logger)
+
+
+def execute_asset_status_cache_iteration(
+    workspace_process_context: IWorkspaceProcessContext, logger: logging.Logger
+) -> DaemonIterator:
+    instance = workspace_process_context.instance
+    if not instance.can_read_asset_status_cache():
+        yield
+        return
+
+    asset_graph = workspace_process_context.create_request_context().asset_graph
+    partitions_defs_by_key = {}
+    for asset_key in asset_graph.materializable_asset_keys:
+        partitions_def = asset_graph.get(asset_key).partitions_def
+        if partitions_def and is_cacheable_partition_type(partitions_def):
+            partitions_defs_by_key[asset_key] = partitions_def
+
+    dynamic_partitions_loader = CachingDynamicPartitionsLoader(instance)
+    asset_keys = sorted(partitions_defs_by_key.keys())
+    num_updated = 0
+    for i in range(0, len(asset_keys), ASSET_RECORD_FETCH_BATCH_SIZE):
+        yield
+
+        asset_records = instance.get_asset_records(
+            asset_keys[i : i + ASSET_RECORD_FETCH_BATCH_SIZE]
+        )
+        for asset_record in asset_records:
+            asset_key = asset_record.asset_entry.asset_key
+            partitions_def = partitions_defs_by_key[asset_key]
+            if not asset_status_cache_needs_update(
+                asset_record.asset_entry, partitions_def, dynamic_partitions_loader
+            ):
+                continue
+
+            try:
+                get_and_update_asset_status_cache_value(
+                    instance,
+                    asset_key,
+                    partitions_def,
+                    dynamic_partitions_loader=dynamic_partitions_loader,
+                )
+                num_updated += 1
+            except Exception:
+                yield DaemonErrorCapture.process_exception(
+                    sys.exc_info(),
+                    logger=logger,
+                    log_message=f"Error updating the cached status of {asset_key.to_user_string()}",
+                )
+
+    if num_updated:
+        logger.info(f"Updated the cached partition status of {num_updated} assets")
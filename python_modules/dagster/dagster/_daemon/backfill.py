@@ -14,7 +14,10 @@
     DagsterError,
     DagsterUserCodeUnreachableError,
 )
-from dagster._core.execution.asset_backfill import execute_asset_backfill_iteration
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillMaterializationTailer,
+    execute_asset_backfill_iteration,
+)
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 from dagster._core.execution.job_backfill import execute_job_backfill_iteration
 from dagster._core.workspace.context import IWorkspaceProcessContext
@@ -64,6 +67,7 @@ def execute_backfill_iteration_loop(
     from dagster._daemon.daemon import SpanMarker
 
     backfill_futures: dict[str, Future] = {}
+    backfill_iteration_timestamps: dict[str, float] = {}
     while True:
         start_time = get_current_timestamp()
         if until and start_time >= until:
@@ -78,6 +82,7 @@ def execute_backfill_iteration_loop(
                 logger,
                 threadpool_executor=threadpool_executor,
                 backfill_futures=backfill_futures,
+                backfill_iteration_timestamps=backfill_iteration_timestamps,
             )
         except Exception:
             error_info = DaemonErrorCapture.process_exception(
@@ -103,6 +108,7 @@ def execute_backfill_iteration(
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     backfill_futures: Optional[dict[str, Future]] = None,
     debug_crash_flags: Optional[Mapping[str, int]] = None,
+    backfill_iteration_timestamps: Optional[dict[str, float]] = None,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
     instance = workspace_process_context.instance
 
@@ -120,6 +126,13 @@ def execute_backfill_iteration(
 
     backfill_jobs = [*in_progress_backfills, *canceling_backfills]
 
+    # read new materializations once for all asset backfills evaluated in this iteration
+    materialization_tailer = (
+        AssetBackfillMaterializationTailer(instance)
+        if any(backfill.is_asset_backfill for backfill in backfill_jobs)
+        else None
+    )
+
     yield from execute_backfill_jobs(
         workspace_process_context,
         logger,
@@ -127,9 +140,44 @@ def execute_backfill_iteration(
         threadpool_executor,
         backfill_futures,
         debug_crash_flags,
+        materialization_tailer=materialization_tailer,
+        backfill_iteration_timestamps=backfill_iteration_timestamps,
     )
 
 
+def _timed_backfill_iteration(
+    backfill: PartitionBackfill,
+    logger: logging.Logger,
+    backfill_iteration: Iterable[None],
+    backfill_iteration_timestamps: Optional[dict[str, float]] = None,
+) -> Iterable[None]:
+    """Runs a backfill iteration, recording when it started (used to order backfills on the next
+    daemon iteration) and logging how long it took at debug level, with a
+    `backfill_iteration_duration_seconds` attribute on the record for log-based metrics.
+    """
+    start_time = get_current_timestamp()
+    if backfill_iteration_timestamps is not None:
+        # recorded when the iteration actually starts, which in threadpool mode can be later than
+        # when it was submitted if all workers are busy
+        backfill_iteration_timestamps[backfill.backfill_id] = start_time
+    try:
+        yield from backfill_iteration
+    finally:
+        duration = get_current_timestamp() - start_time
+        # LoggerAdapters replace the `extra` of each record with their own, so re-wrap the logger
+        # underneath the per-backfill adapter with its extra plus the duration
+        if isinstance(logger, logging.LoggerAdapter):
+            base_logger, extra = logger.logger, dict(logger.extra or {})
+        else:
+            base_logger, extra = logger, {}
+        duration_logger = logging.LoggerAdapter(
+            base_logger, extra={**extra, "backfill_iteration_duration_seconds": duration}
+        )
+        duration_logger.debug(
+            f"Backfill iteration for {backfill.backfill_id} took {duration:.2f} seconds"
+        )
+
+
 def _is_retryable_asset_backfill_error(e: Exception):
     # Retry on issues reaching or loading user code
     if isinstance(e, (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError)):
@@ -147,9 +195,27 @@ def execute_backfill_jobs(
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     backfill_futures: Optional[dict[str, Future]] = None,
     debug_crash_flags: Optional[Mapping[str, int]] = None,
+    materialization_tailer: Optional[AssetBackfillMaterializationTailer] = None,
+    backfill_iteration_timestamps: Optional[dict[str, float]] = None,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
     instance = workspace_process_context.instance
 
+    if backfill_iteration_timestamps is not None:
+        # evaluate the backfills that have waited the longest first, so that no backfill starves
+        # behind others when they can't all be evaluated at once. In threadpool mode this only
+        # sets the order in which iterations are queued on the executor, which matters once every
+        # worker is busy; the iteration time budget is enforced inside each worker's iteration.
+        active_backfill_ids = {backfill_job.backfill_id for backfill_job in backfill_jobs}
+        for backfill_id in list(backfill_iteration_timestamps.keys()):
+            if backfill_id not in active_backfill_ids:
+                del backfill_iteration_timestamps[backfill_id]
+        backfill_jobs = sorted(
+            backfill_jobs,
+            key=lambda backfill_job: backfill_iteration_timestamps.get(
+                backfill_job.backfill_id, 0.0
+            ),
+        )
+
     for backfill_job in backfill_jobs:
         backfill_id = backfill_job.backfill_id
 
@@ -175,36 +241,61 @@ def execute_backfill_jobs(
 
                     if backfill.is_asset_backfill:
                         future = threadpool_executor.submit(
-                            return_as_list(execute_asset_backfill_iteration),
+                            return_as_list(_timed_backfill_iteration),
                             backfill,
                             backfill_logger,
-                            workspace_process_context,
-                            instance,
+                            execute_asset_backfill_iteration(
+                                backfill,
+                                backfill_logger,
+                                workspace_process_context,
+                                instance,
+                                materialization_tailer,
+                            ),
+                            backfill_iteration_timestamps,
                         )
                     else:
                         future = threadpool_executor.submit(
-                            return_as_list(execute_job_backfill_iteration),
+                            return_as_list(_timed_backfill_iteration),
                             backfill,
                             backfill_logger,
-                            workspace_process_context,
-                            debug_crash_flags,
-                            instance,
+                            execute_job_backfill_iteration(
+                                backfill,
+                                backfill_logger,
+                                workspace_process_context,
+                                debug_crash_flags,
+                                instance,
+                            ),
+                            backfill_iteration_timestamps,
                         )
                     backfill_futures[backfill_id] = future
                     yield
 
                 else:
                     if backfill.is_asset_backfill:
-                        yield from execute_asset_backfill_iteration(
-                            backfill, backfill_logger, workspace_process_context, instance
+                        yield from _timed_backfill_iteration(
+                            backfill,
+                            backfill_logger,
+                            execute_asset_backfill_iteration(
+                                backfill,
+                                backfill_logger,
+                                workspace_process_context,
+                                instance,
+                                materialization_tailer,
+                            ),
+                            backfill_iteration_timestamps,
                         )
                     else:
-                        yield from execute_job_backfill_iteration(
+                        yield from _timed_backfill_iteration(
                             backfill,
                             backfill_logger,
-                            workspace_process_context,
-                            debug_crash_flags,
-                            instance,
+                            execute_job_backfill_iteration(
+                                backfill,
+                                backfill_logger,
+                                workspace_process_context,
+                                debug_crash_flags,
+                                instance,
+                            ),
+                            backfill_iteration_timestamps,
                         )
             except Exception as e:
                 backfill = check.not_none(instance.get_backfill(backfill.backfill_id))
@@ -17,6 +17,7 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext, WorkspaceProcessContext
 from dagster._core.workspace.load_target import WorkspaceLoadTarget
 from dagster._daemon.asset_daemon import AssetDaemon
+from dagster._daemon.asset_status_cache import AssetStatusCacheDaemon
 from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
 from dagster._daemon.daemon import (
     BackfillDaemon,
@@ -369,6 +370,10 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
     elif daemon_type == EventLogConsumerDaemon.daemon_type():
         return EventLogConsumerDaemon()
+    elif daemon_type == AssetStatusCacheDaemon.daemon_type():
+        return AssetStatusCacheDaemon(
+            interval_seconds=instance.asset_status_cache_reconcile_interval_seconds
+        )
     elif daemon_type == AssetDaemon.daemon_type():
         return AssetDaemon(
             settings=instance.get_auto_materialize_settings(),
@@ -15,12 +15,14 @@
 
 import collections.abc
 import dataclasses
+import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import is_dataclass
 from enum import Enum
 from functools import cached_property, partial
 from inspect import Parameter, signature
+from itertools import islice
 from typing import (  # noqa: UP035
     TYPE_CHECKING,
     AbstractSet,
@@ -816,12 +818,20 @@ def pack(
 def serialize_value(
     val: PackableValue,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    compact: bool = False,
     **json_kwargs: Any,
 ) -> str:
     """Serialize an object to a JSON string.
 
     Objects are first converted to a JSON-serializable form with `pack_value`.
+
+    If `compact` is set, the value is written in the compact encoding, in which the class and field
+    names of each distinct object shape are only written once. `deserialize_value` detects and reads
+    both encodings.
     """
+    if compact:
+        return _serialize_compact(val, whitelist_map, **json_kwargs)
+
     serializable_value = _transform_for_serialization(
         val,
         whitelist_map=whitelist_map,
@@ -1170,10 +1180,15 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            if val.startswith(_COMPACT_PREFIX):
+                unpacked_value = _deserialize_compact(val, whitelist_map, context)
+            else:
+                unpacked_value = seven.json.loads(
+                    val,
+                    object_hook=partial(
+                        _unpack_object, whitelist_map=whitelist_map, context=context
+                    ),
+                )
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -1315,6 +1330,123 @@ def _unpack_value(
     return val
 
 
+###################################################################################################
+# Compact encoding
+###################################################################################################
+
+# A value serialized with the compact encoding is a JSON array:
+#
+#   ["__serdes_compact__", <version>, <shapes>, <value>]
+#
+# Every JSON object of the packed value (whitelisted objects, enums, sets, and plain mappings) is
+# replaced by an array `[<shape id>, <field values>...]`, where the shape with that (1-based) id in
+# `<shapes>` is `[<class name or null>, <field names>...]`. Payloads made of many objects of the
+# same classes, like event log entries, asset subsets or backfill data, then only contain each
+# class and field name once, and parse without creating a dict per object. Arrays of the packed
+# value are prefixed with a tag: 0, or -1 when none of their items are arrays, so that they can be
+# returned as is.
+
+_COMPACT_MARKER: Final = "__serdes_compact__"
+_COMPACT_VERSION: Final = 1
+_COMPACT_PREFIX: Final = f'["{_COMPACT_MARKER}",'
+_COMPACT_LIST_TAG: Final = 0
+_COMPACT_SCALAR_LIST_TAG: Final = -1
+
+
+def use_compact_serdes_encoding() -> bool:
+    """Whether values written to storage should use the compact encoding. Off by default, since
+    older versions of dagster cannot read it.
+    """
+    return str(os.getenv("DAGSTER_SERDES_COMPACT_ENCODING")).lower() in ("1", "true", "t")
+
+
+def _serialize_compact(val: PackableValue, whitelist_map: WhitelistMap, **json_kwargs: Any) -> str:
+    shape_ids: dict[tuple[Optional[str], ...], int] = {}
+    encoded_value = _encode_compact(pack_value(val, whitelist_map), shape_ids)
+    shapes = [list(shape) for shape in shape_ids]
+    return seven.json.dumps(
+        [_COMPACT_MARKER, _COMPACT_VERSION, shapes, encoded_value],
+        **{"separators": (",", ":"), **json_kwargs},
+    )
+
+
+def _compact_key(key: Any) -> str:
+    # match the conversion of non-string mapping keys by json.dumps
+    return str(key) if isinstance(key, str) else seven.json.dumps(key)
+
+
+def _encode_compact(
+    val: JsonSerializableValue, shape_ids: dict[tuple[Optional[str], ...], int]
+) -> JsonSerializableValue:
+    tval = type(val)
+    if tval is dict:
+        val = cast(dict, val)
+        items = iter(val.items())
+        klass_name = val.get("__class__")
+        if isinstance(klass_name, str) and next(iter(val)) == "__class__":
+            next(items)
+        else:
+            klass_name = None
+
+        values = []
+        field_names = []
+        for key, value in items:
+            field_names.append(_compact_key(key))
+            values.append(_encode_compact(value, shape_ids))
+
+        shape = (klass_name, *field_names)
+        shape_id = shape_ids.get(shape)
+        if shape_id is None:
+            shape_id = shape_ids[shape] = len(shape_ids) + 1
+        return [shape_id, *values]
+
+    if tval is list:
+        items = [_encode_compact(item, shape_ids) for item in cast(list, val)]
+        if any(type(item) is list for item in items):
+            return [_COMPACT_LIST_TAG, *items]
+        return [_COMPACT_SCALAR_LIST_TAG, *items]
+
+    return val
+
+
+def _deserialize_compact(
+    val: str, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    _marker, version, shapes, encoded_value = seven.json.loads(val)
+    if version != _COMPACT_VERSION:
+        raise DeserializationError(
+            f"Attempted to deserialize a value with compact encoding version {version}, only"
+            f" version {_COMPACT_VERSION} is supported."
+        )
+    return _decode_compact(
+        encoded_value, [(shape[0], shape[1:]) for shape in shapes], whitelist_map, context
+    )
+
+
+def _decode_compact(
+    val: JsonSerializableValue,
+    shapes: Sequence[tuple[Optional[str], Sequence[str]]],
+    whitelist_map: WhitelistMap,
+    context: UnpackContext,
+) -> UnpackedValue:
+    if type(val) is not list:
+        return val
+
+    tag = val[0]
+    if tag == _COMPACT_SCALAR_LIST_TAG:
+        return val[1:]
+    if tag == _COMPACT_LIST_TAG:
+        return [
+            _decode_compact(item, shapes, whitelist_map, context) for item in islice(val, 1, None)
+        ]
+
+    klass_name, field_names = shapes[tag - 1]
+    unpacked: dict[str, Any] = {} if klass_name is None else {"__class__": klass_name}
+    for field_name, item in zip(field_names, islice(val, 1, None)):
+        unpacked[field_name] = _decode_compact(item, shapes, whitelist_map, context)
+    return _unpack_object(unpacked, whitelist_map, context)
+
+
 ###################################################################################################
 # Validation
 ###################################################################################################
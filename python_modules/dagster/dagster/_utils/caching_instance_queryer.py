@@ -41,7 +41,10 @@
     from dagster._core.execution.asset_backfill import AssetBackfillData
     from dagster._core.storage.event_log import EventLogRecord
     from dagster._core.storage.event_log.base import AssetRecord
-    from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+    from dagster._core.storage.partition_status_cache import (
+        AssetStatusCacheValue,
+        MaterializedPartitionsAfterCursor,
+    )
 
 RECORD_BATCH_SIZE = 1000
 
@@ -75,6 +78,10 @@ def __init__(
         self._asset_partition_versions_updated_after_cursor_cache: dict[
             AssetKeyPartitionKey, int
         ] = {}
+        self._latest_storage_id_by_partition_cache: dict[AssetKey, Mapping[str, int]] = {}
+        self._materialized_partitions_after_status_cache: dict[
+            AssetKey, MaterializedPartitionsAfterCursor
+        ] = {}
 
         self._dynamic_partitions_cache: dict[str, Sequence[str]] = {}
 
@@ -106,6 +113,114 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
 
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
 
+    def prefetch_materialized_partitions(self, asset_keys: Iterable[AssetKey]):
+        """For performance, batches together queries for the materialized partitions of selected
+        assets.
+        """
+        to_fetch = [
+            asset_key
+            for asset_key in asset_keys
+            if asset_key not in self._asset_partitions_cache[None]
+        ]
+        if to_fetch:
+            self._asset_partitions_cache[None].update(
+                self.instance.get_materialized_partitions_by_asset(to_fetch)
+            )
+
+    def prefetch_materialized_partitions_for_status_cache(self, asset_keys: Iterable[AssetKey]):
+        """For performance, batches together queries for the partitions that were materialized
+        since the asset status cache of each of the selected partitioned assets was last updated,
+        which are otherwise fetched one asset at a time when the cache values are updated.
+        """
+        from dagster._core.storage.event_log.base import AssetRecord
+        from dagster._core.storage.partition_status_cache import (
+            MaterializedPartitionsAfterCursor,
+            is_cacheable_partition_type,
+        )
+
+        asset_keys = [
+            asset_key
+            for asset_key in asset_keys
+            if asset_key not in self._materialized_partitions_after_status_cache
+            and self.asset_graph.has(asset_key)
+            and self.asset_graph.get(asset_key).partitions_def is not None
+            and is_cacheable_partition_type(
+                check.not_none(self.asset_graph.get(asset_key).partitions_def)
+            )
+        ]
+        # load the asset records in one batch, after which they are cached by the loading context
+        AssetRecord.blocking_get_many(self._loading_context, asset_keys)
+
+        cursor_by_asset_key: dict[AssetKey, int] = {}
+        for asset_key in asset_keys:
+            asset_record = AssetRecord.blocking_get(self._loading_context, asset_key)
+            cached_status = asset_record.asset_entry.cached_status if asset_record else None
+            last_materialization_storage_id = (
+                asset_record.asset_entry.last_materialization_storage_id if asset_record else None
+            )
+            if (
+                cached_status is not None
+                and last_materialization_storage_id is not None
+                and last_materialization_storage_id > cached_status.latest_storage_id
+            ):
+                cursor_by_asset_key[asset_key] = cached_status.latest_storage_id
+
+        if not cursor_by_asset_key:
+            return
+
+        # a single cursor is used for all assets, and the partitions materialized before the
+        # cursor of each asset are filtered out when its cache value is updated
+        after_cursor = min(cursor_by_asset_key.values())
+        storage_ids_by_asset_key = self.instance.get_latest_storage_id_by_partition_for_assets(
+            list(cursor_by_asset_key.keys()),
+            DagsterEventType.ASSET_MATERIALIZATION,
+            after_cursor=after_cursor,
+        )
+        for asset_key, storage_id_by_partition in storage_ids_by_asset_key.items():
+            self._materialized_partitions_after_status_cache[asset_key] = (
+                MaterializedPartitionsAfterCursor(
+                    after_cursor=after_cursor, storage_id_by_partition=storage_id_by_partition
+                )
+            )
+
+    def prefetch_latest_storage_ids_by_partition(
+        self, asset_keys: Iterable[AssetKey], after_cursor: Optional[int] = None
+    ):
+        """For performance, batches together queries for the latest materialization or observation
+        storage id of each partition of selected partitioned assets.
+
+        Args:
+            asset_keys (Iterable[AssetKey]): The asset keys to prefetch.
+            after_cursor (Optional[int]): If provided, materializable assets whose asset record
+                shows no materialization after this cursor are skipped, since callers looking for
+                updates after the cursor will not need their partitions.
+        """
+        asset_keys_by_event_type: dict[DagsterEventType, list[AssetKey]] = defaultdict(list)
+        for asset_key in asset_keys:
+            if (
+                asset_key in self._latest_storage_id_by_partition_cache
+                or not self.asset_graph.has(asset_key)
+                or not self.asset_graph.get(asset_key).is_partitioned
+            ):
+                continue
+
+            if after_cursor is not None and not self.asset_graph.get(asset_key).is_observable:
+                asset_record = self.get_asset_record(asset_key)
+                last_record = (
+                    asset_record.asset_entry.last_materialization_record if asset_record else None
+                )
+                if last_record is None or last_record.storage_id <= after_cursor:
+                    continue
+
+            asset_keys_by_event_type[self._event_type_for_key(asset_key)].append(asset_key)
+
+        for event_type, event_type_asset_keys in asset_keys_by_event_type.items():
+            self._latest_storage_id_by_partition_cache.update(
+                self.instance.get_latest_storage_id_by_partition_for_assets(
+                    event_type_asset_keys, event_type
+                )
+            )
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -123,6 +238,9 @@ def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetSta
             partitions_def=partitions_def,
             dynamic_partitions_loader=self,
             loading_context=self._loading_context,
+            materialized_partitions_after_cursor=self._materialized_partitions_after_status_cache.get(
+                asset_key
+            ),
         )
 
     @cached_method
@@ -136,8 +254,10 @@ def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> Partitions
             return partitions_def.empty_subset()
 
         return cache_value.deserialize_failed_partition_subsets(
-            partitions_def
-        ) | cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+            partitions_def, dynamic_partitions_store=self
+        ) | cache_value.deserialize_in_progress_partition_subsets(
+            partitions_def, dynamic_partitions_store=self
+        )
 
     @cached_method
     def get_materialized_asset_subset(
@@ -150,7 +270,9 @@ def get_materialized_asset_subset(
             if cache_value is None:
                 value = partitions_def.empty_subset()
             else:
-                value = cache_value.deserialize_materialized_partition_subsets(partitions_def)
+                value = cache_value.deserialize_materialized_partition_subsets(
+                    partitions_def, dynamic_partitions_store=self
+                )
         else:
             value = self.asset_partition_has_materialization_or_observation(
                 AssetKeyPartitionKey(asset_key)
@@ -168,7 +290,9 @@ def get_in_progress_asset_subset(
             if cache_value is None:
                 value = partitions_def.empty_subset()
             else:
-                value = cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+                value = cache_value.deserialize_in_progress_partition_subsets(
+                    partitions_def, dynamic_partitions_store=self
+                )
         else:
             # NOTE: this computation is not correct in all cases for unpartitioned assets. it is
             # possible (though rare) for run A to be launched targeting an asset, then later run B
@@ -227,7 +351,9 @@ def get_failed_asset_subset(self, *, asset_key: AssetKey) -> SerializableEntityS
             if cache_value is None:
                 value = partitions_def.empty_subset()
             else:
-                value = cache_value.deserialize_failed_partition_subsets(partitions_def)
+                value = cache_value.deserialize_failed_partition_subsets(
+                    partitions_def, dynamic_partitions_store=self
+                )
         else:
             # ideally, unpartitioned assets would also be handled by the asset status cache
             planned_materialization_info = (
@@ -324,12 +450,18 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.get(asset_key).is_partitioned:
+            if asset_key not in self._latest_storage_id_by_partition_cache:
+                self._latest_storage_id_by_partition_cache[asset_key] = (
+                    self.instance.get_latest_storage_id_by_partition(
+                        asset_key, event_type=self._event_type_for_key(asset_key)
+                    )
+                )
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in self._latest_storage_id_by_partition_cache[
+                        asset_key
+                    ].items()
                 }
             )
         return latest_storage_ids
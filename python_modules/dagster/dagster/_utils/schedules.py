@@ -1,11 +1,18 @@
+import bisect
 import calendar
 import datetime
 import functools
+import itertools
 import math
 import re
+import threading
+from array import array
+from collections import OrderedDict
 from collections.abc import Iterator, Sequence
 from typing import Optional, Union
 
+import pytz
+
 import dagster._check as check
 from dagster._core.definitions.partition import ScheduleType
 from dagster._time import get_timezone
@@ -616,6 +623,176 @@ def has_out_of_range_cron_interval(cron_schedule: Union[str, Sequence[str]]):
     )
 
 
+# Approximate number of ticks in each chunk of a CronTickTable
+CRON_TICK_TABLE_TICKS_PER_CHUNK = 256
+# Maximum number of chunks each CronTickTable keeps in memory
+CRON_TICK_TABLE_MAX_CHUNKS = 32
+# Bounds on the span of time covered by each chunk of a CronTickTable, in seconds
+_MIN_CRON_TICK_TABLE_CHUNK_SPAN = 60 * 60
+_MAX_CRON_TICK_TABLE_CHUNK_SPAN = 4 * 366 * 24 * 60 * 60
+# Number of ticks used to estimate how often a cron string ticks
+_CRON_TICK_TABLE_SAMPLE_SIZE = 16
+# Ticks before this timestamp (the epoch) are not cached
+_CRON_TICK_TABLE_MIN_TIMESTAMP = 0
+_SECONDS_PER_HOUR = 60 * 60
+
+
+@functools.cache
+def _supports_cron_tick_table(execution_timezone: str) -> bool:
+    """Returns whether ticks in the timezone can be cached in a CronTickTable.
+
+    The cron string iterator can return different ticks depending on the start timestamp in
+    timezones whose UTC offset is not a whole number of hours, or that shift by more than an hour
+    at a time, so these are not cached in order to preserve the results of the iterator exactly.
+    """
+    if execution_timezone.upper() == "UTC":
+        return True
+
+    try:
+        tz = pytz.timezone(execution_timezone)
+    except pytz.UnknownTimeZoneError:
+        return False
+
+    transition_times = getattr(tz, "_utc_transition_times", None)
+    transition_info = getattr(tz, "_transition_info", None)
+    if transition_times is None or transition_info is None:
+        offset = tz.utcoffset(None)
+        return offset is not None and offset.total_seconds() % _SECONDS_PER_HOUR == 0
+
+    min_transition_time = datetime.datetime.fromtimestamp(
+        _CRON_TICK_TABLE_MIN_TIMESTAMP, tz=datetime.timezone.utc
+    ).replace(tzinfo=None)
+    first_idx = max(bisect.bisect_right(transition_times, min_transition_time) - 1, 0)
+    offsets = [int(info[0].total_seconds()) for info in transition_info[first_idx:]]
+    return all(offset % _SECONDS_PER_HOUR == 0 for offset in offsets) and all(
+        abs(after - before) <= _SECONDS_PER_HOUR for before, after in zip(offsets, offsets[1:])
+    )
+
+
+class CronTickTable:
+    """Cache of the tick timestamps of a cron string in a timezone.
+
+    Ticks are computed with the cron string iterator in chunks, each covering the ticks in a fixed
+    span of time. The span is chosen from the average spacing of the first ticks computed, so that
+    each chunk holds roughly CRON_TICK_TABLE_TICKS_PER_CHUNK ticks whether the cron string ticks
+    every minute or every month. Lookups within a chunk are binary searches, and only the most
+    recently used CRON_TICK_TABLE_MAX_CHUNKS chunks are kept. Ticks before the epoch are not
+    cached, and are computed with the iterator whenever they are needed.
+    """
+
+    def __init__(self, cron_string: str, execution_timezone: str):
+        self._cron_string = cron_string
+        self._execution_timezone = execution_timezone
+        self._chunk_span: Optional[int] = None
+        self._chunks: OrderedDict[int, array[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_chunk_span(self, timestamp: float) -> int:
+        if self._chunk_span is None:
+            sample = [
+                dt.timestamp()
+                for dt in itertools.islice(
+                    _uncached_cron_string_iterator(
+                        timestamp, self._cron_string, self._execution_timezone
+                    ),
+                    _CRON_TICK_TABLE_SAMPLE_SIZE,
+                )
+            ]
+            avg_spacing = (sample[-1] - sample[0]) / (len(sample) - 1)
+            chunk_span = int(avg_spacing * CRON_TICK_TABLE_TICKS_PER_CHUNK)
+            self._chunk_span = min(
+                max(chunk_span, _MIN_CRON_TICK_TABLE_CHUNK_SPAN), _MAX_CRON_TICK_TABLE_CHUNK_SPAN
+            )
+        return self._chunk_span
+
+    def _get_chunk(self, chunk_idx: int) -> "array[float]":
+        """Returns the sorted timestamps of the ticks in the chunk with the given index."""
+        with self._lock:
+            chunk = self._chunks.get(chunk_idx)
+            if chunk is not None:
+                self._chunks.move_to_end(chunk_idx)
+                return chunk
+
+        chunk_span = check.not_none(self._chunk_span)
+        chunk_end = (chunk_idx + 1) * chunk_span
+        chunk = array("d")
+        for dt in _uncached_cron_string_iterator(
+            chunk_idx * chunk_span, self._cron_string, self._execution_timezone
+        ):
+            tick = dt.timestamp()
+            if tick >= chunk_end:
+                break
+            chunk.append(tick)
+
+        with self._lock:
+            self._chunks[chunk_idx] = chunk
+            self._chunks.move_to_end(chunk_idx)
+            while len(self._chunks) > CRON_TICK_TABLE_MAX_CHUNKS:
+                self._chunks.popitem(last=False)
+        return chunk
+
+    def iter_ticks(self, start_timestamp: float, ascending: bool = True) -> Iterator[float]:
+        """Yields the timestamps of ticks >= start_timestamp in ascending order, or of ticks <=
+        start_timestamp in descending order.
+        """
+        if start_timestamp < _CRON_TICK_TABLE_MIN_TIMESTAMP:
+            yield from self._iter_uncached_ticks(start_timestamp, ascending)
+            return
+
+        chunk_idx = int(start_timestamp // self._get_chunk_span(start_timestamp))
+        chunk = self._get_chunk(chunk_idx)
+        if ascending:
+            for i in range(bisect.bisect_left(chunk, start_timestamp), len(chunk)):
+                yield chunk[i]
+            while True:
+                chunk_idx += 1
+                yield from self._get_chunk(chunk_idx)
+        else:
+            for i in reversed(range(bisect.bisect_right(chunk, start_timestamp))):
+                yield chunk[i]
+            while chunk_idx > 0:
+                chunk_idx -= 1
+                yield from reversed(self._get_chunk(chunk_idx))
+            # ticks are whole seconds, so this continues from the latest tick before the epoch
+            yield from self._iter_uncached_ticks(_CRON_TICK_TABLE_MIN_TIMESTAMP - 1, ascending)
+
+    def _iter_uncached_ticks(self, start_timestamp: float, ascending: bool) -> Iterator[float]:
+        for dt in _uncached_cron_string_iterator(
+            start_timestamp, self._cron_string, self._execution_timezone, ascending
+        ):
+            yield dt.timestamp()
+
+    def next_tick(self, timestamp: float) -> float:
+        """Returns the timestamp of the earliest tick at or after the given timestamp."""
+        return next(self.iter_ticks(timestamp))
+
+    def prev_tick(self, timestamp: float) -> float:
+        """Returns the timestamp of the latest tick at or before the given timestamp."""
+        return next(self.iter_ticks(timestamp, ascending=False))
+
+    def ticks_between(self, start_timestamp: float, end_timestamp: float) -> "array[float]":
+        """Returns the timestamps of the ticks in [start_timestamp, end_timestamp)."""
+        return array(
+            "d",
+            itertools.takewhile(
+                lambda tick: tick < end_timestamp, self.iter_ticks(start_timestamp)
+            ),
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def get_cron_tick_table(cron_string: str, execution_timezone: Optional[str]) -> CronTickTable:
+    return CronTickTable(cron_string, execution_timezone or "UTC")
+
+
+def _can_use_cron_tick_table(cron_string: str, execution_timezone: Optional[str]) -> bool:
+    # leap day cron strings are derived from a Feb 28th iterator, which skips a start timestamp
+    # that is exactly on a tick, unlike the tick table
+    return not cron_string.endswith(" 29 2 *") and _supports_cron_tick_table(
+        execution_timezone or "UTC"
+    )
+
+
 def cron_string_iterator(
     start_timestamp: float,
     cron_string: str,
@@ -623,7 +800,50 @@ def cron_string_iterator(
     ascending: bool = True,
     start_offset: int = 0,
 ) -> Iterator[datetime.datetime]:
-    """Generator of datetimes >= start_timestamp for the given cron string."""
+    """Generator of datetimes >= start_timestamp for the given cron string, or of datetimes <=
+    start_timestamp in descending order if ascending is False.
+    """
+    if start_offset != 0 or not _can_use_cron_tick_table(cron_string, execution_timezone):
+        yield from _uncached_cron_string_iterator(
+            start_timestamp, cron_string, execution_timezone, ascending, start_offset
+        )
+        return
+
+    tz = get_timezone(execution_timezone or "UTC")
+    for tick in get_cron_tick_table(cron_string, execution_timezone).iter_ticks(
+        start_timestamp, ascending
+    ):
+        yield datetime.datetime.fromtimestamp(tick, tz=tz)
+
+
+def cron_string_timestamp_iterator(
+    start_timestamp: float,
+    cron_string: str,
+    execution_timezone: Optional[str],
+    ascending: bool = True,
+) -> Iterator[float]:
+    """Generator of the timestamps of the datetimes yielded by cron_string_iterator, read directly
+    from the cron tick table where possible.
+    """
+    if not _can_use_cron_tick_table(cron_string, execution_timezone):
+        for dt in _uncached_cron_string_iterator(
+            start_timestamp, cron_string, execution_timezone, ascending
+        ):
+            yield dt.timestamp()
+        return
+
+    yield from get_cron_tick_table(cron_string, execution_timezone).iter_ticks(
+        start_timestamp, ascending
+    )
+
+
+def _uncached_cron_string_iterator(
+    start_timestamp: float,
+    cron_string: str,
+    execution_timezone: Optional[str],
+    ascending: bool = True,
+    start_offset: int = 0,
+) -> Iterator[datetime.datetime]:
     # leap day special casing
     if cron_string.endswith(" 29 2 *"):
         min_hour, _ = cron_string.split(" 29 2 *")
@@ -784,6 +1004,12 @@ def reverse_cron_string_iterator(
     cron_string: str,
     execution_timezone: Optional[str],
 ) -> Iterator[datetime.datetime]:
+    """Generator of datetimes <= end_timestamp for the given cron string, in descending order.
+
+    Like cron_string_iterator, this walks the chunks of the cron string's CronTickTable backwards,
+    and only computes ticks with the cron string iterator for leap day cron strings, timezones the
+    table does not support, and ticks before the epoch.
+    """
     yield from cron_string_iterator(end_timestamp, cron_string, execution_timezone, ascending=False)
 
 
@@ -4,11 +4,17 @@
 import pytest
 from dagster import (
     DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
     MultiPartitionKey,
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    BitmapPartitionsSubset,
+    DefaultPartitionsSubset,
+    PartitionKeyIndex,
+)
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     HourlyPartitionsDefinition,
@@ -17,6 +23,7 @@
     TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.instance_for_test import instance_for_test
 from dagster._core.test_utils import freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
@@ -82,6 +89,156 @@ class NewSerializationVersionSubset(TimeWindowPartitionsSubset):
 composite = MultiPartitionsDefinition({"date": time_window_partitions, "abc": static_partitions})
 
 
+def test_bitmap_partitions_subset():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(200)])
+    key_index = PartitionKeyIndex.for_partitions_def(partitions_def)
+    evens = check_bitmap(
+        BitmapPartitionsSubset.from_partition_keys(key_index, [str(i) for i in range(0, 200, 2)])
+    )
+    low = check_bitmap(
+        BitmapPartitionsSubset.from_partition_keys(key_index, [str(i) for i in range(100)])
+    )
+
+    assert len(evens) == 100
+    assert "4" in evens and "5" not in evens and "foo" not in evens
+    assert evens.get_partition_keys() == {str(i) for i in range(0, 200, 2)}
+
+    assert check_bitmap(evens | low) == DefaultPartitionsSubset(
+        {str(i) for i in range(200) if i < 100 or i % 2 == 0}
+    )
+    assert check_bitmap(evens & low) == DefaultPartitionsSubset({str(i) for i in range(0, 100, 2)})
+    assert check_bitmap(low - evens) == DefaultPartitionsSubset({str(i) for i in range(1, 100, 2)})
+    assert set(evens.get_partition_keys_not_in_subset(partitions_def)) == {
+        str(i) for i in range(1, 200, 2)
+    }
+    assert low.get_partition_key_ranges(partitions_def) == [PartitionKeyRange("0", "99")]
+    assert (low - evens).empty_subset().is_empty
+
+    # mixing with default subsets
+    assert DefaultPartitionsSubset({"0", "1"}) | evens == evens.with_partition_keys(["1"])
+    assert DefaultPartitionsSubset({"0", "1"}) == low & DefaultPartitionsSubset({"0", "1"})
+
+    # keys that are not in the index fall back to a default subset
+    with_unknown_key = low.with_partition_keys(["foo"])
+    assert isinstance(with_unknown_key, DefaultPartitionsSubset)
+    assert with_unknown_key == DefaultPartitionsSubset({"foo", *low.get_partition_keys()})
+
+    assert evens.to_serializable_subset() == DefaultPartitionsSubset(
+        set(evens.get_partition_keys())
+    )
+
+
+def check_bitmap(subset):
+    assert isinstance(subset, BitmapPartitionsSubset)
+    return subset
+
+
+def test_bitmap_partitions_subset_hash():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10)])
+    key_index = PartitionKeyIndex.for_partitions_def(partitions_def)
+    low = check_bitmap(BitmapPartitionsSubset.from_partition_keys(key_index, ["0", "1"]))
+    high = check_bitmap(BitmapPartitionsSubset.from_partition_keys(key_index, ["8", "9"]))
+
+    same_as_low = check_bitmap(BitmapPartitionsSubset.from_partition_keys(key_index, ["1", "0"]))
+    assert low == same_as_low
+    assert hash(low) == hash(same_as_low)
+    # subsets of the same size hash differently
+    assert len({hash(low), hash(high)}) == 2
+    assert len({low, high, low | high}) == 3
+
+
+@pytest.mark.parametrize(
+    "partition_keys",
+    [[], ["b"], ["a", "b", "c", "d", "e"], ["a", "c", "e"], ["b", "c", "d"]],
+)
+def test_bitmap_partitions_subset_serialization(partition_keys):
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d", "e"])
+    subset = BitmapPartitionsSubset.from_subset(
+        partitions_def.subset_with_partition_keys(partition_keys), partitions_def
+    )
+    serialized = subset.serialize()
+    deserialized = partitions_def.deserialize_subset(serialized)
+    assert isinstance(deserialized, BitmapPartitionsSubset)
+    assert deserialized == subset
+    assert deserialized.get_partition_keys() == set(partition_keys)
+
+    # subsets serialized with the previous format can still be read
+    legacy = partitions_def.deserialize_subset(
+        partitions_def.subset_with_partition_keys(partition_keys).serialize()
+    )
+    assert isinstance(legacy, DefaultPartitionsSubset)
+    assert legacy == subset
+
+
+def test_default_subset_with_bitmap_like_keys():
+    partitions_def = StaticPartitionsDefinition(["run_lengths", "version"])
+    subset = partitions_def.subset_with_partition_keys(["run_lengths"])
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+
+
+def test_bitmap_partitions_subset_dynamic_partitions():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+    with instance_for_test() as instance:
+        instance.add_dynamic_partitions("fruits", ["apple", "banana", "cherry"])
+        subset = BitmapPartitionsSubset.from_subset(
+            DefaultPartitionsSubset({"apple", "cherry"}),
+            partitions_def,
+            dynamic_partitions_store=instance,
+        )
+        assert isinstance(subset, BitmapPartitionsSubset)
+        serialized = subset.serialize()
+
+        # partitions added after serialization do not invalidate the serialized subset
+        instance.add_dynamic_partitions("fruits", ["durian"])
+        deserialized = partitions_def.deserialize_subset(
+            serialized, dynamic_partitions_store=instance
+        )
+        assert deserialized == DefaultPartitionsSubset({"apple", "cherry"})
+        assert set(
+            deserialized.get_partition_keys_not_in_subset(
+                partitions_def, dynamic_partitions_store=instance
+            )
+        ) == {"banana", "durian"}
+
+        instance.delete_dynamic_partition("fruits", "apple")
+        with pytest.raises(DagsterInvalidDeserializationVersionError):
+            partitions_def.deserialize_subset(serialized, dynamic_partitions_store=instance)
+
+
+def test_bitmap_partitions_subset_dynamic_key_index_reuse():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+    with instance_for_test() as instance:
+        instance.add_dynamic_partitions("fruits", ["apple", "banana", "cherry"])
+        subset = BitmapPartitionsSubset.from_subset(
+            DefaultPartitionsSubset({"apple", "cherry"}),
+            partitions_def,
+            dynamic_partitions_store=instance,
+        )
+        assert isinstance(subset, BitmapPartitionsSubset)
+        serialized = subset.serialize()
+
+        # the key index is shared for as long as the dynamic partition keys are unchanged
+        deserialized = partitions_def.deserialize_subset(
+            serialized, dynamic_partitions_store=instance
+        )
+        assert isinstance(deserialized, BitmapPartitionsSubset)
+        assert deserialized.key_index is subset.key_index
+        assert hash(deserialized) == hash(subset)
+        assert hash(subset) == hash(
+            BitmapPartitionsSubset.from_partition_keys(
+                PartitionKeyIndex(["apple", "banana", "cherry"]), ["apple", "cherry"]
+            )
+        )
+
+        instance.add_dynamic_partitions("fruits", ["durian"])
+        deserialized = partitions_def.deserialize_subset(
+            serialized, dynamic_partitions_store=instance
+        )
+        assert isinstance(deserialized, BitmapPartitionsSubset)
+        assert deserialized.key_index is not subset.key_index
+        assert deserialized.get_partition_keys() == subset.get_partition_keys()
+
+
 def test_get_subset_type():
     assert composite.__class__.__name__ == MultiPartitionsDefinition.__name__
     assert static_partitions.__class__.__name__ == StaticPartitionsDefinition.__name__
@@ -4,6 +4,7 @@
 from typing import AbstractSet, NamedTuple, Optional, Union, cast  # noqa: UP035
 from unittest.mock import MagicMock, patch
 
+import dagster._check as check
 import pytest
 from dagster import (
     AssetCheckResult,
@@ -52,6 +53,7 @@
 from dagster._core.execution.asset_backfill import (
     AssetBackfillData,
     AssetBackfillIterationResult,
+    AssetBackfillMaterializationTailer,
     AssetBackfillStatus,
     backfill_is_complete,
     execute_asset_backfill_iteration_inner,
@@ -1948,3 +1950,101 @@ def foo_check():
     run_request = result.run_requests[0]
     assert run_request.asset_selection == [foo.key]
     assert run_request.asset_check_keys == [foo_check.check_key]
+
+
+def test_asset_backfill_materialization_tailer() -> None:
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream():
+        pass
+
+    @asset(partitions_def=partitions_def, deps=[upstream])
+    def downstream():
+        pass
+
+    with instance_for_test() as instance:
+        materialize(
+            [upstream, downstream],
+            partition_key="a",
+            instance=instance,
+            tags={BACKFILL_ID_TAG: "backfill_1"},
+        )
+        storage_id_after_first_run = check.not_none(
+            instance.event_log_storage.get_maximum_record_id()
+        )
+        materialize([upstream], partition_key="b", instance=instance)
+        materialize(
+            [upstream], partition_key="c", instance=instance, tags={BACKFILL_ID_TAG: "backfill_1"}
+        )
+        materialize(
+            [upstream], partition_key="b", instance=instance, tags={BACKFILL_ID_TAG: "backfill_2"}
+        )
+
+        tailer = AssetBackfillMaterializationTailer(instance)
+        assert tailer.max_storage_id == instance.event_log_storage.get_maximum_record_id()
+
+        def _read(asset_keys, after_storage_id):
+            for _ in tailer.read_materializations(asset_keys, after_storage_id):
+                pass
+
+        # only the materializations of the requested assets are read
+        _read({upstream.key}, storage_id_after_first_run)
+        assert set(
+            tailer.get_materialized_asset_partitions("backfill_1", storage_id_after_first_run)
+        ) == {AssetKeyPartitionKey(upstream.key, "c")}
+
+        # a lower cursor reads the events before the ones already read, and other assets are
+        # read from the lower cursor up to the maximum storage id
+        _read({upstream.key, downstream.key}, 0)
+        assert set(tailer.get_materialized_asset_partitions("backfill_1", 0)) == {
+            AssetKeyPartitionKey(upstream.key, "a"),
+            AssetKeyPartitionKey(downstream.key, "a"),
+            AssetKeyPartitionKey(upstream.key, "c"),
+        }
+        assert set(
+            tailer.get_materialized_asset_partitions("backfill_2", storage_id_after_first_run)
+        ) == {AssetKeyPartitionKey(upstream.key, "b")}
+        assert tailer.get_materialized_asset_partitions("backfill_3", 0) == []
+
+        # materializations that have already been read are not read again
+        with patch.object(
+            instance.event_log_storage,
+            "get_materialization_records_for_assets",
+            wraps=instance.event_log_storage.get_materialization_records_for_assets,
+        ) as get_records_mock:
+            _read({upstream.key, downstream.key}, storage_id_after_first_run)
+            assert get_records_mock.call_count == 0
+
+        # events written after the tailer was created are left for the next tick
+        materialize(
+            [downstream], partition_key="c", instance=instance, tags={BACKFILL_ID_TAG: "backfill_1"}
+        )
+        _read({downstream.key}, 0)
+        assert AssetKeyPartitionKey(
+            downstream.key, "c"
+        ) not in tailer.get_materialized_asset_partitions("backfill_1", 0)
+
+
+def test_asset_backfill_materialization_tailer_wiped_asset() -> None:
+    @asset(partitions_def=StaticPartitionsDefinition(["a", "b"]))
+    def upstream():
+        pass
+
+    with instance_for_test() as instance:
+        materialize(
+            [upstream], partition_key="a", instance=instance, tags={BACKFILL_ID_TAG: "backfill_1"}
+        )
+        instance.wipe_assets([upstream.key])
+        materialize(
+            [upstream], partition_key="b", instance=instance, tags={BACKFILL_ID_TAG: "backfill_1"}
+        )
+
+        tailer = AssetBackfillMaterializationTailer(instance)
+        for _ in tailer.read_materializations({upstream.key}, 0):
+            pass
+
+        # materializations from before the asset was wiped are not read
+        assert tailer.get_materialized_asset_partitions("backfill_1", 0) == [
+            AssetKeyPartitionKey(upstream.key, "b")
+        ]
@@ -2,6 +2,7 @@
 from contextlib import ExitStack
 from unittest.mock import MagicMock, patch
 
+import dagster._check as check
 import pytest
 from dagster import (
     AssetDep,
@@ -9,11 +10,13 @@
     DagsterInstance,
     DailyPartitionsDefinition,
     DynamicPartitionsDefinition,
+    HourlyPartitionsDefinition,
     PartitionKeyRange,
     TimeWindowPartitionMapping,
     WeeklyPartitionsDefinition,
     asset,
 )
+from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 from dagster._core.definitions.partition import StaticPartitionsDefinition
 from dagster._core.execution.asset_backfill import AssetBackfillData, AssetBackfillStatus
 from dagster._core.instance_for_test import instance_for_test
@@ -307,6 +310,50 @@ def unpartitioned_upstream_of_partitioned():
     assert result.run_requests[0].tags == {}
 
 
+def test_asset_backfill_groups_non_partitioned_assets_by_backfill_policy():
+    @asset(backfill_policy=BackfillPolicy.single_run())
+    def unpartitioned_single_run_a():
+        return 1
+
+    @asset(backfill_policy=BackfillPolicy.single_run())
+    def unpartitioned_single_run_b():
+        return 1
+
+    @asset
+    def unpartitioned_no_policy():
+        return 1
+
+    assets = [
+        unpartitioned_single_run_a,
+        unpartitioned_single_run_b,
+        unpartitioned_no_policy,
+    ]
+    asset_graph = get_asset_graph({"repo": assets})
+
+    backfill_data = AssetBackfillData.from_asset_partitions(
+        partition_names=None,
+        asset_graph=asset_graph,
+        asset_selection=[a.key for a in assets],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=True,
+        backfill_start_timestamp=get_current_timestamp(),
+    )
+    result = execute_asset_backfill_iteration_consume_generator(
+        backfill_id="test_backfill_id",
+        asset_backfill_data=backfill_data,
+        asset_graph=asset_graph,
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert sorted(
+        sorted(key.to_user_string() for key in check.not_none(run_request.asset_selection))
+        for run_request in result.run_requests
+    ) == [
+        ["unpartitioned_no_policy"],
+        ["unpartitioned_single_run_a", "unpartitioned_single_run_b"],
+    ]
+    assert all(run_request.partition_key is None for run_request in result.run_requests)
+
+
 def test_asset_backfill_return_single_run_request_for_partitioned():
     time_now = get_current_datetime()
     daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
@@ -394,6 +441,63 @@ def upstream_daily_partitioned_asset():
     )
 
 
+def test_asset_backfill_run_requests_planned_without_expanding_partitions():
+    time_now = get_current_datetime()
+    hourly_partitions_def = HourlyPartitionsDefinition(
+        "2019-01-01-00:00", end_date="2024-01-01-00:00"
+    )
+
+    @asset(partitions_def=hourly_partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def upstream_hourly_partitioned_asset():
+        return 1
+
+    @asset(
+        partitions_def=hourly_partitions_def,
+        backfill_policy=BackfillPolicy.single_run(),
+        deps=[upstream_hourly_partitioned_asset],
+    )
+    def downstream_hourly_partitioned_asset():
+        return 1
+
+    asset_graph = get_asset_graph(
+        {"repo": [upstream_hourly_partitioned_asset, downstream_hourly_partitioned_asset]}
+    )
+
+    backfill_data = AssetBackfillData.from_asset_partitions(
+        partition_names=None,
+        asset_graph=asset_graph,
+        asset_selection=[
+            upstream_hourly_partitioned_asset.key,
+            downstream_hourly_partitioned_asset.key,
+        ],
+        dynamic_partitions_store=MagicMock(),
+        all_partitions=True,
+        backfill_start_timestamp=time_now.timestamp(),
+    )
+
+    # planning runs for the ~44k partitions of each asset should work on partition key ranges
+    with patch.object(
+        AssetGraphSubset,
+        "iterate_asset_partitions",
+        side_effect=Exception("asset partitions should not be expanded"),
+    ):
+        result = execute_asset_backfill_iteration_consume_generator(
+            backfill_id="test_backfill_id",
+            asset_backfill_data=backfill_data,
+            asset_graph=asset_graph,
+            instance=DagsterInstance.ephemeral(),
+        )
+
+    assert len(result.run_requests) == 1
+    run_request = result.run_requests[0]
+    assert set(run_request.asset_selection or []) == {
+        upstream_hourly_partitioned_asset.key,
+        downstream_hourly_partitioned_asset.key,
+    }
+    assert run_request.tags.get(ASSET_PARTITION_RANGE_START_TAG) == "2019-01-01-00:00"
+    assert run_request.tags.get(ASSET_PARTITION_RANGE_END_TAG) == "2023-12-31-23:00"
+
+
 def test_asset_backfill_status_count_with_backfill_policies():
     daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
     weekly_partitions_def = WeeklyPartitionsDefinition("2023-01-01")
@@ -1164,8 +1268,9 @@ def partitioned_asset():
             monkeypatch.setenv("DAGSTER_EVENT_BATCH_SIZE", str(batch_size))
             if throw_store_event_batch_error:
                 stack.enter_context(
-                    patch(
-                        "dagster._core.storage.event_log.base.EventLogStorage.store_event_batch",
+                    patch.object(
+                        type(instance.event_log_storage),
+                        "store_event_batch",
                         side_effect=Exception("failed"),
                     )
                 )
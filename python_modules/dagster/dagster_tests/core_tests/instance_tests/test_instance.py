@@ -1,7 +1,11 @@
+import logging
 import os
 import re
 import tempfile
+import time
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
 
@@ -32,6 +36,13 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import (
+    DagsterEvent,
+    DagsterEventType,
+    EngineEventData,
+    StepMaterializationData,
+)
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -798,3 +809,240 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def _step_log_entry(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+    )
+
+
+def _engine_event_entry(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "my_job",
+            message=message,
+            event_specific_data=EngineEventData(),
+            step_key="my_step",
+        ),
+    )
+
+
+def _asset_materialization_entry(run_id: str, asset_key: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "my_job",
+            event_specific_data=StepMaterializationData(AssetMaterialization(asset_key=asset_key)),
+            step_key="my_step",
+        ),
+    )
+
+
+@contextmanager
+def _buffering_instance_for_test(**event_write_buffer_settings):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        with instance_for_test(
+            temp_dir=tmpdir_path,
+            overrides={
+                "event_log_storage": {
+                    "module": "dagster.core.storage.event_log",
+                    "class": "ConsolidatedSqliteEventLogStorage",
+                    "config": {"base_dir": tmpdir_path},
+                },
+                "event_write_buffer": {"enabled": True, **event_write_buffer_settings},
+            },
+        ) as instance:
+            assert instance.event_log_storage.supports_batch_writes_for_all_event_types
+            yield instance
+
+
+def _stored_messages(instance: DagsterInstance, run_id: str) -> list[str]:
+    # read from the storage directly, since reads through the instance write buffered events first
+    return [event.user_message for event in instance.event_log_storage.get_logs_for_run(run_id)]
+
+
+def test_event_write_buffering():
+    with _buffering_instance_for_test(max_age_seconds=60) as instance:
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        # the first event is written immediately, and the following ones are buffered
+        instance.handle_new_event(_step_log_entry(run_id, "one"))
+        instance.handle_new_event(_step_log_entry(run_id, "two"))
+        instance.handle_new_event(_step_log_entry(run_id, "three"))
+        assert _stored_messages(instance, run_id) == ["one"]
+
+        # events that can't be buffered write the buffered events first
+        instance.handle_new_event(_engine_event_entry(run_id, "four"))
+        assert _stored_messages(instance, run_id) == ["one", "two", "three", "four"]
+
+        instance.handle_new_event(_step_log_entry(run_id, "five"))
+        assert _stored_messages(instance, run_id) == ["one", "two", "three", "four"]
+
+        instance.flush_buffered_events()
+        assert _stored_messages(instance, run_id) == ["one", "two", "three", "four", "five"]
+
+
+def test_event_write_buffering_asset_and_error_events():
+    with _buffering_instance_for_test(max_age_seconds=60) as instance:
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        instance.handle_new_event(_step_log_entry(run_id, "one"))
+        instance.handle_new_event(_step_log_entry(run_id, "two"))
+        assert _stored_messages(instance, run_id) == ["one"]
+
+        # asset events are written immediately, along with the events buffered before them
+        instance.handle_new_event(_asset_materialization_entry(run_id, "my_asset"))
+        assert len(_stored_messages(instance, run_id)) == 3
+        assert instance.event_log_storage.has_asset_key(AssetKey("my_asset"))
+
+        # as are error logs
+        instance.handle_new_event(_step_log_entry(run_id, "three"))
+        instance.handle_new_event(_step_log_entry(run_id, "four")._replace(level=logging.ERROR))
+        assert _stored_messages(instance, run_id)[-2:] == ["three", "four"]
+
+
+def test_event_write_buffering_max_size():
+    with _buffering_instance_for_test(max_age_seconds=60, max_size=3) as instance:
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            for i in range(7):
+                instance.handle_new_event(_step_log_entry(run_id, str(i)))
+
+            # the first event is written immediately, then two full batches
+            assert store_event_batch.call_count == 2
+            assert len(_stored_messages(instance, run_id)) == 7
+
+
+def test_event_write_buffering_max_age():
+    with _buffering_instance_for_test(max_age_seconds=0.5) as instance:
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        instance.handle_new_event(_step_log_entry(run_id, "one"))
+        instance.handle_new_event(_step_log_entry(run_id, "two"))
+        assert _stored_messages(instance, run_id) == ["one"]
+
+        # the buffer is written in the background once its oldest event is too old, even if no
+        # further events are emitted
+        time.sleep(0.75)
+        assert _stored_messages(instance, run_id) == ["one", "two"]
+
+        instance.handle_new_event(_step_log_entry(run_id, "three"))
+        assert _stored_messages(instance, run_id) == ["one", "two"]
+        time.sleep(0.75)
+        assert _stored_messages(instance, run_id) == ["one", "two", "three"]
+
+
+def test_event_write_buffering_read_after_write():
+    with _buffering_instance_for_test(max_age_seconds=60) as instance:
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        instance.handle_new_event(_step_log_entry(run_id, "one"))
+        instance.handle_new_event(_step_log_entry(run_id, "two"))
+        assert _stored_messages(instance, run_id) == ["one"]
+
+        # reads on another thread don't write the events buffered by this one
+        with ThreadPoolExecutor() as executor:
+            executor.submit(instance.all_logs, run_id).result()
+        assert _stored_messages(instance, run_id) == ["one"]
+
+        # reads through the instance see the events buffered by the same thread
+        assert [event.user_message for event in instance.all_logs(run_id)] == ["one", "two"]
+        assert _stored_messages(instance, run_id) == ["one", "two"]
+
+        instance.handle_new_event(_step_log_entry(run_id, "three"))
+        instance.get_materialized_partitions_by_asset([AssetKey("my_asset")])
+        assert _stored_messages(instance, run_id) == ["one", "two", "three"]
+
+
+def test_event_write_buffering_flush_failure():
+    with _buffering_instance_for_test(max_age_seconds=60) as instance:
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        instance.handle_new_event(_step_log_entry(run_id, "one"))
+        instance.handle_new_event(_step_log_entry(run_id, "two"))
+        instance.handle_new_event(_step_log_entry(run_id, "three"))
+
+        with (
+            patch.object(
+                instance.event_log_storage,
+                "store_event_batch",
+                side_effect=Exception("batch failed"),
+            ),
+            patch.object(
+                instance.event_log_storage, "store_event", side_effect=Exception("write failed")
+            ),
+        ):
+            with pytest.raises(Exception, match="write failed"):
+                instance.handle_new_event(_engine_event_entry(run_id, "four"))
+        assert _stored_messages(instance, run_id) == ["one"]
+
+        # the failed batch is kept, and written ahead of the events buffered after it
+        instance.handle_new_event(_step_log_entry(run_id, "five"))
+        instance.flush_buffered_events(run_id)
+        assert _stored_messages(instance, run_id) == ["one", "two", "three", "five"]
+
+
+def test_event_write_buffering_disabled_by_default():
+    with instance_for_test() as instance:
+        assert not instance.event_write_buffer_enabled
+        run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+        for i in range(3):
+            instance.handle_new_event(_step_log_entry(run_id, str(i)))
+        assert len(_stored_messages(instance, run_id)) == 3
+
+
+def test_event_write_buffering_tracks_bounded_runs():
+    with _buffering_instance_for_test(max_age_seconds=60) as instance:
+        with patch("dagster._core.instance._MAX_TRACKED_RUN_WRITE_TIMES", 2):
+            run_ids = [create_run_for_test(instance, job_name="my_job").run_id for _ in range(3)]
+            for run_id in run_ids:
+                instance.handle_new_event(_step_log_entry(run_id, "one"))
+
+            # runs that never write their job events don't stay tracked forever
+            assert list(instance._last_step_event_write_times) == run_ids[1:]  # noqa: SLF001
+
+
+def test_event_write_buffering_flushed_on_dispose():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        overrides = {
+            "event_log_storage": {
+                "module": "dagster.core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": tmpdir_path},
+            },
+            "event_write_buffer": {"enabled": True, "max_age_seconds": 60},
+        }
+        with instance_for_test(temp_dir=tmpdir_path, overrides=overrides) as instance:
+            run_id = create_run_for_test(instance, job_name="my_job").run_id
+
+            with DagsterInstance.from_ref(instance.get_ref()) as writing_instance:
+                writing_instance.handle_new_event(_step_log_entry(run_id, "one"))
+                writing_instance.handle_new_event(_step_log_entry(run_id, "two"))
+                assert len(_stored_messages(instance, run_id)) == 1
+
+            assert len(instance.all_logs(run_id)) == 2
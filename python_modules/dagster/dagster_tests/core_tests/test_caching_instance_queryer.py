@@ -0,0 +1,147 @@
+from unittest import mock
+
+from dagster import AssetKey, DagsterInstance, StaticPartitionsDefinition, asset, materialize
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
+from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.events import DagsterEventType
+from dagster._time import get_current_datetime
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+
+@asset(partitions_def=partitions_def)
+def upstream() -> None: ...
+
+
+@asset(partitions_def=partitions_def, deps=[upstream])
+def downstream() -> None: ...
+
+
+@asset
+def unpartitioned() -> None: ...
+
+
+asset_graph = AssetGraph.from_assets([upstream, downstream, unpartitioned])
+
+
+def _get_instance_queryer(instance: DagsterInstance) -> CachingInstanceQueryer:
+    return AssetGraphView(
+        temporal_context=TemporalContext(effective_dt=get_current_datetime(), last_event_id=None),
+        instance=instance,
+        asset_graph=asset_graph,
+    ).get_inner_queryer_for_back_compat()
+
+
+def test_prefetch_materialized_partitions() -> None:
+    with DagsterInstance.ephemeral() as instance:
+        materialize([upstream], instance=instance, partition_key="a")
+        materialize([upstream, downstream], instance=instance, partition_key="b")
+
+        queryer = _get_instance_queryer(instance)
+        queryer.prefetch_materialized_partitions([upstream.key, downstream.key, unpartitioned.key])
+
+        with mock.patch.object(
+            instance, "get_materialized_partitions", side_effect=Exception("not prefetched")
+        ):
+            assert queryer.get_materialized_partitions(upstream.key) == {"a", "b"}
+            assert queryer.get_materialized_partitions(downstream.key) == {"b"}
+            assert queryer.get_materialized_partitions(unpartitioned.key) == set()
+
+
+def test_prefetch_latest_storage_ids_by_partition() -> None:
+    with DagsterInstance.ephemeral() as instance:
+        materialize([upstream], instance=instance, partition_key="a")
+        materialize([upstream, downstream], instance=instance, partition_key="b")
+
+        queryer = _get_instance_queryer(instance)
+        queryer.prefetch_latest_storage_ids_by_partition(
+            [upstream.key, downstream.key, unpartitioned.key, AssetKey("missing")]
+        )
+
+        with mock.patch.object(
+            instance, "get_latest_storage_id_by_partition", side_effect=Exception("not prefetched")
+        ):
+            storage_id_a = queryer.get_latest_materialization_or_observation_storage_id(
+                AssetKeyPartitionKey(upstream.key, "a")
+            )
+            storage_id_b = queryer.get_latest_materialization_or_observation_storage_id(
+                AssetKeyPartitionKey(upstream.key, "b")
+            )
+            assert storage_id_a is not None
+            assert storage_id_b is not None
+            assert storage_id_a < storage_id_b
+            assert (
+                queryer.get_latest_materialization_or_observation_storage_id(
+                    AssetKeyPartitionKey(upstream.key, "c")
+                )
+                is None
+            )
+            assert (
+                queryer.get_latest_materialization_or_observation_storage_id(
+                    AssetKeyPartitionKey(downstream.key, "b")
+                )
+                is not None
+            )
+
+
+def test_prefetch_latest_storage_ids_by_partition_after_cursor() -> None:
+    with DagsterInstance.ephemeral() as instance:
+        materialize([upstream], instance=instance, partition_key="a")
+        after_cursor = instance.event_log_storage.get_maximum_record_id()
+        materialize([downstream], instance=instance, partition_key="a")
+
+        queryer = _get_instance_queryer(instance)
+        with mock.patch.object(
+            instance,
+            "get_latest_storage_id_by_partition_for_assets",
+            wraps=instance.get_latest_storage_id_by_partition_for_assets,
+        ) as get_latest_storage_id_by_partition_for_assets:
+            queryer.prefetch_latest_storage_ids_by_partition(
+                [upstream.key, downstream.key], after_cursor=after_cursor
+            )
+
+        # upstream has not been materialized since the cursor, so it is skipped
+        get_latest_storage_id_by_partition_for_assets.assert_called_once_with(
+            [downstream.key], DagsterEventType.ASSET_MATERIALIZATION
+        )
+
+
+def test_prefetch_materialized_partitions_for_status_cache() -> None:
+    with DagsterInstance.ephemeral() as instance:
+        materialize([upstream, downstream], instance=instance, partition_key="a")
+        # build the status cache values of both assets
+        queryer = _get_instance_queryer(instance)
+        for asset_key in [upstream.key, downstream.key]:
+            queryer.get_materialized_asset_subset(asset_key=asset_key)
+
+        materialize([upstream], instance=instance, partition_key="b")
+        materialize([upstream, downstream], instance=instance, partition_key="c")
+
+        queryer = _get_instance_queryer(instance)
+        with mock.patch.object(
+            instance,
+            "get_latest_storage_id_by_partition_for_assets",
+            wraps=instance.get_latest_storage_id_by_partition_for_assets,
+        ) as get_latest_storage_id_by_partition_for_assets:
+            queryer.prefetch_materialized_partitions_for_status_cache(
+                [upstream.key, downstream.key, unpartitioned.key, AssetKey("missing")]
+            )
+        assert get_latest_storage_id_by_partition_for_assets.call_count == 1
+
+        # the new partitions of both assets are read from the prefetched partitions when their
+        # status cache values are updated
+        with mock.patch.object(
+            instance, "get_materialized_partitions", side_effect=Exception("not prefetched")
+        ):
+            assert set(
+                queryer.get_materialized_asset_subset(
+                    asset_key=upstream.key
+                ).subset_value.get_partition_keys()  # pyright: ignore[reportAttributeAccessIssue]
+            ) == {"a", "b", "c"}
+            assert set(
+                queryer.get_materialized_asset_subset(
+                    asset_key=downstream.key
+                ).subset_value.get_partition_keys()  # pyright: ignore[reportAttributeAccessIssue]
+            ) == {"a", "c"}
@@ -0,0 +1,118 @@
+import os
+import sys
+
+import pytest
+from dagster import (
+    AssetKey,
+    DailyPartitionsDefinition,
+    Definitions,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster._core.remote_representation import InProcessCodeLocationOrigin
+from dagster._core.test_utils import (
+    InProcessTestWorkspaceLoadTarget,
+    create_test_daemon_workspace_context,
+    instance_for_test,
+)
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._daemon import get_default_daemon_logger
+from dagster._daemon.asset_status_cache import (
+    AssetStatusCacheDaemon,
+    execute_asset_status_cache_iteration,
+)
+
+static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+daily_partitions_def = DailyPartitionsDefinition(start_date="2024-01-01")
+
+
+@asset(partitions_def=static_partitions_def)
+def static_asset() -> None: ...
+
+
+@asset(partitions_def=daily_partitions_def)
+def daily_asset() -> None: ...
+
+
+@asset
+def unpartitioned_asset() -> None: ...
+
+
+defs = Definitions(assets=[static_asset, daily_asset, unpartitioned_asset])
+
+
+@pytest.fixture
+def instance():
+    with instance_for_test(overrides={"asset_status_cache": {"update_on_write": True}}) as instance:
+        yield instance
+
+
+@pytest.fixture
+def workspace_context(instance):
+    load_target = InProcessTestWorkspaceLoadTarget(
+        InProcessCodeLocationOrigin(
+            loadable_target_origin=LoadableTargetOrigin(
+                executable_path=sys.executable,
+                module_name="dagster_tests.daemon_tests.test_asset_status_cache_daemon",
+                working_directory=os.getcwd(),
+                attribute="defs",
+            ),
+            location_name="test_location",
+        )
+    )
+    with create_test_daemon_workspace_context(load_target, instance) as workspace_context:
+        yield workspace_context
+
+
+def _get_cached_status(instance, asset_key: AssetKey):
+    return next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+
+
+def test_asset_status_cache_daemon_required(instance):
+    assert AssetStatusCacheDaemon.daemon_type() in instance.get_required_daemon_types()
+
+    with instance_for_test() as default_instance:
+        assert (
+            AssetStatusCacheDaemon.daemon_type() not in default_instance.get_required_daemon_types()
+        )
+
+
+def test_asset_status_cache_iteration(instance, workspace_context):
+    logger = get_default_daemon_logger("AssetStatusCacheDaemon")
+
+    materialize([static_asset], instance=instance, partition_key="a")
+    materialize([daily_asset], instance=instance, partition_key="2024-01-02")
+    materialize([unpartitioned_asset], instance=instance)
+    assert _get_cached_status(instance, static_asset.key) is None
+    assert _get_cached_status(instance, daily_asset.key) is None
+
+    # cold caches are built by the daemon
+    list(execute_asset_status_cache_iteration(workspace_context, logger))
+    static_status = _get_cached_status(instance, static_asset.key)
+    assert static_status.deserialize_materialized_partition_subsets(
+        static_partitions_def
+    ).get_partition_keys() == {"a"}
+    daily_status = _get_cached_status(instance, daily_asset.key)
+    assert set(
+        daily_status.deserialize_materialized_partition_subsets(
+            daily_partitions_def
+        ).get_partition_keys()
+    ) == {"2024-01-02"}
+    assert _get_cached_status(instance, unpartitioned_asset.key) is None
+
+    # warm caches are updated on write, and pending partitions are merged by the daemon
+    materialize([static_asset], instance=instance, partition_key="b")
+    assert _get_cached_status(instance, static_asset.key).pending_materialized_partition_keys == [
+        "b"
+    ]
+    list(execute_asset_status_cache_iteration(workspace_context, logger))
+    static_status = _get_cached_status(instance, static_asset.key)
+    assert static_status.pending_materialized_partition_keys is None
+    assert static_status.deserialize_materialized_partition_subsets(
+        static_partitions_def
+    ).get_partition_keys() == {"a", "b"}
+
+    # up-to-date caches are left alone
+    list(execute_asset_status_cache_iteration(workspace_context, logger))
+    assert _get_cached_status(instance, static_asset.key) == static_status
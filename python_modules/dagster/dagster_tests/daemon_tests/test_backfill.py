@@ -1796,6 +1796,169 @@ def _override_backfill_cancellation(backfill: PartitionBackfill):
     assert instance.get_runs_count(RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)) == 0
 
 
+def test_asset_backfill_iteration_time_budget(
+    caplog,
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    set_default_chunk_size,
+):
+    asset_selection = [AssetKey("daily_1"), AssetKey("daily_2")]
+    asset_graph = workspace_context.create_request_context().asset_graph
+
+    num_partitions = DEFAULT_CHUNK_SIZE * 2
+    target_partitions = daily_partitions_def.get_partition_keys()[0:num_partitions]
+    backfill_id = f"backfill_with_{num_partitions}_partitions"
+
+    backfill = PartitionBackfill.from_asset_partitions(
+        asset_graph=asset_graph,
+        backfill_id=backfill_id,
+        tags={},
+        backfill_timestamp=get_current_timestamp(),
+        asset_selection=asset_selection,
+        partition_names=target_partitions,
+        dynamic_partitions_store=instance,
+        all_partitions=False,
+        title=None,
+        description=None,
+    )
+    instance.add_backfill(backfill)
+
+    # the time budget is exhausted after the first chunk, so the remaining runs are left for the
+    # next iteration
+    with environ({"DAGSTER_BACKFILL_ITERATION_TIME_BUDGET_SECONDS": "0.000001"}):
+        assert all(
+            not error
+            for error in list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+        )
+        assert instance.get_runs_count() == DEFAULT_CHUNK_SIZE
+
+        updated_backfill = instance.get_backfill(backfill_id)
+        assert updated_backfill
+        assert updated_backfill.status == BulkActionStatus.REQUESTED
+        assert updated_backfill.submitting_run_requests
+        assert len(updated_backfill.submitting_run_requests) == num_partitions - DEFAULT_CHUNK_SIZE
+        # the pause is stored on the backfill, so any daemon process can tell it apart from an
+        # interrupted iteration
+        assert updated_backfill.submission_paused_by_time_budget
+
+        assert all(
+            not error
+            for error in list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+        )
+        assert instance.get_runs_count() == num_partitions
+
+    # resuming after the time budget was exhausted is expected, and not reported as an interruption
+    assert "Continuing previous backfill iteration" in caplog.text
+    assert "Resuming previous backfill iteration" not in caplog.text
+
+    updated_backfill = instance.get_backfill(backfill_id)
+    assert updated_backfill
+    assert not updated_backfill.submitting_run_requests
+    assert not updated_backfill.submission_paused_by_time_budget
+    assert updated_backfill.status == BulkActionStatus.REQUESTED
+
+
+def test_backfill_daemon_evaluates_least_recently_evaluated_backfills_first(
+    instance: DagsterInstance, workspace_context: WorkspaceProcessContext
+):
+    asset_graph = workspace_context.create_request_context().asset_graph
+
+    for backfill_id in ["backfill_a", "backfill_b"]:
+        instance.add_backfill(
+            PartitionBackfill.from_asset_partitions(
+                asset_graph=asset_graph,
+                backfill_id=backfill_id,
+                tags={},
+                backfill_timestamp=get_current_timestamp(),
+                asset_selection=[AssetKey("daily_1")],
+                partition_names=daily_partitions_def.get_partition_keys()[0:1],
+                dynamic_partitions_store=instance,
+                all_partitions=False,
+                title=None,
+                description=None,
+            )
+        )
+
+    backfill_iteration_timestamps = {"backfill_a": get_current_timestamp(), "stale_backfill": 0.0}
+    evaluated_backfill_ids = []
+
+    def _record_backfill_id(backfill, *args, **kwargs):
+        evaluated_backfill_ids.append(backfill.backfill_id)
+        yield None
+
+    with mock.patch(
+        "dagster._daemon.backfill.execute_asset_backfill_iteration",
+        side_effect=_record_backfill_id,
+    ):
+        list(
+            execute_backfill_iteration(
+                workspace_context,
+                get_default_daemon_logger("BackfillDaemon"),
+                backfill_iteration_timestamps=backfill_iteration_timestamps,
+            )
+        )
+
+    # backfill_b has never been evaluated, so it goes before backfill_a
+    assert evaluated_backfill_ids == ["backfill_b", "backfill_a"]
+    assert set(backfill_iteration_timestamps.keys()) == {"backfill_a", "backfill_b"}
+    assert (
+        backfill_iteration_timestamps["backfill_a"] >= backfill_iteration_timestamps["backfill_b"]
+    )
+
+
+def test_backfill_daemon_logs_iteration_duration_at_debug(
+    instance: DagsterInstance, workspace_context: WorkspaceProcessContext, caplog
+):
+    asset_graph = workspace_context.create_request_context().asset_graph
+    instance.add_backfill(
+        PartitionBackfill.from_asset_partitions(
+            asset_graph=asset_graph,
+            backfill_id="timed_backfill",
+            tags={},
+            backfill_timestamp=get_current_timestamp(),
+            asset_selection=[AssetKey("daily_1")],
+            partition_names=daily_partitions_def.get_partition_keys()[0:1],
+            dynamic_partitions_store=instance,
+            all_partitions=False,
+            title=None,
+            description=None,
+        )
+    )
+
+    def _noop_iteration(*args, **kwargs):
+        yield None
+
+    with (
+        caplog.at_level(logging.DEBUG, logger="dagster.daemon.BackfillDaemon"),
+        mock.patch(
+            "dagster._daemon.backfill.execute_asset_backfill_iteration",
+            side_effect=_noop_iteration,
+        ),
+    ):
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+    duration_records = [
+        record
+        for record in caplog.records
+        if hasattr(record, "backfill_iteration_duration_seconds")
+    ]
+    assert len(duration_records) == 1
+    assert duration_records[0].levelno == logging.DEBUG
+    assert duration_records[0].backfill_id == "timed_backfill"
+
+
 def test_asset_backfill_forcible_mark_as_canceled_during_canceling_iteration(
     instance: DagsterInstance, workspace_context: WorkspaceProcessContext
 ):
@@ -5,6 +5,7 @@
 from typing import Any, Optional, cast
 from unittest import mock
 
+import dagster._check as check
 import pytest
 from dagster import (
     AssetSpec,
@@ -293,6 +294,18 @@ def test_asset_daemon_with_threadpool_without_sensor(
             scenario.evaluate_daemon(instance, threadpool_executor=threadpool_executor)
 
 
+@pytest.mark.parametrize(
+    "scenario", daemon_scenarios, ids=[scenario.id for scenario in daemon_scenarios]
+)
+def test_asset_daemon_with_concurrent_evaluation_without_sensor(
+    scenario: AssetDaemonScenario,
+) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"evaluation_num_workers": 4, "use_sensors": False}}
+    ) as instance:
+        scenario.evaluate_daemon(instance)
+
+
 @pytest.mark.parametrize(
     "scenario",
     auto_materialize_sensor_scenarios,
@@ -376,6 +389,7 @@ def test_daemon_paused() -> None:
         assert ticks[0].timestamp == state.current_time.timestamp()
         assert ticks[0].tick_data.end_timestamp == state.current_time.timestamp()
         assert ticks[0].automation_condition_evaluation_id == 1
+        assert set(check.not_none(ticks[0].tick_data.evaluation_durations).keys()) == {"A", "B"}
 
         state = daemon_scenario.execution_fn(state)
         ticks = _get_asset_daemon_ticks(instance)
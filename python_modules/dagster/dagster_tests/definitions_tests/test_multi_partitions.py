@@ -18,8 +18,17 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
-from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import DefaultPartitionsSubset
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
+from dagster._core.definitions.time_window_partitions import (
+    TimeWindow,
+    TimeWindowPartitionsSubset,
+    get_time_partitions_def,
+)
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster._core.storage.tags import get_multidimensional_partition_tag
 from dagster._core.test_utils import instance_for_test
@@ -173,6 +182,50 @@ def test_multipartitions_subset_serialization():
     ).get_partition_keys() == set(partition_keys)
 
 
+def test_multi_partitions_subset():
+    composite = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    current_time = datetime(year=2015, month=2, day=1)
+    keys_1 = {f"2015-01-{day:02d}|a" for day in range(1, 11)} | {"2015-01-03|b"}
+    keys_2 = {f"2015-01-{day:02d}|a" for day in range(6, 21)} | {"2015-01-07|c"}
+    subset_1 = MultiPartitionsSubset.from_partition_keys(composite, keys_1)
+    subset_2 = MultiPartitionsSubset.from_partition_keys(composite, keys_2)
+    assert isinstance(subset_1, MultiPartitionsSubset)
+    assert isinstance(subset_2, MultiPartitionsSubset)
+    assert isinstance(subset_1.subsets_by_secondary_key["a"], TimeWindowPartitionsSubset)
+
+    assert len(subset_1) == 11
+    assert "2015-01-03|b" in subset_1
+    assert "2015-01-04|b" not in subset_1
+    assert "2015-01-03" not in subset_1
+    assert subset_1.get_partition_keys() == keys_1
+
+    assert (subset_1 | subset_2).get_partition_keys() == keys_1 | keys_2
+    assert (subset_1 & subset_2).get_partition_keys() == keys_1 & keys_2
+    assert (subset_1 - subset_2).get_partition_keys() == keys_1 - keys_2
+    assert subset_1 | DefaultPartitionsSubset(keys_2) == DefaultPartitionsSubset(keys_1 | keys_2)
+    assert subset_1 == DefaultPartitionsSubset(keys_1)
+
+    assert sorted(subset_1.get_partition_key_ranges(composite, current_time=current_time)) == [
+        PartitionKeyRange("2015-01-01|a", "2015-01-10|a"),
+        PartitionKeyRange("2015-01-03|b", "2015-01-03|b"),
+    ]
+    assert len(list(subset_1.get_partition_keys_not_in_subset(composite, current_time))) == (
+        31 * 3 - 11
+    )
+
+    # round trips through the asset status cache serialization, and falls back to the set of
+    # keys for serdes
+    deserialized = composite.deserialize_subset(subset_1.serialize())
+    assert isinstance(deserialized, MultiPartitionsSubset)
+    assert deserialized == subset_1
+    assert subset_1.to_serializable_subset() == DefaultPartitionsSubset(keys_1)
+
+
 def test_multipartitions_subset_equality():
     assert multipartitions_def.empty_subset().with_partition_keys(
         [
@@ -422,6 +475,67 @@ def test_get_num_partitions():
     )
 
 
+def test_partition_key_space():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    current_time = datetime(year=2015, month=3, day=1)
+    partition_keys = multipartitions_def.get_partition_keys(current_time=current_time)
+    key_space = multipartitions_def.get_partition_key_space(current_time=current_time)
+
+    assert len(key_space) == len(partition_keys) == 59 * 3
+    assert list(key_space) == partition_keys
+    assert key_space[-1] == partition_keys[-1]
+    assert key_space[5:17] == partition_keys[5:17]
+    assert key_space[::40] == partition_keys[::40]
+    for i, partition_key in enumerate(partition_keys):
+        assert key_space[i] == partition_key
+        assert key_space.index(partition_key) == i
+        assert partition_key in key_space
+
+    assert "2015-03-01|a" not in key_space
+    assert "2015-02-01|d" not in key_space
+    assert "2015-02-01" not in key_space
+    with pytest.raises(IndexError):
+        key_space[len(partition_keys)]
+    with pytest.raises(ValueError):
+        key_space.index("2014-12-31|a")
+
+    assert key_space.get_dimension_partition_keys("static") == ["a", "b", "c"]
+    assert key_space.get_keys_with_dimension_value("static", "b") == [
+        key for key in partition_keys if key.keys_by_dimension["static"] == "b"
+    ]
+
+
+def test_multipartitions_subset_key_ranges():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c", "d"]),
+        }
+    )
+    current_time = datetime(year=2015, month=1, day=20)
+    subset = multipartitions_def.empty_subset().with_partition_keys(
+        [
+            *[f"2015-01-{day:02d}|a" for day in [1, 2, 3, 7, 8, 19]],
+            *[f"2015-01-{day:02d}|c" for day in range(1, 20)],
+        ]
+    )
+    assert sorted(
+        subset.get_partition_key_ranges(multipartitions_def, current_time=current_time)
+    ) == sorted(
+        [
+            PartitionKeyRange("2015-01-01|a", "2015-01-03|a"),
+            PartitionKeyRange("2015-01-07|a", "2015-01-08|a"),
+            PartitionKeyRange("2015-01-19|a", "2015-01-19|a"),
+            PartitionKeyRange("2015-01-01|c", "2015-01-19|c"),
+        ]
+    )
+
+
 def test_dynamic_dimension_in_multipartitioned_asset():
     multipartitions_def = MultiPartitionsDefinition(
         {
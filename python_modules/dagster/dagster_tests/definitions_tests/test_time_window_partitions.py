@@ -1,9 +1,12 @@
+import itertools
 import pickle
 import random
 from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Optional, cast
+from unittest.mock import patch
 
+import dagster._check as check
 import pytest
 from dagster import (
     DagsterInvalidDefinitionError,
@@ -19,19 +22,26 @@
     weekly_partitioned_config,
 )
 from dagster._check import CheckError
+from dagster._core.definitions.time_window_partition_index import (
+    _TICKS_PER_BLOCK,
+    TimeWindowPartitionIndex,
+)
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     ScheduleType,
     TimeWindow,
+    TimeWindowPartitionKeyCodec,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.test_utils import freeze_time
 from dagster._record import copy
 from dagster._serdes import deserialize_value, serialize_value
-from dagster._time import create_datetime, parse_time_string
+from dagster._time import create_datetime, datetime_from_timestamp, parse_time_string
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
+from dagster._utils.schedules import cron_string_iterator
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -1172,6 +1182,114 @@ def test_dst_transition_daily_partitions() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "cron_schedule, timezone",
+    [
+        ("0 * * * *", "UTC"),
+        ("0 * * * *", "US/Pacific"),
+        ("15 * * * *", "Europe/Berlin"),
+        ("*/15 * * * *", "US/Pacific"),
+        ("0 * * * *", "Australia/Lord_Howe"),
+        ("0 * * * *", "Asia/Kolkata"),
+        ("0 0 * * *", "US/Pacific"),
+        ("30 2 * * *", "Europe/Berlin"),
+        ("0 0 * * 1", "America/New_York"),
+        ("0 0 1 * *", "UTC"),
+        ("0 9-17 * * 1-5", "America/Chicago"),
+    ],
+)
+def test_partition_index_matches_cron_iteration(cron_schedule: str, timezone: str) -> None:
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule,
+        start=datetime(2020, 1, 1, 7, 13),
+        end=datetime(2021, 12, 1),
+        timezone=timezone,
+        fmt="%Y-%m-%d-%H:%M",
+    )
+    start_timestamp = partitions_def.start.timestamp()
+    end_timestamp = check.not_none(partitions_def.end).timestamp()
+    ticks = []
+    for tick in cron_string_iterator(start_timestamp, cron_schedule, timezone):
+        if tick.timestamp() < start_timestamp:
+            continue
+        if tick.timestamp() > end_timestamp:
+            break
+        ticks.append(tick)
+
+    expected_keys = [
+        dst_safe_strftime(tick, timezone, partitions_def.fmt, cron_schedule) for tick in ticks[:-1]
+    ]
+    partition_keys = partitions_def.get_partition_keys()
+    assert partition_keys == expected_keys
+    assert partitions_def.get_num_partitions() == len(expected_keys)
+    assert partitions_def.get_last_partition_window() == TimeWindow(ticks[-2], ticks[-1])
+
+    for idx in random.Random(0).sample(range(len(expected_keys)), min(50, len(expected_keys))):
+        key = expected_keys[idx]
+        assert (
+            partitions_def.get_partition_keys_between_indexes(idx, idx + 3)
+            == (expected_keys[idx : idx + 3])
+        )
+        assert partitions_def.time_window_for_partition_key(key) == TimeWindow(
+            ticks[idx], ticks[idx + 1]
+        )
+        assert partitions_def.has_partition_key(key)
+        assert partitions_def.get_partition_key_for_timestamp(ticks[idx].timestamp()) == key
+        assert partitions_def.get_partition_key_for_timestamp(ticks[idx + 1].timestamp() - 1) == key
+        assert (
+            partitions_def.get_partition_key_for_timestamp(
+                ticks[idx + 1].timestamp(), end_closed=True
+            )
+            == key
+        )
+        assert partitions_def.get_next_partition_key(key) == (
+            expected_keys[idx + 1] if idx + 1 < len(expected_keys) else None
+        )
+        assert partitions_def.get_prev_partition_window(ticks[idx]) == (
+            TimeWindow(ticks[idx - 1], ticks[idx]) if idx > 0 else None
+        )
+
+
+def test_partition_index_far_lookups_keep_bounded_tables() -> None:
+    index = TimeWindowPartitionIndex(
+        "30 2 * * *",
+        "Europe/Berlin",
+        create_datetime(2020, 1, 1, tz="Europe/Berlin").timestamp(),
+    )
+    assert not index.has_fixed_interval
+
+    timestamps = [
+        create_datetime(2100, 3, 14, 12, 30, tz="Europe/Berlin").timestamp(),
+        create_datetime(1990, 11, 4, 12, 30, tz="Europe/Berlin").timestamp(),
+    ]
+    with patch("dagster._core.definitions.time_window_partition_index._MAX_CACHED_BLOCKS", 4):
+        for timestamp in timestamps:
+            prev_tick = next(
+                cron_string_iterator(timestamp, "30 2 * * *", "Europe/Berlin", ascending=False)
+            )
+            floor_index = index.floor_index(timestamp)
+            assert index.timestamp_for_index(floor_index) == prev_tick.timestamp()
+            assert index.timestamp_for_index(floor_index + 1) > timestamp
+            assert index.floor_index(prev_tick.timestamp()) == floor_index
+            assert index.ceil_index(prev_tick.timestamp() + 1) == floor_index + 1
+
+        # ticks near the start are recomputed after being evicted
+        assert (
+            index.timestamp_for_index(1)
+            == next(
+                cron_string_iterator(index.origin_timestamp + 1, "30 2 * * *", "Europe/Berlin")
+            ).timestamp()
+        )
+
+        # only the first tick of each block and the most recently used blocks are kept
+        assert len(index._blocks) <= 4  # noqa: SLF001
+        num_ticks = index.floor_index(timestamps[0]) - index.floor_index(timestamps[1])
+        num_block_starts = len(index._forward_block_starts) + len(  # noqa: SLF001
+            index._negated_backward_block_starts  # noqa: SLF001
+        )
+        assert num_block_starts <= num_ticks // _TICKS_PER_BLOCK + 3
+
+
 def test_unique_identifier():
     assert (
         DailyPartitionsDefinition(start_date="2015-01-01").get_serializable_unique_identifier()
@@ -1831,3 +1949,132 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition("2023-01-01", end_date="2024-01-01"),
+        HourlyPartitionsDefinition(
+            "2023-03-01-00:00", end_date="2023-04-01-00:00", timezone="America/Los_Angeles"
+        ),
+    ],
+)
+def test_time_window_partitions_subset_set_operations_match_partition_key_sets(
+    partitions_def: TimeWindowPartitionsDefinition,
+) -> None:
+    all_keys = partitions_def.get_partition_keys()
+    rng = random.Random(0)
+
+    def random_keys() -> set[str]:
+        # mix of contiguous runs and scattered partitions
+        keys = set(rng.sample(all_keys, rng.randint(0, len(all_keys) // 4)))
+        for _ in range(rng.randint(0, 5)):
+            start = rng.randrange(len(all_keys))
+            keys.update(all_keys[start : start + rng.randint(1, 100)])
+        return keys
+
+    for _ in range(20):
+        a_keys = random_keys()
+        b_keys = random_keys()
+        a = partitions_def.empty_subset().with_partition_keys(a_keys)
+        b = partitions_def.empty_subset().with_partition_keys(b_keys)
+
+        for subset, expected_keys in [
+            (a, a_keys),
+            (a | b, a_keys | b_keys),
+            (a & b, a_keys & b_keys),
+            (a - b, a_keys - b_keys),
+            (a.with_partition_keys(b_keys), a_keys | b_keys),
+        ]:
+            assert set(subset.get_partition_keys()) == expected_keys
+            assert len(subset) == len(expected_keys)
+            assert subset == partitions_def.empty_subset().with_partition_keys(expected_keys)
+
+        assert set(a.get_partition_keys_not_in_subset(partitions_def)) == set(all_keys) - a_keys
+        for key in rng.sample(all_keys, 20):
+            assert (key in a) == (key in a_keys)
+
+
+@pytest.mark.parametrize(
+    "timezone",
+    [
+        "UTC",
+        "Etc/GMT+5",
+        "America/Los_Angeles",
+        "Europe/Berlin",
+        "Asia/Kolkata",
+        "America/Sao_Paulo",
+        "Africa/Casablanca",
+    ],
+)
+@pytest.mark.parametrize(
+    "fmt, cron_schedule",
+    [
+        ("%Y-%m-%d", "0 0 * * *"),
+        ("%Y-%m-%d-%H:%M", "0 * * * *"),
+        ("%Y-%m-%d-%H:%M", "*/15 * * * *"),
+        ("%Y/%m/%d %H", "0 * * * *"),
+    ],
+)
+def test_time_window_partition_key_codec_matches_dst_safe_conversions(
+    timezone: str, fmt: str, cron_schedule: str
+) -> None:
+    codec = TimeWindowPartitionKeyCodec(timezone=timezone, fmt=fmt, cron_schedule=cron_schedule)
+    # spans two DST transitions in each direction, and years past the end of the tz database
+    timestamps = [
+        tick.timestamp()
+        for start in ["2022-10-01", "2023-03-01", "2045-03-01"]
+        for tick in itertools.islice(
+            cron_string_iterator(
+                create_datetime(*map(int, start.split("-")), tz=timezone).timestamp(),
+                cron_schedule,
+                timezone,
+            ),
+            24 * 60 if "/" not in cron_schedule else 4 * 24 * 60,
+        )
+    ]
+
+    expected_keys = [
+        dst_safe_strftime(datetime_from_timestamp(ts, tz=timezone), timezone, fmt, cron_schedule)
+        for ts in timestamps
+    ]
+    assert codec.timestamps_to_keys(timestamps) == expected_keys
+    assert list(codec.keys_to_timestamps(expected_keys)) == [
+        dst_safe_strptime(key, timezone, fmt).timestamp() for key in expected_keys
+    ]
+
+
+@pytest.mark.parametrize(
+    "timezone, uses_arithmetic_offset",
+    [
+        ("Asia/Kolkata", True),
+        ("Asia/Tokyo", True),
+        ("America/Sao_Paulo", True),
+        # recurring DST rules apply after the last transition known to pytz
+        ("America/Los_Angeles", False),
+        ("Africa/Casablanca", False),
+    ],
+)
+def test_time_window_partition_key_codec_offset_after_last_transition(
+    timezone: str, uses_arithmetic_offset: bool
+) -> None:
+    codec = TimeWindowPartitionKeyCodec(
+        timezone=timezone, fmt="%Y-%m-%d-%H:%M", cron_schedule="0 * * * *"
+    )
+    timestamp = create_datetime(2045, 6, 1, tz=timezone).timestamp()
+    assert (codec._get_offset_range(timestamp) is not None) == uses_arithmetic_offset  # noqa: SLF001
+
+
+@pytest.mark.parametrize("partition_key", ["2023-1-1", "2023-02-30", "2023-01-01-24:00", "abc"])
+def test_time_window_partition_key_codec_invalid_keys(partition_key: str) -> None:
+    codec = TimeWindowPartitionKeyCodec(
+        timezone="UTC", fmt="%Y-%m-%d-%H:%M", cron_schedule="0 * * * *"
+    )
+    try:
+        expected = dst_safe_strptime(partition_key, "UTC", "%Y-%m-%d-%H:%M").timestamp()
+    except ValueError:
+        with pytest.raises(ValueError):
+            codec.key_to_timestamp(partition_key)
+    else:
+        assert codec.key_to_timestamp(partition_key) == expected
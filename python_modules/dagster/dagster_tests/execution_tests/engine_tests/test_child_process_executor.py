@@ -4,6 +4,7 @@
 from multiprocessing.process import BaseProcess
 
 import pytest
+from dagster._core.errors import raise_execution_interrupts
 from dagster._core.executor.child_process_executor import (
     ChildProcessCommand,
     ChildProcessCrashException,
@@ -11,6 +12,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -47,6 +49,19 @@ def execute(self):
         segfault()
 
 
+class GetPidCommand(ChildProcessCommand):
+    def execute(self):
+        yield os.getpid()
+
+
+class InterruptibleCommand(ChildProcessCommand):
+    def execute(self):
+        yield os.getpid()
+        with raise_execution_interrupts():
+            time.sleep(30)
+        yield "done"
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):
         time.sleep(0.5)
@@ -115,3 +130,82 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing_ctx, LongRunningCommand()))
+
+
+def _get_command_results(pool, command, term_event=None):
+    return [
+        event
+        for event in pool.execute_command(command, term_event or multiprocessing_ctx.Event())
+        if event is not None and not isinstance(event, (ChildProcessEvent, BaseProcess))
+    ]
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing_ctx, max_workers=1).start() as pool:
+        assert _get_command_results(pool, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+
+        pids = {_get_command_results(pool, GetPidCommand())[0] for _ in range(3)}
+        assert len(pids) == 1
+        assert os.getpid() not in pids
+
+
+def test_worker_pool_recycles_workers():
+    with ChildProcessWorkerPool(
+        multiprocessing_ctx, max_workers=1, max_commands_per_worker=2
+    ).start() as pool:
+        pids = [_get_command_results(pool, GetPidCommand())[0] for _ in range(4)]
+        assert pids[0] == pids[1]
+        assert pids[2] == pids[3]
+        assert pids[0] != pids[2]
+
+
+def test_worker_pool_uncaught_exception():
+    with ChildProcessWorkerPool(multiprocessing_ctx, max_workers=1) as pool:
+        pid = _get_command_results(pool, GetPidCommand())[0]
+        results = [
+            event
+            for event in pool.execute_command(ThrowAnErrorCommand(), multiprocessing_ctx.Event())
+            if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        assert len(results) == 1
+        assert "AnError" in str(results[0].error_info.message)
+
+        # the worker is still usable after an error in a command
+        assert _get_command_results(pool, GetPidCommand()) == [pid]
+
+
+def test_worker_pool_crashy_process():
+    with ChildProcessWorkerPool(multiprocessing_ctx, max_workers=1) as pool:
+        pid = _get_command_results(pool, GetPidCommand())[0]
+
+        with pytest.raises(ChildProcessCrashException) as exc:
+            _get_command_results(pool, CrashyCommand())
+        assert exc.value.exit_code == 1
+
+        # the crashed worker is replaced
+        new_pid = _get_command_results(pool, GetPidCommand())[0]
+        assert new_pid != pid
+
+
+def test_worker_pool_terminate_command():
+    with ChildProcessWorkerPool(multiprocessing_ctx, max_workers=1) as pool:
+        term_event = multiprocessing_ctx.Event()
+        results = []
+        start_time = time.time()
+        for event in pool.execute_command(InterruptibleCommand(), term_event):
+            if isinstance(event, int):
+                pid = event
+                term_event.set()
+            elif event is not None and not isinstance(event, BaseProcess):
+                results.append(event)
+
+        assert time.time() - start_time < 30
+        assert "done" not in results
+        error_events = [
+            event for event in results if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        assert len(error_events) == 1
+        assert error_events[0].error_info.cls_name == "DagsterExecutionInterruptedError"
+
+        # the terminated worker is replaced
+        assert _get_command_results(pool, GetPidCommand())[0] != pid
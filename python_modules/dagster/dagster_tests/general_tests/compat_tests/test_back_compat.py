@@ -43,9 +43,19 @@
 from dagster._core.storage.event_log.migration import migrate_event_log_data
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
-from dagster._core.storage.runs.migration import BACKFILL_JOB_NAME_AND_TAGS, RUN_BACKFILL_ID
+from dagster._core.storage.runs.migration import (
+    BACKFILL_JOB_NAME_AND_TAGS,
+    RUN_BACKFILL_ID,
+    RUN_PARTITION_STATUS,
+)
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.sqlalchemy_compat import db_select
-from dagster._core.storage.tags import BACKFILL_ID_TAG, REPOSITORY_LABEL_TAG
+from dagster._core.storage.tags import (
+    BACKFILL_ID_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    REPOSITORY_LABEL_TAG,
+)
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import create_snapshot_id
@@ -1781,3 +1791,100 @@ def test_add_backfill_end_timestamp():
             no_runs_backfill = instance.get_backfill(no_runs_backfill.backfill_id)
             assert no_runs_backfill
             assert no_runs_backfill.backfill_end_timestamp == no_runs_backfill.backfill_timestamp
+
+
+def test_add_asset_partition_status_table():
+    src_dir = file_relative_path(__file__, "snapshot_1_9_3_add_run_tags_run_id_idx/sqlite")
+    asset_key = AssetKey("partitioned_asset")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "asset_partition_status" not in get_sqlite3_tables(db_path)
+            for partition in ["a", "b"]:
+                instance.report_runless_asset_event(
+                    AssetMaterialization(asset_key, partition=partition)
+                )
+            assert instance.get_materialized_partitions(asset_key) == {"a", "b"}
+
+            # the data migration is skipped until the table exists
+            instance.reindex()
+            assert isinstance(instance.event_log_storage, SqlEventLogStorage)
+            assert not instance.event_log_storage.can_read_asset_partition_status()
+
+            instance.upgrade()
+            assert "asset_partition_status" in get_sqlite3_tables(db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert isinstance(instance.event_log_storage, SqlEventLogStorage)
+            assert instance.event_log_storage.can_read_asset_partition_status()
+            assert instance.get_materialized_partitions(asset_key) == {"a", "b"}
+
+            instance.report_runless_asset_event(AssetMaterialization(asset_key, partition="c"))
+            assert instance.get_materialized_partitions(asset_key) == {"a", "b", "c"}
+
+
+def test_add_run_partition_status_table():
+    src_dir = file_relative_path(__file__, "snapshot_1_9_3_add_run_tags_run_id_idx/sqlite")
+
+    def _add_partition_run(instance, partition, status):
+        return instance.add_run(
+            DagsterRun(
+                job_name="foo_job",
+                run_id=make_new_run_id(),
+                status=status,
+                tags={
+                    PARTITION_NAME_TAG: partition,
+                    PARTITION_SET_TAG: "foo_set",
+                    REPOSITORY_LABEL_TAG: "foo_repo",
+                },
+            )
+        )
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "run_partition_status" not in get_sqlite3_tables(db_path)
+            run_storage = instance.run_storage
+            assert isinstance(run_storage, SqlRunStorage)
+
+            _add_partition_run(instance, "a", DagsterRunStatus.FAILURE)
+            a_retried = _add_partition_run(instance, "a", DagsterRunStatus.SUCCESS)
+            b = _add_partition_run(instance, "b", DagsterRunStatus.SUCCESS)
+            _add_partition_run(instance, "b", DagsterRunStatus.CANCELED)
+
+            assert not run_storage.can_read_run_partition_status()
+            assert {
+                data.partition: data.run_id
+                for data in run_storage.get_latest_run_partition_data("foo_set", "foo_repo")
+            } == {"a": a_retried.run_id, "b": b.run_id}
+
+            instance.upgrade()
+            assert "run_partition_status" in get_sqlite3_tables(db_path)
+
+            # the table is not read until the optional data migration has filled it in
+            assert not run_storage.has_built_index(RUN_PARTITION_STATUS)
+            assert not run_storage.can_read_run_partition_status()
+            assert {
+                data.partition: data.run_id
+                for data in run_storage.get_latest_run_partition_data("foo_set", "foo_repo")
+            } == {"a": a_retried.run_id, "b": b.run_id}
+
+            instance.reindex()
+            assert run_storage.has_built_index(RUN_PARTITION_STATUS)
+            assert run_storage.can_read_run_partition_status()
+
+            assert {
+                data.partition: data.run_id
+                for data in run_storage.get_latest_run_partition_data("foo_set", "foo_repo")
+            } == {"a": a_retried.run_id, "b": b.run_id}
+
+            c = _add_partition_run(instance, "c", DagsterRunStatus.STARTED)
+            assert {
+                data.partition: data.run_id
+                for data in run_storage.get_latest_run_partition_data(
+                    "foo_set", "foo_repo", ["a", "c"]
+                )
+            } == {"a": a_retried.run_id, "c": c.run_id}
@@ -1,4 +1,5 @@
 import dataclasses
+import json
 import re
 import string
 from collections import namedtuple
@@ -10,6 +11,7 @@
 import pydantic
 import pytest
 from dagster._check.functions import CheckError
+from dagster._core.test_utils import environ
 from dagster._model import DagsterModel
 from dagster._record import IHaveNew, record, record_custom
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
@@ -28,6 +30,7 @@
     pack_value,
     serialize_value,
     unpack_value,
+    use_compact_serdes_encoding,
 )
 from dagster._serdes.utils import hash_str
 from dagster._utils.cached_method import cached_method
@@ -1217,3 +1220,97 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_compact_encoding():
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+        BLUE = "BLUE"
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour"})
+    class Leaf(NamedTuple):
+        color: Color
+        tags: Mapping[str, str]
+
+    @_whitelist_for_serdes(test_env)
+    class Node(NamedTuple):
+        name: str
+        children: Sequence["Node"]
+        ids: AbstractSet[int]
+        names: frozenset
+        by_color: Mapping[Color, int]
+        leaves: Sequence[Leaf]
+
+    leaf = Leaf(Color.RED, {"a": "b"})
+    val = Node(
+        name="root",
+        leaves=[leaf, Leaf(Color.BLUE, {})],
+        children=[
+            Node(
+                name=f"child_{i}",
+                children=[],
+                ids={i, i + 1},
+                names=frozenset([str(i)]),
+                by_color={},
+                leaves=[],
+            )
+            for i in range(10)
+        ],
+        ids=set(),
+        names=frozenset(),
+        by_color=SerializableNonScalarKeyMapping({Color.RED: 1}),
+    )
+
+    serialized = serialize_value(val, whitelist_map=test_env)
+    compact_serialized = serialize_value(val, whitelist_map=test_env, compact=True)
+    assert len(compact_serialized) < len(serialized) * 0.6
+    # class and field names are only written once
+    assert serialized.count('"Node"') == 11
+    assert compact_serialized.count('"Node"') == 1
+    assert compact_serialized.count('"children"') == 1
+
+    # the encoding is detected when deserializing
+    assert deserialize_value(compact_serialized, whitelist_map=test_env) == val
+    assert deserialize_value(compact_serialized, Node, whitelist_map=test_env) == val
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+
+    for plain_val in [None, 1, "foo", [], [1, [2, {"a": [3]}]], {"a": None}, {1: 2}]:
+        assert deserialize_value(serialize_value(plain_val, compact=True)) == deserialize_value(
+            json.dumps(plain_val)
+        )
+
+
+def test_compact_encoding_unknown_class():
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_env)
+    class Fizz(NamedTuple):
+        buzz: int
+
+    compact_serialized = serialize_value({"a": [Fizz(1)]}, whitelist_map=test_env, compact=True)
+
+    with pytest.raises(
+        DeserializationError,
+        match='Attempted to deserialize class "Fizz" which is not in the whitelist',
+    ):
+        deserialize_value(compact_serialized, whitelist_map=WhitelistMap.create())
+
+    with pytest.raises(DeserializationError, match="compact encoding version 2"):
+        deserialize_value(
+            compact_serialized.replace('"__serdes_compact__",1', '"__serdes_compact__",2'),
+            whitelist_map=test_env,
+        )
+
+
+def test_use_compact_serdes_encoding():
+    with environ({"DAGSTER_SERDES_COMPACT_ENCODING": ""}):
+        assert not use_compact_serdes_encoding()
+
+    with environ({"DAGSTER_SERDES_COMPACT_ENCODING": "true"}):
+        assert use_compact_serdes_encoding()
+
+    with environ({"DAGSTER_SERDES_COMPACT_ENCODING": "0"}):
+        assert not use_compact_serdes_encoding()
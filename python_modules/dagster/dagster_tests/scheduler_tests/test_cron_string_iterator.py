@@ -1,11 +1,17 @@
 import calendar
 import datetime
+import itertools
+import zoneinfo
 
 import pytest
+import pytz
 from dagster._time import create_datetime, get_timezone
+from dagster._utils import schedules
 from dagster._utils.schedules import (
     _croniter_string_iterator,
+    _uncached_cron_string_iterator,
     cron_string_iterator,
+    get_cron_tick_table,
     is_valid_cron_string,
     reverse_cron_string_iterator,
 )
@@ -664,3 +670,142 @@ def test_invalid_cron_strings():
 
     assert is_valid_cron_string("0 0 31 1 *")
     assert not is_valid_cron_string("0 0 32 1 *")
+
+
+TICK_TABLE_CRON_STRINGS = [
+    "0 * * * *",
+    "*/15 * * * *",
+    "30 2 * * *",
+    "45 1 * * *",
+    "0 9 * * 1-5",
+    "0 3 * * 0",
+    "0 0 1 * *",
+    "0 2 29 2 *",
+]
+
+
+def _get_start_timestamps(execution_timezone: str) -> list[float]:
+    # the first and last UTC offset transitions in 2021-2024, where ticks are most likely to differ
+    try:
+        transition_times = getattr(pytz.timezone(execution_timezone), "_utc_transition_times", [])
+    except pytz.UnknownTimeZoneError:
+        transition_times = []
+    transition_timestamps = [
+        dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+        for dt in transition_times
+        if 2021 <= dt.year <= 2024
+    ]
+    if not transition_timestamps:
+        return [1672531200]
+    return [
+        transition_timestamps[0] - 2 * 60 * 60,
+        transition_timestamps[-1] - 3 * 24 * 60 * 60 + 1,
+    ]
+
+
+@pytest.mark.parametrize("execution_timezone", sorted(zoneinfo.available_timezones()))
+def test_cron_tick_table_matches_uncached_iterator(execution_timezone, monkeypatch):
+    # small chunks, so that iterating crosses chunk boundaries
+    monkeypatch.setattr(schedules, "CRON_TICK_TABLE_TICKS_PER_CHUNK", 16)
+
+    for cron_string in TICK_TABLE_CRON_STRINGS:
+        get_cron_tick_table.cache_clear()
+        start_timestamps = _get_start_timestamps(execution_timezone)
+        # a start timestamp that is exactly on a tick
+        start_timestamps.append(
+            next(
+                _uncached_cron_string_iterator(start_timestamps[0], cron_string, execution_timezone)
+            ).timestamp()
+        )
+
+        for start_timestamp in start_timestamps:
+            for ascending in [True, False]:
+                expected = [
+                    dt.timestamp()
+                    for dt in itertools.islice(
+                        _uncached_cron_string_iterator(
+                            start_timestamp, cron_string, execution_timezone, ascending
+                        ),
+                        25,
+                    )
+                ]
+                actual = [
+                    dt.timestamp()
+                    for dt in itertools.islice(
+                        cron_string_iterator(
+                            start_timestamp, cron_string, execution_timezone, ascending
+                        ),
+                        25,
+                    )
+                ]
+                assert actual == expected, (cron_string, start_timestamp, ascending)
+
+
+def test_cron_tick_table(monkeypatch):
+    monkeypatch.setattr(schedules, "CRON_TICK_TABLE_TICKS_PER_CHUNK", 16)
+    monkeypatch.setattr(schedules, "CRON_TICK_TABLE_MAX_CHUNKS", 4)
+    get_cron_tick_table.cache_clear()
+
+    tick_table = get_cron_tick_table("0 0 * * *", "America/New_York")
+    start = create_datetime(2023, 3, 1, tz="America/New_York")
+
+    assert tick_table.next_tick(start.timestamp()) == start.timestamp()
+    assert (
+        tick_table.next_tick(start.timestamp() + 1)
+        == create_datetime(2023, 3, 2, tz="America/New_York").timestamp()
+    )
+    assert (
+        tick_table.prev_tick(start.timestamp() - 1)
+        == create_datetime(2023, 2, 28, tz="America/New_York").timestamp()
+    )
+
+    end = create_datetime(2024, 3, 1, tz="America/New_York")
+    ticks = tick_table.ticks_between(start.timestamp(), end.timestamp())
+    assert len(ticks) == 366
+    assert list(ticks) == [
+        dt.timestamp()
+        for dt in itertools.takewhile(
+            lambda dt: dt < end,
+            _uncached_cron_string_iterator(start.timestamp(), "0 0 * * *", "America/New_York"),
+        )
+    ]
+
+    # only the most recently used chunks are kept
+    assert len(tick_table._chunks) <= 4  # noqa: SLF001
+
+
+def test_reverse_cron_string_iterator_reads_from_tick_table(monkeypatch):
+    monkeypatch.setattr(schedules, "CRON_TICK_TABLE_TICKS_PER_CHUNK", 16)
+    get_cron_tick_table.cache_clear()
+
+    end = create_datetime(2024, 3, 1, 12, tz="America/New_York")
+    expected = list(
+        itertools.islice(
+            _uncached_cron_string_iterator(
+                end.timestamp(), "0 * * * *", "America/New_York", ascending=False
+            ),
+            100,
+        )
+    )
+    assert (
+        list(
+            itertools.islice(
+                reverse_cron_string_iterator(end.timestamp(), "0 * * * *", "America/New_York"), 100
+            )
+        )
+        == expected
+    )
+
+    # once the chunks are cached, iterating backwards again doesn't compute any ticks
+    def _fail(*args, **kwargs):
+        raise Exception("ticks should be read from the tick table")
+
+    monkeypatch.setattr(schedules, "_uncached_cron_string_iterator", _fail)
+    assert (
+        list(
+            itertools.islice(
+                reverse_cron_string_iterator(end.timestamp(), "0 * * * *", "America/New_York"), 100
+            )
+        )
+        == expected
+    )
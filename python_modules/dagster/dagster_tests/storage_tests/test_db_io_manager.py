@@ -3,6 +3,10 @@
 import pytest
 from dagster import AssetKey, InputContext, OutputContext, asset, build_output_context
 from dagster._check import CheckError
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionKey,
+    MultiPartitionsDefinition,
+)
 from dagster._core.definitions.partition import StaticPartitionsDefinition
 from dagster._core.definitions.time_window_partitions import DailyPartitionsDefinition, TimeWindow
 from dagster._core.errors import DagsterInvariantViolationError
@@ -315,6 +319,144 @@ def test_asset_out_multiple_static_partitions():
     assert handler.handle_input_calls[0][1] == table_slice
 
 
+def test_asset_out_multi_partitioned_range():
+    handler = IntHandler()
+    connect_mock = MagicMock()
+    db_client = MagicMock(
+        spec=DbClient,
+        get_select_statement=MagicMock(return_value=""),
+        connect=connect_mock,
+        get_table_name=mock_table_name,
+        supports_partition_dimension_groups=True,
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "color": StaticPartitionsDefinition(["red", "yellow", "blue"]),
+            "date": DailyPartitionsDefinition(start_date="2020-01-01"),
+        }
+    )
+    partition_expr = {"color": "color_col", "date": "date_col"}
+    output_context = MagicMock(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        definition_metadata={"partition_expr": partition_expr},
+        asset_partitions_def=partitions_def,
+    )
+
+    def _load_table_slice(partition_keys):
+        input_context = MagicMock(
+            asset_key=asset_key,
+            upstream_output=output_context,
+            resource_config=resource_config,
+            dagster_type=resolve_dagster_type(int),
+            asset_partition_keys=partition_keys,
+            definition_metadata=None,
+            asset_partitions_def=partitions_def,
+        )
+        assert manager.load_input(input_context) == 7
+        return handler.handle_input_calls[-1][1]
+
+    def _time_window(start_day, end_day):
+        return TimeWindow(create_datetime(2020, 1, start_day), create_datetime(2020, 1, end_day))
+
+    # a range of dates across a set of colors is a single product
+    table_slice = _load_table_slice(
+        [
+            MultiPartitionKey({"color": color, "date": date})
+            for color in ["red", "blue"]
+            for date in ["2020-01-02", "2020-01-03", "2020-01-04"]
+        ]
+    )
+    assert table_slice.partition_dimensions == [
+        TablePartitionDimension(partition_expr="color_col", partitions=["blue", "red"]),
+        TablePartitionDimension(partition_expr="date_col", partitions=_time_window(2, 5)),
+    ]
+    assert table_slice.partition_dimension_groups is None
+
+    # other key sets are split into products, bounded by partition_dimensions
+    table_slice = _load_table_slice(
+        [
+            "red|2020-01-01",
+            "red|2020-01-02",
+            "red|2020-01-05",
+            "yellow|2020-01-01",
+            "yellow|2020-01-02",
+        ]
+    )
+    assert table_slice.partition_dimensions == [
+        TablePartitionDimension(partition_expr="color_col", partitions=["red", "yellow"]),
+        TablePartitionDimension(partition_expr="date_col", partitions=_time_window(1, 6)),
+    ]
+    assert table_slice.partition_dimension_groups == [
+        [
+            TablePartitionDimension(partition_expr="color_col", partitions=["red"]),
+            TablePartitionDimension(partition_expr="date_col", partitions=_time_window(1, 3)),
+        ],
+        [
+            TablePartitionDimension(partition_expr="color_col", partitions=["red"]),
+            TablePartitionDimension(partition_expr="date_col", partitions=_time_window(5, 6)),
+        ],
+        [
+            TablePartitionDimension(partition_expr="color_col", partitions=["yellow"]),
+            TablePartitionDimension(partition_expr="date_col", partitions=_time_window(1, 3)),
+        ],
+    ]
+
+
+def test_asset_out_multi_partitioned_range_without_partition_dimension_groups():
+    handler = IntHandler()
+    db_client = MagicMock(
+        spec=DbClient,
+        get_select_statement=MagicMock(return_value=""),
+        connect=MagicMock(),
+        get_table_name=mock_table_name,
+        supports_partition_dimension_groups=False,
+    )
+    manager = build_db_io_manager(type_handlers=[handler], db_client=db_client)
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "color": StaticPartitionsDefinition(["red", "yellow", "blue"]),
+            "date": DailyPartitionsDefinition(start_date="2020-01-01"),
+        }
+    )
+    output_context = MagicMock(
+        asset_key=asset_key,
+        resource_config=resource_config,
+        definition_metadata={"partition_expr": {"color": "color_col", "date": "date_col"}},
+        asset_partitions_def=partitions_def,
+    )
+
+    def _input_context(partition_keys):
+        return MagicMock(
+            asset_key=asset_key,
+            upstream_output=output_context,
+            resource_config=resource_config,
+            dagster_type=resolve_dagster_type(int),
+            asset_partition_keys=partition_keys,
+            definition_metadata=None,
+            asset_partitions_def=partitions_def,
+        )
+
+    # a single product is selected exactly by partition_dimensions
+    assert manager.load_input(_input_context(["red|2020-01-01", "blue|2020-01-01"])) == 7
+    table_slice = handler.handle_input_calls[-1][1]
+    assert table_slice.partition_dimensions == [
+        TablePartitionDimension(partition_expr="color_col", partitions=["blue", "red"]),
+        TablePartitionDimension(
+            partition_expr="date_col",
+            partitions=TimeWindow(create_datetime(2020, 1, 1), create_datetime(2020, 1, 2)),
+        ),
+    ]
+    assert table_slice.partition_dimension_groups is None
+
+    # other key sets can't be selected without the groups
+    with pytest.raises(ValueError, match="not the cartesian product"):
+        manager.load_input(_input_context(["red|2020-01-01", "yellow|2020-01-02"]))
+
+
 def test_different_output_and_input_types():
     int_handler = IntHandler()
     str_handler = StringHandler()
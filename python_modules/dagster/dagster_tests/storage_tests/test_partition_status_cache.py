@@ -1,5 +1,18 @@
+from unittest import mock
+
 import pytest
+from dagster import (
+    StaticPartitionsDefinition,
+    _check as check,
+    asset,
+    materialize,
+)
+from dagster._core.storage.partition_status_cache import (
+    asset_status_cache_needs_update,
+    get_and_update_asset_status_cache_value,
+)
 from dagster._core.test_utils import instance_for_test
+from dagster._utils import Counter, traced_counter
 
 from dagster_tests.storage_tests.utils.partition_status_cache import TestPartitionStatusCache
 
@@ -9,3 +22,172 @@ class TestSqlPartitionStatusCache(TestPartitionStatusCache):
     def instance(self):
         with instance_for_test() as the_instance:
             yield the_instance
+
+
+class TestSqlPartitionStatusCacheUpdateOnWrite(TestPartitionStatusCache):
+    @pytest.fixture
+    def instance(self):
+        with instance_for_test(
+            overrides={"asset_status_cache": {"update_on_write": True}}
+        ) as the_instance:
+            yield the_instance
+
+
+def test_update_cached_status_on_write():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    with instance_for_test(overrides={"asset_status_cache": {"update_on_write": True}}) as instance:
+        # the cache value is built on the first read
+        materialize([asset1], instance=instance, partition_key="a")
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset1.key, partitions_def
+        )
+        assert cached_status
+        assert cached_status.pending_materialized_partition_keys is None
+
+        # subsequent materializations are recorded in the cache value as they are written
+        materialize([asset1], instance=instance, partition_key="b")
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        stored_status = check.not_none(asset_entry.cached_status)
+        assert stored_status.pending_materialized_partition_keys == ["b"]
+        assert stored_status.latest_storage_id == asset_entry.last_materialization_storage_id
+        assert asset_status_cache_needs_update(asset_entry, partitions_def, instance)
+
+        # ...so reading it does not need to query the event log for new materializations
+        traced_counter.set(Counter())
+        cached_status = check.not_none(
+            get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+        )
+        counts = traced_counter.get().counts()  # pyright: ignore[reportOptionalMemberAccess]
+        assert not counts.get("DagsterInstance.get_materialized_partitions")
+        assert cached_status.pending_materialized_partition_keys is None
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"a", "b"}
+
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        assert not asset_status_cache_needs_update(asset_entry, partitions_def, instance)
+
+
+def test_update_cached_status_on_write_already_materialized():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    with instance_for_test(overrides={"asset_status_cache": {"update_on_write": True}}) as instance:
+        materialize([asset1], instance=instance, partition_key="a")
+        get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+
+        # partition a is already in the materialized subset, so it isn't added to the pending keys
+        materialize([asset1], instance=instance, partition_key="a")
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        stored_status = check.not_none(asset_entry.cached_status)
+        assert not stored_status.pending_materialized_partition_keys
+        assert stored_status.latest_storage_id == asset_entry.last_materialization_storage_id
+
+        materialize([asset1], instance=instance, partition_key="b")
+        materialize([asset1], instance=instance, partition_key="b")
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        stored_status = check.not_none(asset_entry.cached_status)
+        assert stored_status.pending_materialized_partition_keys == ["b"]
+        assert stored_status.latest_storage_id == asset_entry.last_materialization_storage_id
+
+
+def test_update_cached_status_on_write_disabled():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    with instance_for_test() as instance:
+        materialize([asset1], instance=instance, partition_key="a")
+        get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+
+        # without opting in, storing events doesn't read the cached status
+        with mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.SqlEventLogStorage.has_cached_status_data_col",
+            new_callable=mock.PropertyMock,
+        ) as has_cached_status_data_col:
+            materialize([asset1], instance=instance, partition_key="b")
+        assert not has_cached_status_data_col.called
+
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        assert not check.not_none(asset_entry.cached_status).pending_materialized_partition_keys
+
+
+def test_update_cached_status_on_write_max_pending_keys():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    with instance_for_test(overrides={"asset_status_cache": {"update_on_write": True}}) as instance:
+        materialize([asset1], instance=instance, partition_key="a")
+        get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+
+        with mock.patch(
+            "dagster._core.storage.partition_status_cache.MAX_PENDING_MATERIALIZED_PARTITION_KEYS",
+            1,
+        ):
+            materialize([asset1], instance=instance, partition_key="b")
+            materialize([asset1], instance=instance, partition_key="c")
+
+        # once the cache value is full, new materializations are fetched from the event log on read
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        stored_status = check.not_none(asset_entry.cached_status)
+        assert stored_status.pending_materialized_partition_keys == ["b"]
+        assert stored_status.latest_storage_id < check.not_none(
+            asset_entry.last_materialization_storage_id
+        )
+
+        cached_status = check.not_none(
+            get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"a", "b", "c"}
+
+
+def test_update_cached_status_on_write_dropped_update():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    with instance_for_test(overrides={"asset_status_cache": {"update_on_write": True}}) as instance:
+        materialize([asset1], instance=instance, partition_key="a")
+        get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+
+        # the writer of partition b fails to update the cache value after storing its events...
+        with mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.SqlEventLogStorage.update_asset_cached_status_data_for_event"
+        ):
+            materialize([asset1], instance=instance, partition_key="b")
+        b_storage_id = check.not_none(
+            next(
+                iter(instance.get_asset_records([asset1.key]))
+            ).asset_entry.last_materialization_storage_id
+        )
+
+        # ...so the next writer does not advance the cache value past the materialization of b
+        materialize([asset1], instance=instance, partition_key="c")
+        asset_entry = next(iter(instance.get_asset_records([asset1.key]))).asset_entry
+        stored_status = check.not_none(asset_entry.cached_status)
+        assert stored_status.pending_materialized_partition_keys == ["c"]
+        assert stored_status.latest_storage_id < b_storage_id
+
+        cached_status = check.not_none(
+            get_and_update_asset_status_cache_value(instance, asset1.key, partitions_def)
+        )
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"a", "b", "c"}
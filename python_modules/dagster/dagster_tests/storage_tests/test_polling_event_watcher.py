@@ -1,13 +1,19 @@
 import tempfile
+import threading
 import time
 from collections.abc import Mapping
 from contextlib import contextmanager
 from typing import Any, Callable, Optional
+from unittest import mock
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
@@ -147,3 +153,168 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_many_runs_with_one_query_per_poll():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        # not run sharded, so the new events of all watched runs can be fetched at once
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        run_ids = [make_new_run_id() for _ in range(5)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _make_callback(run_id):
+            return lambda event, _cursor: watched[run_id].append(event)
+
+        callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+
+        storage.store_event(create_event(1, run_ids[0]))
+
+        with mock.patch.object(
+            storage, "get_records_for_run", wraps=storage.get_records_for_run
+        ) as get_records_for_run:
+            for run_id in run_ids:
+                watcher.watch_run(run_id, None, callbacks[run_id])
+            assert all(watcher.has_run_id(run_id) for run_id in run_ids)
+            assert (
+                len(
+                    [thread for thread in threading.enumerate() if thread.name == "sql-event-watch"]
+                )
+                == 1
+            )
+
+            for i, run_id in enumerate(run_ids):
+                storage.store_event(create_event(i + 2, run_id))
+
+            attempts = 20
+            while sum(len(events) for events in watched.values()) < 6 and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert get_records_for_run.call_count == 0
+
+        assert [int(event.message) for event in watched[run_ids[0]]] == [1, 2]
+        for i, run_id in enumerate(run_ids[1:]):
+            assert [int(event.message) for event in watched[run_id]] == [i + 3]
+
+        watcher.unwatch_run(run_ids[0], callbacks[run_ids[0]])
+        assert not watcher.has_run_id(run_ids[0])
+
+        storage.store_event(create_event(7, run_ids[0]))
+        storage.store_event(create_event(8, run_ids[1]))
+
+        attempts = 20
+        while len(watched[run_ids[1]]) < 2 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(event.message) for event in watched[run_ids[0]]] == [1, 2]
+        assert [int(event.message) for event in watched[run_ids[1]]] == [3, 8]
+
+        watcher.close()
+        storage.dispose()
+
+
+def test_watcher_survives_poll_errors():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        run_id = make_new_run_id()
+        watched = []
+
+        with mock.patch.object(
+            storage,
+            "get_records_for_runs_after_storage_id",
+            side_effect=_raise_once(storage.get_records_for_runs_after_storage_id),
+        ) as get_records_for_runs:
+            watcher.watch_run(run_id, None, lambda event, _cursor: watched.append(event))
+            storage.store_event(create_event(1, run_id))
+
+            attempts = 20
+            while not watched and attempts > 0:
+                watcher.notify_new_events(run_id)
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert get_records_for_runs.call_count > 1
+
+        assert [int(event.message) for event in watched] == [1]
+
+        watcher.close()
+        storage.dispose()
+
+
+def _raise_once(fn):
+    calls = []
+
+    def _fn(*args, **kwargs):
+        calls.append(None)
+        if len(calls) == 1:
+            raise Exception("transient error")
+        return fn(*args, **kwargs)
+
+    return _fn
+
+
+def test_watcher_replaces_dead_thread():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        run_ids = [make_new_run_id() for _ in range(2)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        watcher.watch_run(
+            run_ids[0], None, lambda event, _cursor: watched[run_ids[0]].append(event)
+        )
+
+        # stop the thread as if it had died
+        dead_thread = watcher._watcher_thread  # noqa: SLF001
+        assert dead_thread
+        dead_thread.should_thread_exit.set()
+        dead_thread.wake()
+        dead_thread.join()
+
+        watcher.watch_run(
+            run_ids[1], None, lambda event, _cursor: watched[run_ids[1]].append(event)
+        )
+        assert watcher._watcher_thread is not dead_thread  # noqa: SLF001
+        assert all(watcher.has_run_id(run_id) for run_id in run_ids)
+
+        for i, run_id in enumerate(run_ids):
+            storage.store_event(create_event(i + 1, run_id))
+
+        attempts = 20
+        while not all(watched.values()) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(event.message) for event in watched[run_ids[0]]] == [1]
+        assert [int(event.message) for event in watched[run_ids[1]]] == [2]
+
+        watcher.close()
+        storage.dispose()
+
+
+def test_watcher_set_max_poll_period():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage, max_poll_period=60)
+        run_id = make_new_run_id()
+        watched = []
+
+        watcher.watch_run(run_id, None, lambda event, _cursor: watched.append(event))
+        # let the first polls find nothing, so that the thread backs off
+        time.sleep(2)
+        storage.store_event(create_event(1, run_id))
+
+        # a shorter period applies to the current wait, without a notification
+        watcher.set_max_poll_period(0.1)
+        attempts = 10
+        while not watched and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(event.message) for event in watched] == [1]
+
+        watcher.close()
+        storage.dispose()
@@ -1,6 +1,8 @@
 import inspect
 import json
 import pickle
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional, cast
@@ -24,6 +26,7 @@
     MultiPartitionsDefinition,
     OpExecutionContext,
     OutputContext,
+    PartitionKeyRange,
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     asset,
@@ -463,6 +466,83 @@ def my_asset() -> Any:
     assert handled_output_data.metadata["length"] == MetadataValue.int(get_length(json_data))
 
 
+class ConcurrencyTrackingIOManager(DummyIOManager):
+    """Records how many `load_from_path` calls are running at the same time."""
+
+    max_concurrent_partition_loads = 4
+
+    def __init__(self, base_path: UPath):
+        super().__init__(base_path=base_path)
+        self._lock = threading.Lock()
+        self.num_loaded = 0
+        self.num_active = 0
+        self.max_active = 0
+
+    def load_from_path(self, context: InputContext, path: UPath) -> str:
+        with self._lock:
+            self.num_active += 1
+            self.max_active = max(self.max_active, self.num_active)
+        time.sleep(0.01)
+        with self._lock:
+            self.num_active -= 1
+            self.num_loaded += 1
+        return super().load_from_path(context, path)
+
+
+def test_upath_io_manager_concurrent_partition_loads(
+    tmp_path: Path,
+    daily: DailyPartitionsDefinition,
+    hourly: HourlyPartitionsDefinition,
+    start: datetime,
+):
+    my_io_manager = ConcurrencyTrackingIOManager(UPath(tmp_path))
+
+    @asset(partitions_def=hourly)
+    def upstream_asset(context: AssetExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(partitions_def=daily)
+    def downstream_asset(upstream_asset: dict[str, str]) -> dict[str, str]:
+        return upstream_asset
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        partition_key=start.strftime(daily.fmt),
+        resources={"io_manager": my_io_manager},
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert list(downstream_asset_data.keys()) == hourly.get_partition_keys_in_range(
+        PartitionKeyRange(f"{start:%Y-%m-%d}-00:00", f"{start:%Y-%m-%d}-23:00")
+    )
+    assert my_io_manager.num_loaded == 24
+    assert 1 < my_io_manager.max_active <= 4
+
+
+def test_upath_io_manager_iter_partitions(
+    tmp_path: Path, hourly: HourlyPartitionsDefinition, start: datetime
+):
+    my_io_manager = ConcurrencyTrackingIOManager(UPath(tmp_path))
+    partition_key_range = PartitionKeyRange(f"{start:%Y-%m-%d}-00:00", f"{start:%Y-%m-%d}-23:00")
+    context = build_input_context(
+        asset_key="upstream_asset",
+        asset_partitions_def=hourly,
+        asset_partition_key_range=partition_key_range,
+        definition_metadata={"max_concurrent_partition_loads": 2},
+    )
+
+    partitions = my_io_manager.iter_partitions(context)
+    first_partition_key, _ = next(partitions)
+    assert first_partition_key == partition_key_range.start
+    # only a bounded number of partitions is loaded ahead of the consumer
+    assert my_io_manager.num_loaded <= 3
+    assert my_io_manager.max_active <= 2
+
+    assert [partition_key for partition_key, _ in partitions] == (
+        hourly.get_partition_keys_in_range(partition_key_range)[1:]
+    )
+    assert my_io_manager.num_loaded == 24
+
+
 class AsyncJSONIOManager(ConfigurableIOManager, UPathIOManager):
     base_dir: str = PydanticField(None, description="Base directory for storing files.")  # type: ignore
 
@@ -1325,6 +1325,46 @@ def foo():
         result = storage.fetch_materializations(foo.key, limit=100)
         assert len(result.records) == 2
 
+    def test_store_event_batch_mixed_events(self, storage, test_run_id):
+        asset_key = AssetKey(["batched_asset"])
+        other_asset_key = AssetKey(["other_batched_asset"])
+
+        @op
+        def materialize(context):
+            context.log.info("before materializations")
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 1}, partition="a")
+            yield AssetObservation(asset_key=asset_key, metadata={"count": 2})
+            yield AssetMaterialization(asset_key=other_asset_key, metadata={"count": 3})
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 4}, partition="b")
+            context.log.info("after materializations")
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        with instance_for_test() as test_instance:
+            events, _ = _synthesize_events(_ops, instance=test_instance, run_id=test_run_id)
+
+        storage.store_event_batch(events)
+
+        stored_events = storage.get_logs_for_run(test_run_id)
+        assert [event.message for event in stored_events] == [event.message for event in events]
+
+        asset_records = {
+            record.asset_entry.asset_key: record
+            for record in storage.get_asset_records([asset_key, other_asset_key])
+        }
+        last_materialization = asset_records[asset_key].asset_entry.last_materialization
+        assert last_materialization
+        assert last_materialization.asset_materialization.metadata["count"].value == 4  # pyright: ignore[reportOptionalMemberAccess]
+        other_last_materialization = asset_records[other_asset_key].asset_entry.last_materialization
+        assert other_last_materialization
+        assert other_last_materialization.asset_materialization.metadata["count"].value == 3  # pyright: ignore[reportOptionalMemberAccess]
+
+        result = storage.fetch_materializations(asset_key, limit=100)
+        assert [record.partition_key for record in result.records] == ["b", "a"]
+        assert len(storage.fetch_observations(asset_key, limit=100).records) == 1
+
     def test_asset_materialization_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -2823,6 +2863,207 @@ def _store_partition_event(asset_key, partition) -> int:
             latest_storage_ids["p1"] = _store_partition_event(a, "p1")
             _assert_storage_matches(latest_storage_ids)
 
+    def test_get_partitions_for_multiple_assets(self, storage, instance):
+        a = AssetKey("multi_asset_a")
+        b = AssetKey("multi_asset_b")
+        c = AssetKey("multi_asset_no_partitions")
+        d = AssetKey("multi_asset_no_materializations")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(b, partition="x")
+            yield AssetMaterialization(c)
+            yield AssetObservation(d, partition="x")
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(b, partition="z")
+            yield Output(None)
+
+        asset_keys = [a, b, c, d]
+        cursor_run1 = _store_materialization_events(
+            storage, materialize, instance, make_new_run_id()
+        )
+        _store_materialization_events(storage, materialize_two, instance, make_new_run_id())
+
+        def _assert_matches_single_asset_queries():
+            _assert_bulk_queries_match()
+            if isinstance(storage, SqlEventLogStorage):
+                # also check the queries that aggregate over the event log
+                with mock.patch.object(
+                    storage, "can_read_asset_partition_status", return_value=False
+                ):
+                    _assert_bulk_queries_match()
+
+        def _assert_bulk_queries_match():
+            assert storage.get_materialized_partitions_by_asset(asset_keys) == {
+                asset_key: storage.get_materialized_partitions(asset_key)
+                for asset_key in asset_keys
+            }
+            assert storage.get_materialized_partitions_by_asset(
+                asset_keys, after_cursor=cursor_run1
+            ) == {
+                asset_key: storage.get_materialized_partitions(asset_key, after_cursor=cursor_run1)
+                for asset_key in asset_keys
+            }
+            for event_type in [
+                DagsterEventType.ASSET_MATERIALIZATION,
+                DagsterEventType.ASSET_OBSERVATION,
+            ]:
+                assert storage.get_latest_storage_id_by_partition_for_assets(
+                    asset_keys, event_type
+                ) == {
+                    asset_key: storage.get_latest_storage_id_by_partition(asset_key, event_type)
+                    for asset_key in asset_keys
+                }
+            for after_cursor, limit in [(0, 100), (cursor_run1, 100), (0, 2)]:
+                assert [
+                    record.storage_id
+                    for record in storage.get_materialization_records_for_assets(
+                        asset_keys, after_cursor, sys.maxsize, limit
+                    )
+                ] == [
+                    record.storage_id
+                    for record in EventLogStorage.get_materialization_records_for_assets(
+                        storage, asset_keys, after_cursor, sys.maxsize, limit
+                    )
+                ]
+
+        assert storage.get_materialized_partitions_by_asset(asset_keys) == {
+            a: {"x", "y"},
+            b: {"x", "z"},
+            c: set(),
+            d: set(),
+        }
+        assert storage.get_materialized_partitions_by_asset(
+            asset_keys, after_cursor=cursor_run1
+        ) == {a: {"y"}, b: {"z"}, c: set(), d: set()}
+        _assert_matches_single_asset_queries()
+
+        storage_ids_after_cursor = storage.get_latest_storage_id_by_partition_for_assets(
+            asset_keys, DagsterEventType.ASSET_MATERIALIZATION, after_cursor=cursor_run1
+        )
+        assert {
+            asset_key: set(storage_id_by_partition)
+            for asset_key, storage_id_by_partition in storage_ids_after_cursor.items()
+        } == {a: {"y"}, b: {"z"}, c: set(), d: set()}
+        assert all(
+            storage_id > cursor_run1
+            for storage_id_by_partition in storage_ids_after_cursor.values()
+            for storage_id in storage_id_by_partition.values()
+        )
+
+        assert {
+            (record.asset_key, record.partition_key)
+            for record in storage.get_materialization_records_for_assets(
+                asset_keys, cursor_run1, sys.maxsize, 100
+            )
+        } == {(a, "y"), (b, "z")}
+
+        storage.wipe_asset(a)
+        assert storage.get_materialized_partitions_by_asset([a, b])[a] == set()
+        assert {
+            record.asset_key
+            for record in storage.get_materialization_records_for_assets(
+                [a, b], 0, sys.maxsize, 100
+            )
+        } == {b}
+        _assert_matches_single_asset_queries()
+
+    def test_asset_partition_status_table_long_partition_keys(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+        if not storage.can_read_asset_partition_status():
+            pytest.skip("This test requires the asset partition status table")
+
+        asset_key = AssetKey("partition_status_long_keys_asset")
+        # keys that only differ after a prefix longer than MySQL can index
+        partitions = ["x" * 300 + "a", "x" * 300 + "b"]
+
+        @op
+        def materialize():
+            for partition in partitions:
+                yield AssetMaterialization(asset_key, partition=partition)
+            yield Output(None)
+
+        _store_materialization_events(storage, materialize, instance, make_new_run_id())
+        assert storage.get_materialized_partitions(asset_key) == set(partitions)
+        assert set(
+            storage.get_latest_storage_id_by_partition(
+                asset_key, DagsterEventType.ASSET_MATERIALIZATION
+            ).keys()
+        ) == set(partitions)
+
+    def test_asset_partition_status_table(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+        if not storage.can_read_asset_partition_status():
+            pytest.skip("This test requires the asset partition status table")
+
+        asset_key = AssetKey("partition_status_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(asset_key, partition="a")
+            yield AssetMaterialization(asset_key, partition="b")
+            yield AssetObservation(asset_key, partition="a")
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(asset_key, partition="a")
+            yield Output(None)
+
+        run_id_1 = make_new_run_id()
+        run_id_2 = make_new_run_id()
+
+        _store_materialization_events(storage, materialize, instance, run_id_1)
+        run_1_storage_ids = storage.get_latest_storage_id_by_partition(
+            asset_key, DagsterEventType.ASSET_MATERIALIZATION
+        )
+        assert set(run_1_storage_ids.keys()) == {"a", "b"}
+        assert set(
+            storage.get_latest_storage_id_by_partition(
+                asset_key, DagsterEventType.ASSET_OBSERVATION
+            ).keys()
+        ) == {"a"}
+
+        _store_materialization_events(storage, materialize_two, instance, run_id_2)
+        latest_storage_ids = storage.get_latest_storage_id_by_partition(
+            asset_key, DagsterEventType.ASSET_MATERIALIZATION
+        )
+        assert latest_storage_ids["a"] > run_1_storage_ids["a"]
+        assert latest_storage_ids["b"] == run_1_storage_ids["b"]
+        assert storage.get_materialized_partitions(
+            asset_key, after_cursor=run_1_storage_ids["b"]
+        ) == {"a"}
+
+        # rebuilding the table from the event log does not change the results
+        storage.rebuild_asset_partition_status(asset_key)
+        assert (
+            storage.get_latest_storage_id_by_partition(
+                asset_key, DagsterEventType.ASSET_MATERIALIZATION
+            )
+            == latest_storage_ids
+        )
+
+        # deleting the events of a run falls back to the latest remaining events
+        storage.delete_events(run_id_2)
+        assert (
+            storage.get_latest_storage_id_by_partition(
+                asset_key, DagsterEventType.ASSET_MATERIALIZATION
+            )
+            == run_1_storage_ids
+        )
+        assert storage.get_materialized_partitions(asset_key) == {"a", "b"}
+
+        storage.wipe_asset(asset_key)
+        assert storage.get_materialized_partitions(asset_key) == set()
+
     @pytest.mark.parametrize(
         "dagster_event_type",
         [DagsterEventType.ASSET_OBSERVATION, DagsterEventType.ASSET_MATERIALIZATION],
@@ -4800,6 +5041,7 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                pending_materialized_partition_keys=["quux"],
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
@@ -1330,6 +1330,115 @@ def test_partition_status(self, storage: RunStorage):
         assert {_.partition for _ in partition_data} == {"one", "two", "three"}
         assert {_.run_id for _ in partition_data} == {one.run_id, two_retried.run_id, three.run_id}
 
+    def test_latest_run_partition_data(self, storage: RunStorage):
+        def _add_partition_run(partition, status, repository_label="foo_repo"):
+            run = TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                job_name="foo_job",
+                status=status,
+                tags={
+                    PARTITION_NAME_TAG: partition,
+                    PARTITION_SET_TAG: "foo_set",
+                    REPOSITORY_LABEL_TAG: repository_label,
+                },
+            )
+            storage.add_run(run)
+            return run
+
+        def _latest_run_ids(partition_names=None):
+            return {
+                data.partition: data.run_id
+                for data in storage.get_latest_run_partition_data(
+                    "foo_set", "foo_repo", partition_names
+                )
+            }
+
+        one = _add_partition_run("one", DagsterRunStatus.FAILURE)
+        two = _add_partition_run("two", DagsterRunStatus.FAILURE)
+        two_retried = _add_partition_run("two", DagsterRunStatus.SUCCESS)
+        _add_partition_run("three", DagsterRunStatus.CANCELED)
+        _add_partition_run("one", DagsterRunStatus.SUCCESS, repository_label="bar_repo")
+
+        assert _latest_run_ids() == {"one": one.run_id, "two": two_retried.run_id}
+        assert _latest_run_ids(["two", "three"]) == {"two": two_retried.run_id}
+
+        # canceling the latest run of a partition falls back to the previous run
+        storage.handle_run_event(
+            two_retried.run_id,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_CANCELED.value,
+                job_name="foo_job",
+            ),
+        )
+        [two_data] = storage.get_latest_run_partition_data("foo_set", "foo_repo", ["two"])
+        assert two_data.run_id == two.run_id
+        assert two_data.status == DagsterRunStatus.FAILURE
+
+        storage.handle_run_event(
+            one.run_id,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_START.value,
+                job_name="foo_job",
+            ),
+        )
+        [one_data] = storage.get_latest_run_partition_data("foo_set", "foo_repo", ["one"])
+        assert one_data.status == DagsterRunStatus.STARTED
+
+        if self.can_delete_runs():
+            storage.delete_run(two.run_id)
+            assert _latest_run_ids() == {"one": one.run_id}
+
+    def test_run_partition_status_stale_write(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage) or not storage.can_read_run_partition_status():
+            pytest.skip("storage does not read from a run partition status table")
+
+        def _add_partition_run(status):
+            run = TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                job_name="foo_job",
+                status=status,
+                tags={
+                    PARTITION_NAME_TAG: "one",
+                    PARTITION_SET_TAG: "foo_set",
+                    REPOSITORY_LABEL_TAG: "foo_repo",
+                },
+            )
+            storage.add_run(run)
+            return run
+
+        one = _add_partition_run(DagsterRunStatus.FAILURE)
+        one_retried = _add_partition_run(DagsterRunStatus.SUCCESS)
+
+        def _write_run_partition_status(run, update_timestamp):
+            with storage.connect() as conn:
+                storage._write_run_partition_status(  # noqa: SLF001
+                    conn,
+                    repository_label="foo_repo",
+                    partition_set="foo_set",
+                    partition="one",
+                    values={
+                        "run_id": run.run_id,
+                        "status": run.status.value,
+                        "start_time": None,
+                        "end_time": None,
+                    },
+                    update_timestamp=update_timestamp,
+                )
+
+        def _latest_run_id():
+            [data] = storage.get_latest_run_partition_data("foo_set", "foo_repo", ["one"])
+            return data.run_id
+
+        # a recomputation that read the runs before the latest run was added is not applied
+        _write_run_partition_status(one, datetime(2000, 1, 1))
+        assert _latest_run_id() == one_retried.run_id
+
+        # ...but a recomputation from a more recent state of the runs is
+        _write_run_partition_status(one, datetime(2100, 1, 1))
+        assert _latest_run_id() == one.run_id
+
     def _skip_in_memory(self, storage):
         from dagster._core.storage.runs import InMemoryRunStorage
 
@@ -64,6 +64,13 @@ def handle_output(
         partition_filters = None
         partition_columns = None
 
+        if table_slice.partition_dimension_groups:
+            raise ValueError(
+                "Writing a set of multi-dimensional partitions that is not the product of its"
+                " dimensions' partitions is not supported yet. Write each partition in its own"
+                " run."
+            )
+
         if table_slice.partition_dimensions is not None:
             partition_filters = partition_dimensions_to_dnf(
                 partition_dimensions=table_slice.partition_dimensions,
@@ -235,7 +242,20 @@ def _table_reader(table_slice: TableSlice, connection: TableConnection) -> ds.Da
     table = DeltaTable(table_uri=connection.table_uri, storage_options=connection.storage_options)
 
     partition_expr = None
-    if table_slice.partition_dimensions is not None:
+    if table_slice.partition_dimension_groups:
+        # each group is a conjunction of partition filters, and the slice is their disjunction
+        partition_filters_by_group = [
+            partition_dimensions_to_dnf(partition_dimensions=group, table_schema=table.schema())
+            for group in table_slice.partition_dimension_groups
+        ]
+        partition_expr = _filters_to_expression(
+            [
+                partition_filters
+                for partition_filters in partition_filters_by_group
+                if partition_filters
+            ]
+        )
+    elif table_slice.partition_dimensions is not None:
         partition_filters = partition_dimensions_to_dnf(
             partition_dimensions=table_slice.partition_dimensions,
             table_schema=table.schema(),
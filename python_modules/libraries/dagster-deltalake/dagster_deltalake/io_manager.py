@@ -176,6 +176,8 @@ def create_io_manager(self, context) -> DbIOManager:
 
 
 class DeltaLakeDbClient(DbClient):
+    supports_partition_dimension_groups = True
+
     @staticmethod
     def delete_table_slice(
         context: OutputContext, table_slice: TableSlice, connection: TableConnection
@@ -200,7 +202,9 @@ def get_select_statement(table_slice: TableSlice) -> str:
 
         if table_slice.partition_dimensions and len(table_slice.partition_dimensions) > 0:
             query = f"SELECT {col_str} FROM {table_slice.schema}.{table_slice.table} WHERE\n"
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+            return query + _partition_where_clause(
+                table_slice.partition_dimensions, table_slice.partition_dimension_groups
+            )
         else:
             return f"""SELECT {col_str} FROM {table_slice.schema}.{table_slice.table}"""
 
@@ -243,7 +247,13 @@ def connect(context, table_slice: TableSlice) -> Iterator[TableConnection]:
 
 def _partition_where_clause(
     partition_dimensions: Sequence[TablePartitionDimension],
+    partition_dimension_groups: Optional[Sequence[Sequence[TablePartitionDimension]]] = None,
 ) -> str:
+    if partition_dimension_groups:
+        # each group selects a product of partitions, so the slice is the union of the groups
+        return " OR\n".join(
+            f"({_partition_where_clause(group)})" for group in partition_dimension_groups
+        )
     return " AND\n".join(
         (
             _time_window_where_clause(partition_dimension)
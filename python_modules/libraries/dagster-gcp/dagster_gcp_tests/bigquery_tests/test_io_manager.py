@@ -128,6 +128,49 @@ def test_get_cleanup_statement():
     )
 
 
+def test_get_cleanup_statement_multi_partition_groups():
+    groups = [
+        [
+            TablePartitionDimension(partition_expr="my_fruit_col", partitions=["apple"]),
+            TablePartitionDimension(
+                partitions=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 4)),
+                partition_expr="my_timestamp_col",
+            ),
+        ],
+        [
+            TablePartitionDimension(partition_expr="my_fruit_col", partitions=["banana"]),
+            TablePartitionDimension(
+                partitions=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 3)),
+                partition_expr="my_timestamp_col",
+            ),
+        ],
+    ]
+    assert (
+        _get_cleanup_statement(
+            TableSlice(
+                database="db",
+                schema="schema1",
+                table="table1",
+                partition_dimensions=[
+                    TablePartitionDimension(
+                        partition_expr="my_fruit_col", partitions=["apple", "banana"]
+                    ),
+                    TablePartitionDimension(
+                        partitions=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 4)),
+                        partition_expr="my_timestamp_col",
+                    ),
+                ],
+                partition_dimension_groups=groups,
+            )
+        )
+        == "DELETE FROM `db.schema1.table1` WHERE\n"
+        "(my_fruit_col in ('apple') AND\nmy_timestamp_col >= '2020-01-02 00:00:00' AND"
+        " my_timestamp_col < '2020-01-04 00:00:00') OR\n"
+        "(my_fruit_col in ('banana') AND\nmy_timestamp_col >= '2020-01-02 00:00:00' AND"
+        " my_timestamp_col < '2020-01-03 00:00:00')"
+    )
+
+
 def test_get_cleanup_statement_partitioned():
     assert (
         _get_cleanup_statement(
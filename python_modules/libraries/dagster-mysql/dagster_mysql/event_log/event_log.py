@@ -11,6 +11,7 @@
 from dagster._core.storage.config import MySqlStorageConfig, mysql_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
+    AssetPartitionStatusTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlPollingEventWatcher,
@@ -170,6 +171,35 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+        # the cached status is updated first, since it reads the previous partition status
+        self.update_asset_cached_status_data_for_event(event, event_id)
+        self.store_asset_partition_status(event, event_id)
+
+    def store_asset_partition_status(self, event: EventLogEntry, event_id: int) -> None:
+        column = self._get_asset_partition_status_column(event)
+        if column is None:
+            return
+
+        dagster_event = event.get_dagster_event()
+        asset_key_str = dagster_event.asset_key.to_string()  # type: ignore  # (possible none)
+        partition = check.not_none(dagster_event.partition)
+        query = db_dialects.mysql.insert(AssetPartitionStatusTable).values(
+            asset_key=asset_key_str,
+            partition=partition,
+            asset_partition_hash=self.get_asset_partition_hash(asset_key_str, partition),
+            **{column.name: event_id},
+        )
+        # greatest returns null if any argument is null, so coalesce the existing storage id
+        query = query.on_duplicate_key_update(
+            {
+                column.name: db.func.greatest(
+                    db.func.coalesce(column, 0), query.inserted[column.name]
+                )
+            }
+        )
+        with self.index_connection() as conn:
+            conn.execute(query)
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -1,12 +1,15 @@
-from typing import TYPE_CHECKING, Any, Optional, cast
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 import polars as pl
 import pyarrow.dataset as ds
-from dagster import InputContext, OutputContext
+from dagster import InputContext, MultiPartitionsDefinition, OutputContext
+from dagster._core.storage.upath_io_manager import is_dict_type
 from fsspec.implementations.local import LocalFileSystem
 from packaging.version import Version
 
 from dagster_polars.io_managers.base import BasePolarsUPathIOManager
+from dagster_polars.io_managers.type_routers import resolve_type_router
 
 if TYPE_CHECKING:
     from upath import UPath
@@ -14,6 +17,14 @@
 
 DAGSTER_POLARS_STORAGE_METADATA_KEY = "dagster_polars_metadata"
 
+# metadata key that opts a partitioned asset into being stored as a hive-partitioned dataset
+HIVE_PARTITION_BY_METADATA_KEY = "hive_partition_by"
+
+# name of the file holding the data of a single partition inside its hive-style directory
+HIVE_PARTITION_FILE_NAME = "data"
+
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 
 def get_pyarrow_dataset(path: "UPath", context: InputContext) -> ds.Dataset:
     context_metadata = context.definition_metadata or {}
@@ -39,8 +50,8 @@ def get_pyarrow_dataset(path: "UPath", context: InputContext) -> ds.Dataset:
     return dataset
 
 
-def scan_parquet(path: "UPath", context: InputContext) -> pl.LazyFrame:
-    """Scan a parquet file and return a lazy frame (uses polars native reader).
+def scan_parquet(path: Union["UPath", Sequence["UPath"]], context: InputContext) -> pl.LazyFrame:
+    """Scan a parquet file (or multiple parquet files) and return a lazy frame (uses polars native reader).
 
     :param path:
     :param context:
@@ -48,9 +59,10 @@ def scan_parquet(path: "UPath", context: InputContext) -> pl.LazyFrame:
     """
     context_metadata = context.definition_metadata or {}
 
+    paths = path if isinstance(path, Sequence) else [path]
     storage_options = cast(
         Optional[dict[str, Any]],
-        (path.storage_options if hasattr(path, "storage_options") else None),
+        (paths[0].storage_options if hasattr(paths[0], "storage_options") else None),
     )
 
     kwargs = dict(
@@ -70,7 +82,16 @@ def scan_parquet(path: "UPath", context: InputContext) -> pl.LazyFrame:
         kwargs["row_count_name"] = context_metadata.get("row_count_name", None)
         kwargs["row_count_offset"] = context_metadata.get("row_count_offset", 0)
 
-    return pl.scan_parquet(str(path), storage_options=storage_options, **kwargs)  # type: ignore
+    source = [str(p) for p in path] if isinstance(path, Sequence) else str(path)
+    return pl.scan_parquet(source, storage_options=storage_options, **kwargs)  # type: ignore
+
+
+def get_partition_columns(hive_partition_by: Union[str, dict[str, str]]) -> list[str]:
+    return (
+        list(hive_partition_by.values())
+        if isinstance(hive_partition_by, dict)
+        else [hive_partition_by]
+    )
 
 
 class PolarsParquetIOManager(BasePolarsUPathIOManager):
@@ -117,6 +138,35 @@ def my_asset() -> pl.DataFrame:  # data will be stored at <base_dir>/my_dataset/
                 }
             )
 
+        Storing partitions of a partitioned asset as a single hive-partitioned dataset, so that
+        multiple partitions are loaded as one lazy scan over all partition files:
+
+        .. code-block:: python
+
+            @asset(
+                io_manager_key="polars_parquet_io_manager",
+                partitions_def=DailyPartitionsDefinition(start_date="2024-01-01"),
+                metadata={
+                    "hive_partition_by": "date"  # data will be stored at <base_dir>/upstream/date=<partition_key>/data.parquet
+                },
+            )
+            def upstream() -> pl.DataFrame:
+                ...
+
+            @asset(
+                ins={"upstream": AssetIn(partition_mapping=AllPartitionMapping())},
+            )
+            def downstream(upstream: pl.LazyFrame) -> pl.DataFrame:
+                # `upstream` is a single scan over all partition files with a `date` column
+                # taken from the directory names, and filters on it are pushed down to skip files
+                return upstream.filter(pl.col("date") >= date(2024, 6, 1)).collect()
+
+        When using a `MultiPartitionsDefinition`, `hive_partition_by` should be a dict mapping
+        dimension names to column names, like `{"time": "date", "category": "category"}`.
+        The partition columns are taken from the directory names, so they are dropped from the
+        DataFrame before writing if it contains them. Use a dict type annotation to load
+        partitions as separate DataFrames instead.
+
     """
 
     extension: str = ".parquet"
@@ -128,6 +178,7 @@ def sink_df_to_path(
         path: "UPath",
     ):
         context_metadata = context.definition_metadata or {}
+        df = self._drop_hive_partition_columns(context, df)
 
         fs = path.fs if hasattr(path, "fs") else None
         if isinstance(fs, LocalFileSystem):
@@ -157,6 +208,7 @@ def write_df_to_path(
         path: "UPath",
     ):
         context_metadata = context.definition_metadata or {}
+        df = self._drop_hive_partition_columns(context, df)
         compression = context_metadata.get("compression", "zstd")
         compression_level = context_metadata.get("compression_level")
         statistics = context_metadata.get("statistics", False)
@@ -201,3 +253,96 @@ def scan_df_from_path(
         partition_key: Optional[str] = None,
     ) -> pl.LazyFrame:
         return scan_parquet(path, context)
+
+    def load_partitions(self, context: InputContext):
+        hive_partition_by = self._get_hive_partition_by(context)
+        if hive_partition_by is None or is_dict_type(context.dagster_type.typing_type):
+            # default behaviour
+            return super().load_partitions(context)
+
+        # user enabled hive partitioning and wants a `pl.DataFrame` or `pl.LazyFrame`:
+        # scan all partition files at once
+        paths = list(self._get_paths_for_partitions(context).values())
+        context.log.debug(
+            f"Scanning {len(paths)} partitions from {self._get_path_without_extension(context)} "
+            f"using {self.__class__.__name__}..."
+        )
+
+        context_metadata = context.definition_metadata or {}
+        if context_metadata.get("allow_missing_partitions", False):
+            existing_paths = [path for path in paths if self.path_exists(path)]
+            if len(existing_paths) < len(paths):
+                context.log.warning(
+                    f"Skipped {len(paths) - len(existing_paths)} missing partitions "
+                    "because the input metadata includes allow_missing_partitions=True"
+                )
+            paths = existing_paths
+            if not paths:
+                return None
+
+        ldf = scan_parquet(paths, context)
+
+        columns = context_metadata.get("columns")
+        if columns is not None:
+            context.log.debug(f"Loading {columns=}")
+            ldf = ldf.select(columns)
+
+        type_router = resolve_type_router(context, context.dagster_type.typing_type)
+        return ldf.collect() if self.type_router_is_eager(type_router) else ldf
+
+    def get_path_for_partition(
+        self, context: Union[InputContext, OutputContext], path: "UPath", partition: str
+    ) -> "UPath":
+        hive_partition_by = self._get_hive_partition_by(context)
+        if hive_partition_by is None:
+            return path / partition  # one file per partition
+
+        partitions_def = context.asset_partitions_def
+        if isinstance(partitions_def, MultiPartitionsDefinition):
+            if not isinstance(hive_partition_by, dict):
+                raise ValueError(
+                    f"Metadata value for `{HIVE_PARTITION_BY_METADATA_KEY}` must be a dictionary "
+                    "mapping dimension names to column names for multi-partitioned assets. "
+                    f"Found: `{hive_partition_by}`"
+                )
+            # `partition` is formatted as dimension keys ordered by dimension name
+            dimension_names = sorted(dim.name for dim in partitions_def.partitions_defs)
+            hive_path = path
+            for dimension_name, key in zip(dimension_names, partition.split("/")):
+                hive_path = hive_path / f"{hive_partition_by[dimension_name]}={key}"
+        elif isinstance(hive_partition_by, str):
+            hive_path = path / f"{hive_partition_by}={partition}"
+        else:
+            raise ValueError(
+                f"Metadata value for `{HIVE_PARTITION_BY_METADATA_KEY}` must be a string for "
+                f"single-partitioned assets. Found: `{hive_partition_by}`"
+            )
+
+        return hive_path / HIVE_PARTITION_FILE_NAME
+
+    @staticmethod
+    def _get_hive_partition_by(
+        context: Union[InputContext, OutputContext],
+    ) -> Optional[Union[str, dict[str, str]]]:
+        """Returns the `hive_partition_by` metadata value of the asset if its partitions are
+        stored as a hive-partitioned dataset.
+        """
+        if isinstance(context, InputContext):
+            if context.upstream_output is None:
+                return None
+            metadata = context.upstream_output.definition_metadata
+        else:
+            metadata = context.definition_metadata
+
+        if not context.has_asset_partitions or metadata is None:
+            return None
+
+        return metadata.get(HIVE_PARTITION_BY_METADATA_KEY)
+
+    def _drop_hive_partition_columns(self, context: OutputContext, df: FrameT) -> FrameT:
+        hive_partition_by = self._get_hive_partition_by(context)
+        if hive_partition_by is None:
+            return df
+
+        # the partition columns are stored in the directory names
+        return df.select(pl.all().exclude(get_partition_columns(hive_partition_by)))
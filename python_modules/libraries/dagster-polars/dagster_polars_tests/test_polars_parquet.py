@@ -1,8 +1,18 @@
 import os
+from datetime import date
 
 import polars as pl
 import polars.testing as pl_testing
-from dagster import asset, materialize
+from dagster import (
+    AllPartitionMapping,
+    AssetExecutionContext,
+    AssetIn,
+    DailyPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
 from dagster_polars import PolarsParquetIOManager
 from hypothesis import given, settings
 from polars.testing.parametric import dataframes
@@ -60,3 +70,132 @@ def downstream2(downstream: pl.LazyFrame) -> pl.LazyFrame:
     saved_path = get_saved_path(result, "upstream")
     pl_testing.assert_frame_equal(df, pl.read_parquet(saved_path))
     os.remove(saved_path)  # cleanup manually because of hypothesis
+
+
+def test_polars_parquet_io_manager_hive_partitioning(
+    polars_parquet_io_manager: PolarsParquetIOManager, df_for_parquet: pl.DataFrame
+):
+    partitions_def = DailyPartitionsDefinition(start_date="2024-01-01", end_date="2024-01-04")
+
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        partitions_def=partitions_def,
+        metadata={"hive_partition_by": "date"},
+    )
+    def upstream_partitioned(context: AssetExecutionContext) -> pl.DataFrame:
+        return df_for_parquet.with_columns(pl.lit(context.partition_key).alias("date"))
+
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        ins={"upstream_partitioned": AssetIn(partition_mapping=AllPartitionMapping())},
+    )
+    def downstream_load_multiple_partitions_as_single_lazy_df(
+        upstream_partitioned: pl.LazyFrame,
+    ) -> None:
+        assert isinstance(upstream_partitioned, pl.LazyFrame)
+        df = upstream_partitioned.filter(pl.col("date") >= date(2024, 1, 2)).collect()
+        assert set(df["date"].unique()) == {date(2024, 1, 2), date(2024, 1, 3)}
+        assert len(df) == 2 * len(df_for_parquet)
+
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        ins={"upstream_partitioned": AssetIn(partition_mapping=AllPartitionMapping())},
+    )
+    def downstream_load_multiple_partitions_as_dict(
+        upstream_partitioned: dict[str, pl.DataFrame],
+    ) -> None:
+        assert set(upstream_partitioned.keys()) == {"2024-01-01", "2024-01-02", "2024-01-03"}
+
+    for partition_key in partitions_def.get_partition_keys():
+        result = materialize([upstream_partitioned], partition_key=partition_key)
+        saved_path = get_saved_path(result, "upstream_partitioned")
+        assert saved_path.endswith(f"upstream_partitioned/date={partition_key}/data.parquet")
+        # the partition column is stored in the directory name
+        assert "date" not in pl.read_parquet(saved_path, hive_partitioning=False).columns
+
+    assert materialize(
+        [
+            upstream_partitioned.to_source_asset(),
+            downstream_load_multiple_partitions_as_single_lazy_df,
+            downstream_load_multiple_partitions_as_dict,
+        ],
+    ).success
+
+
+def test_polars_parquet_io_manager_hive_multi_partitioning(
+    polars_parquet_io_manager: PolarsParquetIOManager, df_for_parquet: pl.DataFrame
+):
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "time": DailyPartitionsDefinition(start_date="2024-01-01", end_date="2024-01-03"),
+            "category": StaticPartitionsDefinition(["a", "b"]),
+        }
+    )
+
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        partitions_def=partitions_def,
+        metadata={"hive_partition_by": {"time": "date", "category": "category"}},
+    )
+    def upstream_partitioned() -> pl.DataFrame:
+        return df_for_parquet
+
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        ins={"upstream_partitioned": AssetIn(partition_mapping=AllPartitionMapping())},
+    )
+    def downstream_load_multiple_partitions_as_single_df(
+        upstream_partitioned: pl.DataFrame,
+    ) -> None:
+        assert set(upstream_partitioned["category"].unique()) == {"a", "b"}
+        assert set(upstream_partitioned["date"].unique()) == {date(2024, 1, 1), date(2024, 1, 2)}
+
+    for day in ["2024-01-01", "2024-01-02"]:
+        for category in ["a", "b"]:
+            result = materialize([upstream_partitioned], partition_key=f"{category}|{day}")
+            saved_path = get_saved_path(result, "upstream_partitioned")
+            assert saved_path.endswith(
+                f"upstream_partitioned/category={category}/date={day}/data.parquet"
+            )
+
+    assert materialize(
+        [
+            upstream_partitioned.to_source_asset(),
+            downstream_load_multiple_partitions_as_single_df,
+        ],
+    ).success
+
+
+def test_polars_parquet_io_manager_partition_by_keeps_file_per_partition(
+    polars_parquet_io_manager: PolarsParquetIOManager, df_for_parquet: pl.DataFrame
+):
+    partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+    # `partition_by` is only used to read datasets, and doesn't change where partitions are stored
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        partitions_def=partitions_def,
+        metadata={"partition_by": "hive"},
+    )
+    def upstream_partitioned() -> pl.DataFrame:
+        return df_for_parquet
+
+    @asset(
+        io_manager_def=polars_parquet_io_manager,
+        ins={"upstream_partitioned": AssetIn(partition_mapping=AllPartitionMapping())},
+    )
+    def downstream_load_multiple_partitions_as_dict(
+        upstream_partitioned: dict[str, pl.DataFrame],
+    ) -> None:
+        assert set(upstream_partitioned.keys()) == {"a", "b"}
+        for df in upstream_partitioned.values():
+            pl_testing.assert_frame_equal(df, df_for_parquet)
+
+    for partition_key in partitions_def.get_partition_keys():
+        result = materialize([upstream_partitioned], partition_key=partition_key)
+        saved_path = get_saved_path(result, "upstream_partitioned")
+        assert saved_path.endswith(f"upstream_partitioned/{partition_key}.parquet")
+
+    assert materialize(
+        [upstream_partitioned.to_source_asset(), downstream_load_multiple_partitions_as_dict],
+    ).success
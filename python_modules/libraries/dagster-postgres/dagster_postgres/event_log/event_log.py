@@ -9,11 +9,12 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
+    AssetPartitionStatusTable,
     DynamicPartitionsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
@@ -34,6 +35,7 @@
 from sqlalchemy import event
 from sqlalchemy.engine import Connection
 
+from dagster_postgres.event_log.event_watcher import PostgresEventNotificationListener
 from dagster_postgres.utils import (
     create_pg_connection,
     pg_alembic_config,
@@ -92,6 +94,7 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
         self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_notification_listener: Optional[PostgresEventNotificationListener] = None
 
         self._secondary_index_cache = {}
 
@@ -184,7 +187,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wake up any watchers of the run
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -211,23 +214,25 @@ def store_event(self, event: EventLogEntry) -> None:
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
 
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
+        if not events:
+            return
 
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn:
             result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
             event_ids = [cast(int, row[0]) for row in result.fetchall()]
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
-
-        if any(event_id is None for event_id in event_ids):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+            # wake up any watchers of the runs, once per run
+            last_event_id_by_run_id = {
+                event.run_id: event_id for event, event_id in zip(events, event_ids)
+            }
+            for run_id, event_id in last_event_id_by_run_id.items():
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(event_id)},
+                )
 
-        self.store_asset_event_tags(events, event_ids)
+        self.store_indexes_for_event_batch(events, event_ids)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -281,6 +286,32 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+        # the cached status is updated first, since it reads the previous partition status
+        self.update_asset_cached_status_data_for_event(event, event_id)
+        self.store_asset_partition_status(event, event_id)
+
+    def store_asset_partition_status(self, event: EventLogEntry, event_id: int) -> None:
+        column = self._get_asset_partition_status_column(event)
+        if column is None:
+            return
+
+        dagster_event = event.get_dagster_event()
+        asset_key_str = dagster_event.asset_key.to_string()  # type: ignore  # (possible none)
+        partition = check.not_none(dagster_event.partition)
+        query = db_dialects.postgresql.insert(AssetPartitionStatusTable).values(
+            asset_key=asset_key_str,
+            partition=partition,
+            asset_partition_hash=self.get_asset_partition_hash(asset_key_str, partition),
+            **{column.name: event_id},
+        )
+        # greatest ignores nulls, so this keeps the latest storage id
+        query = query.on_conflict_do_update(
+            index_elements=[AssetPartitionStatusTable.c.asset_partition_hash],
+            set_={column.name: db.func.greatest(column, query.excluded[column.name])},
+        )
+        with self.index_connection() as conn:
+            conn.execute(query)
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -343,7 +374,15 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
+            # start with the default poll period, since notifications can be silently dropped,
+            # e.g. when connecting through pgbouncer in transaction pooling mode. The listener only
+            # raises it while its probe notifications are delivered.
             self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_notification_listener = PostgresEventNotificationListener(
+                self._engine, CHANNEL_NAME, self._event_watcher
+            )
+            self._event_notification_listener.daemon = True
+            self._event_notification_listener.start()
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
@@ -361,6 +400,10 @@ def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
             self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self) -> None:
+        if self._event_notification_listener:
+            self._event_notification_listener.should_thread_exit.set()
+            self._event_notification_listener.join()
+            self._event_notification_listener = None
         if self._event_watcher:
             self._event_watcher.close()
             self._event_watcher = None
@@ -0,0 +1,146 @@
+import logging
+import select
+import threading
+import time
+import uuid
+from typing import Optional
+
+import dagster._check as check
+import psycopg2
+import psycopg2.extensions
+import sqlalchemy as db
+from dagster._core.storage.event_log.polling_event_watcher import (
+    MAX_POLL_PERIOD,
+    SqlPollingEventWatcher,
+)
+
+from dagster_postgres.utils import retry_pg_connection_fn
+
+# How often the listener checks whether it should exit while waiting for notifications
+LISTEN_TIMEOUT = 1.0  # 1s
+# How long the listener waits before reconnecting after losing its connection
+RECONNECT_WAIT = 5.0  # 5s
+# How often the listener checks that notifications are delivered, by sending itself a probe
+PROBE_INTERVAL = 60.0  # 60s
+# How long the listener waits for a probe before treating notifications as undelivered
+PROBE_TIMEOUT = 5.0  # 5s
+# Maximum poll period of the watcher while probes confirm that notifications are delivered
+NOTIFIED_MAX_POLL_PERIOD = 60.0  # 60s
+# Payloads of probe notifications. Event notifications are `<run_id>_<storage_id>`, so payloads
+# without an underscore are never mistaken for them.
+PROBE_PAYLOAD_PREFIX = "probe-"
+
+
+class PostgresEventNotificationListener(threading.Thread):
+    """subclass of Thread that LISTENs on a Postgres channel for the notifications sent when events
+    are stored, and wakes the given watcher up when one of its watched runs has new events.
+
+    The payload of each notification is `<run_id>_<storage_id>`. Notifications are only a hint to
+    fetch new events right away: the watcher still polls as a fallback, so notifications that are
+    missed while the listener is reconnecting only delay the events until the next poll.
+
+    Notifications can also be silently dropped for good, e.g. behind pgbouncer in transaction
+    pooling mode. The listener regularly sends a probe notification through the storage engine,
+    the same way events are notified, and only raises the watcher's maximum poll period to
+    NOTIFIED_MAX_POLL_PERIOD while its probes are received. Exits when `self.should_thread_exit`
+    is set.
+    """
+
+    def __init__(self, engine: db.engine.Engine, channel: str, watcher: SqlPollingEventWatcher):
+        super().__init__()
+        self._engine = check.inst_param(engine, "engine", db.engine.Engine)
+        self._channel = check.str_param(channel, "channel")
+        self._watcher = check.inst_param(watcher, "watcher", SqlPollingEventWatcher)
+        self._should_thread_exit = threading.Event()
+        self._delivery_confirmed: Optional[bool] = None
+        self.name = f"postgres-event-listen-{self._channel}"
+
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
+
+    @property
+    def delivery_confirmed(self) -> bool:
+        """Whether the last probe notification sent by the listener was received."""
+        return bool(self._delivery_confirmed)
+
+    def _set_delivery_confirmed(self, delivery_confirmed: bool) -> None:
+        if delivery_confirmed == self._delivery_confirmed:
+            return
+        if not delivery_confirmed:
+            logging.getLogger("dagster").warning(
+                f"Notifications on channel {self._channel} are not being delivered, e.g. because"
+                " the connection goes through a pooler in transaction pooling mode. Falling back"
+                f" to polling for new events at least every {MAX_POLL_PERIOD} seconds."
+            )
+        self._delivery_confirmed = delivery_confirmed
+        self._watcher.set_max_poll_period(
+            NOTIFIED_MAX_POLL_PERIOD if delivery_confirmed else MAX_POLL_PERIOD
+        )
+
+    def _send_probe(self, payload: str) -> None:
+        with self._engine.connect() as conn:
+            conn.execute(
+                db.text(f"""NOTIFY {self._channel}, :payload; """),
+                {"payload": payload},
+            )
+
+    def run(self) -> None:
+        while not self._should_thread_exit.is_set():
+            try:
+                self._listen()
+            except Exception:
+                # notifications sent while reconnecting are lost, so poll at the default rate until
+                # a probe is received again
+                if self._delivery_confirmed:
+                    self._delivery_confirmed = None
+                    self._watcher.set_max_poll_period(MAX_POLL_PERIOD)
+                logging.getLogger("dagster").warning(
+                    f"Error while listening for notifications on channel {self._channel}, "
+                    f"reconnecting in {RECONNECT_WAIT} seconds.",
+                    exc_info=True,
+                )
+                self._should_thread_exit.wait(RECONNECT_WAIT)
+
+    def _listen(self) -> None:
+        # connect with the same arguments as the storage engine, but hold a dedicated connection
+        # outside of SQLAlchemy so that notifications can be read from it directly
+        connect_args, connect_kwargs = self._engine.dialect.create_connect_args(self._engine.url)
+        conn = retry_pg_connection_fn(lambda: psycopg2.connect(*connect_args, **connect_kwargs))
+        try:
+            # LISTEN only takes effect once committed, and notifications are only delivered
+            # between transactions
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as curs:
+                curs.execute(f"LISTEN {self._channel};")
+
+            probe_payload: Optional[str] = None
+            probe_sent_at = 0.0
+            next_probe_at = time.monotonic()
+            while not self._should_thread_exit.is_set():
+                now = time.monotonic()
+                if probe_payload is None and now >= next_probe_at:
+                    probe_payload = f"{PROBE_PAYLOAD_PREFIX}{uuid.uuid4().hex}"
+                    probe_sent_at = now
+                    self._send_probe(probe_payload)
+                elif probe_payload is not None and now - probe_sent_at >= PROBE_TIMEOUT:
+                    self._set_delivery_confirmed(False)
+                    probe_payload = None
+                    next_probe_at = now + PROBE_INTERVAL
+
+                if select.select([conn], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                    continue
+
+                conn.poll()
+                while conn.notifies:
+                    notification = conn.notifies.pop(0)
+                    if notification.payload == probe_payload:
+                        self._set_delivery_confirmed(True)
+                        probe_payload = None
+                        next_probe_at = time.monotonic() + PROBE_INTERVAL
+                        continue
+                    run_id, _, _ = notification.payload.rpartition("_")
+                    if run_id:
+                        self._watcher.notify_new_events(run_id)
+        finally:
+            conn.close()
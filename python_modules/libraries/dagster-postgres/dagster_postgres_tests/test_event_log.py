@@ -9,6 +9,7 @@
 from dagster._core.test_utils import ensure_dagster_tests_import, instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_watcher import NOTIFIED_MAX_POLL_PERIOD
 
 ensure_dagster_tests_import()
 from dagster_tests.storage_tests.utils.event_log_storage import (
@@ -109,6 +110,54 @@ def watch_two(event, _cursor):
         gc.collect()
         assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
 
+    def test_event_log_storage_watch_notifications(self, conn_string):
+        with _clean_storage(conn_string) as storage:
+            run_ids = [make_new_run_id() for _ in range(3)]
+            watched = []
+
+            def watch(event, _cursor):
+                watched.append(event)
+
+            for run_id in run_ids:
+                storage.watch(run_id, None, watch)
+
+            # let the polling back off, so that the next poll is more than 5 seconds away
+            time.sleep(8)
+
+            storage.store_event_batch(
+                [
+                    create_test_event_log_record(str(i), run_id=run_id)
+                    for i, run_id in enumerate(run_ids)
+                ]
+            )
+
+            # the events are fetched as soon as the notification is received
+            attempts = 10
+            while len(watched) < 3 and attempts > 0:
+                time.sleep(0.2)
+                attempts -= 1
+            assert sorted(int(evt.message) for evt in watched) == [0, 1, 2]
+
+            for run_id in run_ids:
+                storage.end_watch(run_id, watch)
+
+    def test_event_log_storage_watch_confirms_notification_delivery(self, conn_string):
+        with _clean_storage(conn_string) as storage:
+            run_id = make_new_run_id()
+            watch = lambda _event, _cursor: None
+            storage.watch(run_id, None, watch)
+
+            listener = storage._event_notification_listener  # noqa: SLF001
+            assert listener
+            attempts = 20
+            while not listener.delivery_confirmed and attempts > 0:
+                time.sleep(0.2)
+                attempts -= 1
+            assert listener.delivery_confirmed
+            assert storage._event_watcher._max_poll_period == NOTIFIED_MAX_POLL_PERIOD  # noqa: SLF001  # pyright: ignore[reportOptionalMemberAccess]
+
+            storage.end_watch(run_id, watch)
+
     def test_load_from_config(self, hostname):
         url_cfg = f"""
         event_log_storage:
@@ -349,6 +349,8 @@ def create_io_manager(self, context) -> DbIOManager:
 
 
 class SnowflakeDbClient(DbClient):
+    supports_partition_dimension_groups = True
+
     @staticmethod
     @contextmanager
     def connect(context, table_slice):
@@ -391,7 +393,9 @@ def get_select_statement(table_slice: TableSlice) -> str:
                 f"SELECT {col_str} FROM"
                 f" {table_slice.database}.{table_slice.schema}.{table_slice.table} WHERE\n"
             )
-            return query + _partition_where_clause(table_slice.partition_dimensions)
+            return query + _partition_where_clause(
+                table_slice.partition_dimensions, table_slice.partition_dimension_groups
+            )
         else:
             return f"""SELECT {col_str} FROM {table_slice.database}.{table_slice.schema}.{table_slice.table}"""
 
@@ -404,12 +408,22 @@ def _get_cleanup_statement(table_slice: TableSlice) -> str:
         query = (
             f"DELETE FROM {table_slice.database}.{table_slice.schema}.{table_slice.table} WHERE\n"
         )
-        return query + _partition_where_clause(table_slice.partition_dimensions)
+        return query + _partition_where_clause(
+            table_slice.partition_dimensions, table_slice.partition_dimension_groups
+        )
     else:
         return f"DELETE FROM {table_slice.database}.{table_slice.schema}.{table_slice.table}"
 
 
-def _partition_where_clause(partition_dimensions: Sequence[TablePartitionDimension]) -> str:
+def _partition_where_clause(
+    partition_dimensions: Sequence[TablePartitionDimension],
+    partition_dimension_groups: Optional[Sequence[Sequence[TablePartitionDimension]]] = None,
+) -> str:
+    if partition_dimension_groups:
+        # each group selects a product of partitions, so the slice is the union of the groups
+        return " OR\n".join(
+            f"({_partition_where_clause(group)})" for group in partition_dimension_groups
+        )
     return " AND\n".join(
         (
             _time_window_where_clause(partition_dimension)